@@ -0,0 +1,3 @@
+"""
+Package script.
+"""
@@ -0,0 +1,64 @@
+"""
+Benchmark for the construction of the PyExpression tree.
+
+Measures the throughput (nodes per second) of converting an
+already parsed AST of a large generated module to PyExpressions.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_builder [--functions N] [--depth D] [--repeat R]
+"""
+from argparse import ArgumentParser, Namespace
+from ast import parse, walk
+from time import perf_counter
+from typing import List
+
+from benchmarks.generator import ProgramGenerator
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="PyExpression tree construction throughput")
+    parser.add_argument("--functions", type=int, default=500, help="Amount of functions in the generated module")
+    parser.add_argument("--depth", type=int, default=4, help="Nesting depth of each generated function")
+    parser.add_argument("--repeat", type=int, default=5, help="How many times to build (best time is kept)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    # Create a session with the default options (without any debugging flags)
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.Constants import AST_EXPR_TO_PYEXPR
+    from src.compiler.ModuleRegistry import ModuleRegistry
+    from src.pyexpressions.concrete.PyModule import PyModule
+    session = CompileSession()
+    # Load the ported libraries, so that only the tree is timed
+    session.get_port_manager()
+
+    # Parse the generated module once, only the tree construction is timed
+    tree = parse(ProgramGenerator.generate_module(args.functions, args.depth))
+    # Count the AST nodes which are converted to PyExpressions
+    node_count = sum(1 for node in walk(tree) if type(node) in AST_EXPR_TO_PYEXPR)
+
+    # Build the tree a few times, and keep the best time
+    timings: List[float] = []
+    for _ in range(args.repeat):
+        start = perf_counter()
+        PyModule(tree, registry=ModuleRegistry(session))
+        timings.append(perf_counter() - start)
+    best = min(timings)
+
+    # Print the results
+    print(f"Built {node_count} nodes ({args.functions} functions, depth {args.depth}), best of {args.repeat}:")
+    print(f"  {best * 1000:10.1f} ms")
+    print(f"  {node_count / best:10.0f} nodes/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark for the latency of the compile server.
+
+Compares a cold run of the command line (a new process, which imports the
+compiler and loads the ports) to requests sent to a running compile server,
+for a small file which imports a module (so the server's module cache is used).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_daemon [--functions N] [--depth D] [--repeat R]
+"""
+from argparse import ArgumentParser, Namespace
+from os.path import join
+from statistics import median
+from subprocess import Popen, run, DEVNULL
+from sys import executable
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+from typing import List, Optional
+
+from benchmarks.generator import ProgramGenerator
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Compile server latency")
+    parser.add_argument("--functions", type=int, default=20, help="Amount of functions in the imported module")
+    parser.add_argument("--depth", type=int, default=4, help="Nesting depth of each generated function")
+    parser.add_argument("--repeat", type=int, default=50, help="How many requests to send to the server")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    from src import __version__
+    from src.compiler.CompileOptions import CompileOptions
+    from src.compiler.daemon.CompileClient import CompileClient
+    from src.compiler.daemon.CompileRequest import CompileRequest
+
+    with TemporaryDirectory() as directory:
+        # An imported module of generated functions, and a small file which uses it
+        with open(join(directory, "library.py"), "w") as f:
+            f.write(ProgramGenerator.generate_module(args.functions, args.depth))
+        main_path = join(directory, "main.py")
+        source = "import library\nvalue: int = 1\nprint(value)\n"
+        with open(main_path, "w") as f:
+            f.write(source)
+
+        # A cold run of the command line, without the server
+        start = perf_counter()
+        run([executable, "compy.py", "--no-cache", "--no-daemon", "--source-roots", directory,
+             "-o", join(directory, "main.cpp"), main_path], stdout=DEVNULL, check=True)
+        cold = perf_counter() - start
+
+        # Start the server, and wait until it accepts connections
+        address = join(directory, "compy.sock")
+        server = Popen([executable, "compy.py", "serve", "--daemon-address", address], stdout=DEVNULL)
+        try:
+            client: Optional[CompileClient] = None
+            while client is None:
+                sleep(0.05)
+                client = CompileClient.connect(address)
+
+            # Send the requests over a single connection (like an editor would)
+            request = CompileRequest(__version__, source, main_path, CompileOptions(source_roots=(directory,)))
+            timings: List[float] = []
+            with client:
+                for _ in range(args.repeat + 1):
+                    start = perf_counter()
+                    response = client.compile(request)
+                    timings.append(perf_counter() - start)
+                    assert response.error is None, response.error
+            # The first request parses the imported module
+            first, warm = timings[0], timings[1:]
+
+            # Command line runs which hand the file to the server
+            start = perf_counter()
+            run([executable, "compy.py", "--no-cache", "--daemon-address", address, "--source-roots", directory,
+                 "-o", join(directory, "main.cpp"), main_path], stdout=DEVNULL, check=True)
+            client_run = perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+
+    # Print the results
+    print(f"Transpiling a file which imports {args.functions} functions (depth {args.depth}):")
+    print(f"  {'cold command line run':<32} {cold * 1000:10.1f} ms")
+    print(f"  {'command line run with server':<32} {client_run * 1000:10.1f} ms")
+    print(f"  {'first server request':<32} {first * 1000:10.1f} ms")
+    print(f"  {'warm server request (median)':<32} {median(warm) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
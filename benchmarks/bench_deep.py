@@ -0,0 +1,117 @@
+"""
+Benchmark for deeply nested expressions.
+
+Builds modules holding a single expression which is nested thousands of
+levels deep, then times building their trees and transpiling them, with
+the default recursion limit. The time per level should stay the same as
+the depth grows (the nodes are built and written with explicit stacks).
+
+The expressions are built as AST nodes directly: CPython's own parser
+stops at about 200 nested parentheses, and converts long chains of
+operations (such as 'a + a + ... + a') to AST nodes recursively, so
+ast.parse itself rejects them past a few thousand levels.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_deep [--depths N,N,...] [--shapes binop,boolop,call]
+"""
+from argparse import ArgumentParser, Namespace
+from ast import Add, And, BinOp, BoolOp, Call, Compare, Constant, Expr, Gt, Load, Module, Name, Or, parse
+from sys import getrecursionlimit
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from src.compiler.CodeBuffer import CodeBuffer
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Deeply nested expressions")
+    parser.add_argument("--depths", default="1000,10000,50000", help="The nesting depths to time")
+    parser.add_argument("--shapes", default="binop,boolop,call", help="The kinds of expressions to nest")
+    return parser.parse_args()
+
+
+def nest_binop(depth: int) -> Expr:
+    """
+    :param depth: The nesting depth.
+    :return: The statement 'print(value + 1 + 1 + ...)' (nested on the left, as the parser nests it).
+    """
+    expression = Name("value", Load())
+    for _ in range(depth):
+        expression = BinOp(expression, Add(), Constant(1))
+    return Expr(Call(Name("print", Load()), [expression], []))
+
+
+def nest_boolop(depth: int) -> Expr:
+    """
+    :param depth: The nesting depth.
+    :return: The statement 'print(value > 0 and (value > 1 or (value > 2 and ...)))'.
+    """
+    expression = Compare(Name("value", Load()), [Gt()], [Constant(depth)])
+    for level in reversed(range(depth)):
+        condition = Compare(Name("value", Load()), [Gt()], [Constant(level)])
+        expression = BoolOp(And() if level % 2 == 0 else Or(), [condition, expression])
+    return Expr(Call(Name("print", Load()), [expression], []))
+
+
+def nest_call(depth: int) -> Expr:
+    """
+    :param depth: The nesting depth.
+    :return: The statement 'print(identity(identity(...(value))))'.
+    """
+    expression = Name("value", Load())
+    for _ in range(depth):
+        expression = Call(Name("identity", Load()), [expression], [])
+    return Expr(Call(Name("print", Load()), [expression], []))
+
+
+# The functions which build each kind of nested expression
+SHAPES: Dict[str, Callable[[int], Expr]] = {"binop": nest_binop, "boolop": nest_boolop, "call": nest_call}
+
+
+def build_module(statement: Expr) -> Module:
+    """
+    :param statement: The nested statement.
+    :return: A module which declares the names used by the statement, then runs it.
+    """
+    # def identity(x: int) -> int: return x
+    # value: int = 5
+    header: List = parse("def identity(x: int) -> int:\n    return x\nvalue: int = 5\n").body
+    # (the nested nodes have no line numbers, which only the logging and the definition store use)
+    return Module(header + [statement], [])
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.ModuleRegistry import ModuleRegistry
+    from src.pyexpressions.concrete.PyModule import PyModule
+
+    print(f"Recursion limit: {getrecursionlimit()}")
+    for shape in args.shapes.split(","):
+        for depth in [int(depth) for depth in args.depths.split(",")]:
+            tree = build_module(SHAPES[shape](depth))
+
+            start_time = perf_counter()
+            module = PyModule(tree, None, "", ModuleRegistry(CompileSession()))
+            build_time = perf_counter() - start_time
+
+            start_time = perf_counter()
+            buffer = CodeBuffer()
+            module.emit(buffer)
+            size = len(buffer.getvalue())
+            emit_time = perf_counter() - start_time
+
+            print(f"  {shape:<7} depth {depth:>7}  build {build_time * 1000:9.1f} ms "
+                  f"({build_time / depth * 1e6:5.2f} us/level)  emit {emit_time * 1000:9.1f} ms "
+                  f"({emit_time / depth * 1e6:5.2f} us/level)  {size / 1024:8.0f} KB of code")
+
+
+if __name__ == "__main__":
+    main()
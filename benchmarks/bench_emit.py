@@ -0,0 +1,117 @@
+"""
+Benchmark for writing large transpiled outputs.
+
+Generates a program whose output is tens of megabytes (deeply nested
+functions, with long string constants in their innermost bodies), parses
+it once, then compares the time and the peak memory of writing its output:
+ - as a string (module.transpile(), then a single write), and
+ - streamed straight into the file (Compiler.transpile_to_file).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_emit [--size-mb MB] [--depth D] [--mode both|string|stream]
+"""
+from argparse import ArgumentParser, Namespace
+from os.path import getsize, join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+from typing import Callable, List, Tuple
+
+# The length of the string constants (most of the output is made of them, so few nodes are needed)
+CONSTANT_LENGTH: int = 2000
+# The amount of statements in the innermost body of each function
+STATEMENTS: int = 5
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Writing large transpiled outputs")
+    parser.add_argument("--size-mb", type=float, default=50, help="The approximate size of the output, in MB")
+    parser.add_argument("--depth", type=int, default=8, help="Nesting depth of each generated function")
+    parser.add_argument("--mode", choices=("both", "string", "stream"), default="both", help="The ways to write")
+    return parser.parse_args()
+
+
+def generate_module(size: int, depth: int) -> str:
+    """
+    Generates a module whose transpiled output is about the given size.
+
+    :param size: The approximate size of the output, in bytes.
+    :param depth: How deeply the conditionals in each function are nested.
+    :return: The source code of the module.
+    """
+    functions = max(1, size // (CONSTANT_LENGTH * STATEMENTS))
+    lines: List[str] = []
+    for index in range(functions):
+        lines.append(f"def func_{index}(value: int) -> int:")
+        for level in range(depth):
+            lines.append(f"{'    ' * (level + 1)}if value > {level}:")
+        indent = "    " * (depth + 1)
+        for statement in range(STATEMENTS):
+            lines.append(f"{indent}print(\"{chr(ord('a') + statement % 26) * CONSTANT_LENGTH}\")")
+        lines.append("    return value")
+    lines.append("print(func_0(1))")
+    return "\n".join(lines) + "\n"
+
+
+def measure(write: Callable[[], None]) -> Tuple[float, int]:
+    """
+    Runs a write twice: once for its time, and once (traced) for its peak memory.
+
+    :param write: The function which writes the output.
+    :return: The time it took (in seconds), and the peak of memory allocated while it ran (in bytes).
+    """
+    start_time = perf_counter()
+    write()
+    elapsed = perf_counter() - start_time
+
+    start()
+    try:
+        reset_peak()
+        baseline, _ = get_traced_memory()
+        write()
+        _, peak = get_traced_memory()
+    finally:
+        stop()
+    return elapsed, peak - baseline
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    from src.compiler.Compiler import Compiler
+    from src.compiler.CompileSession import CompileSession
+
+    source = generate_module(int(args.size_mb * 1024 * 1024), args.depth)
+    start_time = perf_counter()
+    module = Compiler.parse(source, CompileSession())
+    print(f"Parsed {len(source) / 1024 / 1024:.1f} MB of source in {perf_counter() - start_time:.1f} s")
+
+    with TemporaryDirectory() as directory:
+        output_path = join(directory, "output.cpp")
+
+        def write_string() -> None:
+            code = module.transpile()
+            with open(output_path, "w") as f:
+                f.write(code)
+
+        def write_stream() -> None:
+            Compiler.transpile_to_file(module, output_path)
+
+        modes = {"string": write_string, "stream": write_stream}
+        for mode, write in modes.items():
+            if args.mode not in ("both", mode):
+                continue
+            elapsed, peak = measure(write)
+            size = getsize(output_path)
+            print(f"  {mode:<8} {size / 1024 / 1024:8.1f} MB output  {elapsed * 1000:10.1f} ms  "
+                  f"peak {peak / 1024 / 1024:8.1f} MB ({peak / size:5.2f}x the output)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark for incremental recompilation.
+
+Measures how long it takes to rebuild a large generated module after
+editing a single function, when the unchanged definitions are reused
+from the definition store, compared to a full rebuild.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_incremental [--functions N] [--depth D] [--repeat R]
+"""
+from argparse import ArgumentParser, Namespace
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import List, Optional, TYPE_CHECKING
+
+from benchmarks.generator import ProgramGenerator
+
+if TYPE_CHECKING:
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.cache.DefinitionStore import DefinitionStore
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Edit-one-function rebuild time against a full rebuild")
+    parser.add_argument("--functions", type=int, default=1000, help="Amount of functions in the generated module")
+    parser.add_argument("--depth", type=int, default=4, help="Nesting depth of each generated function")
+    parser.add_argument("--repeat", type=int, default=3, help="How many times to rebuild (best time is kept)")
+    return parser.parse_args()
+
+
+def build(source: str, session: "CompileSession", definitions: Optional["DefinitionStore"]) -> float:
+    """
+    Parses and transpiles a module.
+
+    :param source: The source code to compile.
+    :param session: The session to compile in.
+    :param definitions: The definition store to use (None for a full rebuild).
+    :return: The time it took, in seconds.
+    """
+    from src.compiler.Compiler import Compiler
+
+    start = perf_counter()
+    Compiler.parse(source, session, None, definitions).transpile()
+    return perf_counter() - start
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    # Create a session with the default options (without any debugging flags)
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.Compiler import Compiler
+    from src.compiler.cache.DefinitionStore import DefinitionStore
+    session = CompileSession()
+
+    # Warm up (load the ported libraries and such)
+    Compiler.parse("print(1)", session)
+
+    # Generate the module, and an edited version of it (a single function body is changed)
+    source = ProgramGenerator.generate_module(args.functions, args.depth)
+    edited_header = f"def func_{args.functions // 2}(value: int) -> int:\n    total: int = value * "
+    assert edited_header in source
+    edited_sources = [
+        source.replace(edited_header + "2 + 1", edited_header + f"2 + {edit + 2}") for edit in range(args.repeat)
+    ]
+
+    # A full rebuild
+    full: List[float] = [build(source, session, None) for _ in range(args.repeat)]
+
+    with TemporaryDirectory() as directory:
+        # The first build fills the store
+        definitions = DefinitionStore(directory)
+        cold = build(source, session, definitions)
+        # Rebuild after each edit (a new edit each time, so the edited function is never stored)
+        incremental: List[float] = [build(edited_source, session, definitions) for edited_source in edited_sources]
+
+    # Print the results
+    print(f"Rebuilding a module of {args.functions} functions (depth {args.depth}), best of {args.repeat}:")
+    print(f"  {'full rebuild':<28} {min(full) * 1000:10.1f} ms")
+    print(f"  {'first build (fills store)':<28} {cold * 1000:10.1f} ms")
+    print(f"  {'edit one function':<28} {min(incremental) * 1000:10.1f} ms")
+    print(f"  {'speedup':<28} {min(full) / min(incremental):10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
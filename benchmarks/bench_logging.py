@@ -0,0 +1,83 @@
+"""
+Benchmark for the cost of debug logging during parsing.
+
+Measures how long it takes to parse (build the PyExpression tree of)
+a large generated module, with and without the debug text flag.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_logging [--functions N] [--depth D] [--repeat R]
+"""
+from argparse import ArgumentParser, Namespace
+from contextlib import redirect_stdout
+from os import devnull
+from subprocess import run, PIPE
+from sys import executable
+from time import perf_counter
+from typing import List
+
+from benchmarks.generator import ProgramGenerator
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Parse time with and without debug flags")
+    parser.add_argument("--functions", type=int, default=500, help="Amount of functions in the generated module")
+    parser.add_argument("--depth", type=int, default=6, help="Nesting depth of each generated function")
+    parser.add_argument("--repeat", type=int, default=3, help="How many times to parse (best time is kept)")
+    parser.add_argument("--debug-text", action="store_true", help="Enable the debug text flag (worker only)")
+    parser.add_argument("--worker", action="store_true", help="Run a single measurement in this process")
+    return parser.parse_args()
+
+
+def measure(args: Namespace) -> float:
+    """
+    Parses the generated module in this process.
+
+    :param args: The benchmark arguments.
+    :return: The best parse time, in seconds.
+    """
+    # Each configuration gets its own process, so they don't share any warmed up state
+    from src.compiler.CompileOptions import CompileOptions
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.Compiler import Compiler
+    session = CompileSession(CompileOptions(debug_text=args.debug_text))
+
+    # Generate the input once
+    source = ProgramGenerator.generate_module(args.functions, args.depth)
+
+    # Parse it a few times, and keep the best time
+    timings: List[float] = []
+    with open(devnull, "w") as sink, redirect_stdout(sink):
+        for _ in range(args.repeat):
+            start = perf_counter()
+            Compiler.parse(source, session)
+            timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    # Worker mode, print the measurement for the parent process
+    if args.worker:
+        print(measure(args))
+        return
+
+    # Otherwise, run each configuration in its own process
+    print(f"Parsing a module of {args.functions} functions (depth {args.depth}), best of {args.repeat}:")
+    for label, flags in (("no debug flags", []), ("-dt (debug text)", ["--debug-text"])):
+        result = run(
+            [executable, "-m", "benchmarks.bench_logging", "--worker",
+             "--functions", str(args.functions), "--depth", str(args.depth), "--repeat", str(args.repeat)] + flags,
+            stdout=PIPE, check=True, text=True
+        )
+        print(f"  {label:<20} {float(result.stdout.strip()) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for the memory footprint of the PyExpression tree.
+
+Measures how many bytes the compiler retains for each PyExpression
+node, after building the tree of a large generated module.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_memory [--functions N] [--depth D]
+"""
+from argparse import ArgumentParser, Namespace
+from ast import parse
+from gc import collect, get_objects
+from tracemalloc import start, stop, take_snapshot
+
+from benchmarks.generator import ProgramGenerator
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Retained memory per PyExpression node")
+    parser.add_argument("--functions", type=int, default=500, help="Amount of functions in the generated module")
+    parser.add_argument("--depth", type=int, default=4, help="Nesting depth of each generated function")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    # Create a session with the default options (without any debugging flags)
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.Compiler import Compiler
+    from src.compiler.ModuleRegistry import ModuleRegistry
+    from src.pyexpressions.abstract.PyExpression import PyExpression
+    from src.pyexpressions.concrete.PyModule import PyModule
+    session = CompileSession()
+
+    # Warm up (load the ported libraries and such), so that only the tree is measured
+    Compiler.parse("print(1)", session)
+    # Parse the generated module, the AST is not part of the measurement
+    tree = parse(ProgramGenerator.generate_module(args.functions, args.depth))
+
+    # Measure the memory which is still allocated after building the tree
+    collect()
+    start()
+    before = take_snapshot()
+    module = PyModule(tree, registry=ModuleRegistry(session))
+    collect()
+    after = take_snapshot()
+    stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    # Count the nodes which were created
+    node_count = sum(1 for obj in get_objects() if isinstance(obj, PyExpression))
+
+    # Print the results
+    print(f"Built {node_count} nodes ({args.functions} functions, depth {args.depth}):")
+    print(f"  {retained / 1024 / 1024:10.2f} MB retained")
+    print(f"  {retained / node_count:10.1f} bytes/node")
+
+    # Keep the tree alive until here
+    del module
+
+
+if __name__ == "__main__":
+    main()
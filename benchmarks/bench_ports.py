@@ -0,0 +1,168 @@
+"""
+Benchmark for loading port libraries.
+
+Generates a library with many ports, both as a Python module (stub
+functions, with their native code in strings) and as a declarative
+library (a manifest, and a header file for each port), and compares
+how long it takes to link each one and call one of its ports. Both are
+timed cold (the library's index is compiled) and warm (only the index
+is read, and the called port is loaded on its own). A Python module
+which is linked but unused is not imported at all.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ports [--ports N] [--repeat R]
+"""
+from argparse import ArgumentParser, Namespace
+from json import dump
+from os import mkdir, remove
+from os.path import join
+from sys import path as module_search_path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, List
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Port library loading")
+    parser.add_argument("--ports", type=int, default=2000, help="Amount of ports in the generated library")
+    parser.add_argument("--repeat", type=int, default=5, help="How many times to load each library (best is kept)")
+    return parser.parse_args()
+
+
+def generate_module(ports: int) -> str:
+    """
+    Generates a port library as a Python module.
+
+    :param ports: The amount of ports.
+    :return: The source code of the module.
+    """
+    lines: List[str] = ["from typing import Dict", "", "from src import PyPortFunctionSignature", ""]
+    for index in range(ports):
+        lines.append(f"def add_{index}(number: int) -> int:")
+        lines.append(f"    \"\"\"\n    Adds {index} to a number.\n    \"\"\"")
+        lines.append("")
+    lines.append("ported_objs: Dict[str, PyPortFunctionSignature] = {")
+    for index in range(ports):
+        lines.append(f"    \"add_{index}\": PyPortFunctionSignature(function=add_{index}, "
+                     f"code=\"return number + {index};\"),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_library(directory: str, ports: int) -> None:
+    """
+    Generates a declarative port library.
+
+    :param directory: The directory to generate the library in.
+    :param ports: The amount of ports.
+    """
+    manifest = {"ports": {}}
+    for index in range(ports):
+        manifest["ports"][f"add_{index}"] = {"signature": f"add_{index}(number: int) -> int",
+                                             "header": f"add_{index}.hpp"}
+        with open(join(directory, f"add_{index}.hpp"), "w") as f:
+            f.write(f"#pragma once\n\nint add_{index}(int number) {{\nreturn number + {index};\n}}\n")
+    with open(join(directory, "ports.json"), "w") as f:
+        dump(manifest, f, indent=4)
+
+
+def best_of(repeat: int, function: Callable[[], None]) -> float:
+    """
+    :param repeat: How many times to run the function.
+    :param function: The function to time.
+    :return: The fastest run, in seconds.
+    """
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    from sys import modules
+    from src.compiler.Compiler import Compiler
+    from src.compiler.CompileOptions import CompileOptions
+    from src.compiler.CompileSession import CompileSession
+    from src.pybuiltins.PortLibrary import PortLibrary
+    from src.pybuiltins.PortModule import PortModule
+
+    # A program which calls a single port of the library
+    source = f"value: int = add_{args.ports // 2}(1)\nprint(value)\n"
+    # A program which only calls builtins
+    baseline_source = "value: int = 1\nprint(value)\n"
+
+    # Warm up the compiler itself
+    Compiler.compile("print(1)\n", CompileSession())
+
+    with TemporaryDirectory() as directory:
+        # The Python module library (imported again for each run)
+        with open(join(directory, "bench_port_module.py"), "w") as f:
+            f.write(generate_module(args.ports))
+        module_search_path.insert(0, directory)
+
+        # The indexes of the libraries are stored in a cache directory of their own
+        cache_directory = join(directory, "cache")
+
+        def link_and_call(library: str) -> None:
+            Compiler.compile(source, CompileSession(CompileOptions(links=(library,), cache_directory=cache_directory)))
+
+        # The index of the module's port names (see PortModule)
+        module_index = PortModule("bench_port_module", cache_directory).get_index_path()
+
+        def load_module(cold: bool) -> None:
+            modules.pop("bench_port_module", None)
+            if cold:
+                try:
+                    remove(module_index)
+                except OSError:
+                    pass
+            link_and_call("bench_port_module")
+
+        module_cold_time = best_of(args.repeat, lambda: load_module(True))
+        module_warm_time = best_of(args.repeat, lambda: load_module(False))
+
+        def load_unused() -> None:
+            modules.pop("bench_port_module", None)
+            Compiler.compile(baseline_source, CompileSession(CompileOptions(links=("bench_port_module",),
+                                                                            cache_directory=cache_directory)))
+
+        module_unused_time = best_of(args.repeat, load_unused)
+
+        # The declarative library, without its index (cold), and with it (warm)
+        library = join(directory, "library")
+        mkdir(library)
+        generate_library(library, args.ports)
+
+        def load_cold() -> None:
+            try:
+                remove(PortLibrary(library, cache_directory).get_index_path())
+            except OSError:
+                pass
+            link_and_call(library)
+
+        cold_time = best_of(args.repeat, load_cold)
+        warm_time = best_of(args.repeat, lambda: link_and_call(library))
+        builtins_time = best_of(args.repeat, lambda: Compiler.compile(baseline_source, CompileSession()))
+
+    # Print the results
+    print(f"Compiling a call to one port of a library of {args.ports} ports (best of {args.repeat}):")
+    print(f"  {'builtins only (baseline)':<32} {builtins_time * 1000:10.1f} ms")
+    print(f"  {'Python module, cold':<32} {module_cold_time * 1000:10.1f} ms")
+    print(f"  {'Python module, warm (indexed)':<32} {module_warm_time * 1000:10.1f} ms")
+    print(f"  {'Python module, warm, unused':<32} {module_unused_time * 1000:10.1f} ms")
+    print(f"  {'declarative, cold (compiled)':<32} {cold_time * 1000:10.1f} ms")
+    print(f"  {'declarative, warm (indexed)':<32} {warm_time * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
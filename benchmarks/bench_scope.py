@@ -0,0 +1,119 @@
+"""
+Benchmark for the scaling of the scope handler.
+
+For a growing amount of symbols, declares them in a module scope, creates
+a function scope for each of them (which sees every symbol declared before
+it), and looks every symbol up from the innermost scopes. The time per
+symbol should stay flat as the amount of symbols grows.
+
+Then looks the symbols up from scopes which are nested more and more
+deeply, where the time per lookup should stay flat as the depth grows.
+
+Then compiles whole generated modules with many globals and functions,
+to show the same scaling through the compiler.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_scope [--sizes N,N,...] [--depths N,N,...] [--compile-sizes N,N,...]
+"""
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from typing import List
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Scope handler scaling")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Amounts of symbols for the scope handler")
+    parser.add_argument("--depths", default="1,10,100,1000", help="Nesting depths of the scopes to look up from")
+    parser.add_argument("--compile-sizes", default="1000,5000,20000", help="Amounts of globals for whole modules")
+    return parser.parse_args()
+
+
+def generate_module(symbols: int) -> str:
+    """
+    Generates a module with many globals, and many functions which use them.
+
+    :param symbols: The amount of globals (and functions).
+    :return: The source code of the module.
+    """
+    lines: List[str] = []
+    for index in range(symbols):
+        lines.append(f"value_{index}: int = {index}")
+        lines.append(f"def func_{index}(argument: int) -> int:")
+        lines.append(f"    return argument + 1")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    from src.compiler.Compiler import Compiler
+    from src.compiler.CompileSession import CompileSession
+    from src.scopes.Scope import Scope
+    from src.scopes.objects.Type import Type
+    from src.scopes.objects.Variable import Variable
+
+    print("Scope handler (declare, create a nested scope per symbol, look up each symbol):")
+    for size in [int(size) for size in args.sizes.split(",")]:
+        start = perf_counter()
+        module_scope = Scope()
+        function_scopes: List[Scope] = []
+        for index in range(size):
+            module_scope.declare_object(Variable(f"value_{index}", Type("int")))
+            # Each function sees the globals declared before it, and declares an argument
+            function_scope = Scope(module_scope)
+            function_scope.declare_object(Variable("argument", Type("int")))
+            function_scopes.append(function_scope)
+        declared = perf_counter()
+
+        # Look every global up from the innermost scope of the last function
+        inner_scope = Scope(function_scopes[-1])
+        for index in range(size):
+            inner_scope.get_object_if_exists(f"value_{index}")
+        looked_up = perf_counter()
+
+        print(f"  {size:>8} symbols  declare {(declared - start) * 1000:9.1f} ms "
+              f"({(declared - start) / size * 1e6:6.2f} us/symbol)  "
+              f"lookup {(looked_up - declared) * 1000:9.1f} ms "
+              f"({(looked_up - declared) / size * 1e6:6.2f} us/symbol)")
+
+    print("Nested scopes (1000 symbols, looked up 10 times from the innermost scope):")
+    for depth in [int(depth) for depth in args.depths.split(",")]:
+        module_scope = Scope()
+        for index in range(1000):
+            module_scope.declare_object(Variable(f"value_{index}", Type("int")))
+        inner_scope = module_scope
+        for level in range(depth):
+            inner_scope = Scope(inner_scope)
+            inner_scope.declare_object(Variable(f"local_{level}", Type("int")))
+
+        start = perf_counter()
+        for index in range(1000):
+            inner_scope.get_object_if_exists(f"value_{index}")
+        first = perf_counter()
+        for _ in range(9):
+            for index in range(1000):
+                inner_scope.get_object_if_exists(f"value_{index}")
+        again = perf_counter()
+
+        print(f"  depth {depth:>6}  first lookup {(first - start) / 1000 * 1e6:7.2f} us/symbol  "
+              f"later lookups {(again - first) / 9000 * 1e6:6.2f} us/symbol")
+
+    print("Whole modules (a global and a function per symbol, parse only):")
+    session = CompileSession()
+    Compiler.parse("print(1)", session)
+    for size in [int(size) for size in args.compile_sizes.split(",")]:
+        source = generate_module(size)
+        start = perf_counter()
+        Compiler.parse(source, session)
+        elapsed = perf_counter() - start
+        print(f"  {size:>8} symbols  {elapsed * 1000:9.1f} ms ({elapsed / size * 1e6:7.2f} us/symbol)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for the cold start of the compiler.
+
+Imports the entry points of the compiler in fresh interpreters (with
+"python -X importtime"), and reports how long the imports took, the
+slowest modules, and any of the heavy debugging dependencies which were
+imported (these should only be imported when their debugging flag is used).
+
+Exits with an error if a heavy dependency was imported, or if an import
+took longer than the given budget, so it can guard the startup time.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_startup [--repeat R] [--budget MS] [--top N]
+"""
+from argparse import ArgumentParser, Namespace
+from re import compile as compile_regex
+from subprocess import run, PIPE
+from sys import executable
+from typing import Dict, List, Tuple
+
+# The entry points to import, by label
+ENTRY_POINTS: Dict[str, str] = {
+    "command line": "import compy",
+    "compiler": "import src.compiler.Compiler",
+    "compile server client": "import src.compiler.daemon.CompileClient",
+}
+
+# Modules which only the debugging backends may import
+HEAVY_MODULES: Tuple[str, ...] = ("tkinter", "ete3", "numpy", "PyQt5")
+
+# A line of the -X importtime output: self time, cumulative time and the (indented) module name
+IMPORT_TIME_REGEX = compile_regex(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the benchmark.
+    """
+    parser = ArgumentParser(description="Import time of the compiler's entry points")
+    parser.add_argument("--repeat", type=int, default=5, help="How many fresh interpreters to measure (best is kept)")
+    parser.add_argument("--budget", type=float, default=None, help="Fail if an entry point takes longer (ms)")
+    parser.add_argument("--top", type=int, default=5, help="How many of the slowest modules to show")
+    return parser.parse_args()
+
+
+def measure(statement: str) -> List[Tuple[str, int, int]]:
+    """
+    Runs an import statement in a fresh interpreter.
+
+    :param statement: The statement to run.
+    :return: The imported modules, as (name, self time, cumulative time) tuples, in microseconds.
+    """
+    result = run([executable, "-X", "importtime", "-c", statement], stderr=PIPE, check=True, text=True)
+    modules: List[Tuple[str, int, int]] = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_REGEX.match(line)
+        if match is not None:
+            modules.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return modules
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    args = parse_args()
+
+    failed = False
+    print(f"Import time of each entry point, best of {args.repeat}:")
+    for label, statement in ENTRY_POINTS.items():
+        # Keep the fastest run (the others were slowed down by the system)
+        runs = [measure(statement) for _ in range(args.repeat)]
+        best = min(runs, key=lambda modules: sum(self_time for _, self_time, _ in modules))
+        total = sum(self_time for _, self_time, _ in best) / 1000
+        print(f"  {label:<24} {total:10.1f} ms  ({len(best)} modules)")
+
+        # Show where the time went
+        for name, self_time, _ in sorted(best, key=lambda module: -module[1])[:args.top]:
+            print(f"    {self_time / 1000:8.1f} ms  {name}")
+
+        # Guard against the heavy dependencies, and the budget
+        heavy = sorted({name for name, _, _ in best if name.split(".")[0] in HEAVY_MODULES})
+        if heavy:
+            print(f"    FAILED: imported {', '.join(heavy)}")
+            failed = True
+        if args.budget is not None and total > args.budget:
+            print(f"    FAILED: over the budget of {args.budget:.1f} ms")
+            failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Check that the transpiled output is reproducible.
+
+Transpiles each file in fresh interpreters with different string hash
+seeds (PYTHONHASHSEED), and compares the outputs byte for byte. Any
+order which comes from a set of strings (or from object addresses)
+changes between the runs, so identical inputs would produce different
+outputs (and miss ccache, or any other content-hashed cache).
+
+Exits with an error if the outputs of a file differ. The tests run
+the same check over the examples (see tests/test_reproducible), this
+script checks other files, seeds and libraries.
+
+Usage (from the repository root):
+    python -m benchmarks.check_reproducible [--seeds S,S,...] [--links LINKS] [files ...]
+"""
+from argparse import ArgumentParser, Namespace
+from glob import glob
+from hashlib import sha256
+from os import environ
+from os.path import basename, join
+from subprocess import run, DEVNULL
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import Dict, List
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the check.
+    """
+    parser = ArgumentParser(description="Reproducibility of the transpiled output")
+    parser.add_argument("files", nargs="*", help="The files to transpile (defaults to the examples)")
+    parser.add_argument("--seeds", default="0,1,2,3,random", help="The hash seeds to transpile with")
+    parser.add_argument("--links", default="examples.example_port", help="The port libraries to link")
+    return parser.parse_args()
+
+
+def transpile(path: str, seed: str, links: str, output_path: str) -> bytes:
+    """
+    Transpiles a file in a fresh interpreter.
+
+    :param path: The path of the file.
+    :param seed: The hash seed of the interpreter.
+    :param links: The port libraries to link.
+    :param output_path: The path to write the output to.
+    :return: The transpiled output.
+    """
+    # The cache and the compile server would return the output of another run
+    run([executable, "compy.py", "--no-cache", "--no-daemon", "-l", links, "-o", output_path, path],
+        env=dict(environ, PYTHONHASHSEED=seed), stdout=DEVNULL, check=True)
+    with open(output_path, "rb") as f:
+        return f.read()
+
+
+def main() -> None:
+    """
+    Runs the check.
+    """
+    args = parse_args()
+    files: List[str] = args.files or sorted(
+        path for path in glob(join("examples", "example_*.py")) if basename(path) != "example_port.py"
+    )
+    seeds: List[str] = args.seeds.split(",")
+
+    failed = False
+    print(f"Transpiling {len(files)} files with the hash seeds {', '.join(seeds)}:")
+    with TemporaryDirectory() as directory:
+        for path in files:
+            # The hash of the output of each seed
+            hashes: Dict[str, str] = {
+                seed: sha256(transpile(path, seed, args.links, join(directory, "output.cpp"))).hexdigest()
+                for seed in seeds
+            }
+            if len(set(hashes.values())) == 1:
+                print(f"  {path:<40} same output ({hashes[seeds[0]][:12]})")
+            else:
+                print(f"  {path:<40} FAILED: " + ", ".join(f"{seed}={digest[:12]}" for seed, digest in hashes.items()))
+                failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Generates large synthetic programs written in the ComPy syntax subset.
+Used by the benchmarks to measure the compiler on inputs much larger than the examples.
+"""
+from os import makedirs
+from os.path import join
+from typing import List
+
+
+class ProgramGenerator:
+    """
+    Static class which builds ComPy-subset source code.
+    """
+
+    @classmethod
+    def generate_module(cls, functions: int = 500, depth: int = 4) -> str:
+        """
+        Generates a module made of many functions, each with nested
+        conditionals and loops, followed by code which calls them.
+
+        :param functions: The amount of functions to generate.
+        :param depth: How deeply the conditionals in each function are nested.
+        :return: The source code of the module.
+        """
+        # Generate each function definition
+        lines: List[str] = []
+        for index in range(functions):
+            lines.extend(cls.generate_function(index, depth))
+            lines.append("")
+
+        # Call each function from the main code
+        for index in range(functions):
+            lines.append(f"result_{index}: int = func_{index}({index})")
+            lines.append(f"print(\"Result {index}: \" + str(result_{index}))")
+
+        # Join the lines together
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def generate_program(cls, directory: str, modules: int = 20, functions: int = 100, depth: int = 4,
+                         classes: int = 5, package: str = "generated") -> str:
+        """
+        Writes a program made of many modules to a directory: a package of
+        modules (each with functions, classes, loops and calls to ported
+        functions), and a main module which imports all of them.
+
+        The program calls the 'add' and 'print_sum' ports, so it must be
+        compiled with the examples/example_ports library linked, and with
+        the directory as a source root.
+
+        :param directory: The directory to write the program to.
+        :param modules: The amount of imported modules.
+        :param functions: The amount of functions in each module (and in the main module).
+        :param depth: How deeply the conditionals and loops in each function are nested.
+        :param classes: The amount of classes in each module.
+        :param package: The name of the package of the imported modules.
+        :return: The path of the main module.
+        """
+        makedirs(join(directory, package), exist_ok=True)
+        with open(join(directory, package, "__init__.py"), "w") as f:
+            f.write("")
+
+        # Write each imported module
+        for module in range(modules):
+            with open(join(directory, package, f"module_{module}.py"), "w") as f:
+                f.write(cls.generate_library_module(f"m{module}_", functions, depth, classes))
+
+        # The main module imports every other module, then runs code of its own
+        lines = [f"import {package}.module_{module}" for module in range(modules)]
+        lines.append("")
+        lines.append(cls.generate_module(functions, depth))
+        main_path = join(directory, "main.py")
+        with open(main_path, "w") as f:
+            f.write("\n".join(lines))
+        return main_path
+
+    @classmethod
+    def generate_library_module(cls, prefix: str, functions: int, depth: int, classes: int) -> str:
+        """
+        Generates a module which is imported by the main module.
+        All of its names start with a prefix, as the modules are merged into a single output.
+
+        :param prefix: The prefix of the names of the module.
+        :param functions: The amount of functions to generate.
+        :param depth: How deeply the conditionals and loops in each function are nested.
+        :param classes: The amount of classes to generate.
+        :return: The source code of the module.
+        """
+        lines: List[str] = []
+        # Alternate between the two kinds of functions
+        for index in range(functions):
+            if index % 2 == 0:
+                lines.extend(cls.generate_function(index, depth, prefix))
+            else:
+                lines.extend(cls.generate_loop_function(index, depth, prefix))
+            lines.append("")
+
+        for index in range(classes):
+            lines.extend(cls.generate_class(index, prefix))
+            lines.append("")
+
+        # Use each class, then call each function
+        for index in range(classes):
+            lines.append(f"{prefix}counter_{index}: {prefix}Counter_{index} = {prefix}Counter_{index}()")
+            lines.append(f"print({prefix}counter_{index}.step({index}))")
+        for index in range(functions):
+            lines.append(f"print_sum({prefix}func_{index}({index}), {index})")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def generate_loop_function(index: int, depth: int, prefix: str = "") -> List[str]:
+        """
+        Generates a single function definition, made of nested loops which call a ported function.
+
+        :param index: A unique index, used to name the function.
+        :param depth: How deeply the loops in the function are nested.
+        :param prefix: The prefix of the function's name.
+        :return: The lines of source code of the function.
+        """
+        lines = [
+            f"def {prefix}func_{index}(value: int) -> int:",
+            "    total: int = add(value, 1)",
+        ]
+
+        # Nest the loops, one indentation level each
+        for level in range(depth):
+            indent = "    " * (level + 1)
+            lines.append(f"{indent}for i_{level} in range({level + 2}):")
+            lines.append(f"{indent}    total = add(total, i_{level} * {level + 1})")
+
+        lines.extend([
+            "    if total > 1000 or total < 0:",
+            "        total = total % 1000",
+            "    return total",
+        ])
+        return lines
+
+    @staticmethod
+    def generate_class(index: int, prefix: str = "") -> List[str]:
+        """
+        Generates a single class definition, with a field, a constructor and a method.
+
+        :param index: A unique index, used to name the class.
+        :param prefix: The prefix of the class's name.
+        :return: The lines of source code of the class.
+        """
+        return [
+            f"class {prefix}Counter_{index}:",
+            "    count: int = 0",
+            "",
+            "    def __init__(self) -> None:",
+            f"        start: int = {index}",
+            "        print(start)",
+            "",
+            "    def step(self, amount: int) -> int:",
+            "        self.count += add(amount, 1)",
+            "        return self.count",
+        ]
+
+    @staticmethod
+    def generate_function(index: int, depth: int, prefix: str = "") -> List[str]:
+        """
+        Generates a single function definition.
+
+        :param index: A unique index, used to name the function.
+        :param depth: How deeply the conditionals in the function are nested.
+        :param prefix: The prefix of the function's name.
+        :return: The lines of source code of the function.
+        """
+        # Function header and local variable
+        lines = [
+            f"def {prefix}func_{index}(value: int) -> int:",
+            "    total: int = value * 2 + 1",
+        ]
+
+        # Nest the conditionals, one indentation level each
+        for level in range(depth):
+            indent = "    " * (level + 1)
+            lines.append(f"{indent}if total > {level} and value != {level + 1}:")
+            lines.append(f"{indent}    total = total + (value * {level + 2} - {level}) % 7")
+
+        # A loop with an augmented assignment
+        lines.extend([
+            "    while total < 100:",
+            "        total += 3",
+            f"    print(\"{prefix}func_{index}: \" + str(total))",
+            "    return total",
+        ])
+        return lines
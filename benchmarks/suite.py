@@ -0,0 +1,315 @@
+"""
+Compiler throughput benchmark suite.
+
+'run' generates a large program (see ProgramGenerator.generate_program),
+compiles it, and times each phase of the compilation:
+ - parse:     ast.parse of every module of the program,
+ - build:     the construction of the PyExpression trees (without parsing),
+ - transpile: module.transpile(),
+ - write:     writing the output to a file.
+It then compiles the program once more while tracing allocations, for
+the peak and retained memory of each phase (with --memory-report, the
+memory retained by the tree is attributed to its structures as well, see
+MemoryReport), and appends the results to a JSON history.
+
+'compare' compares a run of the history with an earlier run of the same
+scale, and fails if a phase got slower (or used more memory) by more than
+a threshold, so the compiler's performance can be tracked across releases.
+
+Usage (from the repository root):
+    python -m benchmarks.suite run [--scale small|medium|large] [--modules N] [--functions N] [--depth D]
+                                   [--classes N] [--repeat R] [--label LABEL] [--history PATH] [--memory-report]
+    python -m benchmarks.suite compare [--baseline RUN] [--current RUN] [--threshold T] [--history PATH]
+"""
+from argparse import ArgumentParser, Namespace
+from ast import parse
+from datetime import datetime, timezone
+from glob import glob
+from json import dump, load
+from os import replace
+from os.path import abspath, isfile, join
+from platform import python_version
+from subprocess import run as run_process, DEVNULL, PIPE
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.generator import ProgramGenerator
+
+# The ports library which the generated programs call
+PORTS_LIBRARY: str = abspath(join("examples", "example_ports"))
+# The default path of the history
+DEFAULT_HISTORY: str = "bench_history.json"
+# The phases of a compilation, in order
+PHASES: Tuple[str, ...] = ("parse", "build", "transpile", "write")
+# The sizes of the generated programs (amount of imported modules, functions per module, depth, classes per module)
+SCALES: Dict[str, Dict[str, int]] = {
+    "small": {"modules": 5, "functions": 40, "depth": 3, "classes": 2},
+    "medium": {"modules": 20, "functions": 100, "depth": 4, "classes": 5},
+    "large": {"modules": 50, "functions": 200, "depth": 5, "classes": 10},
+}
+# Changes in time smaller than this are noise, and are never reported as regressions (in seconds)
+MIN_TIME_CHANGE: float = 0.002
+
+# A single run of the history
+Run = Dict[str, Any]
+
+
+def parse_args() -> Namespace:
+    """
+    :return: The parsed command line arguments of the suite.
+    """
+    parser = ArgumentParser(description="Compiler throughput benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Benchmark the compiler, and add the results to the history")
+    run_parser.add_argument("--scale", choices=SCALES, default="medium", help="The size of the generated program")
+    for name in SCALES["medium"]:
+        run_parser.add_argument(f"--{name}", type=int, help=f"Overrides the amount of {name} of the scale")
+    run_parser.add_argument("--repeat", type=int, default=3, help="How many times to compile (best time is kept)")
+    run_parser.add_argument("--label", help="A name for the run (defaults to the current git commit)")
+    run_parser.add_argument("--history", default=DEFAULT_HISTORY, help="The JSON file to add the results to")
+    run_parser.add_argument("--memory-report", action="store_true", help="Attribute the memory of the tree to its "
+                                                                         "structures (node classes, scopes, AST...)")
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs of the history")
+    compare_parser.add_argument("--baseline", help="The run to compare with, by index or label (defaults to the "
+                                                   "latest earlier run of the same scale)")
+    compare_parser.add_argument("--current", default="-1", help="The run to check, by index or label (defaults to "
+                                                                "the latest run)")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="The relative slowdown (or memory "
+                                                                             "growth) to report as a regression")
+    compare_parser.add_argument("--history", default=DEFAULT_HISTORY, help="The JSON file of the results")
+    return parser.parse_args()
+
+
+def compile_program(directory: str, main_path: str,
+                    measure: Callable[[str, Callable[[], Any]], Any]) -> int:
+    """
+    Compiles a generated program, one phase at a time.
+
+    :param directory: The directory of the program (its source root).
+    :param main_path: The path of the main module.
+    :param measure: Runs each phase (called with the name of the phase, and a function which runs it).
+    :return: The size of the output, in characters.
+    """
+    from src.compiler.CompileOptions import CompileOptions
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.Compiler import Compiler
+
+    sources: Dict[str, str] = {}
+    for path in sorted(glob(join(directory, "**", "*.py"), recursive=True)):
+        with open(path) as f:
+            sources[path] = f.read()
+
+    # A new session each time, so no module is reused from an earlier compilation
+    session = CompileSession(CompileOptions(links=(PORTS_LIBRARY,), source_roots=(directory,)))
+    measure("parse", lambda: [parse(source) for source in sources.values()])
+    # The imported modules are parsed while the tree is built (the parse phase is subtracted from it later)
+    module = measure("build", lambda: Compiler.parse(sources[main_path], session, main_path))
+    code: str = measure("transpile", module.transpile)
+
+    def write() -> None:
+        with open(join(directory, "output.cpp"), "w") as f:
+            f.write(code)
+
+    measure("write", write)
+    return len(code)
+
+
+def run_benchmark(args: Namespace) -> Run:
+    """
+    Generates a program, and benchmarks its compilation.
+
+    :param args: The parsed command line arguments.
+    :return: The results of the run.
+    """
+    from src.compiler.MemoryReport import MemoryReport
+
+    scale = dict(SCALES[args.scale])
+    for name in scale:
+        if getattr(args, name) is not None:
+            scale[name] = getattr(args, name)
+
+    with TemporaryDirectory() as directory:
+        main_path = ProgramGenerator.generate_program(directory, **scale)
+        lines = 0
+        for path in glob(join(directory, "**", "*.py"), recursive=True):
+            with open(path) as f:
+                lines += len(f.readlines())
+
+        # Time each phase (the best time of all the repeats)
+        times: Dict[str, float] = {}
+
+        def time_phase(phase: str, function: Callable[[], Any]) -> Any:
+            start_time = perf_counter()
+            result = function()
+            elapsed = perf_counter() - start_time
+            times[phase] = min(times.get(phase, elapsed), elapsed)
+            return result
+
+        output_size = 0
+        for _ in range(args.repeat):
+            output_size = compile_program(directory, main_path, time_phase)
+        # The build phase parses the imported modules as well
+        times["build"] = max(0.0, times["build"] - times["parse"])
+
+        # Trace the allocations of each phase (in a separate compilation, as tracing slows it down)
+        memory = MemoryReport()
+
+        def trace_phase(phase: str, function: Callable[[], Any]) -> Any:
+            with memory.measure(phase):
+                result = function()
+            # The build phase returns the tree, whose memory is attributed before it is transpiled
+            if phase == "build" and args.memory_report:
+                memory.record_tree(result)
+            return result
+
+        try:
+            compile_program(directory, main_path, trace_phase)
+        finally:
+            memory.stop()
+        if args.memory_report:
+            memory.report()
+        memory_phases = memory.to_dict()["phases"]
+        peaks: Dict[str, int] = {phase: memory_phases[phase]["peak"] for phase in PHASES}
+
+    result: Run = {
+        "label": args.label or get_commit(),
+        "commit": get_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": python_version(),
+        "scale": scale,
+        "lines": lines,
+        "output_size": output_size,
+        "times": {phase: times[phase] for phase in PHASES},
+        "total_time": sum(times.values()),
+        "peak_memory": {phase: peaks[phase] for phase in PHASES},
+        "total_peak_memory": max(peaks.values()),
+        "retained_memory": {phase: memory_phases[phase]["retained"] for phase in PHASES},
+    }
+    if args.memory_report:
+        result["memory_by_structure"] = memory.to_dict()["categories"]
+    return result
+
+
+def get_commit() -> Optional[str]:
+    """
+    :return: The current git commit (None if it is unknown).
+    """
+    try:
+        result = run_process(["git", "rev-parse", "--short", "HEAD"], stdout=PIPE, stderr=DEVNULL, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def read_history(path: str) -> List[Run]:
+    """
+    :param path: The path of the history.
+    :return: The runs of the history, oldest first (empty if there is no history yet).
+    """
+    if not isfile(path):
+        return []
+    with open(path) as f:
+        history: List[Run] = load(f)
+    return history
+
+
+def write_history(path: str, history: List[Run]) -> None:
+    """
+    Writes the history (to a temporary file first, so it is never left half-written).
+
+    :param path: The path of the history.
+    :param history: The runs of the history, oldest first.
+    """
+    with open(path + ".tmp", "w") as f:
+        dump(history, f, indent=2)
+    replace(path + ".tmp", path)
+
+
+def find_run(history: List[Run], reference: str) -> int:
+    """
+    :param history: The runs of the history.
+    :param reference: The index of a run (negative indices count from the end), or its label.
+    :return: The index of the run (the latest run with the label).
+    """
+    try:
+        index = int(reference)
+    except ValueError:
+        for index in reversed(range(len(history))):
+            if history[index]["label"] == reference:
+                return index
+        raise SystemExit(f"No run is labeled '{reference}'")
+    if not -len(history) <= index < len(history):
+        raise SystemExit(f"There is no run {index} (the history has {len(history)} runs)")
+    return index % len(history)
+
+
+def compare_runs(baseline: Run, current: Run, threshold: float) -> bool:
+    """
+    Prints the changes between two runs.
+
+    :param baseline: The earlier run.
+    :param current: The run to check.
+    :param threshold: The relative change to report as a regression.
+    :return: True if any phase regressed.
+    """
+    print(f"Comparing '{current['label']}' ({current['date']}) with '{baseline['label']}' ({baseline['date']}):")
+    rows: List[Tuple[str, float, float, float]] = [
+        (f"{phase} time", baseline["times"][phase], current["times"][phase], MIN_TIME_CHANGE) for phase in PHASES
+    ]
+    rows.append(("total time", baseline["total_time"], current["total_time"], MIN_TIME_CHANGE))
+    rows.extend((f"{phase} memory", baseline["peak_memory"][phase], current["peak_memory"][phase], 0)
+                for phase in PHASES)
+    rows.append(("peak memory", baseline["total_peak_memory"], current["total_peak_memory"], 0))
+
+    regressed = False
+    for name, before, after, min_change in rows:
+        change = (after - before) / before if before else 0.0
+        is_regression = change > threshold and after - before > min_change
+        regressed = regressed or is_regression
+        unit = 1000 if name.endswith("time") else 1 / 1024 / 1024
+        print(f"  {name:<18} {before * unit:10.1f} -> {after * unit:10.1f} {'ms' if unit == 1000 else 'MB'}  "
+              f"{change * 100:+7.1f}%{'  REGRESSION' if is_regression else ''}")
+    return regressed
+
+
+def main() -> None:
+    """
+    Runs the suite.
+    """
+    args = parse_args()
+    history = read_history(args.history)
+
+    if args.command == "run":
+        result = run_benchmark(args)
+        history.append(result)
+        write_history(args.history, history)
+        print(f"Compiled {result['lines']} lines ({result['output_size'] / 1024:.0f} KB of output), "
+              f"run {len(history) - 1} of {args.history}:")
+        for phase in PHASES:
+            print(f"  {phase:<10} {result['times'][phase] * 1000:10.1f} ms  "
+                  f"peak {result['peak_memory'][phase] / 1024 / 1024:8.1f} MB")
+        print(f"  {'total':<10} {result['total_time'] * 1000:10.1f} ms  "
+              f"peak {result['total_peak_memory'] / 1024 / 1024:8.1f} MB")
+        return
+
+    if not history:
+        raise SystemExit(f"The history {args.history} is empty")
+    current = find_run(history, args.current)
+    if args.baseline is not None:
+        baseline = find_run(history, args.baseline)
+    else:
+        # The latest earlier run of the same program
+        earlier = [index for index in range(current) if history[index]["scale"] == history[current]["scale"]]
+        if not earlier:
+            raise SystemExit("There is no earlier run of the same scale to compare with")
+        baseline = earlier[-1]
+
+    if compare_runs(history[baseline], history[current], args.threshold):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
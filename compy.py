@@ -4,94 +4,366 @@ Main script for ComPy.
 Takes command line arguments, parses them, and
 performs the logic related to it.
 """
-from argparse import ArgumentParser, FileType
-from os.path import getsize
+from argparse import ArgumentParser
+from dataclasses import replace
+from os.path import getsize, abspath
 from platform import system
+from signal import signal, default_int_handler, SIGTERM
 from subprocess import Popen, DEVNULL
-from typing import IO
+from os.path import isdir, isfile
+from sys import argv, stderr
+from time import perf_counter
+from typing import Optional
 
+from src import __version__, __stable__
 from src.compiler.Args import Args
-from src.compiler.Compiler import Compiler
+from src.compiler.BuildStats import BuildStats
+from src.compiler.MemoryReport import MemoryReport
+from src.compiler.CompileOptions import CompileOptions
 from src.compiler.Util import Util
+from src.compiler.daemon.CompileClient import CompileClient
+from src.compiler.daemon.CompileRequest import CompileRequest
+from src.structures.Errors import OutputCollisionError
 
-# Version information, will be moved to a setup.py in the future
-__version__ = 1.0
-__stable__ = False
-
-# Print the relevant version information
-print(f"ComPy Release v{__version__} {'Stable' if __stable__ else 'Alpha (might have bugs/unsupported features)'}")
+# The compiler itself is only imported when this process transpiles,
+# so handing a file to the compile server is quick.
 
 # Get arguments with argument parser class
 parser = ArgumentParser()
 # Add args to the parser
-parser.add_argument('file', type=FileType(), help='The file to compile')
-parser.add_argument('-o', '--output', type=FileType('w'), help='The file to output the ASM code to')
-parser.add_argument('-l', '--links', help='Links the ported libraries to the executable '
-                                          '(seperate with the ; character)')
+parser.add_argument('files', nargs='+', help='The file to compile (or multiple files and directories, '
+                                             'which are compiled as a batch)')
+parser.add_argument('-o', '--output', help='The file to output the ASM code to (or the directory to output to, '
+                                           'when compiling a batch)')
+parser.add_argument('-j', '--jobs', type=int, default=1, help='The amount of processes to compile a batch with')
+parser.add_argument('-l', '--links', help='Links the ported libraries to the executable, by module name or by '
+                                          'directory (seperate with the ; character)')
 parser.add_argument('-g', '--compile', action='store_true', help='Compiles the output to an executable (you must have '
                                                                  'g++ installed and on the PATH)')
 parser.add_argument('-c', '--compress', action='store_true', help='Compresses the output executable (you must have UPX '
                                                                   'installed and on the PATH)')
+parser.add_argument('-O', dest='optimization_level', type=int, choices=range(4), default=0, metavar='LEVEL',
+                    help='The optimization level, from -O0 (no optimization passes, the default) to -O3')
+parser.add_argument('--time-passes', action='store_true', help='Prints the time of each optimization pass')
+parser.add_argument('--backend', choices=('tree', 'ir'), default='tree', help='Prints the output code from the tree '
+                                                                            '(the default), or from the typed IR')
+parser.add_argument('--emit-ir', action='store_true', help='Writes the typed IR of the file next to the output, as '
+                                                           'text (<output>.ir)')
 parser.add_argument('-dg', '--debug-gui', action='store_true', help='Opens the debugging GUI, mainly used to display '
                                                                     'information about the AST')
 parser.add_argument('-dt', '--debug-text', action='store_true', help='Prints out more logging information, mainly the '
                                                                      'AST tree in text form')
 parser.add_argument('-di', '--debug-image', action='store_true', help='Renders the AST as an image')
+parser.add_argument('--profile-compiler', action='store_true', help='Profiles the compiler itself, per node class and '
+                                                                    'source line (the collapsed stacks are written '
+                                                                    'next to the output, for flame graph tools)')
+parser.add_argument('--stats-json', metavar='PATH', help='Writes the statistics of the build (the time of each phase, '
+                                                         'node counts, output sizes, peak memory...) to a JSON file')
+parser.add_argument('--memory-report', action='store_true', help='Reports the peak and retained memory of each phase, '
+                                                                 'and the memory held by each structure of the tree')
+parser.add_argument('--no-cache', action='store_true', help='Always transpile the file, without reading or writing '
+                                                            'the transpilation cache')
+parser.add_argument('--source-roots', help='The directories to search imported modules in (seperate with the ; '
+                                         'character, defaults to the Python module search path)')
+parser.add_argument('--cache-dir', help='The directory of the transpilation cache (can be shared between builds, '
+                                         'defaults to ~/.cache/compy)')
+parser.add_argument('--no-daemon', action='store_true', help='Always transpile in this process, even if a compile '
+                                                             'server is running (see "compy.py serve")')
+parser.add_argument('--daemon-address', help='The address of the compile server (defaults to a socket in a '
+                                             'directory of the current user)')
+
+# Get arguments of the compile server
+serve_parser = ArgumentParser(prog="compy.py serve", description='Runs a compile server, which keeps the compiler '
+                                                                 'loaded and transpiles files for later runs of '
+                                                                 'compy.py (until interrupted)')
+serve_parser.add_argument('--daemon-address', help='The address to listen on (defaults to a socket in a directory of '
+                                                   'the current user)')
+serve_parser.add_argument('--max-modules', type=int, default=256, help='The maximum amount of parsed imported '
+                                                                       'modules to keep in memory')
+
+
+def transpile_with_daemon(source: str, source_path: str, options: CompileOptions) -> Optional[str]:
+    """
+    Transpiles a file with the compile server, if one is running.
+
+    :param source: The source code of the file.
+    :param source_path: The path of the file.
+    :param options: The options to transpile with.
+    :return: The transpiled code, or None if there is no server to transpile it.
+    """
+    client = CompileClient.connect(Args().get_args().daemon_address)
+    if client is None:
+        return None
+
+    # Local imports to avoid loading the whole compiler
+    from src.compiler.ModuleResolver import ModuleResolver
+
+    # The server runs in another directory (and with another module search path),
+    # so every path is sent as an absolute one
+    options = replace(options, source_roots=tuple(
+        abspath(root) for root in (options.source_roots or ModuleResolver.get_default_roots())
+    ), links=tuple(
+        # Declarative port libraries are directories (the others are module names)
+        abspath(link) if isdir(link) else link for link in options.links
+    ))
+    request = CompileRequest(__version__, source, abspath(source_path), options)
+
+    print("Transpiling the file with the compile server...")
+    try:
+        with client:
+            response = client.compile(request)
+    except (OSError, EOFError):
+        # The server stopped while transpiling
+        return None
+
+    # Report errors like the compiler would, without a stack trace (it is in the server's process)
+    if response.error is not None:
+        print(f"Transpilation failed: {response.error}", file=stderr)
+        raise SystemExit(1)
+    print(f"{'Loaded from the cache' if response.cached else 'Successfully transpiled'} "
+          f"in {response.seconds * 1000:.1f} ms!")
+    return response.code
+
+
+def transpile_locally(source: str, source_path: str, options: CompileOptions, output_path: str,
+                      stats: Optional[BuildStats] = None, memory_report: Optional[MemoryReport] = None) -> None:
+    """
+    Transpiles a file in this process.
+
+    :param source: The source code of the file.
+    :param source_path: The path of the file.
+    :param options: The options to transpile with.
+    :param output_path: The path of the file to write the transpiled code to.
+    :param stats: The statistics of the build (None if they are not collected).
+    :param memory_report: The memory report of the build (None if the memory is not reported).
+    """
+    # Import locally, as the compiler is only needed when transpiling in this process
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.Compiler import Compiler
+    from src.compiler.cache.TranspileCache import TranspileCache
+
+    # Create the compilation session out of the options
+    session = CompileSession(options, stats=stats, memory_report=memory_report)
+
+    # Use the cache, unless it was disabled (the debuggers, the memory report and the IR need to parse the file anyway)
+    cache: Optional[TranspileCache] = None
+    cache_key: Optional[str] = None
+    if options.cache_directory is not None and not options.is_debug() and memory_report is None \
+            and not Args().get_args().emit_ir:
+        # Look up the file in the cache
+        with session.measure("cache"):
+            cache = TranspileCache(options.cache_directory)
+            cache_key = cache.get_key(source, session, source_path)
+            compiled_text = cache.load(cache_key, session)
+
+        # If the file was cached, then there is nothing to parse
+        if compiled_text is not None:
+            print("Loaded the transpiled file from the cache!")
+            with session.measure("write"):
+                write_output(compiled_text, output_path)
+            if stats is not None:
+                stats.record("cached", True)
+            return
+
+    # Compile the file straight into the output file
+    print("Parsing and transpiling the file...")
+    module = Compiler.parse(source, session, source_path, cache.get_definitions() if cache is not None else None)
+    # Attribute the memory of the tree (before it is transpiled, which only adds the output)
+    if memory_report is not None:
+        memory_report.record_tree(module)
+    print(f"Writing to output file '{output_path}'...")
+    Compiler.transpile_to_file(module, output_path, output_path + ".ir" if Args().get_args().emit_ir else None)
+    print("Successfully transpiled!")
+    if Args().get_args().emit_ir:
+        print(f"Wrote the IR to '{output_path}.ir'")
+    if stats is not None:
+        stats.record("cached", False)
+        stats.record_tree(module)
+
+    # Print where the compiler spent its time
+    if options.profile_compiler:
+        session.get_profiler().report(output_path + ".folded")
+    # Print the time of each optimization pass
+    if Args().get_args().time_passes:
+        session.get_pass_manager().report()
+    if stats is not None:
+        stats.record("passes", session.get_pass_manager().get_times())
+    # Print where the compiler used its memory
+    if memory_report is not None:
+        memory_report.report()
+
+    # Store it for the next time
+    if cache is not None and cache_key is not None:
+        with session.measure("cache"), open(output_path, "r") as ioStream:
+            cache.store(cache_key, module, ioStream.read())
+
+
+def write_output(compiled_text: str, output_path: str) -> None:
+    """
+    Writes transpiled code which was not transpiled in this process (by the compile server, or from the cache).
+
+    :param compiled_text: The transpiled code.
+    :param output_path: The path of the file to write the transpiled code to.
+    """
+    print(f"Writing to output file '{output_path}'...")
+    with open(output_path, "w") as ioStream:
+        ioStream.write(compiled_text)
+
+
+def compile_file() -> None:
+    """
+    Compiles a single file, as specified by the command line arguments.
+    """
+    # Collect the statistics of the build, if requested
+    stats: Optional[BuildStats] = BuildStats() if Args().get_args().stats_json else None
+    # Trace the memory of the build, if requested (before anything is read)
+    memory_report: Optional[MemoryReport] = MemoryReport() if Args().get_args().memory_report else None
+
+    # Get the source file
+    source_path: str = Args().get_args().files[0]
+    # Read the source file
+    print("Reading source file...")
+    with BuildStats.measure_optional(stats, "read"), MemoryReport.measure_optional(memory_report, "read"), \
+            open(source_path, "r") as ioStream:
+        source = ioStream.read()
+
+    # If there is an output file, then write there
+    # Otherwise, add .cpp to the file and write there
+    output_path: str = Args().get_args().output if Args().get_args().output else source_path + '.cpp'
+
+    # Transpile it with the compile server if one is running
+    # (the debuggers must run in this process, and so must the phases which the statistics measure, and the IR)
+    options = CompileOptions.from_args(Args().get_args())
+    compiled_text: Optional[str] = None
+    if not Args().get_args().no_daemon and not options.is_debug() and stats is None and memory_report is None \
+            and not Args().get_args().time_passes and not Args().get_args().emit_ir:
+        compiled_text = transpile_with_daemon(source, source_path, options)
+    # Otherwise, transpile it here (straight into the output file)
+    if compiled_text is not None:
+        write_output(compiled_text, output_path)
+    else:
+        transpile_locally(source, source_path, options, output_path, stats, memory_report)
+
+    # If compilation is enabled
+    if Args().get_args().compile:
+        # Determine executable file name
+        exe_path: str = output_path + ".exe" if system() == "Windows" else output_path.replace(".", "_")
+
+        # Run G++ to compile the file
+        print(f"Compiling to file '{exe_path}'...")
+        with BuildStats.measure_optional(stats, "g++"):
+            Popen([
+                # Output options and warnings
+                "g++", "-o", exe_path, "-fconcepts",
+                # Optimizations
+                "-Os", "-s", "-fno-zero-initialized-in-bss", "-ffunction-sections", "-fdata-sections",
+                "-Wl,--gc-sections",
+                # Input file
+                output_path
+            ]).wait()
+
+        # Get output file size
+        output_size = getsize(exe_path)
+        print(f"Successfully compiled: {Util.represent_file_size(output_size)}")
+        if stats is not None:
+            stats.record("binary_size", output_size)
+
+        # If compression is enabled
+        if Args().get_args().compress:
+            # Add even more optimizations (packing)
+            print(f"Packing file '{exe_path}'...")
+            with BuildStats.measure_optional(stats, "upx"):
+                Popen(["upx", "-q", "--best", exe_path], stdout=DEVNULL, stderr=DEVNULL).wait()
+
+            # Get new output file size
+            packed_size = getsize(exe_path)
+            print(
+                f"Successfully packed: {Util.represent_file_size(output_size)} -> "
+                f"{Util.represent_file_size(packed_size)} ({round(100 * packed_size / output_size)}% ratio)")
+            if stats is not None:
+                stats.record("packed_size", packed_size)
+
+    # Write the statistics of the build
+    if stats is not None:
+        stats.record("source_size", len(source.encode()))
+        stats.record("output_size", getsize(output_path))
+        stats.write(Args().get_args().stats_json)
+        print(f"Wrote the statistics of the build to '{Args().get_args().stats_json}'")
+
+
+def compile_batch() -> None:
+    """
+    Compiles multiple files (or directories), as specified by the command line arguments.
+    """
+    # Import locally, as the compiler is only needed when transpiling in this process
+    from src.compiler.BatchCompiler import BatchCompiler
+
+    # Find the files to compile (the inputs must not be written to the same output files)
+    try:
+        jobs = BatchCompiler.collect_jobs(Args().get_args().files, Args().get_args().output)
+    except OutputCollisionError as e:
+        parser.error(str(e))
+    print(f"Transpiling {len(jobs)} files with {Args().get_args().jobs} processes...")
+
+    # Compile them
+    start = perf_counter()
+    results = BatchCompiler.run(Args().get_args(), jobs)
+    BatchCompiler.print_summary(results, perf_counter() - start)
+
+    # Fail if any of the files failed
+    if any(result.error is not None for result in results):
+        raise SystemExit(1)
+
+
+def main() -> None:
+    """
+    Main function, parses the command line arguments and compiles the input.
+    """
+    # Print the relevant version information
+    print(f"ComPy Release v{__version__} {'Stable' if __stable__ else 'Alpha (might have bugs/unsupported features)'}")
+
+    # Run the compile server instead, if requested
+    if argv[1:2] == ["serve"]:
+        serve()
+        return
+
+    # Parse args, then create
+    # a singleton from arguments
+    Args(parser.parse_args())
+
+    # A single file is compiled the regular way
+    if len(Args().get_args().files) == 1 and isfile(Args().get_args().files[0]) and Args().get_args().jobs <= 1:
+        compile_file()
+        return
+
+    # A batch can't be debugged or compiled to executables
+    if CompileOptions.from_args(Args().get_args()).is_debug() or Args().get_args().compile or Args().get_args().compress \
+            or Args().get_args().stats_json or Args().get_args().memory_report or Args().get_args().time_passes \
+            or Args().get_args().emit_ir:
+        parser.error("the debugging flags, -g/-c, --stats-json, --memory-report, --time-passes and --emit-ir can only "
+                     "be used when compiling a single file")
+    compile_batch()
+
+
+def serve() -> None:
+    """
+    Runs the compile server, as specified by the command line arguments.
+    """
+    # Import locally, as only the server needs to load the compiler up front
+    from src.compiler.daemon.CompileServer import CompileServer
+
+    # Stop cleanly when terminated as well (so the socket is removed)
+    signal(SIGTERM, default_int_handler)
+
+    serve_args = serve_parser.parse_args(argv[2:])
+    server = CompileServer(serve_args.daemon_address, serve_args.max_modules)
+    print(f"Compile server listening on '{server.get_address()}' (press Ctrl+C to stop)...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Compile server stopped.")
+
 
-# Parse args, then create
-# a singleton from arguments
-Args(parser.parse_args())
-
-# Get the source file
-ioStream: IO = Args().get_args().file
-# Read the source file
-print("Reading source file...")
-source = ioStream.read()
-# Close the file
-ioStream.close()
-
-# Compile the file to a string
-print("Parsing and transpiling the file...")
-compiled_text: str = Compiler.compile(source)
-print("Successfully transpiled!")
-
-# If there is an output file, then write there
-# Otherwise, add .cpp to the file and write there
-ioStream = Args().get_args().output if Args().get_args().output else open(Args().get_args().file.name + '.cpp', "w")
-# Write to the file
-print(f"Writing to output file '{ioStream.name}'...")
-ioStream.write(compiled_text)
-# Close the stream
-ioStream.close()
-
-# If compilation is enabled
-if Args().get_args().compile:
-    # Determine executable file name
-    exe_path: str = ioStream.name + ".exe" if system() == "Windows" else ioStream.name.replace(".", "_")
-
-    # Run G++ to compile the file
-    print(f"Compiling to file '{exe_path}'...")
-    Popen([
-        # Output options and warnings
-        "g++", "-o", exe_path, "-fconcepts",
-        # Optimizations
-        "-Os", "-s", "-fno-zero-initialized-in-bss", "-ffunction-sections", "-fdata-sections", "-Wl,--gc-sections",
-        # Input file
-        ioStream.name
-    ]).wait()
-
-    # Get output file size
-    output_size = getsize(exe_path)
-    print(f"Successfully compiled: {Util.represent_file_size(output_size)}")
-
-    # If compression is enabled
-    if Args().get_args().compress:
-        # Add even more optimizations (packing)
-        print(f"Packing file '{exe_path}'...")
-        Popen(["upx", "-q", "--best", exe_path], stdout=DEVNULL, stderr=DEVNULL).wait()
-
-        # Get new output file size
-        packed_size = getsize(exe_path)
-        print(
-            f"Successfully packed: {Util.represent_file_size(output_size)} -> {Util.represent_file_size(packed_size)} "
-            f"({round(100 * packed_size / output_size)}% ratio)")
+# The worker processes of a batch import this script as well, so only run when executed directly
+if __name__ == "__main__":
+    main()
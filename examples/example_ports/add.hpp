@@ -0,0 +1,5 @@
+#pragma once
+
+int add(int number_one, int number_two) {
+return number_one + number_two;
+}
@@ -0,0 +1,9 @@
+#pragma once
+
+#include <string>
+#include "add.hpp"
+#include "../../src/pybuiltins/module/builtins/print.hpp"
+
+void print_sum(int number_one, int number_two) {
+print(std::to_string(add(number_one, number_two)));
+}
@@ -3,3 +3,7 @@ Importer script for APIs.
 """
 
 from .pybuiltins import PyPortFunctionSignature as PyPortFunctionSignature
+
+# Version information, will be moved to a setup.py in the future
+__version__ = 1.0
+__stable__ = False
@@ -0,0 +1,181 @@
+"""
+BatchCompiler class.
+Transpiles many files in a single invocation, optionally across multiple processes.
+"""
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from os import makedirs, walk
+from os.path import isdir, join, relpath, dirname, realpath
+from time import perf_counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.compiler.BatchResult import BatchResult
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.CompileSession import CompileSession
+from src.compiler.Compiler import Compiler
+from src.compiler.cache.TranspileCache import TranspileCache
+from src.structures.Errors import OutputCollisionError
+
+# A file to transpile, and the file to write the transpiled code to
+BatchJob = Tuple[str, str]
+
+
+class BatchCompiler:
+    """
+    Static class which transpiles many source files.
+
+    The files are spread across a pool of worker processes (each one
+    loads the compiler a single time, then transpiles many files).
+    An error in one file is reported, without stopping the batch.
+    The results are always reported in the order of the inputs,
+    no matter which worker finished first.
+    """
+
+    # The compilation session of the current process (created by init_process, and shared
+    # by all the files of the process so the ports and directory listings are reused)
+    __session: Optional[CompileSession] = None
+
+    @staticmethod
+    def collect_jobs(paths: List[str], output_directory: Optional[str]) -> List[BatchJob]:
+        """
+        Expands the input paths to a list of files to transpile.
+
+        :param paths: The input files and directories (directories are searched for .py files recursively).
+        :param output_directory: The directory to write the transpiled files to (None to write
+                                 each one next to its source file).
+        :return: The list of jobs, in the order of the inputs (directories are sorted by name).
+        :raises OutputCollisionError: If two files would be written to the same output file
+                                      (such as a/main.py and b/main.py, with an output directory).
+        """
+        jobs: List[BatchJob] = []
+        seen: Set[str] = set()
+        # The source file of each output file
+        outputs: Dict[str, str] = {}
+        for path in paths:
+            # Find the files, and their paths relative to the input
+            if isdir(path):
+                sources = []
+                for directory, sub_directories, files in walk(path):
+                    # Walk in a deterministic order, and skip the caches
+                    sub_directories[:] = sorted(name for name in sub_directories if name != "__pycache__")
+                    sources.extend(join(directory, name) for name in sorted(files) if name.endswith(".py"))
+                relative_to = path
+            else:
+                sources = [path]
+                relative_to = dirname(path)
+
+            # Add a job for each file (only once, even if it was passed multiple times)
+            for source_path in sources:
+                if realpath(source_path) in seen:
+                    continue
+                seen.add(realpath(source_path))
+                # Mirror the input tree in the output directory
+                output_path = source_path + ".cpp" if output_directory is None else \
+                    join(output_directory, relpath(source_path, relative_to or ".") + ".cpp")
+                # Files are never silently overwritten by other files of the batch
+                previous_source = outputs.setdefault(realpath(output_path), source_path)
+                if previous_source != source_path:
+                    raise OutputCollisionError(output_path, previous_source, source_path)
+                jobs.append((source_path, output_path))
+        return jobs
+
+    @classmethod
+    def init_process(cls, args: Namespace) -> None:
+        """
+        Prepares a process to transpile files.
+
+        :param args: The command line arguments.
+        """
+        cls.__session = CompileSession(CompileOptions.from_args(args))
+
+    @classmethod
+    def transpile_file(cls, job: BatchJob) -> BatchResult:
+        """
+        Transpiles a single file (in the current process).
+
+        :param job: The file to transpile, and the file to write the transpiled code to.
+        :return: The result of the transpilation.
+        """
+        source_path, output_path = job
+        session = cls.__session
+        if session is None:
+            raise RuntimeError("BatchCompiler.init_process must be called before transpiling files")
+        start = perf_counter()
+        cached = False
+        try:
+            # Read the source file
+            with open(source_path, "r") as f:
+                source = f.read()
+
+            # Make sure that the output directory exists
+            if dirname(output_path):
+                makedirs(dirname(output_path), exist_ok=True)
+
+            # Load it from the cache, or transpile it
+            cache_directory = session.get_options().cache_directory
+            if cache_directory is None:
+                # Transpile it straight into the output file
+                Compiler.transpile_to_file(Compiler.parse(source, session, source_path), output_path)
+            else:
+                cache = TranspileCache(cache_directory)
+                cache_key = cache.get_key(source, session, source_path)
+                compiled_text = cache.load(cache_key, session)
+                cached = compiled_text is not None
+                if compiled_text is None:
+                    module = Compiler.parse(source, session, source_path, cache.get_definitions())
+                    compiled_text = Compiler.transpile(module)
+                    cache.store(cache_key, module, compiled_text)
+
+                # Write the output file (replacing it once it is complete, like a single file compilation)
+                Compiler.write_atomically(output_path, lambda f: f.write(compiled_text))
+        except Exception as e:
+            # Report the error, and move on to the next file
+            return BatchResult(source_path, output_path, perf_counter() - start, cached, f"{type(e).__name__}: {e}")
+        return BatchResult(source_path, output_path, perf_counter() - start, cached, None)
+
+    @classmethod
+    def run(cls, args: Namespace, jobs: List[BatchJob]) -> List[BatchResult]:
+        """
+        Transpiles a batch of files.
+
+        :param args: The command line arguments.
+        :param jobs: The files to transpile (see collect_jobs).
+        :return: The results, in the same order as the jobs.
+        """
+        # A single worker runs in this process
+        if args.jobs <= 1:
+            cls.init_process(args)
+            return [cls.transpile_file(job) for job in jobs]
+
+        # Otherwise, spread the files across the worker processes
+        # (map keeps the order of the jobs, and sends them to the workers in chunks)
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=cls.init_process, initargs=(args,)) as executor:
+            return list(executor.map(cls.transpile_file, jobs, chunksize=max(1, len(jobs) // (args.jobs * 4))))
+
+    @staticmethod
+    def print_summary(results: List[BatchResult], seconds: float, slowest: int = 5) -> None:
+        """
+        Prints the results of a batch.
+
+        :param results: The results of the batch.
+        :param seconds: How long the whole batch took.
+        :param slowest: How many of the slowest files to show.
+        """
+        # Report each file, in order
+        for result in results:
+            if result.error is not None:
+                print(f"FAILED {result.source_path}: {result.error}")
+            else:
+                print(f"{'cached' if result.cached else 'OK':>6} {result.source_path} -> {result.output_path}")
+
+        # Summarize
+        failed = sum(1 for result in results if result.error is not None)
+        cached = sum(1 for result in results if result.cached)
+        print(f"\nTranspiled {len(results) - failed}/{len(results)} files ({cached} from the cache, {failed} failed) "
+              f"in {seconds:.2f}s ({len(results) / seconds if seconds else 0:.1f} files/sec)")
+
+        # Show the slowest files (ties are broken by path, so the output is stable)
+        if results:
+            print("Slowest files:")
+            for result in sorted(results, key=lambda r: (-r.seconds, r.source_path))[:slowest]:
+                print(f"  {result.seconds * 1000:10.1f} ms  {result.source_path}")
@@ -0,0 +1,24 @@
+"""
+The result of transpiling a single file in a batch.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    The result of transpiling a single file in a batch.
+    Sent back from the worker processes, so it only holds simple values.
+    """
+
+    # The file which was transpiled
+    source_path: str
+    # The file which the transpiled code was written to
+    output_path: str
+    # How long it took to transpile the file (including reading and writing it)
+    seconds: float
+    # Whether the transpiled code was loaded from the cache
+    cached: bool
+    # The error which stopped the transpilation (None if it succeeded)
+    error: Optional[str]
@@ -0,0 +1,186 @@
+"""
+BuildStats class.
+Machine-readable statistics of a build (see the --stats-json flag).
+"""
+from contextlib import nullcontext
+from gc import get_objects
+from json import dump
+from os import times
+from sys import platform
+from time import perf_counter, process_time
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+# The resource module only exists on Unix (the peak memory is not reported elsewhere)
+try:
+    from resource import getrusage, RUSAGE_CHILDREN, RUSAGE_SELF
+except ImportError:
+    getrusage = None
+
+# Only import the expression classes when type checking, as they import the compiler
+if TYPE_CHECKING:
+    from src.pyexpressions.concrete.PyModule import PyModule
+
+
+class BuildStats:
+    """
+    Collects the statistics of a build: the wall and CPU time of each
+    phase (read, parse, build, transpile, write, g++, upx...), and
+    values about the input and the output (node counts, scope sizes,
+    ports, output sizes and peak memory), written as a JSON report
+    for build dashboards.
+
+    Phases can be nested (for example, imported modules are parsed
+    while the tree is built), in which case the time of the nested
+    phase is not counted in the outer phase, so the phases add up to
+    the total time of the build.
+
+    The statistics are their own context manager (see measure), rather
+    than a generator based one: contextlib sets the traceback of the
+    errors raised through a generator, which the frozen errors of the
+    compiler don't allow.
+    """
+
+    # The wall and CPU time of each phase, in seconds (in the order the phases first ran)
+    __phases: Dict[str, Dict[str, float]]
+    # The phase which measure was called for, until it is entered
+    __pending: Optional[str]
+    # The name and the starting wall and CPU time of each running phase (innermost last)
+    __running: List[Tuple[str, float, float]]
+    # The wall and CPU time of the nested phases of each running phase
+    __nested: List[List[float]]
+    # The other statistics, by name
+    __values: Dict[str, Any]
+
+    def __init__(self) -> None:
+        self.__phases = {}
+        self.__pending = None
+        self.__running = []
+        self.__nested = []
+        self.__values = {}
+
+    def measure(self, phase: str) -> "BuildStats":
+        """
+        Measures the time of a phase (the time of each run is added to the phase).
+
+        :param phase: The name of the phase.
+        :return: The statistics, which measure the phase while they are entered (in a with statement).
+        """
+        self.__pending = phase
+        return self
+
+    def __enter__(self) -> None:
+        if self.__pending is None:
+            raise RuntimeError("BuildStats must be entered through measure")
+        self.__running.append((self.__pending, perf_counter(), self.get_cpu_time()))
+        self.__pending = None
+        self.__nested.append([0.0, 0.0])
+
+    def __exit__(self, *_: Any) -> bool:
+        phase, start_wall, start_cpu = self.__running.pop()
+        wall, cpu = perf_counter() - start_wall, self.get_cpu_time() - start_cpu
+        nested_wall, nested_cpu = self.__nested.pop()
+        # The outer phase does not include this one
+        if self.__nested:
+            self.__nested[-1][0] += wall
+            self.__nested[-1][1] += cpu
+        totals = self.__phases.setdefault(phase, {"wall": 0.0, "cpu": 0.0})
+        totals["wall"] += wall - nested_wall
+        totals["cpu"] += cpu - nested_cpu
+        # (an error raised in the phase is never suppressed)
+        return False
+
+    @staticmethod
+    def measure_optional(stats: Optional["BuildStats"], phase: str) -> ContextManager[None]:
+        """
+        Measures the time of a phase, if the statistics are collected.
+
+        :param stats: The statistics (None if they are not collected).
+        :param phase: The name of the phase.
+        :return: A context manager which measures the code which runs inside it.
+        """
+        return nullcontext() if stats is None else stats.measure(phase)
+
+    def record(self, name: str, value: Any) -> None:
+        """
+        Records a statistic.
+
+        :param name: The name of the statistic.
+        :param value: Its value (must be serializable to JSON).
+        """
+        self.__values[name] = value
+
+    def record_tree(self, module: "PyModule") -> None:
+        """
+        Records the statistics of a parsed tree: the nodes of each type, the size of the scopes
+        (the objects declared in them, by the type of node that holds them) and the ports pulled in.
+
+        :param module: The root module of the tree (its imported modules are part of it).
+        """
+        # Import locally, as the expressions import the compiler
+        from src.pyexpressions.abstract.PyExpression import PyExpression
+        from src.pyexpressions.highlevel.PyScoped import PyScoped
+
+        # The nodes do not list their children, so count the nodes which are alive (the tree is the only one)
+        nodes: Dict[str, int] = {}
+        scopes: Dict[str, Dict[str, int]] = {}
+        for obj in get_objects():
+            if not isinstance(obj, PyExpression):
+                continue
+            name = obj.__class__.__name__
+            nodes[name] = nodes.get(name, 0) + 1
+            if isinstance(obj, PyScoped):
+                size = obj.get_scope().get_size()
+                kind = scopes.setdefault(name, {"count": 0, "objects": 0, "max_objects": 0})
+                kind["count"] += 1
+                kind["objects"] += size
+                kind["max_objects"] = max(kind["max_objects"], size)
+
+        self.record("nodes", dict(sorted(nodes.items())))
+        self.record("node_count", sum(nodes.values()))
+        self.record("scopes", dict(sorted(scopes.items())))
+        self.record("ports", len(module.get_ported_dependencies()))
+        self.record("includes", len(module.get_dependencies()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: The statistics, as a dictionary (the peak memory is measured now).
+        """
+        stats: Dict[str, Any] = {
+            "phases": self.__phases,
+            "total": {
+                "wall": sum(phase["wall"] for phase in self.__phases.values()),
+                "cpu": sum(phase["cpu"] for phase in self.__phases.values()),
+            },
+        }
+        stats.update(self.__values)
+        # The peak resident memory of this process, and of the largest child process (g++ and upx)
+        stats["peak_rss"] = self.get_peak_rss(RUSAGE_SELF) if getrusage is not None else None
+        stats["peak_rss_children"] = self.get_peak_rss(RUSAGE_CHILDREN) if getrusage is not None else None
+        return stats
+
+    def write(self, path: str) -> None:
+        """
+        Writes the statistics to a JSON file.
+
+        :param path: The path of the file.
+        """
+        with open(path, "w") as f:
+            dump(self.to_dict(), f, indent=2)
+
+    @staticmethod
+    def get_cpu_time() -> float:
+        """
+        :return: The CPU time used by this process and its finished child processes (g++ and upx), in seconds.
+        """
+        children = times()
+        return process_time() + children.children_user + children.children_system
+
+    @staticmethod
+    def get_peak_rss(who: int) -> int:
+        """
+        :param who: RUSAGE_SELF or RUSAGE_CHILDREN.
+        :return: The peak resident memory, in bytes.
+        """
+        # Linux reports kilobytes, and macOS reports bytes
+        peak: int = getrusage(who).ru_maxrss
+        return peak if platform == "darwin" else peak * 1024
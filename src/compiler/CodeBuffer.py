@@ -0,0 +1,87 @@
+"""
+CodeBuffer class.
+Collects transpiled code in fragments.
+"""
+from typing import List, Optional, TextIO, TYPE_CHECKING
+
+# Only import the statistics when type checking, as they import the compiler
+if TYPE_CHECKING:
+    from src.compiler.BuildStats import BuildStats
+
+
+class CodeBuffer:
+    """
+    A sink for transpiled code (see PyExpression.emit).
+
+    The nodes write their code in fragments, which are only appended
+    to a list, and joined once at the end (or written to a file in
+    large blocks). That way, the code of a deeply nested node is never
+    copied into the code of each of its parents, and a file can be
+    written without ever holding its whole code in memory.
+    """
+
+    __slots__ = ("__chunks", "__size", "__target", "__flush_size", "__stats")
+
+    # The default amount of characters to collect before writing them to the target (1M characters)
+    DEFAULT_FLUSH_SIZE: int = 1 << 20
+
+    # The fragments which were not written to the target yet
+    __chunks: List[str]
+    # The amount of characters in the fragments
+    __size: int
+    # The file to write the code to (None to keep it in memory)
+    __target: Optional[TextIO]
+    __flush_size: int
+    # The statistics to measure the writes to the target in (None to not measure them)
+    __stats: Optional["BuildStats"]
+
+    def __init__(self, target: Optional[TextIO] = None, flush_size: int = DEFAULT_FLUSH_SIZE,
+                 stats: Optional["BuildStats"] = None) -> None:
+        """
+        :param target: The file to write the code to, in blocks (None to keep the code in memory, see getvalue).
+        :param flush_size: The amount of characters to collect before writing them to the target.
+        :param stats: The statistics to measure the writes to the target in, as the "write" phase.
+        """
+        self.__chunks = []
+        self.__size = 0
+        self.__target = target
+        self.__flush_size = flush_size
+        self.__stats = stats
+
+    def write(self, text: str) -> int:
+        """
+        Writes a fragment of code.
+
+        :param text: The fragment to write.
+        :return: The amount of characters written (like TextIO.write).
+        """
+        self.__chunks.append(text)
+        if self.__target is not None:
+            self.__size += len(text)
+            if self.__size >= self.__flush_size:
+                self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        """
+        Writes the collected fragments to the target (must be called once the code is complete).
+        """
+        if self.__target is not None and self.__chunks:
+            if self.__stats is None:
+                self.__target.write("".join(self.__chunks))
+            else:
+                with self.__stats.measure("write"):
+                    self.__target.write("".join(self.__chunks))
+            self.__chunks.clear()
+            self.__size = 0
+
+    def getvalue(self) -> str:
+        """
+        :return: The code which was written (only when there is no target).
+        """
+        if self.__target is not None:
+            raise ValueError("The code was written to the target")
+        # Join the fragments once, and keep the result (so calling this again does not copy them again)
+        code = "".join(self.__chunks)
+        self.__chunks = [code]
+        return code
@@ -0,0 +1,70 @@
+"""
+Options for compiling source code.
+"""
+from argparse import Namespace
+from dataclasses import dataclass, field
+from os import environ
+from os.path import abspath, expanduser, join
+from typing import Optional, Tuple
+
+
+# Freeze the class, so that a single instance can be shared by many compilations
+@dataclass(frozen=True)
+class CompileOptions:
+    """
+    Options which control how source code is compiled.
+
+    Passed explicitly to the compiler (through a CompileSession),
+    rather than read from the command line arguments, so the compiler
+    can be used as a library with different options at the same time.
+    """
+
+    # The port libraries to link, as directories or module names (in order, later ones override earlier ones)
+    links: Tuple[str, ...] = field(default=())
+    # The directories to search imported modules in (None for the Python module search path)
+    source_roots: Optional[Tuple[str, ...]] = field(default=None)
+    # The optimization level, which selects the passes that run over the tree (0 to PassManager.MAX_LEVEL)
+    optimization_level: int = field(default=0)
+    # The backend which prints the output code: "tree" (each node transpiles itself) or "ir" (see IRLowering)
+    backend: str = field(default="tree")
+    # Debugging flags
+    debug_gui: bool = field(default=False)
+    debug_text: bool = field(default=False)
+    debug_image: bool = field(default=False)
+    # Profile the compiler itself (per node class and source line)
+    profile_compiler: bool = field(default=False)
+    # The transpile cache directory, which the port libraries store their indexes in (None if nothing is cached)
+    cache_directory: Optional[str] = field(default=None)
+
+    @classmethod
+    def from_args(cls, args: Namespace) -> "CompileOptions":
+        """
+        Creates the options out of the command line arguments.
+
+        :param args: The parsed command line arguments.
+        :return: The matching CompileOptions instance.
+        """
+        return cls(
+            links=tuple(args.links.split(";")) if args.links else (),
+            source_roots=tuple(args.source_roots.split(";")) if args.source_roots else None,
+            optimization_level=args.optimization_level,
+            backend=args.backend,
+            debug_gui=args.debug_gui,
+            debug_text=args.debug_text,
+            debug_image=args.debug_image,
+            profile_compiler=args.profile_compiler,
+            cache_directory=None if args.no_cache else abspath(args.cache_dir or cls.get_default_cache_directory())
+        )
+
+    @staticmethod
+    def get_default_cache_directory() -> str:
+        """
+        :return: The default transpile cache directory of the current user.
+        """
+        return join(environ.get("XDG_CACHE_HOME") or expanduser(join("~", ".cache")), "compy")
+
+    def is_debug(self) -> bool:
+        """
+        :return: True if any debugging flags are turned on (profiling is done by the loggers as well).
+        """
+        return self.debug_gui or self.debug_text or self.debug_image or self.profile_compiler
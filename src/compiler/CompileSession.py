@@ -0,0 +1,183 @@
+"""
+State which is shared by compilations with the same options.
+"""
+from contextlib import ExitStack, nullcontext
+from typing import ContextManager, Optional, TYPE_CHECKING
+
+from src.compiler.BuildStats import BuildStats
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.MemoryReport import MemoryReport
+from src.compiler.ModuleCache import ModuleCache
+from src.compiler.ModuleResolver import ModuleResolver
+from src.structures.Errors import MissingDependencyError
+
+# Only import the loggers and ports when type checking,
+# as they are loaded on first use (and they import the expressions)
+if TYPE_CHECKING:
+    from src.compiler.logging.LoggerGUI import LoggerGUI
+    from src.compiler.logging.LoggerImage import LoggerImage
+    from src.compiler.logging.Profiler import Profiler
+    from src.compiler.passes.PassManager import PassManager
+    from src.pybuiltins.PyPortManager import PyPortManager
+
+
+class CompileSession:
+    """
+    A compilation session.
+
+    Holds everything which used to be process-wide: the options, the
+    linked port libraries, the module resolver and the debuggers.
+    Each PyModule gets its session explicitly, so multiple sessions
+    (with different options) can be used in the same process- even
+    at the same time, from different threads (a single session should
+    only be used by one thread at a time).
+
+    A session can be reused for many compilations, which saves loading
+    the port libraries and listing the source directories every time.
+    """
+
+    __options: CompileOptions
+    __resolver: ModuleResolver
+    # Parsed imported modules which are kept between compilations (None to parse them every time)
+    __module_cache: Optional[ModuleCache]
+    # The statistics of the build (None if they are not collected)
+    __stats: Optional[BuildStats]
+    # The memory report of the build (None if the memory is not reported)
+    __memory_report: Optional[MemoryReport]
+    __port_manager: Optional["PyPortManager"]
+    __pass_manager: Optional["PassManager"]
+    __logger_gui: Optional["LoggerGUI"]
+    __logger_image: Optional["LoggerImage"]
+    __profiler: Optional["Profiler"]
+
+    def __init__(self, options: Optional[CompileOptions] = None, module_cache: Optional[ModuleCache] = None,
+                 stats: Optional[BuildStats] = None, memory_report: Optional[MemoryReport] = None) -> None:
+        """
+        :param options: The options of the compilations (None for the default options).
+        :param module_cache: A cache to keep the parsed imported modules in, between
+                             compilations (None to parse them again in each compilation).
+        :param stats: The statistics to record the time of each phase of the compilations in (None to not record).
+        :param memory_report: The report to record the memory of each phase of the compilations in (None to not record).
+        """
+        self.__options = options if options is not None else CompileOptions()
+        self.__resolver = ModuleResolver(self.__options.source_roots)
+        self.__module_cache = module_cache
+        self.__stats = stats
+        self.__memory_report = memory_report
+        # These are loaded on first use
+        self.__port_manager = None
+        self.__pass_manager = None
+        self.__logger_gui = None
+        self.__logger_image = None
+        self.__profiler = None
+
+    def get_options(self) -> CompileOptions:
+        """
+        :return: The options of the compilations.
+        """
+        return self.__options
+
+    def get_resolver(self) -> ModuleResolver:
+        """
+        :return: The resolver which finds imported modules.
+        """
+        return self.__resolver
+
+    def get_module_cache(self) -> Optional[ModuleCache]:
+        """
+        :return: The cache of parsed imported modules (None if they are not kept between compilations).
+        """
+        return self.__module_cache
+
+    def get_stats(self) -> Optional[BuildStats]:
+        """
+        :return: The statistics of the build (None if they are not collected).
+        """
+        return self.__stats
+
+    def get_memory_report(self) -> Optional[MemoryReport]:
+        """
+        :return: The memory report of the build (None if the memory is not reported).
+        """
+        return self.__memory_report
+
+    def measure(self, phase: str) -> ContextManager[None]:
+        """
+        Measures the time and the memory of a phase of the compilation,
+        if the statistics are collected or the memory is reported.
+        (This is not a generator based context manager, as contextlib sets the
+        traceback of the errors raised through those, which the frozen errors reject.)
+
+        :param phase: The name of the phase (see BuildStats.measure and MemoryReport.measure).
+        :return: A context manager which measures the code which runs inside it.
+        """
+        # Most compilations measure nothing
+        if self.__stats is None and self.__memory_report is None:
+            return nullcontext()
+        if self.__memory_report is None:
+            return self.__stats.measure(phase)  # type: ignore
+        if self.__stats is None:
+            return self.__memory_report.measure(phase)
+        # Both are measured (they are entered right away, and exited when the with statement exits the stack)
+        stack = ExitStack()
+        stack.enter_context(self.__stats.measure(phase))
+        stack.enter_context(self.__memory_report.measure(phase))
+        return stack
+
+    def get_port_manager(self) -> "PyPortManager":
+        """
+        :return: The manager of the ported objects (the builtins and the linked libraries).
+        """
+        # Import locally, as the ports import the expressions
+        from src.pybuiltins.PyPortManager import PyPortManager
+
+        if self.__port_manager is None:
+            self.__port_manager = PyPortManager(self.__options.links, self.__options.cache_directory)
+        return self.__port_manager
+
+    def get_pass_manager(self) -> "PassManager":
+        """
+        :return: The manager of the passes over the tree (the passes of the optimization level).
+        """
+        # Import locally, as the passes import the expressions
+        from src.compiler.passes.PassManager import PassManager
+
+        if self.__pass_manager is None:
+            self.__pass_manager = PassManager(self.__options.optimization_level)
+        return self.__pass_manager
+
+    def get_logger_gui(self) -> "LoggerGUI":
+        """
+        :return: The debugging GUI (opened on first use).
+        """
+        if self.__logger_gui is None:
+            # Import locally, as the GUI (and tkinter) is only needed when debugging
+            try:
+                from src.compiler.logging.LoggerGUI import LoggerGUI
+            except ImportError as e:
+                raise MissingDependencyError("debugging GUI", e.name or "tkinter") from e
+            self.__logger_gui = LoggerGUI()
+        return self.__logger_gui
+
+    def get_logger_image(self) -> "LoggerImage":
+        """
+        :return: The debugging image renderer (created on first use).
+        """
+        if self.__logger_image is None:
+            # Import locally, as the image (and ete3, with its dependencies) is only needed when debugging
+            try:
+                from src.compiler.logging.LoggerImage import LoggerImage
+            except ImportError as e:
+                raise MissingDependencyError("debugging image", e.name or "ete3") from e
+            self.__logger_image = LoggerImage()
+        return self.__logger_image
+
+    def get_profiler(self) -> "Profiler":
+        """
+        :return: The profiler of the compiler (created on first use).
+        """
+        if self.__profiler is None:
+            # Import locally, as the profiler is only needed when profiling
+            from src.compiler.logging.Profiler import Profiler
+            self.__profiler = Profiler()
+        return self.__profiler
@@ -2,9 +2,21 @@
 Compiler class.
 """
 from ast import AST, parse, unparse
+from os import remove, replace
+from os.path import isfile
+from typing import Callable, Iterable, List, Optional, TextIO, TYPE_CHECKING
 
+from src.compiler.CodeBuffer import CodeBuffer
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.CompileSession import CompileSession
+from src.compiler.TreeBuilder import TreeBuilder
 from src.pyexpressions.concrete.PyModule import PyModule
 
+# Only import the cache and the IR when type checking, as they import the compiler
+if TYPE_CHECKING:
+    from src.compiler.cache.DefinitionStore import DefinitionStore
+    from src.compiler.ir.IRModule import IRModule
+
 
 class Compiler:
     """
@@ -12,28 +24,151 @@ class Compiler:
     """
 
     @staticmethod
-    def parse(source: str) -> PyModule:
+    def parse(source: str, session: Optional[CompileSession] = None, path: Optional[str] = None,
+              definitions: Optional["DefinitionStore"] = None) -> PyModule:
         """
         Initiates the parsing sequence.
         This turns the code into a series of nodes, filled
         with the proper data structures alongside other nested nodes.
 
         :param source: The source code to compile.
+        :param session: The session to compile in (None for a new session, with the default options).
+        :param path: The path of the source file, used to resolve relative imports (None if it is unknown).
+        :param definitions: A store of previously transpiled definitions to reuse (None to parse everything).
         :return: A transpiled AST head node.
         """
+        # Import locally to avoid cyclic import error
+        from src.compiler.ModuleRegistry import ModuleRegistry
+
         # Instantiate PyModule using AST
-        return PyModule(parse(source))
+        # (the rest of the tree is built by the TreeBuilder)
+        registry = ModuleRegistry(session if session is not None else CompileSession())
+        session = registry.get_session()
+        # The stored definitions were transpiled as they were parsed, so they are not optimized
+        # (and the IR backend does not use the transpiled code of the tree at all)
+        if session.get_options().optimization_level > 0 or session.get_options().backend == "ir":
+            definitions = None
+        with session.measure("parse"):
+            tree = parse(source)
+        # (imported modules are parsed while the tree is built, which is measured as parsing)
+        with session.measure("build"):
+            module = PyModule(tree, definitions, source, registry, path)
+        # Run the passes of the optimization level over the tree (none at -O0)
+        with session.measure("optimize"):
+            session.get_pass_manager().run(module)
+        return module
 
     @classmethod
-    def compile(cls, source: str) -> str:
+    def compile(cls, source: str, session: Optional[CompileSession] = None) -> str:
         """
         Automatically parses the file, then transpiles it.
         This is essentially a wrapper function for parse().
 
         :param source: The source code to compile.
+        :param session: The session to compile in (None for a new session, with the default options).
+        :return: The transpiled source code.
+        """
+        return cls.transpile(cls.parse(source, session))
+
+    @staticmethod
+    def lower(module: PyModule) -> "IRModule":
+        """
+        Lowers a parsed module to the IR, and verifies it.
+
+        :param module: The parsed module.
+        :return: The IR of the module.
+        """
+        # Import locally, as the IR is only needed by its backend (and by --emit-ir)
+        from src.compiler.ir.IRLowering import IRLowering
+        from src.compiler.ir.IRVerifier import IRVerifier
+
+        session = module.get_session()
+        with session.measure("lower"):
+            ir_module = IRLowering.lower(module)
+        with session.measure("verify"):
+            IRVerifier.check(ir_module)
+        return ir_module
+
+    @classmethod
+    def transpile(cls, module: PyModule) -> str:
+        """
+        Transpiles a parsed module with the backend of its options.
+
+        :param module: The parsed module.
         :return: The transpiled source code.
         """
-        return cls.parse(source).transpile()
+        if module.get_session().get_options().backend != "ir":
+            return module.transpile()
+        # Import locally, as the IR is only needed by its backend
+        from src.compiler.ir.IRCppPrinter import IRCppPrinter
+
+        ir_module = cls.lower(module)
+        with module.get_session().measure("transpile"):
+            return IRCppPrinter.transpile(ir_module)
+
+    @classmethod
+    def transpile_to_file(cls, module: PyModule, output_path: str, ir_path: Optional[str] = None) -> None:
+        """
+        Transpiles a parsed module straight into a file, without building its code as a string.
+        The code is written to a temporary file, which replaces the output file once it is complete
+        (so a failed transpilation never leaves half a file behind).
+
+        :param module: The parsed module.
+        :param output_path: The path of the file to write the code to.
+        :param ir_path: The path of the file to write the IR to, as text (None to not write it).
+        """
+        session = module.get_session()
+        # The IR is only built for its backend, or to be written
+        ir_module = cls.lower(module) if session.get_options().backend == "ir" or ir_path is not None else None
+        if ir_path is not None:
+            cls.write_atomically(ir_path, lambda f: f.write(str(ir_module)))
+
+        def emit(f: TextIO) -> None:
+            buffer = CodeBuffer(f, stats=session.get_stats())
+            # The code is written to the file while it is transpiled (the buffer measures those writes)
+            with session.measure("transpile"):
+                if session.get_options().backend == "ir":
+                    # Import locally, as the IR is only needed by its backend
+                    from src.compiler.ir.IRCppPrinter import IRCppPrinter
+                    IRCppPrinter.emit(ir_module, buffer)  # type: ignore
+                else:
+                    module.emit(buffer)
+            buffer.flush()
+
+        with session.measure("write"):
+            cls.write_atomically(output_path, emit)
+
+    @staticmethod
+    def write_atomically(path: str, write: Callable[[TextIO], object]) -> None:
+        """
+        Writes a file through a temporary file, which replaces it once it is complete
+        (so a failed or interrupted compilation never leaves half an output file behind).
+
+        :param path: The path of the file.
+        :param write: Writes the contents to the (temporary) file.
+        """
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w") as f:
+                write(f)
+            replace(temp_path, path)
+        except BaseException:
+            if isfile(temp_path):
+                remove(temp_path)
+            raise
+
+    @classmethod
+    def compile_many(cls, sources: Iterable[str], options: Optional[CompileOptions] = None) -> List[str]:
+        """
+        Compiles many sources with the same options.
+        The sources share a single session, so the port libraries are only loaded once.
+
+        :param sources: The source codes to compile.
+        :param options: The options to compile with (None for the default options).
+        :return: The transpiled source codes, in the same order.
+        """
+        session = CompileSession(options)
+        return [cls.compile(source, session) for source in sources]
 
     @staticmethod
     def unparse(expression: AST) -> str:
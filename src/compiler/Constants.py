@@ -3,9 +3,11 @@ Constants and other 'singleton' objects and maps/dicts.
 """
 from _ast import Constant, BinOp, operator, Add, Sub, Mult, AnnAssign, AST, Expr, Name, Call, FunctionDef, arg, \
     Return, Assign, Module, IfExp, If, cmpop, Eq, Compare, Lt, Gt, BoolOp, NotEq, Or, And, boolop, Div, Mod, FloorDiv, \
-    Pass, GtE, LtE, While, AugAssign, Break, For, ClassDef, Attribute, Is, IsNot, Continue, Import
+    Pass, GtE, LtE, While, AugAssign, Break, For, ClassDef, Attribute, Is, IsNot, Continue, Import, \
+    ImportFrom
 from json import dumps
-from typing import Dict, Type, Any, Callable
+from string import Formatter
+from typing import Dict, List, Optional, Tuple, Type, Any, Callable
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyAnnAssign import PyAnnAssign
@@ -53,6 +55,7 @@ AST_EXPR_TO_PYEXPR: Dict[Type[AST], Type[PyExpression]] = {
     If: PyIf,
     IfExp: PyIfExp,
     Import: PyImport,
+    ImportFrom: PyImport,
     Module: PyModule,
     Name: PyName,
     Pass: PyPass,
@@ -122,3 +125,9 @@ int main() {{
     return 0;
 }}
 """
+
+# The output template, split into its literal text and the names of its sections (in order),
+# so the output can be written one section at a time (see PyModule._emit)
+OUTPUT_CODE_SECTIONS: List[Tuple[str, Optional[str]]] = [
+    (literal_text, section) for literal_text, section, _, _ in Formatter().parse(OUTPUT_CODE_TEMPLATE)
+]
@@ -0,0 +1,203 @@
+"""
+MemoryReport class.
+Attributes the memory of a compilation to the structures which hold it (see the --memory-report flag).
+"""
+from _ast import AST
+from collections import deque
+from contextlib import nullcontext
+from gc import get_referents
+from sys import getsizeof
+from tracemalloc import get_traced_memory, is_tracing, reset_peak, start, stop
+from types import BuiltinFunctionType, CodeType, FrameType, FunctionType, ModuleType
+from typing import Any, ContextManager, Deque, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+# Only import the expression classes when type checking, as they import the compiler
+if TYPE_CHECKING:
+    from src.pyexpressions.abstract.PyExpression import PyExpression
+
+# Objects which are shared by the whole process, so the walk does not enter them (nor count them)
+SHARED_TYPES: Tuple[type, ...] = (type, ModuleType, FunctionType, BuiltinFunctionType, CodeType, FrameType)
+
+
+class MemoryReport:
+    """
+    Reports the memory of a compilation.
+
+    While the report exists, the allocations are traced with tracemalloc,
+    and each phase (see CompileSession.measure) records the peak of the
+    memory allocated while it ran, and the memory which it left allocated
+    (retained). Like BuildStats, the memory retained by a nested phase is
+    not counted in the outer phase, so the phases add up- the peaks
+    include the nested phases, as they cannot be added up.
+
+    The retained memory is attributed to the structures which hold it by
+    walking the references from the root module: each object is counted
+    in the category of the nearest structure above it (a class of node,
+    its Logger, a Scope or a scope Object, an AST node, the ports or the
+    rest of the compiler). Objects which are shared between structures
+    (such as interned names) are only counted once, in the first one
+    which is walked.
+
+    Like BuildStats, the report is its own context manager (see measure),
+    so the frozen errors of the compiler can be raised through it.
+    """
+
+    # The peak and the retained memory of each phase, in bytes (in the order the phases first ran)
+    __phases: Dict[str, Dict[str, int]]
+    # The phase which measure was called for, until it is entered
+    __pending: Optional[str]
+    # The name of each running phase (innermost last)
+    __running: List[str]
+    # The traced memory when each running phase started, the highest peak seen while it ran,
+    # and the memory retained by its nested phases
+    __frames: List[List[int]]
+    # The amount of objects and their size of each category, in bytes (empty until the tree is walked)
+    __categories: Dict[str, Dict[str, int]]
+    # True if this report started tracing the allocations (so it stops it as well)
+    __started_tracing: bool
+
+    def __init__(self) -> None:
+        self.__phases = {}
+        self.__pending = None
+        self.__running = []
+        self.__frames = []
+        self.__categories = {}
+        self.__started_tracing = not is_tracing()
+        if self.__started_tracing:
+            start()
+
+    def measure(self, phase: str) -> "MemoryReport":
+        """
+        Measures the peak and the retained memory of a phase (the retained memory of each run is added to the phase).
+
+        :param phase: The name of the phase.
+        :return: The report, which measures the phase while it is entered (in a with statement).
+        """
+        self.__pending = phase
+        return self
+
+    def __enter__(self) -> None:
+        if self.__pending is None:
+            raise RuntimeError("MemoryReport must be entered through measure")
+        self.__running.append(self.__pending)
+        self.__pending = None
+        current, peak = get_traced_memory()
+        # The peak is reset for this phase, so the outer phase keeps the peak it reached so far
+        if self.__frames:
+            self.__frames[-1][1] = max(self.__frames[-1][1], peak)
+        reset_peak()
+        self.__frames.append([current, current, 0])
+
+    def __exit__(self, *_: Any) -> bool:
+        phase = self.__running.pop()
+        start_memory, highest_peak, nested_retained = self.__frames.pop()
+        current, peak = get_traced_memory()
+        # (the traced peak is not reset here, so the outer phase sees the peak of this one)
+        peak = max(highest_peak, peak) - start_memory
+        retained = current - start_memory
+        if self.__frames:
+            self.__frames[-1][2] += retained
+        totals = self.__phases.setdefault(phase, {"peak": 0, "retained": 0})
+        totals["peak"] = max(totals["peak"], peak)
+        totals["retained"] += retained - nested_retained
+        # (an error raised in the phase is never suppressed)
+        return False
+
+    @staticmethod
+    def measure_optional(report: Optional["MemoryReport"], phase: str) -> ContextManager[None]:
+        """
+        Measures the memory of a phase, if the memory is reported.
+
+        :param report: The memory report (None if the memory is not reported).
+        :param phase: The name of the phase.
+        :return: A context manager which measures the code which runs inside it.
+        """
+        return nullcontext() if report is None else report.measure(phase)
+
+    def record_tree(self, root: "PyExpression") -> None:
+        """
+        Attributes the memory which a tree retains to its structures (replacing the previous attribution).
+
+        :param root: The root of the tree (its imported modules, session and ports are walked as well).
+        """
+        # Import locally, as the expressions import the compiler
+        from src.compiler.logging.Logger import Logger
+        from src.pyexpressions.abstract.PyExpression import PyExpression
+        from src.scopes.Scope import Scope
+        from src.scopes.abstract.Object import Object
+
+        def categorize(obj: Any) -> Optional[str]:
+            """
+            :param obj: An object of the tree.
+            :return: The category of the structure which the object is (None if it is part of the structure above it).
+            """
+            module: str = type(obj).__module__
+            # Ported functions are nodes as well, so the ports are checked first
+            if module.startswith("src.pybuiltins."):
+                return "ports"
+            if isinstance(obj, PyExpression):
+                return f"node {type(obj).__name__}"
+            if isinstance(obj, Logger):
+                return "Logger"
+            if isinstance(obj, Scope):
+                return "Scope"
+            if isinstance(obj, Object):
+                return "Object"
+            if isinstance(obj, AST):
+                return "AST"
+            if module.startswith("src."):
+                return "compiler"
+            return None
+
+        # Walk the references breadth first, so each object is attributed to the structure closest to the root
+        categories: Dict[str, Dict[str, int]] = {}
+        seen: Set[int] = {id(root)}
+        pending: Deque[Tuple[Any, str]] = deque([(root, categorize(root) or "compiler")])
+        while pending:
+            obj, category = pending.popleft()
+            totals = categories.setdefault(category, {"objects": 0, "size": 0})
+            totals["objects"] += 1
+            totals["size"] += getsizeof(obj)
+            for referent in get_referents(obj):
+                if id(referent) in seen or isinstance(referent, SHARED_TYPES):
+                    continue
+                seen.add(id(referent))
+                pending.append((referent, categorize(referent) or category))
+        self.__categories = dict(sorted(categories.items(), key=lambda item: -item[1]["size"]))
+
+    def stop(self) -> None:
+        """
+        Stops tracing the allocations (if this report started tracing them).
+        """
+        if self.__started_tracing:
+            stop()
+            self.__started_tracing = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: The memory of each phase, and of each category (sorted by size), as a dictionary.
+        """
+        return {
+            "phases": self.__phases,
+            "categories": self.__categories,
+            "retained": sum(category["size"] for category in self.__categories.values()),
+        }
+
+    def report(self) -> None:
+        """
+        Prints the memory of each phase, and of each category (and stops tracing the allocations).
+        """
+        self.stop()
+
+        print("Memory report, by phase (in KB, retained is what the phase left allocated):")
+        print(f"  {'phase':<12} {'peak':>12} {'retained':>12}")
+        for phase, memory in self.__phases.items():
+            print(f"  {phase:<12} {memory['peak'] / 1024:>12.1f} {memory['retained'] / 1024:>12.1f}")
+
+        total = sum(category["size"] for category in self.__categories.values())
+        print("Memory report, by structure (the memory retained by the tree, in KB):")
+        print(f"  {'structure':<24} {'objects':>10} {'size':>12} {'share':>7}")
+        for name, category in self.__categories.items():
+            print(f"  {name:<24} {category['objects']:>10} {category['size'] / 1024:>12.1f} "
+                  f"{100 * category['size'] / total if total else 0:>6.1f}%")
+        print(f"  {'total':<24} {sum(c['objects'] for c in self.__categories.values()):>10} {total / 1024:>12.1f}")
@@ -0,0 +1,109 @@
+"""
+ModuleCache class.
+Keeps parsed imported modules in memory, between compilations.
+"""
+from collections import OrderedDict
+from os import stat
+from typing import Dict, Iterable, Optional, Tuple, TYPE_CHECKING
+
+# Only import the modules when type checking, as they import the session
+if TYPE_CHECKING:
+    from src.pyexpressions.concrete.PyModule import PyModule
+
+# The modification time and size of a file (None if it does not exist)
+FileStamp = Optional[Tuple[int, int]]
+
+
+class ModuleCache:
+    """
+    In-memory LRU cache of parsed imported modules, by the real path of their file.
+
+    Imported modules are built as their own trees (they do not depend on
+    the module which imports them), so the same PyModule can be spliced
+    into many compilations of the same session. Each entry remembers the
+    stamps of the module's file and of every file it imports, and is only
+    reused as long as none of them changed.
+
+    Used by long-lived processes (see CompileServer), where the same
+    modules are imported again and again.
+    """
+
+    DEFAULT_MAX_MODULES = 256
+
+    __max_modules: int
+    # The cached modules (least recently used first), and the stamps of their files
+    __entries: "OrderedDict[str, Tuple[PyModule, Dict[str, FileStamp]]]"
+
+    def __init__(self, max_modules: int = DEFAULT_MAX_MODULES) -> None:
+        """
+        :param max_modules: The maximum amount of modules to keep.
+        """
+        self.__max_modules = max_modules
+        self.__entries = OrderedDict()
+
+    @staticmethod
+    def get_stamp(path: str) -> FileStamp:
+        """
+        :param path: The path of the file.
+        :return: The modification time and size of the file (None if it does not exist).
+        """
+        try:
+            stats = stat(path)
+        except OSError:
+            return None
+        return stats.st_mtime_ns, stats.st_size
+
+    def get(self, path: str) -> Optional["PyModule"]:
+        """
+        Retrieves a parsed module, if it is cached and up-to-date.
+
+        :param path: The real path of the module's file.
+        :return: The parsed module, or None if it must be parsed again.
+        """
+        entry = self.__entries.get(path)
+        if entry is None:
+            return None
+
+        # Make sure that none of the files changed since the module was parsed
+        module, stamps = entry
+        if any(self.get_stamp(file_path) != stamp for file_path, stamp in stamps.items()):
+            del self.__entries[path]
+            return None
+
+        # Mark it as recently used
+        self.__entries.move_to_end(path)
+        return module
+
+    def get_stamps(self, path: str) -> Dict[str, FileStamp]:
+        """
+        :param path: The real path of a cached module's file.
+        :return: The stamps of the files which the module was parsed from.
+        """
+        return self.__entries[path][1]
+
+    def put(self, path: str, module: "PyModule", stamps: Iterable[Tuple[str, FileStamp]]) -> None:
+        """
+        Stores a parsed module.
+
+        :param path: The real path of the module's file.
+        :param module: The parsed module.
+        :param stamps: The stamps of the files the module was parsed from
+                       (its own file, and every file that it imports), as taken before reading them.
+        """
+        self.__entries[path] = (module, dict(stamps))
+        self.__entries.move_to_end(path)
+        # Evict the least recently used modules
+        while len(self.__entries) > self.__max_modules:
+            self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all the cached modules.
+        """
+        self.__entries.clear()
+
+    def __len__(self) -> int:
+        """
+        :return: The amount of cached modules.
+        """
+        return len(self.__entries)
@@ -0,0 +1,118 @@
+"""
+ModuleRegistry class.
+Keeps track of the modules imported during a single compilation.
+"""
+from ast import parse
+from typing import Dict, List
+
+from src.compiler.CompileSession import CompileSession
+from src.compiler.ModuleCache import FileStamp, ModuleCache
+from src.pyexpressions.concrete.PyModule import PyModule
+from src.structures.Errors import CyclicImportError
+
+
+class ModuleRegistry:
+    """
+    Registry of the modules which were imported while compiling a single file.
+
+    Each module file is read and parsed a single time, no matter how many
+    other modules import it. The same PyModule instance is then shared by
+    all of the import statements, which lets the module emit its code once.
+    """
+
+    # The session of the compilation (which finds the files of the imported modules)
+    __session: CompileSession
+    # The parsed modules, by the real path of their file
+    __modules: Dict[str, PyModule]
+    # The modules which are being parsed right now, in import order (used to detect cycles)
+    __loading: List[str]
+    # The names of the modules which are being parsed right now (for error messages)
+    __loading_names: List[str]
+    # The stamps of the module files, as they were before reading them (see ModuleCache)
+    __stamps: Dict[str, FileStamp]
+
+    def __init__(self, session: CompileSession) -> None:
+        """
+        :param session: The session of the compilation.
+        """
+        self.__session = session
+        self.__modules = {}
+        self.__loading = []
+        self.__loading_names = []
+        self.__stamps = {}
+
+    def get_session(self) -> CompileSession:
+        """
+        :return: The session of the compilation.
+        """
+        return self.__session
+
+    def is_loading(self) -> bool:
+        """
+        :return: True if an imported module is being parsed right now.
+        """
+        return len(self.__loading) > 0
+
+    def close(self) -> None:
+        """
+        Forgets the imported modules, once the compilation is parsed.
+        The modules can outlive the compilation (see ModuleCache), so they
+        should not keep the rest of the compilation alive through here.
+        """
+        self.__modules.clear()
+        self.__stamps.clear()
+
+    def load(self, module_name: str) -> PyModule:
+        """
+        Retrieves an imported module, parsing it if it was not imported yet.
+
+        :param module_name: The absolute name of the module.
+        :return: The parsed module.
+        """
+        # Find the module's file (the resolver returns real paths, so different names lead to the same file)
+        module_path = self.__session.get_resolver().resolve(module_name)
+
+        # If the module was already parsed, then share it
+        if module_path in self.__modules:
+            return self.__modules[module_path]
+
+        # If the module was parsed by a previous compilation of the session (and did not change since), then reuse it
+        module_cache = self.__session.get_module_cache()
+        if module_cache is not None:
+            cached_module = module_cache.get(module_path)
+            # (its imports must still lead to the same files, as a new module can shadow an imported one)
+            if cached_module is not None and all(
+                    self.__session.get_resolver().find(name) == path
+                    for name, path in cached_module.get_resolved_imports().items()):
+                self.__stamps.update(module_cache.get_stamps(module_path))
+                self.__modules[module_path] = cached_module
+                return cached_module
+
+        # If the module is still being parsed, then it imports itself
+        if module_path in self.__loading:
+            raise CyclicImportError(tuple(self.__loading_names[self.__loading.index(module_path):]) + (module_name,))
+
+        # Read the module (stamped first, so a change made while parsing is noticed by the next compilation)
+        self.__stamps[module_path] = ModuleCache.get_stamp(module_path)
+        with open(module_path, "r") as f:
+            source = f.read()
+
+        # Parse it (the module imports are registered in this registry as well)
+        self.__loading.append(module_path)
+        self.__loading_names.append(module_name)
+        try:
+            with self.__session.measure("parse"):
+                tree = parse(source)
+            module = PyModule(tree, registry=self, path=module_path)
+        finally:
+            self.__loading.pop()
+            self.__loading_names.pop()
+
+        # Register it
+        self.__modules[module_path] = module
+        if module_cache is not None:
+            # The files that it imports were all loaded by this registry, so their stamps are known
+            module_cache.put(module_path, module, [
+                (path, self.__stamps[path]) for path in [module_path, *module.get_source_files()]
+            ])
+        return module
@@ -0,0 +1,192 @@
+"""
+ModuleResolver class.
+Finds the files of imported modules, without importing them.
+"""
+from os import scandir
+from os.path import join, isdir, realpath, dirname
+from sys import path as sys_path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from src.structures.Errors import UnresolvedImportError
+
+# The file names of a directory, and the names of its sub-directories
+DirectoryListing = Tuple[FrozenSet[str], FrozenSet[str]]
+
+
+class ModuleResolver:
+    """
+    Statically resolves module names to their source files.
+
+    Unlike importlib, which imports the parent packages of a dotted
+    module name (running their __init__.py files), this only looks at
+    the file system: each source root is indexed lazily, one directory
+    listing at a time, and every listing is cached- so resolving many
+    imports costs only a few dictionary lookups each, and never runs
+    any of the compiled program's code.
+
+    The listings are kept until they are invalidated, so long-lived
+    resolvers (see CompileServer) should invalidate them before each
+    compilation, to notice the modules which were created (or removed)
+    since.
+
+    The lookup order follows the one of Python: source roots are
+    searched in order, and in each directory a package (a directory
+    with an __init__.py file) comes before a module of the same name.
+    """
+
+    __roots: List[str]
+    # The cached listing of each directory that was looked at (None if it does not exist)
+    __listings: Dict[str, Optional[DirectoryListing]]
+
+    def __init__(self, roots: Optional[Iterable[str]] = None) -> None:
+        """
+        :param roots: The directories to search modules in (None for the default roots, see get_default_roots).
+        """
+        self.__roots = [realpath(root) for root in (roots if roots is not None else self.get_default_roots())]
+        self.__listings = {}
+
+    @staticmethod
+    def get_default_roots() -> List[str]:
+        """
+        :return: The directories on Python's module search path (which is where find_spec used to look).
+        """
+        return [root or "." for root in sys_path if isdir(root or ".")]
+
+    def get_roots(self) -> List[str]:
+        """
+        :return: The directories which modules are searched in.
+        """
+        return self.__roots
+
+    def invalidate(self) -> None:
+        """
+        Forgets the cached directory listings, so the next lookups see the current files.
+        """
+        self.__listings.clear()
+
+    def resolve(self, module_name: str) -> str:
+        """
+        Finds the file of a module.
+
+        :param module_name: The absolute (dotted) name of the module.
+        :return: The real path of the module's file (the __init__.py file for packages).
+        """
+        module_path = self.find(module_name)
+        if module_path is None:
+            raise UnresolvedImportError(module_name)
+        return module_path
+
+    def find(self, module_name: str) -> Optional[str]:
+        """
+        Finds the file of a module, if it exists.
+
+        :param module_name: The absolute (dotted) name of the module.
+        :return: The real path of the module's file (the __init__.py file for packages),
+                or None if it does not exist.
+        """
+        *packages, name = module_name.split(".")
+        # Search each root in order
+        for root in self.__roots:
+            # Walk down the package directories
+            directory: Optional[str] = root
+            for package in packages:
+                directory = self.__get_sub_directory(directory, package)
+                if directory is None:
+                    break
+            if directory is None:
+                continue
+
+            # A package comes before a module
+            package_directory = self.__get_sub_directory(directory, name)
+            if package_directory is not None and self.__has_file(package_directory, "__init__.py"):
+                return realpath(join(package_directory, "__init__.py"))
+            if self.__has_file(directory, name + ".py"):
+                return realpath(join(directory, name + ".py"))
+
+        # The module does not exist
+        return None
+
+    def resolve_relative(self, module_name: Optional[str], level: int, package: Optional[str]) -> str:
+        """
+        Converts an imported module name to an absolute name.
+
+        :param module_name: The imported name (None for 'from . import x' statements).
+        :param level: The amount of leading dots in the import (0 for absolute imports).
+        :param package: The package which the importing module is in (see get_package).
+        :return: The absolute name of the module.
+        """
+        # Absolute imports are already resolved
+        if level == 0:
+            return module_name or ""
+
+        # Go up a package for each extra dot
+        parts = package.split(".") if package else []
+        if package is None or level - 1 >= len(parts):
+            raise UnresolvedImportError("." * level + (module_name or ""))
+        parts = parts[:len(parts) - (level - 1)]
+
+        # Append the imported name
+        return ".".join(parts + ([module_name] if module_name else []))
+
+    def get_package(self, module_path: str) -> Optional[str]:
+        """
+        Finds the package which a module file belongs to.
+
+        :param module_path: The path of the module's file.
+        :return: The absolute name of the package ("" for top-level modules),
+                or None if the file is not in any of the source roots.
+        """
+        module_path = realpath(module_path)
+        directory = dirname(module_path)
+        # A package's __init__.py file is inside of the package itself
+        for root in self.__roots:
+            if directory == root:
+                return ""
+            if directory.startswith(join(root, "")):
+                return directory[len(join(root, "")):].replace("/", ".").replace("\\", ".")
+        return None
+
+    def __get_sub_directory(self, directory: str, name: str) -> Optional[str]:
+        """
+        :param directory: The parent directory.
+        :param name: The name of the sub-directory.
+        :return: The path of the sub-directory, or None if it does not exist.
+        """
+        listing = self.__list_directory(directory)
+        return join(directory, name) if listing is not None and name in listing[1] else None
+
+    def __has_file(self, directory: str, name: str) -> bool:
+        """
+        :param directory: The directory to look in.
+        :param name: The name of the file.
+        :return: True if the directory holds the file.
+        """
+        listing = self.__list_directory(directory)
+        return listing is not None and name in listing[0]
+
+    def __list_directory(self, directory: str) -> Optional[DirectoryListing]:
+        """
+        Lists a directory, or retrieves its listing from the cache.
+
+        :param directory: The directory to list.
+        :return: The names of the files and sub-directories, or None if the directory does not exist.
+        """
+        # Each directory is only listed once
+        if directory in self.__listings:
+            return self.__listings[directory]
+
+        listing: Optional[DirectoryListing]
+        try:
+            # Split the entries to files and directories (the entry types are
+            # usually known from the listing itself, without extra system calls)
+            files, directories = set(), set()
+            with scandir(directory) as entries:
+                for entry in entries:
+                    (directories if entry.is_dir() else files).add(entry.name)
+            listing = (frozenset(files), frozenset(directories))
+        except OSError:
+            # The directory does not exist (or can't be read)
+            listing = None
+
+        self.__listings[directory] = listing
+        return listing
@@ -0,0 +1,126 @@
+"""
+TreeBuilder class.
+Converts AST nodes to their matching PyExpression nodes.
+"""
+from _ast import AST
+from typing import Dict, FrozenSet, List, Tuple, Type, Optional, cast
+
+from src.compiler.Constants import AST_EXPR_TO_PYEXPR
+from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.highlevel.PyIterative import PyIterative
+from src.structures.Errors import UnsupportedFeatureException
+from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE, NodeConstruction
+
+
+class TreeBuilder:
+    """
+    Static class which builds PyExpression trees out of AST trees.
+
+    The node classes are resolved through a dispatch table, which is
+    prepared a single time (when this module is imported), rather than
+    importing and looking up the constants for every node.
+
+    Nodes which can be nested very deeply (operations, calls...) are built
+    with an explicit stack (see construct), so the depth of an expression
+    is not limited by Python's recursion limit.
+    """
+
+    # The dispatch table, from each AST node type to its PyExpression class
+    __dispatch: Dict[Type[AST], Type[PyExpression]] = dict(AST_EXPR_TO_PYEXPR)
+    # The classes which are built with an explicit stack (see PyIterative)
+    __stacked: FrozenSet[Type[PyExpression]] = frozenset(
+        node_class for node_class in __dispatch.values() if issubclass(node_class, PyIterative)
+    )
+
+    @staticmethod
+    def build(expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]) -> PyExpression:
+        """
+        Converts an AST expression to a PyExpression object.
+
+        :param expression: The expression to convert.
+        :param parent: The parent expression which uses this node.
+        :return: A PyExpression object of the matching type.
+        """
+        # Resolve the class of the node
+        node_class = TreeBuilder.__resolve(expression)
+
+        # Build the nested nodes on a stack
+        if node_class in TreeBuilder.__stacked:
+            return TreeBuilder.construct(cast(PyIterative, node_class.__new__(node_class)), expression, parent)
+
+        # Profile the construction of the node, if the compiler is profiled
+        profiler = None if parent is None else parent.get_logger().get_profiler()
+        if profiler is None:
+            # Convert to PyExpression and return
+            return node_class(expression, parent)
+        profiler.start("build", node_class, expression, parent)
+        node = node_class(expression, parent)
+        profiler.stop()
+        return node
+
+    @staticmethod
+    def construct(node: PyIterative, expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]) -> PyExpression:
+        """
+        Initializes a PyIterative node (see PyIterative._construct), and builds its
+        nested nodes with an explicit stack, instead of recursion. The nodes are
+        created in the same order as they would be by recursive construction.
+
+        :param node: The node to initialize (created, but not initialized yet).
+        :param expression: The expression to convert.
+        :param parent: The parent expression which uses this node.
+        :return: The initialized node.
+        """
+        # Profile the construction of each node, if the compiler is profiled
+        profiler = None if parent is None else parent.get_logger().get_profiler()
+        if profiler is not None:
+            profiler.start("build", node.__class__, expression, parent)
+
+        # The nodes being built (each with its construction, which yields the AST nodes of its nested nodes)
+        stack: List[Tuple[PyIterative, NodeConstruction]] = [(node, node._construct(expression, parent))]
+        # The last node which was built (sent to the construction of its parent)
+        built: Optional[PyExpression] = None
+        while stack:
+            current, construction = stack[-1]
+            try:
+                nested_expression = construction.send(built)
+            except StopIteration:
+                # The node is complete
+                stack.pop()
+                built = current
+                if profiler is not None:
+                    profiler.stop()
+                continue
+
+            node_class = TreeBuilder.__resolve(nested_expression)
+            if node_class in TreeBuilder.__stacked:
+                # Build the nested node on the stack
+                if profiler is not None:
+                    profiler.start("build", node_class, nested_expression, current)
+                nested = cast(PyIterative, node_class.__new__(node_class))
+                stack.append((nested, nested._construct(nested_expression, current)))
+                built = None
+            elif profiler is not None:
+                profiler.start("build", node_class, nested_expression, current)
+                built = node_class(nested_expression, current)
+                profiler.stop()
+            else:
+                built = node_class(nested_expression, current)
+        return node
+
+    @staticmethod
+    def __resolve(expression: AST) -> Type[PyExpression]:
+        """
+        :param expression: The expression to convert.
+        :return: The PyExpression class of the expression.
+        """
+        node_class = TreeBuilder.__dispatch.get(expression.__class__)
+
+        # If the expression is not in the table, it is probably a feature we do not support
+        if node_class is None:
+            raise UnsupportedFeatureException(expression)
+        return node_class
+
+
+# Now that the dispatch table is ready, route all the
+# PyExpression.from_ast calls through the tree builder
+PyExpression.set_tree_builder(TreeBuilder.build)
@@ -48,8 +48,8 @@ class Util:
         # On the first 2 arguments of the list
         return reduce(getattr, attrs, obj)
 
-    @classmethod
-    def get_name(cls, obj: Union[AST, "PyExpression"]) -> str:
+    @staticmethod
+    def get_name(obj: Union[AST, "PyExpression"]) -> str:
         """
         Retrieves the name of the AST node's class.
         For example, instead of seeing: <ast.AnnAssign object at 0x000002CC7FE5A310>
@@ -58,7 +58,7 @@ class Util:
         :param obj: An instance of the AST expression or node to name.
         :return: The string representation of the AST node's class name.
         """
-        return str(cls.get_attr(obj, "__class__.__name__"))
+        return obj.__class__.__name__
 
     @staticmethod
     def escape(string: str) -> str:
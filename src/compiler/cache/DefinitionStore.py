@@ -0,0 +1,117 @@
+"""
+DefinitionStore class.
+Stores the transpiled code of single function and class definitions on the disk.
+"""
+from _ast import FunctionDef, ClassDef
+from hashlib import sha256
+from json import dumps, loads
+from re import compile as compile_regex
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+
+from src.compiler.cache.FileCache import FileCache
+from src.scopes.Scope import Scope
+from src.scopes.abstract.Object import Object
+from src.scopes.objects.Class import Class
+from src.scopes.objects.Function import Function
+from src.scopes.objects.Type import Type
+from src.scopes.objects.Variable import Variable
+
+# Only import the port manager when type checking, as the ports import the expressions
+if TYPE_CHECKING:
+    from src.pybuiltins.PyPortManager import PyPortManager
+
+# A stored definition, as written to the disk (see PyCachedDefinition)
+DefinitionEntry = Dict[str, Any]
+
+# Matches every identifier in the source code (and some words which are not, which does not matter)
+IDENTIFIER_REGEX = compile_regex(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+class DefinitionStore:
+    """
+    Content-addressed store of transpiled top-level definitions.
+
+    Each definition is fingerprinted by its source code segment, and by
+    the signatures of every object it references from the enclosing scope. This way, when
+    a single function is edited, only it is rebuilt- alongside the
+    definitions which depend on it, if its signature was changed.
+    """
+
+    # Bumped whenever the layout of the stored definitions changes
+    ENTRY_FORMAT: int = 2
+
+    __cache: FileCache
+
+    def __init__(self, directory: str, max_size: int = FileCache.DEFAULT_MAX_SIZE) -> None:
+        """
+        :param directory: The directory to store the definitions in (can be shared between processes).
+        :param max_size: The maximum size of the directory, in bytes.
+        """
+        self.__cache = FileCache(directory, max_size)
+
+    def fingerprint(self, expression: Union[FunctionDef, ClassDef], source_lines: List[str], scope: Scope,
+                    port_manager: "PyPortManager") -> str:
+        """
+        Computes the fingerprint of a definition.
+
+        :param expression: The AST node of the definition.
+        :param source_lines: The lines of the source code which the definition was parsed from.
+        :param scope: The scope which the definition is declared in.
+        :param port_manager: The ported objects of the compilation.
+        :return: The fingerprint, as a hex string.
+        """
+        # Import locally, as the version is defined by the package script
+        from src import __version__
+
+        # Cut the definition out of the source (including its decorators)
+        first_line = min([expression.lineno] + [decorator.lineno for decorator in expression.decorator_list])
+        segment = "\n".join(source_lines[first_line - 1:expression.end_lineno])
+
+        # Describe each name used in the definition, as it is seen from the outside
+        names: Dict[str, str] = {}
+        for name in set(IDENTIFIER_REGEX.findall(segment)):
+            names[name] = (port_manager.describe_port(name) if port_manager.is_loaded(name)
+                           else self.describe_object(scope.get_object(name)))
+
+        return sha256(dumps({
+            "version": __version__,
+            "format": self.ENTRY_FORMAT,
+            "code": segment,
+            "names": names
+        }, sort_keys=True).encode()).hexdigest()
+
+    def load(self, fingerprint: str) -> Optional[DefinitionEntry]:
+        """
+        :param fingerprint: The fingerprint of the definition.
+        :return: The stored definition, or None if it was not stored.
+        """
+        data = self.__cache.get(fingerprint)
+        return None if data is None else loads(data)
+
+    def store(self, fingerprint: str, entry: DefinitionEntry) -> None:
+        """
+        :param fingerprint: The fingerprint of the definition.
+        :param entry: The definition to store.
+        """
+        self.__cache.put(fingerprint, dumps(entry).encode())
+
+    @staticmethod
+    def describe_object(obj: Optional[Object]) -> str:
+        """
+        Describes the signature of a scope object, as a string.
+
+        :param obj: The object to describe (or None, if the name is not defined).
+        :return: A short description, which changes whenever the signature does.
+        """
+        if isinstance(obj, Function):
+            return f"function -> {obj.return_type.name}"
+        elif isinstance(obj, Variable):
+            return f"variable: {obj.type.name}"
+        elif isinstance(obj, Class):
+            # A class is used through its fields and methods
+            members = obj.scope.get_declared_objects().items()
+            return "class {" + ", ".join(f"{name}: {DefinitionStore.describe_object(member)}"
+                                         for name, member in members) + "}"
+        elif isinstance(obj, Type):
+            return "type"
+        return "undefined"
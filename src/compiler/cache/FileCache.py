@@ -0,0 +1,128 @@
+"""
+FileCache class.
+A size-capped key-value store on the disk.
+"""
+from os import makedirs, remove, replace, scandir, utime, close, write
+from os.path import join, dirname
+from tempfile import mkstemp
+from typing import List, Optional, Tuple
+
+
+class FileCache:
+    """
+    Stores blobs of data on the disk, each under a (hex string) key.
+
+    Entries are written atomically (to a temporary file, which is then
+    renamed over the entry), so multiple processes can safely share
+    the same cache directory. When the cache grows over its size cap,
+    the least recently used entries are evicted (each read refreshes
+    the modification time of the entry, which is used as its age).
+    """
+
+    # The default size cap of a cache directory (256 MB)
+    DEFAULT_MAX_SIZE: int = 256 * 1024 * 1024
+    # Prefix of the temporary files, which are skipped when evicting
+    TEMP_PREFIX: str = ".tmp-"
+
+    __directory: str
+    __max_size: int
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        :param directory: The directory to store the entries in (created when needed).
+        :param max_size: The maximum amount of bytes to store, before evicting entries.
+        """
+        self.__directory = directory
+        self.__max_size = max_size
+
+    def get_directory(self) -> str:
+        """
+        :return: The directory which the entries are stored in.
+        """
+        return self.__directory
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Reads an entry from the cache.
+
+        :param key: The key of the entry.
+        :return: The stored data, or None if there is no such entry.
+        """
+        path = self.__get_path(key)
+        try:
+            # Read the entry
+            with open(path, "rb") as f:
+                data = f.read()
+            # Mark the entry as recently used
+            utime(path)
+        except OSError:
+            # The entry does not exist (or was just evicted by another process)
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Writes an entry to the cache, then evicts old entries if the cache is too large.
+        Failing to write is not an error, as the cache is only an optimization.
+
+        :param key: The key of the entry.
+        :param data: The data to store.
+        """
+        path = self.__get_path(key)
+        try:
+            # Write to a temporary file in the same directory, so that the rename is atomic
+            makedirs(dirname(path), exist_ok=True)
+            handle, temp_path = mkstemp(dir=dirname(path), prefix=self.TEMP_PREFIX)
+            try:
+                write(handle, data)
+            finally:
+                close(handle)
+            # Replace the entry, readers will either see the old entry or the new one
+            replace(temp_path, path)
+        except OSError:
+            # Could not write to the cache directory, so we simply don't cache
+            return
+
+        # Make sure that the cache is not over the limit
+        self.__evict()
+
+    def __evict(self) -> None:
+        """
+        Removes the least recently used entries, until the cache is within its size cap.
+        """
+        # Collect the age, size and path of each entry
+        entries: List[Tuple[float, int, str]] = []
+        total_size = 0
+        try:
+            for bucket in scandir(self.__directory):
+                if not bucket.is_dir():
+                    continue
+                for entry in scandir(bucket.path):
+                    # Skip files which are still being written
+                    if entry.name.startswith(self.TEMP_PREFIX):
+                        continue
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+        except OSError:
+            # Another process is modifying the directory, it will evict instead of us
+            return
+
+        # Remove the oldest entries first
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.__max_size:
+                break
+            try:
+                remove(path)
+            except OSError:
+                # Already removed by another process
+                pass
+            total_size -= size
+
+    def __get_path(self, key: str) -> str:
+        """
+        :param key: The key of the entry.
+        :return: The path of the entry's file (entries are split into buckets by the first 2 characters).
+        """
+        return join(self.__directory, key[:2], key)
@@ -0,0 +1,190 @@
+"""
+TranspileCache class.
+Stores transpiled code on the disk, so unchanged files are not compiled again.
+"""
+from hashlib import sha256
+from json import dumps, loads
+from os.path import join
+from typing import Dict, Optional
+
+from src.compiler.CompileSession import CompileSession
+from src.compiler.cache.DefinitionStore import DefinitionStore
+from src.compiler.cache.FileCache import FileCache
+from src.pybuiltins.PortLibrary import PortLibrary
+from src.pybuiltins.PortModule import PortModule
+from src.pybuiltins.PyPortManager import PyPortManager
+from src.pyexpressions.concrete.PyModule import PyModule
+
+
+class TranspileCache:
+    """
+    Content-addressed cache of transpiled code.
+
+    The key of each entry is a hash of everything the transpiled code
+    depends on, which is known before parsing:
+    - The source code itself.
+    - The package which the source file is in (relative imports depend on it).
+    - The source roots which imports are resolved in, in order.
+    - The compiler version.
+    - The linked port libraries (their names, order and contents).
+    - The optimization level.
+    - The backend which prints the code (see CompileOptions.backend).
+    The key is computed out of the compilation session (see get_key), so
+    every caller keys its entries the same way. None of the other command
+    line flags change the transpiled code (the debugging flags need the
+    tree, so they should not use the cache).
+
+    The Python files which the source imports are only known after parsing,
+    so each entry also stores their hashes, and the file which each imported
+    module name resolved to. The entry is only used if none of the files have
+    changed since, and every name still resolves to the same file (a module
+    which was created since can shadow an imported one, without changing it).
+
+    When a source file is not cached, its unchanged function and class
+    definitions can still be reused, from the definition store which
+    is kept in the same directory.
+    """
+
+    __cache: FileCache
+    __definitions: DefinitionStore
+
+    def __init__(self, directory: str, max_size: int = FileCache.DEFAULT_MAX_SIZE) -> None:
+        """
+        :param directory: The cache directory (can be shared between processes).
+        :param max_size: The maximum size of the cache directory, in bytes.
+        """
+        self.__cache = FileCache(join(directory, "modules"), max_size)
+        self.__definitions = DefinitionStore(join(directory, "definitions"), max_size)
+
+    def get_definitions(self) -> DefinitionStore:
+        """
+        :return: The store of transpiled definitions, to pass to the parser.
+        """
+        return self.__definitions
+
+    def get_key(self, source: str, session: CompileSession, path: Optional[str] = None) -> str:
+        """
+        Computes the key of a source file.
+
+        :param source: The source code to compile.
+        :param session: The session to compile in (which holds the options and the source roots).
+        :param path: The path of the source file (None if it is unknown).
+        :return: The key of the source's entry, as a hex string.
+        """
+        # Import locally, as the version is defined by the package script
+        from src import __version__
+
+        options = session.get_options()
+        resolver = session.get_resolver()
+        return self.hash_bytes(dumps({
+            "version": __version__,
+            "source": self.hash_bytes(source.encode()),
+            "package": resolver.get_package(path) if path is not None else None,
+            "source_roots": resolver.get_roots(),
+            "optimization_level": options.optimization_level,
+            "backend": options.backend,
+            "builtins": PortLibrary(PyPortManager.BUILTINS_DIRECTORY, options.cache_directory).get_digest(),
+            "links": [
+                [library, self.__hash_library(library, options.cache_directory)]
+                for library in options.links
+            ]
+        }, sort_keys=True).encode())
+
+    def load(self, key: str, session: CompileSession) -> Optional[str]:
+        """
+        Loads the transpiled code of a source file from the cache.
+
+        :param key: The key of the source file (see get_key).
+        :param session: The session to compile in (which resolves the imported module names).
+        :return: The transpiled code, or None if it is not cached (or outdated).
+        """
+        # Read the entry
+        data = self.__cache.get(key)
+        if data is None:
+            return None
+        entry = loads(data)
+
+        # Make sure that the imported files did not change
+        source_files: Dict[str, str] = entry["source_files"]
+        for path, file_hash in source_files.items():
+            try:
+                if self.hash_file(path) != file_hash:
+                    return None
+            except OSError:
+                # The imported file was removed
+                return None
+
+        # Make sure that the imported names still lead to the same files
+        resolved_imports: Dict[str, Optional[str]] = entry["resolved_imports"]
+        resolver = session.get_resolver()
+        for module_name, module_path in resolved_imports.items():
+            if resolver.find(module_name) != module_path:
+                return None
+
+        # The entry is up-to-date
+        return entry["code"]
+
+    def store(self, key: str, module: PyModule, code: str) -> None:
+        """
+        Stores the transpiled code of a source file in the cache.
+
+        :param key: The key of the source file (see get_key).
+        :param module: The parsed module of the source file.
+        :param code: The transpiled code of the module.
+        """
+        self.__cache.put(key, dumps({
+            "source_files": {path: self.hash_file(path) for path in sorted(module.get_source_files())},
+            "resolved_imports": module.get_resolved_imports(),
+            "code": code
+        }).encode())
+
+    def compile(self, source: str, session: CompileSession, path: Optional[str] = None) -> str:
+        """
+        Compiles source code, or loads it from the cache if it was already compiled.
+
+        :param source: The source code to compile.
+        :param session: The session to compile in.
+        :param path: The path of the source file (None if it is unknown).
+        :return: The transpiled source code.
+        """
+        # Import locally to avoid cyclic import error
+        from src.compiler.Compiler import Compiler
+
+        # Try to load it
+        key = self.get_key(source, session, path)
+        code = self.load(key, session)
+        if code is None:
+            # Otherwise, compile and store it
+            module = Compiler.parse(source, session, path, self.__definitions)
+            code = Compiler.transpile(module)
+            self.store(key, module, code)
+        return code
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """
+        :param data: The data to hash.
+        :return: The SHA-256 hash of the data, as a hex string.
+        """
+        return sha256(data).hexdigest()
+
+    @classmethod
+    def hash_file(cls, path: str) -> str:
+        """
+        :param path: The path of the file to hash.
+        :return: The SHA-256 hash of the file's contents, as a hex string.
+        """
+        with open(path, "rb") as f:
+            return cls.hash_bytes(f.read())
+
+    @staticmethod
+    def __hash_library(library: str, cache_directory: Optional[str]) -> str:
+        """
+        Hashes a linked port library.
+
+        :param library: The directory of a declarative library, or the module name of a library.
+        :param cache_directory: The transpile cache directory, which the library's index is stored in.
+        :return: The hash of the library's contents, as a hex string.
+        """
+        return (PortLibrary(library, cache_directory) if PortLibrary.is_library(library)
+                else PortModule(library, cache_directory)).get_digest()
@@ -0,0 +1,124 @@
+"""
+CompileClient class.
+Sends compile requests to a running compile server.
+"""
+from multiprocessing.connection import Client, Connection, AuthenticationError
+from os import environ
+from os.path import join, exists
+from platform import system
+from tempfile import gettempdir
+from typing import Any, Optional
+
+from src.compiler.daemon.CompileRequest import CompileRequest
+from src.compiler.daemon.CompileResponse import CompileResponse
+
+# The prefix of Windows named pipe addresses
+PIPE_PREFIX = "\\\\.\\pipe\\"
+
+
+class CompileClient:
+    """
+    A connection to a running CompileServer.
+
+    Kept lightweight on purpose: it does not import the compiler itself,
+    so a short-lived process (such as the command line) only pays for
+    the connection, while the server does the compilation with
+    everything already loaded.
+
+    The server is found by its address (a Unix socket, or a named pipe
+    on Windows), and authenticated with a key which only the current
+    user can read, since requests are sent as pickled objects.
+    """
+
+    __connection: Connection
+
+    def __init__(self, connection: Connection) -> None:
+        """
+        Use CompileClient.connect instead of calling this directly.
+
+        :param connection: The open connection to the server.
+        """
+        self.__connection = connection
+
+    @staticmethod
+    def get_default_address() -> str:
+        """
+        :return: The address that the current user's server listens on by default.
+        """
+        # Windows uses named pipes, which are named after the user
+        if system() == "Windows":
+            return PIPE_PREFIX + "compy-" + environ.get("USERNAME", "user")
+
+        # Otherwise, place the socket in a directory which only the current user can access
+        from os import getuid
+        return join(environ.get("XDG_RUNTIME_DIR") or gettempdir(), f"compy-{getuid()}", "compy.sock")
+
+    @staticmethod
+    def get_key_path(address: str) -> str:
+        """
+        :param address: The address of the server.
+        :return: The path of the file which holds the server's authentication key.
+        """
+        # Named pipes are not files, so their key is kept in the (per-user) temporary directory
+        if address.startswith(PIPE_PREFIX):
+            return join(gettempdir(), address[len(PIPE_PREFIX):] + ".key")
+        return address + ".key"
+
+    @classmethod
+    def connect(cls, address: Optional[str] = None) -> Optional["CompileClient"]:
+        """
+        Connects to a running server.
+
+        :param address: The address of the server (None for the default address).
+        :return: The connected client, or None if no compatible server is running.
+        """
+        # Import locally, as the version is defined by the package script
+        from src import __version__
+
+        address = address if address is not None else cls.get_default_address()
+        key_path = cls.get_key_path(address)
+        # Without a key there is no server (this is much quicker than failing to connect)
+        if not exists(key_path):
+            return None
+
+        try:
+            with open(key_path, "rb") as f:
+                key = f.read()
+            connection = Client(address, authkey=key)
+        except (OSError, EOFError, AuthenticationError):
+            # The server was stopped (or is not ours)
+            return None
+
+        # The server greets with its version, a server of another version would transpile differently
+        try:
+            server_version: Any = connection.recv()
+        except (OSError, EOFError):
+            connection.close()
+            return None
+        if server_version != __version__:
+            connection.close()
+            return None
+        return cls(connection)
+
+    def compile(self, request: CompileRequest) -> CompileResponse:
+        """
+        Sends a request to the server, and waits for its response.
+
+        :param request: The request to send.
+        :return: The server's response (raises OSError or EOFError if the server stopped).
+        """
+        self.__connection.send(request)
+        response: CompileResponse = self.__connection.recv()
+        return response
+
+    def close(self) -> None:
+        """
+        Closes the connection to the server.
+        """
+        self.__connection.close()
+
+    def __enter__(self) -> "CompileClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,24 @@
+"""
+A request sent to the compile server.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from src.compiler.CompileOptions import CompileOptions
+
+
+@dataclass(frozen=True)
+class CompileRequest:
+    """
+    A request to transpile a single source file, sent from a CompileClient to the CompileServer.
+    Sent between processes, so it only holds simple values.
+    """
+
+    # The version of the client's compiler (the server refuses requests of other versions)
+    version: float
+    # The source code to transpile
+    source: str
+    # The path of the source file, used to resolve relative imports (None if it is unknown)
+    path: Optional[str]
+    # The options to transpile with (including the transpilation cache directory, or None to not use the cache)
+    options: CompileOptions
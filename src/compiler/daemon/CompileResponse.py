@@ -0,0 +1,22 @@
+"""
+A response sent back from the compile server.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CompileResponse:
+    """
+    The result of a CompileRequest, sent back from the CompileServer to the CompileClient.
+    Sent between processes, so it only holds simple values.
+    """
+
+    # The transpiled code (None if the transpilation failed)
+    code: Optional[str]
+    # The error which stopped the transpilation (None if it succeeded)
+    error: Optional[str]
+    # Whether the transpiled code was loaded from the cache
+    cached: bool
+    # How long the server took to handle the request
+    seconds: float
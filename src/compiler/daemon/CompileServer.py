@@ -0,0 +1,196 @@
+"""
+CompileServer class.
+A long-lived process which keeps the compiler warm, and transpiles files for clients.
+"""
+from collections import OrderedDict
+from multiprocessing.connection import Listener, Connection, AuthenticationError
+from os import O_CREAT, O_EXCL, O_WRONLY, makedirs, open as open_file, remove, urandom, write, close
+from os.path import dirname, exists
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Optional
+
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.CompileSession import CompileSession
+from src.compiler.Compiler import Compiler
+from src.compiler.ModuleCache import ModuleCache
+from src.compiler.cache.TranspileCache import TranspileCache
+from src.compiler.daemon.CompileClient import CompileClient, PIPE_PREFIX
+from src.compiler.daemon.CompileRequest import CompileRequest
+from src.compiler.daemon.CompileResponse import CompileResponse
+
+
+class CompileServer:
+    """
+    Compile daemon, which transpiles files for CompileClients.
+
+    A regular run of the compiler spends most of its time before parsing
+    even begins: starting the interpreter, importing the compiler and
+    loading the port libraries. The server pays for all of this once,
+    then keeps a warm CompileSession for each set of options that it
+    was asked to compile with (so the ports are reused), alongside an
+    LRU of the parsed imported modules (see ModuleCache), so an unchanged
+    import is not even parsed again. The directory listings of the
+    source roots are read again for each request, so modules which were
+    created after the server started are found as well.
+
+    Each client connection is served by its own thread, but the
+    compilations themselves are done one at a time.
+    """
+
+    # The default amount of option sets to keep warm sessions for
+    DEFAULT_MAX_SESSIONS: int = 8
+
+    __address: str
+    __max_modules: int
+    __max_sessions: int
+    # The warm sessions, by their options (least recently used first)
+    __sessions: "OrderedDict[CompileOptions, CompileSession]"
+    # Only one compilation runs at a time (a session is not thread-safe)
+    __lock: Lock
+
+    def __init__(self, address: Optional[str] = None, max_modules: int = ModuleCache.DEFAULT_MAX_MODULES,
+                 max_sessions: int = DEFAULT_MAX_SESSIONS) -> None:
+        """
+        :param address: The address to listen on (None for the default address, see CompileClient).
+        :param max_modules: The maximum amount of parsed imported modules to keep, per session.
+        :param max_sessions: The maximum amount of option sets to keep warm sessions for.
+        """
+        self.__address = address if address is not None else CompileClient.get_default_address()
+        self.__max_modules = max_modules
+        self.__max_sessions = max_sessions
+        self.__sessions = OrderedDict()
+        self.__lock = Lock()
+
+    def get_address(self) -> str:
+        """
+        :return: The address that the server listens on.
+        """
+        return self.__address
+
+    def serve_forever(self) -> None:
+        """
+        Listens for clients, until the process is interrupted.
+        """
+        # Only a single server can listen on an address
+        running_client = CompileClient.connect(self.__address)
+        if running_client is not None:
+            running_client.close()
+            raise OSError(f"A compile server is already listening on '{self.__address}'.")
+
+        # Warm up with the default options (loads the ported libraries and such)
+        Compiler.compile("print(1)", self.__get_session(CompileOptions()))
+
+        # Create the socket's directory, so that only the current user can reach it
+        if not self.__address.startswith(PIPE_PREFIX):
+            makedirs(dirname(self.__address) or ".", mode=0o700, exist_ok=True)
+            # Remove the socket of a server which was not stopped properly
+            if exists(self.__address):
+                remove(self.__address)
+
+        # Clients authenticate with a random key, which only the current user can read
+        key = urandom(32)
+        key_path = CompileClient.get_key_path(self.__address)
+        listener = Listener(self.__address, authkey=key)
+        if exists(key_path):
+            remove(key_path)
+        key_file = open_file(key_path, O_WRONLY | O_CREAT | O_EXCL, 0o600)
+        try:
+            write(key_file, key)
+        finally:
+            close(key_file)
+
+        try:
+            while True:
+                # Wait for the next client
+                try:
+                    connection = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    # The client disconnected (or did not have the key)
+                    continue
+                Thread(target=self.__serve_connection, args=(connection,), daemon=True).start()
+        finally:
+            # Clients should not find a stopped server (the listener removes the socket itself)
+            if exists(key_path):
+                remove(key_path)
+            listener.close()
+
+    def handle(self, request: CompileRequest) -> CompileResponse:
+        """
+        Transpiles the source of a request.
+
+        :param request: The request to handle.
+        :return: The response to send back.
+        """
+        # Import locally, as the version is defined by the package script
+        from src import __version__
+
+        start = perf_counter()
+        # A client of another version expects another output (clients check the greeting, but requests can be
+        # sent by other programs, or by a client which kept its connection across an upgrade of the server)
+        if request.version != __version__:
+            return CompileResponse(None, f"The compile server runs version {__version__}, "
+                                         f"but the request was sent by version {request.version}.", False, 0)
+        # The debuggers show the tree in the server's process, which the client can't see
+        if request.options.is_debug():
+            return CompileResponse(None, "The debugging flags are not supported by the compile server.", False, 0)
+
+        with self.__lock:
+            cached = False
+            try:
+                session = self.__get_session(request.options)
+                # Modules could have been created (or removed) since the last request
+                session.get_resolver().invalidate()
+                # Load it from the cache, or transpile it
+                if request.options.cache_directory is None:
+                    code = Compiler.transpile(Compiler.parse(request.source, session, request.path))
+                else:
+                    cache = TranspileCache(request.options.cache_directory)
+                    cache_key = cache.get_key(request.source, session, request.path)
+                    loaded_code = cache.load(cache_key, session)
+                    cached = loaded_code is not None
+                    if loaded_code is None:
+                        module = Compiler.parse(request.source, session, request.path, cache.get_definitions())
+                        code = Compiler.transpile(module)
+                        cache.store(cache_key, module, code)
+                    else:
+                        code = loaded_code
+            except Exception as e:
+                # Report the error to the client, and keep serving
+                return CompileResponse(None, f"{type(e).__name__}: {e}", False, perf_counter() - start)
+        return CompileResponse(code, None, cached, perf_counter() - start)
+
+    def __serve_connection(self, connection: Connection) -> None:
+        """
+        Handles the requests of a single client, until it disconnects.
+
+        :param connection: The connection to the client.
+        """
+        # Import locally, as the version is defined by the package script
+        from src import __version__
+
+        with connection:
+            try:
+                # Greet the client with our version, so it knows if our output matches its own
+                connection.send(__version__)
+                while True:
+                    request: CompileRequest = connection.recv()
+                    connection.send(self.handle(request))
+            except (OSError, EOFError):
+                # The client disconnected
+                return
+
+    def __get_session(self, options: CompileOptions) -> CompileSession:
+        """
+        :param options: The options to compile with.
+        :return: The warm session of the options (created if there is none).
+        """
+        session = self.__sessions.get(options)
+        if session is None:
+            session = CompileSession(options, ModuleCache(self.__max_modules))
+            self.__sessions[options] = session
+        self.__sessions.move_to_end(options)
+        # Drop the sessions which were not used for the longest time
+        while len(self.__sessions) > self.__max_sessions:
+            self.__sessions.popitem(last=False)
+        return session
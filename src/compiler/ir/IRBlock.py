@@ -0,0 +1,71 @@
+"""
+IRBlock class.
+A basic block of an IR function.
+"""
+from typing import List, Optional, Tuple
+
+from src.compiler.ir.IRInstruction import IRInstruction
+
+
+class IRBlock:
+    """
+    A basic block: a list of instructions which always run one after
+    the other, ended by a single terminator (a jump, a branch or a
+    return), which is the only instruction that leaves the block.
+    """
+
+    __slots__ = ("__label", "__instructions")
+
+    __label: str
+    __instructions: List[IRInstruction]
+
+    def __init__(self, label: str) -> None:
+        """
+        :param label: The name of the block (unique in its function).
+        """
+        self.__label = label
+        self.__instructions = []
+
+    def get_label(self) -> str:
+        """
+        :return: The name of the block.
+        """
+        return self.__label
+
+    def get_instructions(self) -> List[IRInstruction]:
+        """
+        :return: The instructions of the block, in order (the terminator last).
+        """
+        return self.__instructions
+
+    def append(self, instruction: IRInstruction) -> None:
+        """
+        Adds an instruction to the end of the block.
+
+        :param instruction: The instruction to add.
+        """
+        self.__instructions.append(instruction)
+
+    def get_terminator(self) -> Optional[IRInstruction]:
+        """
+        :return: The terminator of the block (None if the block is not terminated yet).
+        """
+        if self.__instructions and self.__instructions[-1].is_terminator():
+            return self.__instructions[-1]
+        return None
+
+    def is_terminated(self) -> bool:
+        """
+        :return: True if the block ends with a terminator.
+        """
+        return self.get_terminator() is not None
+
+    def get_successors(self) -> Tuple[str, ...]:
+        """
+        :return: The labels of the blocks which the block jumps to.
+        """
+        terminator = self.get_terminator()
+        return () if terminator is None else terminator.targets
+
+    def __str__(self) -> str:
+        return "\n".join([f"{self.__label}:"] + [f"  {instruction}" for instruction in self.__instructions])
@@ -0,0 +1,119 @@
+"""
+IRClass class.
+A class of the IR.
+"""
+from typing import Dict, List, Optional
+
+from src.compiler.ir.IRConstant import IRConstant
+from src.compiler.ir.IRFunction import IRFunction
+from src.compiler.ir.IRVariable import IRVariable
+
+
+class IRClass:
+    """
+    A class of the IR: its typed fields (with their initial values)
+    and its methods, which take the instance as their first argument.
+    """
+
+    __slots__ = ("__name", "__fields", "__field_values", "__constructor", "__methods")
+
+    __name: str
+    # The fields, by their names (in order)
+    __fields: Dict[str, IRVariable]
+    # The initial values of the fields which have one
+    __field_values: Dict[str, IRConstant]
+    __constructor: Optional[IRFunction]
+    # The methods (without the constructor), by their names
+    __methods: Dict[str, IRFunction]
+
+    def __init__(self, name: str) -> None:
+        """
+        :param name: The name of the class.
+        """
+        self.__name = name
+        self.__fields = {}
+        self.__field_values = {}
+        self.__constructor = None
+        self.__methods = {}
+
+    def get_name(self) -> str:
+        """
+        :return: The name of the class.
+        """
+        return self.__name
+
+    def add_field(self, field: IRVariable, value: Optional[IRConstant]) -> None:
+        """
+        Adds a field to the class.
+
+        :param field: The field.
+        :param value: Its initial value (None if it has none).
+        """
+        self.__fields[field.name] = field
+        if value is not None:
+            self.__field_values[field.name] = value
+
+    def get_field(self, name: str) -> Optional[IRVariable]:
+        """
+        :param name: The name of a field.
+        :return: The field (None if the class has no such field).
+        """
+        return self.__fields.get(name)
+
+    def get_fields(self) -> List[IRVariable]:
+        """
+        :return: The fields of the class, in order.
+        """
+        return list(self.__fields.values())
+
+    def get_field_value(self, name: str) -> Optional[IRConstant]:
+        """
+        :param name: The name of a field.
+        :return: The initial value of the field (None if it has none).
+        """
+        return self.__field_values.get(name)
+
+    def set_constructor(self, constructor: IRFunction) -> None:
+        """
+        :param constructor: The constructor of the class.
+        """
+        self.__constructor = constructor
+
+    def get_constructor(self) -> Optional[IRFunction]:
+        """
+        :return: The constructor of the class (None if it has none, so it takes no arguments).
+        """
+        return self.__constructor
+
+    def add_method(self, method: IRFunction) -> None:
+        """
+        :param method: A method of the class.
+        """
+        self.__methods[method.get_name()] = method
+
+    def get_method(self, name: str) -> Optional[IRFunction]:
+        """
+        :param name: The name of a method.
+        :return: The method (None if the class has no such method).
+        """
+        return self.__methods.get(name)
+
+    def get_methods(self) -> List[IRFunction]:
+        """
+        :return: The methods of the class (without the constructor), in order.
+        """
+        return list(self.__methods.values())
+
+    def get_functions(self) -> List[IRFunction]:
+        """
+        :return: The constructor (if there is one) and the methods of the class.
+        """
+        return ([] if self.__constructor is None else [self.__constructor]) + self.get_methods()
+
+    def __str__(self) -> str:
+        fields = "".join(
+            f"\n  field {field}: {field.type}" +
+            (f" = {self.__field_values[field.name]}" if field.name in self.__field_values else "")
+            for field in self.__fields.values()
+        )
+        return f"class @{self.__name} {{{fields}\n}}"
@@ -0,0 +1,43 @@
+"""
+IRConstant class.
+A literal value of the IR.
+"""
+from dataclasses import dataclass
+from json import dumps
+from typing import Any
+
+from src.compiler.ir.IRType import IRType
+from src.compiler.ir.IRValue import IRValue
+from src.compiler.Util import Util
+from src.structures.Errors import UnsupportedFeatureException
+
+
+@dataclass(frozen=True)
+class IRConstant(IRValue):
+    """
+    A literal int, bool or str value.
+    """
+
+    value: Any
+
+    def __str__(self) -> str:
+        if isinstance(self.value, bool):
+            return "true" if self.value else "false"
+        if isinstance(self.value, str):
+            return dumps(self.value)
+        return str(self.value)
+
+    @staticmethod
+    def of(value: Any) -> "IRConstant":
+        """
+        :param value: The Python value of a constant.
+        :return: The constant, with the type of the value.
+        """
+        # (booleans are integers as well, so they are checked first)
+        if isinstance(value, bool):
+            return IRConstant(IRType.BOOL, value)
+        if isinstance(value, int):
+            return IRConstant(IRType.INT, value)
+        if isinstance(value, str):
+            return IRConstant(IRType.STR, value)
+        raise UnsupportedFeatureException(f"{Util.get_name(value)} constant")
@@ -0,0 +1,446 @@
+"""
+IRCppPrinter class.
+Prints the IR of a compilation as C++ code (see the --backend flag).
+"""
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from src.compiler.CodeBuffer import CodeBuffer
+from src.compiler.ir.IRBlock import IRBlock
+from src.compiler.ir.IRClass import IRClass
+from src.compiler.ir.IRConstant import IRConstant
+from src.compiler.ir.IRFunction import IRFunction
+from src.compiler.ir.IRInstruction import IRInstruction
+from src.compiler.ir.IRModule import IRModule
+from src.compiler.ir.IRTemp import IRTemp
+from src.compiler.ir.IRType import IRType
+from src.compiler.ir.IRValue import IRValue
+from src.compiler.ir.IRVariable import IRVariable
+from src.structures.Errors import UnsupportedFeatureException
+from src.structures.TypeRenames import CodeSink
+
+# The native names of the builtin types (the classes keep their names)
+NATIVE_NAMES: Dict[IRType, str] = {
+    IRType.INT: "int",
+    IRType.BOOL: "bool",
+    IRType.STR: "std::string",
+    IRType.VOID: "void",
+    IRType.ANY: "auto",
+}
+# The native operators of the arithmetic and comparison opcodes (integer division truncates in C++)
+OPERATORS: Dict[str, str] = {
+    **{opcode: operator for operator, opcode in IRInstruction.ARITHMETIC.items()},
+    **{opcode: operator for operator, opcode in IRInstruction.COMPARISONS.items()},
+    "floordiv": "/",
+}
+# The types which can be declared without a value, at the top of a function
+DEFAULT_DECLARABLE: Set[IRType] = {IRType.INT, IRType.BOOL, IRType.STR}
+# The indentation of each nesting level
+INDENT: str = "    "
+
+# A temporary or a variable, as a key of the declarations (temporaries and variables never share names)
+ValueKey = Union[int, str]
+
+
+class IRCppPrinter:
+    """
+    Prints the IR of a compilation as C++ code: the includes, the ported
+    functions, the classes (their methods are defined after all of them,
+    so each class can use the classes after it), the functions and the
+    'main' function.
+
+    The control flow of each function is printed as it is in the IR, as
+    labeled blocks which jump to each other with 'goto'. C++ forbids
+    jumping past the declaration of a variable into its scope, so each
+    value is declared where no jump can skip it:
+     - values which are only used after their definition in the same
+       block (and the values of the entry block) are declared where
+       they are defined,
+     - int, bool and str values are declared at the top of the function,
+     - the other values (objects, and values whose type only the native
+       compiler knows) open a scope at the block which defines them,
+       which is closed after the last block that uses them, or jumps
+       back into the scope (jumping into it from before is not allowed).
+    """
+
+    __module: IRModule
+    __lines: List[str]
+    __depth: int
+    # The function being printed, and how each of its values is declared (see __plan_declarations)
+    __function: IRFunction
+    __inline: Set[ValueKey]
+    __top: List[IRValue]
+    # The scopes of the function, as the index of their first and last block
+    __scopes: List[Tuple[int, int]]
+
+    def __init__(self, module: IRModule) -> None:
+        """
+        :param module: The IR to print.
+        """
+        self.__module = module
+        self.__lines = []
+        self.__depth = 0
+        self.__inline = set()
+        self.__top = []
+        self.__scopes = []
+
+    @classmethod
+    def emit(cls, module: IRModule, sink: CodeSink) -> None:
+        """
+        Writes the C++ code of the IR to a sink.
+
+        :param module: The IR of a compilation.
+        :param sink: The sink to write the code to.
+        """
+        printer = cls(module)
+        printer.__print_module()
+        sink.write("\n".join(printer.__lines) + "\n")
+
+    @classmethod
+    def transpile(cls, module: IRModule) -> str:
+        """
+        :param module: The IR of a compilation.
+        :return: The C++ code of the IR.
+        """
+        buffer = CodeBuffer()
+        cls.emit(module, buffer)
+        return buffer.getvalue()
+
+    def __write(self, line: str) -> None:
+        """
+        Adds a line of code, at the current nesting level.
+
+        :param line: The line.
+        """
+        self.__lines.append(INDENT * self.__depth + line)
+
+    def __print_module(self) -> None:
+        """
+        Prints the whole compilation.
+        """
+        module = self.__module
+        for dependency in module.get_dependencies():
+            self.__write(f"#include <{dependency}>")
+        self.__write("")
+
+        # The ported functions, declared first so their definitions can call each other
+        if module.get_ports():
+            for port in module.get_ports():
+                self.__write(self.__get_header(port, with_defaults=True) + ";")
+            self.__write("")
+            for port in module.get_ports():
+                self.__lines.append(str(port.get_native_code()))
+            self.__write("")
+
+        # The classes and the functions are declared before they are defined, so they can use each other
+        for ir_class in module.get_classes():
+            self.__write(f"class {ir_class.get_name()};")
+        for function in module.get_functions():
+            self.__write(self.__get_header(function, with_defaults=True) + ";")
+        if module.get_classes() or module.get_functions():
+            self.__write("")
+        for ir_class in module.get_classes():
+            self.__print_class(ir_class)
+        for ir_class in module.get_classes():
+            for method in ir_class.get_functions():
+                self.__print_function(method, self.__get_header(method, with_defaults=False))
+        for function in module.get_functions():
+            self.__print_function(function, self.__get_header(function, with_defaults=False))
+        self.__print_function(module.get_main(), "int main()", "/* Transpiled with ComPy */")
+
+    def __print_class(self, ir_class: IRClass) -> None:
+        """
+        Prints the definition of a class (its methods are only declared).
+
+        :param ir_class: The class.
+        """
+        # The names which start with '__' are private, like in Python
+        members: Dict[bool, List[str]] = {True: [], False: []}
+        for field in ir_class.get_fields():
+            if field.type == IRType.ANY:
+                raise UnsupportedFeatureException(f"field '{field.name}' of type {IRType.ANY}")
+            value = ir_class.get_field_value(field.name)
+            initializer = "" if value is None else f" = {self.__get_value(value)}"
+            members[field.name.startswith("__")].append(f"{self.__get_type(field.type)} {field.name}{initializer};")
+        for method in ir_class.get_functions():
+            is_private = method.get_name().startswith("__") and method is not ir_class.get_constructor()
+            members[is_private].append(self.__get_header(method, with_defaults=True, qualified=False) + ";")
+
+        self.__write(f"class {ir_class.get_name()} {{")
+        for is_private, section in ((True, "private:"), (False, "public:")):
+            if members[is_private]:
+                self.__write(section)
+                self.__depth += 1
+                for member in members[is_private]:
+                    self.__write(member)
+                self.__depth -= 1
+        self.__write("};")
+        self.__write("")
+
+    def __get_header(self, function: IRFunction, with_defaults: bool, qualified: bool = True) -> str:
+        """
+        :param function: A function, a port or a method.
+        :param with_defaults: True to add the default values of the last arguments.
+        :param qualified: True to prefix a method with the name of its class.
+        :return: The native header of the function.
+        """
+        owner = function.get_owner()
+        params = function.get_params()[0 if owner is None else 1:]
+        required = len(params) - len(function.get_defaults())
+        args = ", ".join(
+            f"{self.__get_type(param.type)} {param.name}" +
+            (f" = {self.__get_value(function.get_defaults()[index - required])}"
+             if with_defaults and index >= required else "")
+            for index, param in enumerate(params)
+        )
+        name = function.get_name() if owner is None or not qualified else f"{owner}::{function.get_name()}"
+        # The constructor is named after its class, and has no return type
+        if owner is not None and function is self.__get_class(owner).get_constructor():
+            return f"{owner}::{owner}({args})" if qualified else f"{owner}({args})"
+        return f"{self.__get_type(function.get_return_type())} {name}({args})"
+
+    def __get_class(self, name: str) -> IRClass:
+        """
+        :param name: The name of a class of the program.
+        :return: The class.
+        """
+        return self.__module.get_class(name)  # type: ignore
+
+    def __print_function(self, function: IRFunction, header: str, comment: Optional[str] = None) -> None:
+        """
+        Prints the definition of a function.
+
+        :param function: The function.
+        :param header: The native header of the function.
+        :param comment: A comment to print at the start of the function (None for no comment).
+        """
+        self.__function = function
+        self.__plan_declarations()
+        blocks = function.get_blocks()
+        scope_starts = {start for start, _ in self.__scopes}
+        scope_ends: Dict[int, int] = {}
+        for _, end in self.__scopes:
+            scope_ends[end] = scope_ends.get(end, 0) + 1
+
+        self.__write(header + " {")
+        self.__depth += 1
+        if comment is not None:
+            self.__write(comment)
+        for value in self.__top:
+            self.__write(f"{self.__get_type(value.type)} {self.__get_value(value)}{{}};")
+        for index, block in enumerate(blocks):
+            if index == 0:
+                # (nothing jumps to the entry block)
+                self.__print_instructions(block)
+            elif index in scope_starts:
+                # The block opens a scope, which its values are declared in
+                self.__write(f"{block.get_label()}: {{")
+                self.__depth += 1
+                self.__print_instructions(block)
+            else:
+                self.__write(f"{block.get_label()}: {{")
+                self.__depth += 1
+                self.__print_instructions(block)
+                self.__depth -= 1
+                self.__write("}")
+            for _ in range(scope_ends.get(index, 0)):
+                self.__depth -= 1
+                self.__write("}")
+        self.__depth -= 1
+        self.__write("}")
+        self.__write("")
+
+    def __plan_declarations(self) -> None:
+        """
+        Decides where each value of the function is declared (see the description of the class).
+        """
+        function = self.__function
+        blocks = function.get_blocks()
+        params = {param.name for param in function.get_params()}
+        # The blocks which set each value (once per instruction) and which use it, by their indices
+        definitions: Dict[ValueKey, List[int]] = {}
+        uses: Dict[ValueKey, List[int]] = {}
+        values: Dict[ValueKey, IRValue] = {}
+        # The values which are used outside the block which sets them (or before they are set in it)
+        escaping: Set[ValueKey] = set()
+        for index, block in enumerate(blocks):
+            set_here: Set[ValueKey] = set()
+            for instruction in block.get_instructions():
+                for operand in instruction.operands:
+                    key = self.__get_key(operand)
+                    if key is not None and key not in params:
+                        uses.setdefault(key, []).append(index)
+                        values[key] = operand
+                        if key not in set_here:
+                            escaping.add(key)
+                key = None if instruction.result is None else self.__get_key(instruction.result)
+                if key is not None and key not in params:
+                    definitions.setdefault(key, []).append(index)
+                    values[key] = instruction.result  # type: ignore
+                    set_here.add(key)
+
+        self.__inline = set()
+        self.__top = []
+        starts: Dict[int, int] = {}
+        for key, value in values.items():
+            defined_in = definitions.get(key, [])
+            used_in = uses.get(key, [])
+            if len(defined_in) == 1 and (defined_in[0] == 0 or key not in escaping):
+                self.__inline.add(key)
+            elif value.type in DEFAULT_DECLARABLE:
+                self.__top.append(value)
+            elif len(defined_in) == 1:
+                self.__inline.add(key)
+                start, end = defined_in[0], max(used_in + defined_in)
+                starts[start] = max(starts.get(start, start), end)
+            else:
+                raise UnsupportedFeatureException(f"{value.type} value '{value}' which is set more than once")
+        self.__scopes = self.__nest_scopes(starts)
+
+    def __nest_scopes(self, starts: Dict[int, int]) -> List[Tuple[int, int]]:
+        """
+        Extends the scopes over the blocks which jump back into them, and nests them in each other.
+
+        :param starts: The scopes, as the index of their last block by the index of their first block.
+        :return: The scopes, as the indices of their first and last blocks.
+        """
+        labels = {block.get_label(): index for index, block in enumerate(self.__function.get_blocks())}
+        predecessors = {labels[label]: [labels[source] for source in sources]
+                        for label, sources in self.__function.get_predecessors().items()}
+        changed = True
+        while changed:
+            changed = False
+            for start, end in sorted(starts.items()):
+                for index in range(start + 1, end + 1):
+                    for source in predecessors[index]:
+                        if source < start:
+                            raise UnsupportedFeatureException(
+                                f"jump into the scope of the values of block '{self.__get_label(start)}'"
+                            )
+                        end = max(end, source)
+                # A scope which starts inside this one, and ends after it, is closed together with it
+                for other_start, other_end in starts.items():
+                    if start < other_start <= end < other_end:
+                        end = other_end
+                if end != starts[start]:
+                    starts[start] = end
+                    changed = True
+        return sorted(starts.items())
+
+    def __get_label(self, index: int) -> str:
+        """
+        :param index: The index of a block of the function.
+        :return: The label of the block.
+        """
+        return self.__function.get_blocks()[index].get_label()
+
+    @staticmethod
+    def __get_key(value: IRValue) -> Optional[ValueKey]:
+        """
+        :param value: An operand or a result.
+        :return: The key of the temporary or the variable (None for constants).
+        """
+        if isinstance(value, IRTemp):
+            return value.index
+        if isinstance(value, IRVariable):
+            return value.name
+        return None
+
+    def __print_instructions(self, block: IRBlock) -> None:
+        """
+        Prints the instructions of a block.
+
+        :param block: The block.
+        """
+        for instruction in block.get_instructions():
+            self.__write(self.__get_statement(instruction))
+
+    def __get_statement(self, instruction: IRInstruction) -> str:
+        """
+        :param instruction: An instruction.
+        :return: The native statement of the instruction.
+        """
+        opcode, operands = instruction.opcode, [self.__get_value(operand) for operand in instruction.operands]
+        if opcode == "jump":
+            return f"goto {instruction.targets[0]};"
+        if opcode == "branch":
+            return f"if ({operands[0]}) goto {instruction.targets[0]}; else goto {instruction.targets[1]};"
+        if opcode == "ret":
+            return f"return {operands[0]};" if operands else "return;"
+        if opcode == "set_field":
+            return f"{self.__get_member(instruction.operands[0], str(instruction.name))} = {operands[1]};"
+        if opcode == "advance":
+            return f"++{operands[0]};"
+
+        if opcode == "copy":
+            expression = operands[0]
+        elif opcode in OPERATORS:
+            left, right = (self.__get_operand(operand, opcode) for operand in instruction.operands)
+            expression = f"{left} {OPERATORS[opcode]} {right}"
+        elif opcode in ("call", "new"):
+            expression = f"{instruction.name}({', '.join(operands)})"
+        elif opcode == "call_method":
+            expression = f"{self.__get_member(instruction.operands[0], str(instruction.name))}" \
+                         f"({', '.join(operands[1:])})"
+        elif opcode == "get_field":
+            expression = self.__get_member(instruction.operands[0], str(instruction.name))
+        elif opcode == "iter":
+            expression = f"{operands[0]}.begin()"
+        elif opcode == "iter_end":
+            expression = f"{operands[0]}.end()"
+        elif opcode == "deref":
+            expression = f"*{operands[0]}"
+        else:
+            raise UnsupportedFeatureException(f"'{opcode}' instruction")
+
+        result = instruction.result
+        if result is None:
+            return f"{expression};"
+        declaration = f"{self.__get_type(result.type)} " if self.__get_key(result) in self.__inline else ""
+        return f"{declaration}{self.__get_value(result)} = {expression};"
+
+    def __get_operand(self, operand: IRValue, opcode: str) -> str:
+        """
+        :param operand: An operand of an arithmetic instruction or a comparison.
+        :param opcode: The opcode of the instruction.
+        :return: The native operand (string literals are converted, as they can't be concatenated natively).
+        """
+        if isinstance(operand, IRConstant) and operand.type == IRType.STR and opcode == "add":
+            return f"std::string({self.__get_value(operand)})"
+        return self.__get_value(operand)
+
+    def __get_member(self, receiver: IRValue, name: str) -> str:
+        """
+        :param receiver: An object.
+        :param name: The name of a field or a method of the object.
+        :return: The native access to the member.
+        """
+        if self.__is_self(receiver):
+            return f"this->{name}"
+        return f"{self.__get_value(receiver)}.{name}"
+
+    def __is_self(self, value: IRValue) -> bool:
+        """
+        :param value: A value of the function.
+        :return: True if the value is the object of the method being printed.
+        """
+        params = self.__function.get_params()
+        return self.__function.get_owner() is not None and bool(params) and value == params[0]
+
+    def __get_value(self, value: IRValue) -> str:
+        """
+        :param value: An operand or a result.
+        :return: The native value.
+        """
+        if isinstance(value, IRTemp):
+            return f"__t{value.index}"
+        if isinstance(value, IRVariable):
+            return "(*this)" if self.__is_self(value) else value.name
+        return str(value)
+
+    @staticmethod
+    def __get_type(value_type: IRType) -> str:
+        """
+        :param value_type: The type of a value.
+        :return: The native type.
+        """
+        return NATIVE_NAMES.get(value_type, value_type.name)
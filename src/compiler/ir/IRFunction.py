@@ -0,0 +1,236 @@
+"""
+IRFunction class.
+A function of the IR, made of basic blocks.
+"""
+from typing import Dict, List, Optional, Set
+
+from src.compiler.ir.IRBlock import IRBlock
+from src.compiler.ir.IRConstant import IRConstant
+from src.compiler.ir.IRTemp import IRTemp
+from src.compiler.ir.IRType import IRType
+from src.compiler.ir.IRVariable import IRVariable
+
+
+class IRFunction:
+    """
+    A function of the IR: its typed arguments and return type, and its
+    code, as basic blocks which jump to each other (the first block is
+    the entry of the function). The blocks are kept in the order they
+    were created in, which is the order the code is printed in.
+
+    Methods take the instance as their first argument ('self'), and
+    ported functions have no blocks, only the native code which
+    defines them (they can only be called).
+    """
+
+    __slots__ = ("__name", "__params", "__defaults", "__return_type", "__owner", "__native_code", "__blocks",
+                 "__variables", "__temp_count", "__block_count")
+
+    __name: str
+    __params: List[IRVariable]
+    # The default values of the last arguments
+    __defaults: List[IRConstant]
+    __return_type: IRType
+    # The name of the class of a method (None for functions)
+    __owner: Optional[str]
+    # The native definition of a ported function (None for the functions of the program)
+    __native_code: Optional[str]
+    # The blocks, by their labels (in order)
+    __blocks: Dict[str, IRBlock]
+    # The arguments and the local variables, by their names
+    __variables: Dict[str, IRVariable]
+    __temp_count: int
+    __block_count: int
+
+    def __init__(self, name: str, params: List[IRVariable], defaults: List[IRConstant], return_type: IRType,
+                 owner: Optional[str] = None, native_code: Optional[str] = None) -> None:
+        """
+        :param name: The name of the function.
+        :param params: The arguments of the function.
+        :param defaults: The default values of the last arguments.
+        :param return_type: The type of the returned value (void if nothing is returned).
+        :param owner: The name of the class of a method (None for functions).
+        :param native_code: The native definition of a ported function (None for the functions of the program).
+        """
+        self.__name = name
+        self.__params = params
+        self.__defaults = defaults
+        self.__return_type = return_type
+        self.__owner = owner
+        self.__native_code = native_code
+        self.__blocks = {}
+        self.__variables = {param.name: param for param in params}
+        self.__temp_count = 0
+        self.__block_count = 0
+
+    def get_name(self) -> str:
+        """
+        :return: The name of the function.
+        """
+        return self.__name
+
+    def get_qualified_name(self) -> str:
+        """
+        :return: The name of the function, after the name of its class for methods.
+        """
+        return self.__name if self.__owner is None else f"{self.__owner}.{self.__name}"
+
+    def get_params(self) -> List[IRVariable]:
+        """
+        :return: The arguments of the function ('self' first, for methods).
+        """
+        return self.__params
+
+    def get_defaults(self) -> List[IRConstant]:
+        """
+        :return: The default values of the last arguments.
+        """
+        return self.__defaults
+
+    def get_required_count(self) -> int:
+        """
+        :return: The amount of arguments which must be passed (those without a default value).
+        """
+        return len(self.__params) - len(self.__defaults)
+
+    def get_return_type(self) -> IRType:
+        """
+        :return: The type of the returned value.
+        """
+        return self.__return_type
+
+    def get_owner(self) -> Optional[str]:
+        """
+        :return: The name of the class of a method (None for functions).
+        """
+        return self.__owner
+
+    def get_native_code(self) -> Optional[str]:
+        """
+        :return: The native definition of a ported function (None for the functions of the program).
+        """
+        return self.__native_code
+
+    def is_port(self) -> bool:
+        """
+        :return: True if this is a ported function (defined by native code, without blocks).
+        """
+        return self.__native_code is not None
+
+    def add_block(self, hint: str) -> IRBlock:
+        """
+        Creates a block, after the existing ones.
+
+        :param hint: What the block is for, which its label starts with (the first block is always the entry).
+        :return: The new block.
+        """
+        label = "entry" if not self.__blocks else f"{hint}{self.__block_count}"
+        self.__block_count += 1
+        block = self.__blocks[label] = IRBlock(label)
+        return block
+
+    def move_to_end(self, block: IRBlock) -> None:
+        """
+        Moves a block after the other blocks (blocks are often created before the code
+        which jumps to them, and are only moved into place when their own code is added).
+
+        :param block: A block of the function.
+        """
+        self.__blocks[block.get_label()] = self.__blocks.pop(block.get_label())
+
+    def get_blocks(self) -> List[IRBlock]:
+        """
+        :return: The blocks, in order (the entry first).
+        """
+        return list(self.__blocks.values())
+
+    def get_block(self, label: str) -> Optional[IRBlock]:
+        """
+        :param label: The label of a block.
+        :return: The block (None if there is no block with the label).
+        """
+        return self.__blocks.get(label)
+
+    def get_predecessors(self) -> Dict[str, List[str]]:
+        """
+        :return: The labels of the blocks which jump to each block, by the label of the block.
+        """
+        predecessors: Dict[str, List[str]] = {label: [] for label in self.__blocks}
+        for block in self.__blocks.values():
+            for target in block.get_successors():
+                if target in predecessors:
+                    predecessors[target].append(block.get_label())
+        return predecessors
+
+    def get_reachable_labels(self) -> Set[str]:
+        """
+        :return: The labels of the blocks which can be reached from the entry.
+        """
+        reachable: Set[str] = set()
+        pending = list(self.__blocks)[:1]
+        while pending:
+            label = pending.pop()
+            if label in reachable or label not in self.__blocks:
+                continue
+            reachable.add(label)
+            pending.extend(self.__blocks[label].get_successors())
+        return reachable
+
+    def remove_unreachable_blocks(self) -> None:
+        """
+        Removes the blocks which can't be reached from the entry (such as the code after a return).
+        """
+        reachable = self.get_reachable_labels()
+        self.__blocks = {label: block for label, block in self.__blocks.items() if label in reachable}
+
+    def new_temp(self, temp_type: IRType) -> IRTemp:
+        """
+        :param temp_type: The type of the temporary.
+        :return: A new temporary of the function.
+        """
+        temp = IRTemp(temp_type, self.__temp_count)
+        self.__temp_count += 1
+        return temp
+
+    def declare_variable(self, name: str, variable_type: IRType) -> IRVariable:
+        """
+        Declares a local variable (the same variable, if it was already declared).
+
+        :param name: The name of the variable.
+        :param variable_type: The type of the variable.
+        :return: The variable.
+        """
+        variable = self.__variables.get(name)
+        if variable is None:
+            variable = self.__variables[name] = IRVariable(variable_type, name)
+        return variable
+
+    def get_variable(self, name: str) -> Optional[IRVariable]:
+        """
+        :param name: The name of a variable.
+        :return: The argument or the local variable (None if it was not declared).
+        """
+        return self.__variables.get(name)
+
+    def get_variables(self) -> List[IRVariable]:
+        """
+        :return: The arguments and the local variables, in the order they were declared in.
+        """
+        return list(self.__variables.values())
+
+    def get_header(self) -> str:
+        """
+        :return: The name, the arguments and the return type of the function, as IR text.
+        """
+        required = self.get_required_count()
+        params = ", ".join(
+            f"{param}: {param.type}" + (f" = {self.__defaults[index - required]}" if index >= required else "")
+            for index, param in enumerate(self.__params)
+        )
+        return f"@{self.get_qualified_name()}({params}) -> {self.__return_type}"
+
+    def __str__(self) -> str:
+        if self.is_port():
+            return f"port {self.get_header()}"
+        blocks = "\n".join(str(block) for block in self.__blocks.values())
+        return f"function {self.get_header()} {{\n{blocks}\n}}"
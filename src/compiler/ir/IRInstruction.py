@@ -0,0 +1,70 @@
+"""
+IRInstruction class.
+A single three-address instruction of the IR.
+"""
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, FrozenSet, Optional, Tuple
+
+from src.compiler.ir.IRValue import IRValue
+
+
+@dataclass(frozen=True)
+class IRInstruction:
+    """
+    A three-address instruction: an operation on a few operands, which
+    stores its result (if it has one) in a temporary or a variable.
+
+    The opcodes are:
+     - copy:                 result = operand
+     - add, sub, mul, div, floordiv, mod (see ARITHMETIC) and
+       eq, ne, lt, le, gt, ge (see COMPARISONS): result = left op right
+     - call:                 calls the function (or the port) 'name' with the operands
+     - call_method:          calls the method 'name' of the first operand, with the other operands
+     - new:                  constructs an object of the class 'name' with the operands
+     - get_field, set_field: reads (or writes the second operand to) the field 'name' of the first operand
+     - iter, iter_end:       the iterators to the start (and past the end) of the iterated operand
+     - deref, advance:       the item of an iterator (and moving the iterator to the next item)
+     - jump, branch, ret:    the terminators, which end each block (see TERMINATORS): a jump to
+                             the target block, a jump to the first target block if the operand
+                             is true (otherwise to the second one), and a return (of the operand)
+    """
+
+    # The arithmetic opcodes, and the comparison opcodes, by their native operators
+    ARITHMETIC: ClassVar[Dict[str, str]] = {"+": "add", "-": "sub", "*": "mul", "/": "div", "//": "floordiv",
+                                            "%": "mod"}
+    COMPARISONS: ClassVar[Dict[str, str]] = {"==": "eq", "!=": "ne", "<": "lt", "<=": "le", ">": "gt", ">=": "ge"}
+    # The opcodes which end a block
+    TERMINATORS: ClassVar[FrozenSet[str]] = frozenset({"jump", "branch", "ret"})
+
+    opcode: str
+    # The temporary (or the variable) which the result is stored in (None if there is no result)
+    result: Optional[IRValue] = field(default=None)
+    operands: Tuple[IRValue, ...] = field(default=())
+    # The function, class, method or field which the instruction refers to
+    name: Optional[str] = field(default=None)
+    # The labels of the blocks which a terminator jumps to
+    targets: Tuple[str, ...] = field(default=())
+
+    def is_terminator(self) -> bool:
+        """
+        :return: True if the instruction ends a block.
+        """
+        return self.opcode in IRInstruction.TERMINATORS
+
+    def __str__(self) -> str:
+        operands = ", ".join(str(operand) for operand in self.operands)
+        if self.opcode in ("call", "new"):
+            operation = f"{self.opcode} @{self.name}({operands})"
+        elif self.opcode == "call_method":
+            arguments = ", ".join(str(operand) for operand in self.operands[1:])
+            operation = f"call_method {self.operands[0]}.{self.name}({arguments})"
+        elif self.opcode in ("get_field", "set_field"):
+            value = "".join(f", {operand}" for operand in self.operands[1:])
+            operation = f"{self.opcode} {self.operands[0]}.{self.name}{value}"
+        else:
+            operation = " ".join(part for part in (self.opcode, operands, ", ".join(self.targets)) if part)
+            if operands and self.targets:
+                operation = f"{self.opcode} {operands}, {', '.join(self.targets)}"
+        if self.result is None:
+            return operation
+        return f"{self.result}: {self.result.type} = {operation}"
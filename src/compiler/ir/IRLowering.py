@@ -0,0 +1,751 @@
+"""
+IRLowering class.
+Lowers the tree of a compilation to the IR.
+"""
+from ast import Pass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, Union, cast
+
+from src.compiler.Util import Util
+from src.compiler.ir.IRBlock import IRBlock
+from src.compiler.ir.IRClass import IRClass
+from src.compiler.ir.IRConstant import IRConstant
+from src.compiler.ir.IRFunction import IRFunction
+from src.compiler.ir.IRInstruction import IRInstruction
+from src.compiler.ir.IRModule import IRModule
+from src.compiler.ir.IRType import IRType
+from src.compiler.ir.IRValue import IRValue
+from src.compiler.ir.IRVariable import IRVariable
+from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.concrete.PyAnnAssign import PyAnnAssign
+from src.pyexpressions.concrete.PyAssign import PyAssign
+from src.pyexpressions.concrete.PyAttribute import PyAttribute
+from src.pyexpressions.concrete.PyAugAssign import PyAugAssign
+from src.pyexpressions.concrete.PyBinOp import PyBinOp
+from src.pyexpressions.concrete.PyBoolOp import PyBoolOp
+from src.pyexpressions.concrete.PyBreak import PyBreak
+from src.pyexpressions.concrete.PyCall import PyCall
+from src.pyexpressions.concrete.PyClassDef import PyClassDef
+from src.pyexpressions.concrete.PyCompare import PyCompare
+from src.pyexpressions.concrete.PyConstant import PyConstant
+from src.pyexpressions.concrete.PyContinue import PyContinue
+from src.pyexpressions.concrete.PyExpr import PyExpr
+from src.pyexpressions.concrete.PyFor import PyFor
+from src.pyexpressions.concrete.PyFunctionDef import PyFunctionDef
+from src.pyexpressions.concrete.PyIf import PyIf
+from src.pyexpressions.concrete.PyIfExp import PyIfExp
+from src.pyexpressions.concrete.PyModule import PyModule
+from src.pyexpressions.concrete.PyName import PyName
+from src.pyexpressions.concrete.PyPass import PyPass
+from src.pyexpressions.concrete.PyReturn import PyReturn
+from src.pyexpressions.concrete.PyWhile import PyWhile
+from src.pyexpressions.highlevel.PyBody import PyBody
+from src.structures.Errors import InvalidTypeError, ObjectAlreadyDefinedError, ObjectNotDefinedError, \
+    UnsupportedFeatureException
+from src.structures.TypeRenames import LoweringSteps
+
+# The value of a call to a function which returns nothing (it can't be used as an operand)
+NO_VALUE: IRConstant = IRConstant(IRType.VOID, None)
+
+
+class IRLowering:
+    """
+    Lowers the tree of a compilation (after the optimization passes) to
+    the IR: each function, method and the code of the module itself
+    become IR functions, whose expressions are broken down into typed
+    three-address instructions, and whose control flow (conditionals,
+    loops, short-circuiting operations...) becomes jumps between blocks.
+
+    Expressions can be nested tens of thousands of levels deep, so they
+    are lowered with an explicit stack: the lowering of each expression
+    is a generator, which yields its nested nodes and receives the
+    values that they were lowered to (see __lower_expression).
+    """
+
+    __module: IRModule
+    # The function whose code is being lowered, and the block that the code is added to
+    __function: IRFunction
+    __block: IRBlock
+    # The blocks which 'continue' and 'break' jump to, for each loop around the code (innermost last)
+    __loops: List[Tuple[IRBlock, IRBlock]]
+    # The lowering of each class of statement, of expressions which are a single value,
+    # and of the other expressions (by the class of their node)
+    __statements: Dict[Type[PyExpression], Callable]
+    __values: Dict[Type[PyExpression], Callable[[PyExpression], IRValue]]
+    __expressions: Dict[Type[PyExpression], Callable[[PyExpression], LoweringSteps]]
+
+    def __init__(self, dependencies: List[str]) -> None:
+        """
+        :param dependencies: The native dependencies of the compilation.
+        """
+        self.__module = IRModule(dependencies, IRFunction("main", [], [], IRType.INT))
+        self.__function = self.__module.get_main()
+        self.__block = self.__function.add_block("entry")
+        self.__loops = []
+        self.__statements = {
+            PyAnnAssign: self.__lower_ann_assign,
+            PyAssign: self.__lower_assign,
+            PyAugAssign: self.__lower_aug_assign,
+            PyBody: self.__lower_body,
+            PyBreak: self.__lower_break,
+            PyContinue: self.__lower_continue,
+            PyExpr: self.__lower_expr,
+            PyFor: self.__lower_for,
+            PyIf: self.__lower_if,
+            PyReturn: self.__lower_return,
+            PyWhile: self.__lower_while,
+        }
+        self.__values = {
+            PyConstant: self.__lower_constant,
+            PyName: self.__lower_name,
+        }
+        self.__expressions = {
+            PyAttribute: self.__lower_attribute,
+            PyBinOp: self.__lower_bin_op,
+            PyBoolOp: self.__lower_bool_op,
+            PyCall: self.__lower_call,
+            PyCompare: self.__lower_compare,
+            PyIfExp: self.__lower_if_exp,
+        }
+
+    @classmethod
+    def lower(cls, module: PyModule) -> IRModule:
+        """
+        Lowers the tree of a compilation to the IR.
+
+        :param module: The root module of the compilation (the imported modules are lowered into it).
+        :return: The IR of the compilation.
+        """
+        dependencies, ported_dependencies = module.collect_dependencies()
+        lowering = cls(dependencies)
+        for port in ported_dependencies:
+            lowering.__declare_port(port.get_function_name(), port.get_interface_function(), port.transpile())
+
+        # Declare every function and class first, as the code can call the ones which are defined after it
+        definitions: List[Tuple[Union[PyFunctionDef, PyClassDef], Union[IRFunction, IRClass]]] = []
+        statements: List[PyExpression] = []
+        for pyexpr in module.iterate_body():
+            if isinstance(pyexpr, PyFunctionDef):
+                definitions.append((pyexpr, lowering.__declare_function(pyexpr)))
+            elif isinstance(pyexpr, PyClassDef):
+                definitions.append((pyexpr, lowering.__declare_class(pyexpr)))
+            elif not pyexpr.is_dead_expression():
+                statements.append(pyexpr)
+
+        # Then lower their code, and the code of the module itself
+        for definition, declaration in definitions:
+            if isinstance(definition, PyClassDef):
+                ir_class = cast(IRClass, declaration)
+                constructor = definition.get_constructor()
+                if constructor is not None:
+                    lowering.__lower_function(cast(IRFunction, ir_class.get_constructor()), constructor.get_code())
+                for method in definition.get_methods():
+                    lowering.__lower_function(cast(IRFunction, ir_class.get_method(method.get_id())),
+                                              method.get_code())
+            else:
+                lowering.__lower_function(cast(IRFunction, declaration), definition.get_code())
+        lowering.__lower_function(lowering.__module.get_main(), statements)
+        return lowering.__module
+
+    def __declare_port(self, name: str, interface: PyFunctionDef, native_code: str) -> None:
+        """
+        Declares a ported function.
+
+        :param name: The native name of the port.
+        :param interface: The function which represents the port in Python.
+        :param native_code: The native definition of the port.
+        """
+        port = self.__create_function(interface, None, native_code)
+        self.__module.add_port(IRFunction(name, port.get_params(), port.get_defaults(), port.get_return_type(),
+                                          native_code=native_code))
+
+    def __declare_function(self, definition: PyFunctionDef) -> IRFunction:
+        """
+        Declares a function of the program (its code is lowered later).
+
+        :param definition: The definition of the function.
+        :return: The declared function.
+        """
+        self.__check_undefined(definition.get_id())
+        function = self.__create_function(definition, None)
+        self.__module.add_function(function)
+        return function
+
+    def __declare_class(self, definition: PyClassDef) -> IRClass:
+        """
+        Declares a class of the program, its fields and its methods (their code is lowered later).
+
+        :param definition: The definition of the class.
+        :return: The declared class.
+        """
+        self.__check_undefined(definition.get_id())
+        ir_class = IRClass(definition.get_id())
+        for field in definition.get_fields():
+            value = field.get_value()
+            ir_class.add_field(IRVariable(IRType.from_native(field.get_type().get_id()), field.get_id()),
+                               None if value is None else self.__get_constant(value, "field value"))
+
+        constructor = definition.get_constructor()
+        if constructor is not None:
+            ir_class.set_constructor(self.__create_function(constructor, ir_class.get_name()))
+        for method in definition.get_methods():
+            ir_class.add_method(self.__create_function(method, ir_class.get_name()))
+        self.__module.add_class(ir_class)
+        return ir_class
+
+    def __check_undefined(self, name: str) -> None:
+        """
+        Makes sure that a function or a class is only defined once (and does not hide a port).
+
+        :param name: The name of the function or the class.
+        """
+        if self.__module.get_function(name) is not None or self.__module.get_class(name) is not None:
+            raise ObjectAlreadyDefinedError(name)
+
+    def __create_function(self, definition: PyFunctionDef, owner: Optional[str],
+                          native_code: Optional[str] = None) -> IRFunction:
+        """
+        :param definition: The definition of a function.
+        :param owner: The name of the class of a method (None for functions).
+        :param native_code: The native definition of a ported function (None for the functions of the program).
+        :return: The function, without code.
+        """
+        params = [] if owner is None else [IRVariable(IRType(owner), "self")]
+        params.extend(IRVariable(IRType.from_native(arg.get_type().get_id()), arg.get_id())
+                      for arg in definition.get_args())
+        defaults = [self.__get_constant(default, "default value") for default in definition.get_defaults()]
+        return IRFunction(definition.get_id(), params, defaults, IRType.from_native(definition.transpile_return_type()),
+                          owner, native_code)
+
+    @staticmethod
+    def __get_constant(pyexpr: PyExpression, usage: str) -> IRConstant:
+        """
+        :param pyexpr: A value which must be constant (such as the default value of an argument).
+        :param usage: What the value is used as (for the error message).
+        :return: The constant.
+        """
+        if not isinstance(pyexpr, PyConstant):
+            raise UnsupportedFeatureException(f"non-constant {usage}")
+        return IRConstant.of(pyexpr.get_value())
+
+    def __lower_function(self, function: IRFunction, statements: Union[PyBody, Sequence[PyExpression]]) -> None:
+        """
+        Lowers the code of a function.
+
+        :param function: The declared function (without code).
+        :param statements: The body of the function (or the statements of the module, for the main function).
+        """
+        self.__function = function
+        self.__block = function.get_block("entry") or function.add_block("entry")
+        self.__lower_statements(statements.get_code() if isinstance(statements, PyBody) else statements)
+
+        # The end of the function returns nothing (the main function returns a success status)
+        if not self.__block.is_terminated():
+            if function is self.__module.get_main():
+                self.__emit("ret", operands=(IRConstant(IRType.INT, 0),))
+            elif function.get_return_type() == IRType.VOID:
+                self.__emit("ret")
+        # The blocks after a return (or a jump) are never run
+        function.remove_unreachable_blocks()
+        if not all(block.is_terminated() for block in function.get_blocks()):
+            # Python returns None at the end of the function, which the return type does not allow
+            raise InvalidTypeError("None", str(function.get_return_type()))
+
+    def __lower_statements(self, statements: Sequence[PyExpression]) -> None:
+        """
+        Lowers statements, one after the other, into the current block (and the blocks after it).
+
+        :param statements: The statements.
+        """
+        for statement in statements:
+            if statement.is_dead_expression():
+                continue
+            lower = self.__statements.get(statement.__class__)
+            if lower is None:
+                raise self.__unsupported(statement)
+            lower(statement)
+
+    def __lower_body(self, statement: PyBody) -> None:
+        """
+        Lowers a body which is a statement of its own (such as the taken branch of an 'if', see ConstantConditions).
+        """
+        self.__lower_statements(statement.get_code())
+
+    @staticmethod
+    def __unsupported(node: PyExpression) -> UnsupportedFeatureException:
+        """
+        :param node: A node which can't be lowered.
+        :return: The error to raise for it.
+        """
+        # Nodes without an AST node of their own (such as bodies) hold a 'pass' statement in its place
+        expression = node.get_expression()
+        if isinstance(expression, Pass) and not isinstance(node, PyPass):
+            return UnsupportedFeatureException(Util.get_name(node))
+        return UnsupportedFeatureException(expression)
+
+    def __lower_ann_assign(self, statement: PyAnnAssign) -> None:
+        """
+        Lowers the declaration of a variable (and the assignment of its value).
+        """
+        variable = self.__function.declare_variable(statement.get_id(),
+                                                    IRType.from_native(statement.get_type().get_id()))
+        value = statement.get_value()
+        if value is not None:
+            self.__emit("copy", variable, (self.__lower_expression(value),))
+
+    def __lower_assign(self, statement: PyAssign) -> None:
+        """
+        Lowers the assignment of a variable.
+        """
+        variable = self.__get_variable(statement.get_id())
+        self.__emit("copy", variable, (self.__lower_expression(statement.get_value()),))
+
+    def __lower_aug_assign(self, statement: PyAugAssign) -> None:
+        """
+        Lowers the augmented assignment of a variable (or of a field).
+        """
+        target = statement.get_target()
+        if isinstance(target, PyAttribute):
+            # Read the field, operate on it, and write it back
+            receiver = self.__lower_expression(target.get_object())
+            current = self.__function.new_temp(self.__get_field_type(receiver, target.get_id()))
+            self.__emit("get_field", current, (receiver,), target.get_id())
+            value = self.__operate(statement.get_op_type(), current, self.__lower_expression(statement.get_value()))
+            self.__emit("set_field", operands=(receiver, value), name=target.get_id())
+        elif isinstance(target, PyName):
+            variable = self.__get_variable(target.get_id())
+            self.__operate(statement.get_op_type(), variable, self.__lower_expression(statement.get_value()),
+                           variable)
+        else:
+            raise UnsupportedFeatureException(target.get_expression())
+
+    def __lower_expr(self, statement: PyExpr) -> None:
+        """
+        Lowers an expression statement (its value is not used).
+        """
+        self.__lower_expression(statement.get_value())
+
+    def __lower_return(self, statement: PyReturn) -> None:
+        """
+        Lowers a return statement.
+        """
+        value = statement.get_value()
+        self.__emit("ret", operands=() if value is None else (self.__lower_expression(value),))
+        # Any code after the return is unreachable
+        self.__enter(self.__function.add_block("after"))
+
+    def __lower_break(self, _: PyBreak) -> None:
+        """
+        Lowers a break statement (a jump out of the innermost loop).
+        """
+        self.__jump(self.__loops[-1][1])
+        self.__enter(self.__function.add_block("after"))
+
+    def __lower_continue(self, _: PyContinue) -> None:
+        """
+        Lowers a continue statement (a jump to the next iteration of the innermost loop).
+        """
+        self.__jump(self.__loops[-1][0])
+        self.__enter(self.__function.add_block("after"))
+
+    def __lower_if(self, statement: PyIf) -> None:
+        """
+        Lowers a conditional statement.
+        """
+        condition = self.__lower_condition(statement.get_condition())
+        then_block = self.__function.add_block("then")
+        else_body = statement.get_else()
+        else_block = None if else_body is None else self.__function.add_block("else")
+        end_block = self.__function.add_block("endif")
+        self.__branch(condition, then_block, else_block or end_block)
+
+        self.__enter(then_block)
+        self.__lower_statements(cast(PyBody, statement.get_code()).get_code())
+        self.__jump(end_block)
+        if else_block is not None:
+            self.__enter(else_block)
+            self.__lower_statements(cast(PyBody, else_body).get_code())
+            self.__jump(end_block)
+        self.__enter(end_block)
+
+    def __lower_while(self, statement: PyWhile) -> None:
+        """
+        Lowers a while loop (the condition is checked before each iteration).
+        """
+        header_block = self.__function.add_block("while")
+        self.__jump(header_block)
+        self.__enter(header_block)
+        condition = self.__lower_condition(statement.get_condition())
+        body_block = self.__function.add_block("do")
+        end_block = self.__function.add_block("endwhile")
+        self.__branch(condition, body_block, end_block)
+
+        self.__enter(body_block)
+        self.__loops.append((header_block, end_block))
+        self.__lower_statements(cast(PyBody, statement.get_code()).get_code())
+        self.__loops.pop()
+        self.__jump(header_block)
+        self.__enter(end_block)
+
+    def __lower_for(self, statement: PyFor) -> None:
+        """
+        Lowers a for loop, with an iterator over the iterated object.
+        """
+        sequence = self.__lower_expression(statement.get_iter())
+        iterator = self.__function.new_temp(IRType.ANY)
+        self.__emit("iter", iterator, (sequence,))
+        header_block = self.__function.add_block("for")
+        self.__jump(header_block)
+
+        # Check the iterator against the end of the object before each iteration
+        self.__enter(header_block)
+        end = self.__function.new_temp(IRType.ANY)
+        self.__emit("iter_end", end, (sequence,))
+        condition = self.__function.new_temp(IRType.BOOL)
+        self.__emit("ne", condition, (iterator, end))
+        body_block = self.__function.add_block("body")
+        next_block = self.__function.add_block("next")
+        end_block = self.__function.add_block("endfor")
+        self.__branch(condition, body_block, end_block)
+
+        self.__enter(body_block)
+        target = statement.get_target()
+        variable = self.__function.declare_variable(target.get_id(), IRType.from_native(target.get_type().get_id()))
+        self.__emit("deref", variable, (iterator,))
+        self.__loops.append((next_block, end_block))
+        self.__lower_statements(statement.get_code().get_code())
+        self.__loops.pop()
+        self.__jump(next_block)
+
+        self.__enter(next_block)
+        self.__emit("advance", operands=(iterator,))
+        self.__jump(header_block)
+        self.__enter(end_block)
+
+    def __lower_condition(self, condition: PyExpression) -> IRValue:
+        """
+        :param condition: The condition of a conditional statement or a loop.
+        :return: The value of the condition (which must be a boolean, or a value which converts to one).
+        """
+        value = self.__lower_expression(condition)
+        if not IRType.BOOL.accepts(value.type):
+            raise InvalidTypeError(str(value.type), str(IRType.BOOL))
+        return value
+
+    def __lower_expression(self, expression: PyExpression) -> IRValue:
+        """
+        Lowers an expression, with an explicit stack of the nested expressions (instead of recursion).
+
+        :param expression: The expression.
+        :return: The value of the expression.
+        """
+        value = self.__lower_value(expression)
+        if value is not None:
+            return value
+        # The expressions being lowered (each one receives the values of its nested expressions)
+        stack: List[LoweringSteps] = [self.__start_expression(expression)]
+        received: Optional[IRValue] = None
+        while stack:
+            try:
+                nested = stack[-1].send(cast(IRValue, received))
+            except StopIteration as lowered:
+                # The expression is complete
+                stack.pop()
+                received = lowered.value
+                continue
+            received = self.__lower_value(nested)
+            if received is None:
+                stack.append(self.__start_expression(nested))
+        return cast(IRValue, received)
+
+    def __lower_value(self, expression: PyExpression) -> Optional[IRValue]:
+        """
+        :param expression: An expression.
+        :return: The value of the expression, if it is a single value (None if it must be lowered to instructions).
+        """
+        lower = self.__values.get(expression.__class__)
+        return None if lower is None else lower(expression)
+
+    def __start_expression(self, expression: PyExpression) -> LoweringSteps:
+        """
+        :param expression: An expression which is lowered to instructions.
+        :return: The lowering of the expression.
+        """
+        lower = self.__expressions.get(expression.__class__)
+        if lower is None:
+            raise self.__unsupported(expression)
+        return lower(expression)
+
+    @staticmethod
+    def __lower_constant(expression: PyConstant) -> IRValue:
+        """
+        Lowers a literal constant.
+        """
+        return IRConstant.of(expression.get_value())
+
+    def __lower_name(self, expression: PyName) -> IRValue:
+        """
+        Lowers the usage of a variable.
+        """
+        return self.__get_variable(expression.get_id())
+
+    def __lower_attribute(self, expression: PyAttribute) -> LoweringSteps:
+        """
+        Lowers reading a field of an object.
+        """
+        receiver = yield expression.get_object()
+        result = self.__function.new_temp(self.__get_field_type(receiver, expression.get_id()))
+        self.__emit("get_field", result, (receiver,), expression.get_id())
+        return result
+
+    def __lower_bin_op(self, expression: PyBinOp) -> LoweringSteps:
+        """
+        Lowers a binary operation.
+        """
+        left = yield expression.get_left()
+        right = yield expression.get_right()
+        return self.__operate(expression.get_op_type(), left, right)
+
+    def __lower_compare(self, expression: PyCompare) -> LoweringSteps:
+        """
+        Lowers a comparison (a chain of comparisons only evaluates each side once, and stops at the first
+        false comparison, like in Python).
+        """
+        left = yield expression.get_left()
+        comparisons = list(zip(expression.get_comparators(), expression.get_right()))
+        if len(comparisons) == 1:
+            right = yield comparisons[0][1]
+            return self.__compare(comparisons[0][0], left, right)
+
+        result = self.__function.new_temp(IRType.BOOL)
+        end_block = self.__function.add_block("endcmp")
+        for index, (comparator, right_expression) in enumerate(comparisons):
+            right = yield right_expression
+            condition = self.__compare(comparator, left, right)
+            self.__emit("copy", result, (condition,))
+            if index == len(comparisons) - 1:
+                self.__jump(end_block)
+            else:
+                next_block = self.__function.add_block("cmp")
+                self.__branch(condition, next_block, end_block)
+                self.__enter(next_block)
+            left = right
+        self.__enter(end_block)
+        return result
+
+    def __lower_bool_op(self, expression: PyBoolOp) -> LoweringSteps:
+        """
+        Lowers a boolean operation (the conditions after the one which decides the result are not evaluated).
+        """
+        is_and = expression.get_op_type() == "&&"
+        conditions = expression.get_conditions()
+        result = self.__function.new_temp(IRType.BOOL)
+        end_block = self.__function.add_block("endbool")
+        for index, condition_expression in enumerate(conditions):
+            condition = yield condition_expression
+            self.__emit("copy", result, (condition,))
+            if index == len(conditions) - 1:
+                self.__jump(end_block)
+            else:
+                next_block = self.__function.add_block("and" if is_and else "or")
+                self.__branch(condition, next_block, end_block) if is_and else \
+                    self.__branch(condition, end_block, next_block)
+                self.__enter(next_block)
+        self.__enter(end_block)
+        return result
+
+    def __lower_if_exp(self, expression: PyIfExp) -> LoweringSteps:
+        """
+        Lowers a conditional expression (only the chosen value is evaluated).
+        """
+        condition = yield expression.get_condition()
+        if not IRType.BOOL.accepts(condition.type):
+            raise InvalidTypeError(str(condition.type), str(IRType.BOOL))
+        then_block = self.__function.add_block("then")
+        else_block = self.__function.add_block("else")
+        self.__branch(condition, then_block, else_block)
+
+        self.__enter(then_block)
+        then_value = yield expression.get_code()
+        then_end = self.__block
+        self.__enter(else_block)
+        else_value = yield expression.get_else()
+        else_end = self.__block
+
+        # The type of the result is only known once both values are lowered, so they are copied to it last
+        result = self.__function.new_temp(IRType.unify(then_value.type, else_value.type))
+        end_block = self.__function.add_block("endif")
+        for block, value in ((then_end, then_value), (else_end, else_value)):
+            self.__block = block
+            self.__emit("copy", result, (value,))
+            self.__jump(end_block)
+        self.__enter(end_block)
+        return result
+
+    def __lower_call(self, expression: PyCall) -> LoweringSteps:
+        """
+        Lowers a call to a function, a port or a method, or the construction of an object.
+        """
+        function = expression.get_function()
+        receiver: Optional[IRValue] = None
+        if isinstance(function, PyAttribute):
+            receiver = yield function.get_object()
+        elif not isinstance(function, PyName):
+            raise UnsupportedFeatureException(function.get_expression())
+        args: List[IRValue] = []
+        for arg in expression.get_args():
+            args.append((yield arg))
+
+        name = function.get_id()
+        # A method of an object
+        if receiver is not None:
+            return self.__call("call_method", self.__get_method_return_type(receiver, name), [receiver] + args, name)
+        # A function of the program, or a port
+        callee = self.__module.get_function(name)
+        if callee is not None:
+            return self.__call("call", callee.get_return_type(), args, name)
+        # The constructor of a class
+        if self.__module.get_class(name) is not None:
+            return self.__call("new", IRType(name), args, name)
+        raise ObjectNotDefinedError(name)
+
+    def __call(self, opcode: str, return_type: IRType, operands: List[IRValue], name: str) -> IRValue:
+        """
+        Adds a call instruction.
+
+        :param opcode: The opcode of the call (call, call_method or new).
+        :param return_type: The type of the returned value.
+        :param operands: The operands of the call.
+        :param name: The name of the called function, method or class.
+        :return: The returned value (NO_VALUE if nothing is returned).
+        """
+        result = None if return_type == IRType.VOID else self.__function.new_temp(return_type)
+        self.__emit(opcode, result, operands, name)
+        return NO_VALUE if result is None else result
+
+    def __operate(self, operator: str, left: IRValue, right: IRValue, result: Optional[IRValue] = None) -> IRValue:
+        """
+        Adds an arithmetic instruction.
+
+        :param operator: The native operator.
+        :param left: The left operand.
+        :param right: The right operand.
+        :param result: The value to store the result in (None for a new temporary).
+        :return: The result.
+        """
+        opcode = IRInstruction.ARITHMETIC.get(operator)
+        if opcode is None:
+            raise UnsupportedFeatureException(f"'{operator}' operator")
+        result_type = IRType.of_operation(opcode, left.type, right.type)
+        if result_type is None:
+            raise InvalidTypeError(str(right.type), str(left.type))
+        result = result or self.__function.new_temp(result_type)
+        self.__emit(opcode, result, (left, right))
+        return result
+
+    def __compare(self, comparator: str, left: IRValue, right: IRValue) -> IRValue:
+        """
+        Adds a comparison instruction.
+
+        :param comparator: The native comparator.
+        :param left: The left operand.
+        :param right: The right operand.
+        :return: The result of the comparison.
+        """
+        result = self.__function.new_temp(IRType.BOOL)
+        self.__emit(IRInstruction.COMPARISONS[comparator], result, (left, right))
+        return result
+
+    def __get_variable(self, name: str) -> IRVariable:
+        """
+        :param name: The name of a variable.
+        :return: The argument or the local variable of the current function.
+        """
+        variable = self.__function.get_variable(name)
+        if variable is None:
+            raise ObjectNotDefinedError(name)
+        return variable
+
+    def __get_class(self, receiver: IRValue, member: str) -> Optional[IRClass]:
+        """
+        :param receiver: An object whose member is used.
+        :param member: The name of the member.
+        :return: The class of the object (None if its type is only known to the native compiler).
+        """
+        if receiver.type == IRType.ANY:
+            return None
+        ir_class = self.__module.get_class(receiver.type.name)
+        if ir_class is None:
+            raise ObjectNotDefinedError(f"{receiver.type}.{member}")
+        return ir_class
+
+    def __get_field_type(self, receiver: IRValue, name: str) -> IRType:
+        """
+        :param receiver: An object.
+        :param name: The name of a field of the object.
+        :return: The type of the field.
+        """
+        ir_class = self.__get_class(receiver, name)
+        if ir_class is None:
+            return IRType.ANY
+        field = ir_class.get_field(name)
+        if field is None:
+            raise ObjectNotDefinedError(f"{receiver.type}.{name}")
+        return field.type
+
+    def __get_method_return_type(self, receiver: IRValue, name: str) -> IRType:
+        """
+        :param receiver: An object.
+        :param name: The name of a method of the object.
+        :return: The type which the method returns.
+        """
+        ir_class = self.__get_class(receiver, name)
+        if ir_class is None:
+            return IRType.ANY
+        method = ir_class.get_method(name)
+        if method is None:
+            raise ObjectNotDefinedError(f"{receiver.type}.{name}")
+        return method.get_return_type()
+
+    def __emit(self, opcode: str, result: Optional[IRValue] = None, operands: Sequence[IRValue] = (),
+               name: Optional[str] = None, targets: Sequence[str] = ()) -> None:
+        """
+        Adds an instruction to the current block.
+
+        :param opcode: The opcode of the instruction.
+        :param result: The value to store the result in (None if there is no result).
+        :param operands: The operands of the instruction.
+        :param name: The function, class, method or field which the instruction refers to.
+        :param targets: The labels of the blocks which a terminator jumps to.
+        """
+        # Functions which return nothing can only be called as statements
+        if any(operand.type == IRType.VOID for operand in operands):
+            raise InvalidTypeError(str(IRType.VOID))
+        self.__block.append(IRInstruction(opcode, result, tuple(operands), name, tuple(targets)))
+
+    def __jump(self, target: IRBlock) -> None:
+        """
+        Ends the current block with a jump (unless it already ended, with a return for example).
+
+        :param target: The block to jump to.
+        """
+        if not self.__block.is_terminated():
+            self.__emit("jump", targets=(target.get_label(),))
+
+    def __branch(self, condition: IRValue, if_true: IRBlock, if_false: IRBlock) -> None:
+        """
+        Ends the current block with a conditional jump.
+
+        :param condition: The condition.
+        :param if_true: The block to jump to if the condition is true.
+        :param if_false: The block to jump to if the condition is false.
+        """
+        self.__emit("branch", operands=(condition,), targets=(if_true.get_label(), if_false.get_label()))
+
+    def __enter(self, block: IRBlock) -> None:
+        """
+        Continues adding the code to a block (which is moved after the blocks added so far).
+
+        :param block: The block.
+        """
+        self.__function.move_to_end(block)
+        self.__block = block
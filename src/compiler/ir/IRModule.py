@@ -0,0 +1,115 @@
+"""
+IRModule class.
+The IR of a whole compilation.
+"""
+from typing import Dict, List, Optional
+
+from src.compiler.ir.IRClass import IRClass
+from src.compiler.ir.IRFunction import IRFunction
+
+
+class IRModule:
+    """
+    The IR of a whole compilation (the imported modules are lowered
+    into it as well, like they are spliced into the output code): the
+    native dependencies, the ported functions which it calls, its
+    classes and functions, and the 'main' function, which runs the
+    code of the module itself.
+    """
+
+    __slots__ = ("__dependencies", "__ports", "__classes", "__functions", "__main")
+
+    # The native dependencies (included headers), in order
+    __dependencies: List[str]
+    # The ported functions, classes and functions of the program, by their names (in order)
+    __ports: Dict[str, IRFunction]
+    __classes: Dict[str, IRClass]
+    __functions: Dict[str, IRFunction]
+    __main: IRFunction
+
+    def __init__(self, dependencies: List[str], main: IRFunction) -> None:
+        """
+        :param dependencies: The native dependencies, in order.
+        :param main: The function which runs the code of the module.
+        """
+        self.__dependencies = dependencies
+        self.__ports = {}
+        self.__classes = {}
+        self.__functions = {}
+        self.__main = main
+
+    def get_dependencies(self) -> List[str]:
+        """
+        :return: The native dependencies, in order.
+        """
+        return self.__dependencies
+
+    def add_port(self, port: IRFunction) -> None:
+        """
+        :param port: A ported function which the program calls.
+        """
+        self.__ports[port.get_name()] = port
+
+    def get_ports(self) -> List[IRFunction]:
+        """
+        :return: The ported functions, in order (each one after the ports which it calls).
+        """
+        return list(self.__ports.values())
+
+    def add_class(self, ir_class: IRClass) -> None:
+        """
+        :param ir_class: A class of the program.
+        """
+        self.__classes[ir_class.get_name()] = ir_class
+
+    def get_class(self, name: str) -> Optional[IRClass]:
+        """
+        :param name: The name of a class.
+        :return: The class (None if there is no such class).
+        """
+        return self.__classes.get(name)
+
+    def get_classes(self) -> List[IRClass]:
+        """
+        :return: The classes of the program, in order.
+        """
+        return list(self.__classes.values())
+
+    def add_function(self, function: IRFunction) -> None:
+        """
+        :param function: A function of the program.
+        """
+        self.__functions[function.get_name()] = function
+
+    def get_function(self, name: str) -> Optional[IRFunction]:
+        """
+        :param name: The name of a function.
+        :return: The function of the program, or the ported function (None if there is no such function).
+        """
+        return self.__functions.get(name) or self.__ports.get(name)
+
+    def get_functions(self) -> List[IRFunction]:
+        """
+        :return: The functions of the program (without the methods and the main function), in order.
+        """
+        return list(self.__functions.values())
+
+    def get_main(self) -> IRFunction:
+        """
+        :return: The function which runs the code of the module.
+        """
+        return self.__main
+
+    def get_code_functions(self) -> List[IRFunction]:
+        """
+        :return: Every function which has blocks: the methods, the functions and the main function.
+        """
+        methods = [method for ir_class in self.__classes.values() for method in ir_class.get_functions()]
+        return methods + self.get_functions() + [self.__main]
+
+    def __str__(self) -> str:
+        sections: List[str] = ["\n".join(f"include <{dependency}>" for dependency in self.__dependencies)]
+        sections.extend(str(port) for port in self.__ports.values())
+        sections.extend(str(ir_class) for ir_class in self.__classes.values())
+        sections.extend(str(function) for function in self.get_code_functions())
+        return "\n\n".join(sections) + "\n"
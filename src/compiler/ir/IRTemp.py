@@ -0,0 +1,22 @@
+"""
+IRTemp class.
+An intermediate result of an IR function.
+"""
+from dataclasses import dataclass
+
+from src.compiler.ir.IRValue import IRValue
+
+
+@dataclass(frozen=True)
+class IRTemp(IRValue):
+    """
+    A temporary, which holds the result of an instruction (see IRFunction.new_temp).
+
+    Temporaries are numbered in the order they are created in, so their
+    names never clash with the names of the variables.
+    """
+
+    index: int
+
+    def __str__(self) -> str:
+        return f"%{self.index}"
@@ -0,0 +1,109 @@
+"""
+IRType class.
+The type of a value of the IR.
+"""
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Optional
+
+
+# Freeze the class, so that types can be shared by many values (and compared by their names)
+@dataclass(frozen=True)
+class IRType:
+    """
+    The type of a value of the IR: one of the builtin types (int, bool,
+    str, void, or any for values whose type is only known to the native
+    compiler), or the name of a class of the program.
+
+    The tree holds the native names of its types (as they are written in
+    the output), which are converted back to IR types with from_native.
+    """
+
+    name: str
+
+    # The builtin types (set right after the class)
+    INT: ClassVar["IRType"]
+    BOOL: ClassVar["IRType"]
+    STR: ClassVar["IRType"]
+    VOID: ClassVar["IRType"]
+    ANY: ClassVar["IRType"]
+
+    def __str__(self) -> str:
+        return self.name
+
+    def is_builtin(self) -> bool:
+        """
+        :return: True if this is a builtin type, False if it is a class.
+        """
+        return self.name in BUILTIN_TYPES
+
+    def is_numeric(self) -> bool:
+        """
+        :return: True if values of this type are integers (booleans are integers too, like in Python).
+        """
+        return self in (IRType.INT, IRType.BOOL)
+
+    def accepts(self, other: "IRType") -> bool:
+        """
+        :param other: The type of a value.
+        :return: True if a value of the other type can be stored in a value of this type.
+        """
+        return self == other or IRType.ANY in (self, other) or (self.is_numeric() and other.is_numeric())
+
+    @staticmethod
+    def from_native(native_name: str) -> "IRType":
+        """
+        :param native_name: The native name of a type (see PyName.translate_builtin_name).
+        :return: The matching IR type (a class, if it is not a builtin type).
+        """
+        return NATIVE_TYPES.get(native_name) or IRType(native_name)
+
+    @staticmethod
+    def of_operation(opcode: str, left: "IRType", right: "IRType") -> Optional["IRType"]:
+        """
+        :param opcode: The opcode of an arithmetic instruction (see IRInstruction.ARITHMETIC).
+        :param left: The type of the left operand.
+        :param right: The type of the right operand.
+        :return: The type of the result (None if the operands can't be operated on together).
+        """
+        if IRType.ANY in (left, right):
+            return IRType.ANY
+        # Strings can only be concatenated (with other strings, or with values that convert to them)
+        if IRType.STR in (left, right):
+            return IRType.STR if opcode == "add" else None
+        if left.is_numeric() and right.is_numeric():
+            return IRType.INT
+        return None
+
+    @staticmethod
+    def unify(first: "IRType", second: "IRType") -> "IRType":
+        """
+        :param first: The type of a value.
+        :param second: The type of another value.
+        :return: The type which can hold both values (any, if they have nothing in common).
+        """
+        if first == second:
+            return first
+        if first.is_numeric() and second.is_numeric():
+            return IRType.INT
+        return IRType.ANY
+
+
+IRType.INT = IRType("int")
+IRType.BOOL = IRType("bool")
+IRType.STR = IRType("str")
+IRType.VOID = IRType("void")
+IRType.ANY = IRType("any")
+
+# The names of the builtin types
+BUILTIN_TYPES: Dict[str, IRType] = {
+    builtin.name: builtin for builtin in (IRType.INT, IRType.BOOL, IRType.STR, IRType.VOID, IRType.ANY)
+}
+# The builtin types, by their native names (see Constants.PY_TYPES_TO_NATIVE_TYPES)
+NATIVE_TYPES: Dict[str, IRType] = {
+    "int": IRType.INT,
+    "bool": IRType.BOOL,
+    "std::string": IRType.STR,
+    "auto": IRType.ANY,
+    "void": IRType.VOID,
+    "null": IRType.VOID,
+}
@@ -0,0 +1,20 @@
+"""
+IRValue base class.
+An operand (or the result) of an IR instruction.
+"""
+from dataclasses import dataclass
+
+from src.compiler.ir.IRType import IRType
+
+
+@dataclass(frozen=True)
+class IRValue:
+    """
+    IRValue base class.
+
+    Every value of the IR is typed: constants, the temporaries which
+    hold the intermediate results of a function, and its variables
+    (the arguments and the local variables of the Python code).
+    """
+
+    type: IRType
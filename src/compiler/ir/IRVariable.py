@@ -0,0 +1,19 @@
+"""
+IRVariable class.
+A named variable of an IR function.
+"""
+from dataclasses import dataclass
+
+from src.compiler.ir.IRValue import IRValue
+
+
+@dataclass(frozen=True)
+class IRVariable(IRValue):
+    """
+    An argument or a local variable of a function, or a field of a class.
+    """
+
+    name: str
+
+    def __str__(self) -> str:
+        return f"%{self.name}"
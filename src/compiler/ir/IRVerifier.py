@@ -0,0 +1,356 @@
+"""
+IRVerifier class.
+Checks that the IR of a compilation is well-formed.
+"""
+from typing import Dict, List, Optional, Set, Union
+
+from src.compiler.ir.IRClass import IRClass
+from src.compiler.ir.IRFunction import IRFunction
+from src.compiler.ir.IRInstruction import IRInstruction
+from src.compiler.ir.IRModule import IRModule
+from src.compiler.ir.IRTemp import IRTemp
+from src.compiler.ir.IRType import IRType
+from src.compiler.ir.IRValue import IRValue
+from src.compiler.ir.IRVariable import IRVariable
+from src.structures.Errors import IRVerificationError
+
+# The amount of operands of the instructions which always take the same amount (the calls take any amount)
+OPERAND_COUNTS: Dict[str, int] = {
+    "copy": 1, "get_field": 1, "set_field": 2, "iter": 1, "iter_end": 1, "deref": 1, "advance": 1, "jump": 0,
+    "branch": 1, **{opcode: 2 for opcode in IRInstruction.ARITHMETIC.values()},
+    **{opcode: 2 for opcode in IRInstruction.COMPARISONS.values()},
+}
+# The amount of blocks which each terminator jumps to
+TARGET_COUNTS: Dict[str, int] = {"jump": 1, "branch": 2, "ret": 0}
+# The opcodes which store a result, and those which don't (the calls store one unless they return nothing)
+WITH_RESULT: Set[str] = {"copy", "get_field", "iter", "iter_end", "deref", "new",
+                         *IRInstruction.ARITHMETIC.values(), *IRInstruction.COMPARISONS.values()}
+WITHOUT_RESULT: Set[str] = {"set_field", "advance", "jump", "branch", "ret"}
+
+
+class IRVerifier:
+    """
+    Checks that the IR of a compilation is well-formed, between the
+    lowering and the backends (which assume that it is):
+     - structure: every block of a function ends with exactly one
+       terminator, which jumps to blocks of the function, and every
+       block can be reached from the entry (which nothing jumps to),
+     - types: the operands of each instruction have the types that it
+       expects, calls match the signatures of the functions they call,
+       and each temporary keeps a single type,
+     - dataflow: every temporary is set on every path to its usages,
+     - module: the functions and classes have unique names, and the
+       functions, methods, classes and fields which are used exist.
+    """
+
+    __module: IRModule
+    # The problems found so far, in order
+    __problems: List[str]
+    # The function being verified (and the type of each of its temporaries)
+    __function: IRFunction
+    __temp_types: Dict[int, IRType]
+
+    def __init__(self, module: IRModule) -> None:
+        """
+        :param module: The IR to verify.
+        """
+        self.__module = module
+        self.__problems = []
+        self.__temp_types = {}
+
+    @classmethod
+    def verify(cls, module: IRModule) -> List[str]:
+        """
+        :param module: The IR of a compilation.
+        :return: The problems found in the IR (empty if it is well-formed).
+        """
+        verifier = cls(module)
+        verifier.__verify_module()
+        for function in module.get_code_functions():
+            verifier.__verify_function(function)
+        return verifier.__problems
+
+    @classmethod
+    def check(cls, module: IRModule) -> None:
+        """
+        Makes sure that the IR of a compilation is well-formed.
+
+        :param module: The IR of a compilation.
+        """
+        problems = cls.verify(module)
+        if problems:
+            raise IRVerificationError(tuple(problems))
+
+    def __report(self, problem: str, where: Optional[str] = None) -> None:
+        """
+        Records a problem.
+
+        :param problem: The problem.
+        :param where: The block (or the instruction) which has the problem (None for the whole function).
+        """
+        location = self.__function.get_qualified_name() if where is None else \
+            f"{self.__function.get_qualified_name()}, {where}"
+        self.__problems.append(f"{location}: {problem}")
+
+    def __verify_module(self) -> None:
+        """
+        Checks the names of the functions and the classes of the module.
+        """
+        names: Set[str] = set()
+        for name in [port.get_name() for port in self.__module.get_ports()] + \
+                    [function.get_name() for function in self.__module.get_functions()] + \
+                    [ir_class.get_name() for ir_class in self.__module.get_classes()]:
+            if name in names:
+                self.__problems.append(f"'{name}' is defined more than once")
+            names.add(name)
+        if self.__module.get_main().get_name() in names:
+            self.__problems.append(f"'{self.__module.get_main().get_name()}' hides the main function")
+        for port in self.__module.get_ports():
+            if port.get_blocks():
+                self.__problems.append(f"port '{port.get_name()}' has blocks")
+
+    def __verify_function(self, function: IRFunction) -> None:
+        """
+        Checks a function of the program.
+
+        :param function: The function.
+        """
+        self.__function = function
+        self.__temp_types = {}
+        blocks = function.get_blocks()
+        if not blocks:
+            self.__report("the function has no blocks")
+            return
+        if len(function.get_defaults()) > len(function.get_params()):
+            self.__report("more default values than arguments")
+
+        # Structure
+        predecessors = function.get_predecessors()
+        if predecessors[blocks[0].get_label()]:
+            self.__report("the entry block is jumped to", blocks[0].get_label())
+        for block in blocks:
+            instructions = block.get_instructions()
+            if not instructions or not instructions[-1].is_terminator():
+                self.__report("the block does not end with a terminator", block.get_label())
+            for index, instruction in enumerate(instructions[:-1]):
+                if instruction.is_terminator():
+                    self.__report("a terminator in the middle of the block", f"{block.get_label()}.{index}")
+            for target in block.get_successors():
+                if function.get_block(target) is None:
+                    self.__report(f"jumps to the unknown block '{target}'", block.get_label())
+        reachable = function.get_reachable_labels()
+        for block in blocks:
+            if block.get_label() not in reachable:
+                self.__report("the block is unreachable", block.get_label())
+
+        # Types
+        for block in blocks:
+            for index, instruction in enumerate(block.get_instructions()):
+                self.__verify_instruction(instruction, f"{block.get_label()}.{index} '{instruction}'")
+
+        # Dataflow
+        self.__verify_definitions(predecessors)
+
+    def __verify_instruction(self, instruction: IRInstruction, where: str) -> None:
+        """
+        Checks the operands, the result and the targets of an instruction.
+
+        :param instruction: The instruction.
+        :param where: The location of the instruction.
+        """
+        opcode, result, operands = instruction.opcode, instruction.result, instruction.operands
+        for value in operands + (() if result is None else (result,)):
+            self.__verify_value(value, where)
+
+        expected_count = OPERAND_COUNTS.get(opcode)
+        if expected_count is not None and len(operands) != expected_count:
+            self.__report(f"expected {expected_count} operands, got {len(operands)}", where)
+            return
+        if opcode in WITH_RESULT and result is None:
+            self.__report("the result is missing", where)
+        elif opcode in WITHOUT_RESULT and result is not None:
+            self.__report("the instruction has no result", where)
+        if len(instruction.targets) != TARGET_COUNTS.get(opcode, 0):
+            self.__report("wrong amount of target blocks", where)
+
+        if opcode == "copy":
+            self.__expect(result, operands[0].type, where)
+        elif opcode in IRInstruction.ARITHMETIC.values():
+            result_type = IRType.of_operation(opcode, operands[0].type, operands[1].type)
+            if result_type is None:
+                self.__report(f"can't operate on {operands[0].type} and {operands[1].type}", where)
+            elif result is not None and result.type != result_type and not result.type.accepts(result_type):
+                self.__report(f"the result should be {result_type}", where)
+        elif opcode in IRInstruction.COMPARISONS.values():
+            if result is not None and result.type != IRType.BOOL:
+                self.__report("the result of a comparison should be bool", where)
+        elif opcode == "branch":
+            if not IRType.BOOL.accepts(operands[0].type):
+                self.__report(f"the condition is {operands[0].type}", where)
+        elif opcode == "ret":
+            return_type = self.__function.get_return_type()
+            if return_type == IRType.VOID:
+                if operands:
+                    self.__report("a value is returned from a void function", where)
+            elif len(operands) != 1:
+                self.__report(f"a {return_type} should be returned", where)
+            elif not return_type.accepts(operands[0].type):
+                self.__report(f"returns {operands[0].type} instead of {return_type}", where)
+        elif opcode in ("call", "new", "call_method"):
+            self.__verify_call(instruction, where)
+        elif opcode in ("get_field", "set_field"):
+            field = self.__get_member(operands[0], instruction.name, where, is_method=False)
+            if field is not None:
+                value = result if opcode == "get_field" else operands[1]
+                if value is not None and not (field.type.accepts(value.type) and value.type.accepts(field.type)):
+                    self.__report(f"the field is {field.type}, not {value.type}", where)
+        elif opcode not in OPERAND_COUNTS:
+            self.__report(f"unknown opcode '{opcode}'", where)
+
+    def __verify_call(self, instruction: IRInstruction, where: str) -> None:
+        """
+        Checks a call to a function, a port or a method, or the construction of an object.
+
+        :param instruction: The call.
+        :param where: The location of the call.
+        """
+        args: List[IRValue] = list(instruction.operands)
+        callee: Optional[IRFunction] = None
+        return_type = IRType.ANY
+        if instruction.opcode == "call":
+            callee = self.__module.get_function(str(instruction.name))
+            if callee is None:
+                self.__report(f"calls the unknown function '{instruction.name}'", where)
+                return
+            return_type = callee.get_return_type()
+        elif instruction.opcode == "new":
+            ir_class = self.__module.get_class(str(instruction.name))
+            if ir_class is None:
+                self.__report(f"constructs the unknown class '{instruction.name}'", where)
+                return
+            callee = ir_class.get_constructor()
+            return_type = IRType(ir_class.get_name())
+            # (the constructed object is passed to the constructor as 'self')
+            args.insert(0, IRValue(return_type))
+            if callee is None and len(args) > 1:
+                self.__report("the class has no constructor, so it takes no arguments", where)
+        elif not args:
+            self.__report("the object is missing", where)
+            return
+        else:
+            method = self.__get_member(args[0], instruction.name, where, is_method=True)
+            if args[0].type == IRType.ANY:
+                return
+            if method is None:
+                return
+            callee = method
+            return_type = method.get_return_type()
+
+        if callee is not None:
+            params = callee.get_params()
+            if not callee.get_required_count() <= len(args) <= len(params):
+                self.__report(f"passes {len(args)} arguments to {callee.get_qualified_name()} (expected "
+                              f"{callee.get_required_count()} to {len(params)})", where)
+            for arg, param in zip(args, params):
+                if not param.type.accepts(arg.type):
+                    self.__report(f"passes {arg.type} to the argument '{param.name}' of type {param.type}", where)
+        result = instruction.result
+        if (result is None) != (return_type == IRType.VOID):
+            self.__report("the result should only be stored when something is returned", where)
+        elif result is not None and not result.type.accepts(return_type):
+            self.__report(f"stores {return_type} in {result.type}", where)
+
+    def __get_member(self, receiver: IRValue, name: Optional[str], where: str,
+                     is_method: bool) -> Optional[Union[IRVariable, IRFunction]]:
+        """
+        :param receiver: An object.
+        :param name: The name of a field or a method of the object.
+        :param where: The location of the instruction which uses the member.
+        :param is_method: True for a method, False for a field.
+        :return: The field or the method (None if it is unknown, or if the type of the object is any).
+        """
+        if receiver.type == IRType.ANY:
+            return None
+        ir_class: Optional[IRClass] = self.__module.get_class(receiver.type.name)
+        if ir_class is None or name is None:
+            self.__report(f"{receiver.type} is not a class", where)
+            return None
+        member = ir_class.get_method(name) if is_method else ir_class.get_field(name)
+        if member is None:
+            self.__report(f"{receiver.type} has no {'method' if is_method else 'field'} '{name}'", where)
+        return member
+
+    def __verify_value(self, value: IRValue, where: str) -> None:
+        """
+        Checks that a temporary keeps a single type, and that a variable is declared in the function.
+
+        :param value: An operand or a result.
+        :param where: The location of the instruction which uses the value.
+        """
+        if isinstance(value, IRTemp):
+            temp_type = self.__temp_types.setdefault(value.index, value.type)
+            if temp_type != value.type:
+                self.__report(f"{value} is both {temp_type} and {value.type}", where)
+        elif isinstance(value, IRVariable):
+            if self.__function.get_variable(value.name) != value:
+                self.__report(f"{value} is not a {value.type} variable of the function", where)
+        if value.type == IRType.VOID:
+            self.__report(f"{value} has no value (void)", where)
+
+    def __expect(self, result: Optional[IRValue], value_type: IRType, where: str) -> None:
+        """
+        Checks that a value can be stored in a result.
+
+        :param result: The result of an instruction.
+        :param value_type: The type of the stored value.
+        :param where: The location of the instruction.
+        """
+        if result is not None and not result.type.accepts(value_type):
+            self.__report(f"can't store {value_type} in {result.type}", where)
+
+    def __verify_definitions(self, predecessors: Dict[str, List[str]]) -> None:
+        """
+        Checks that every temporary is set on every path from the entry to each of its usages
+        (the variables are checked by the native compiler, as Python code can use them before they are set).
+
+        :param predecessors: The labels of the blocks which jump to each block.
+        """
+        blocks = self.__function.get_blocks()
+        all_temps = set(self.__temp_types)
+        # The temporaries which are set at the end of each block, on every path to it (until nothing changes)
+        defined_out: Dict[str, Set[int]] = {block.get_label(): set(all_temps) for block in blocks}
+        defined_out[blocks[0].get_label()] = set()
+        changed = True
+        while changed:
+            changed = False
+            for block in blocks:
+                label = block.get_label()
+                defined = self.__get_defined_in(label, predecessors, defined_out)
+                for instruction in block.get_instructions():
+                    if isinstance(instruction.result, IRTemp):
+                        defined.add(instruction.result.index)
+                if defined != defined_out[label]:
+                    defined_out[label] = defined
+                    changed = True
+
+        for block in blocks:
+            defined = self.__get_defined_in(block.get_label(), predecessors, defined_out)
+            for index, instruction in enumerate(block.get_instructions()):
+                for operand in instruction.operands:
+                    if isinstance(operand, IRTemp) and operand.index not in defined:
+                        self.__report(f"{operand} is used before it is set on some path",
+                                      f"{block.get_label()}.{index} '{instruction}'")
+                if isinstance(instruction.result, IRTemp):
+                    defined.add(instruction.result.index)
+
+    @staticmethod
+    def __get_defined_in(label: str, predecessors: Dict[str, List[str]],
+                         defined_out: Dict[str, Set[int]]) -> Set[int]:
+        """
+        :param label: The label of a block.
+        :param predecessors: The labels of the blocks which jump to each block.
+        :param defined_out: The temporaries which are set at the end of each block.
+        :return: The temporaries which are set at the start of the block (on every path to it).
+        """
+        sources = [defined_out[source] for source in predecessors[label] if source in defined_out]
+        return set.intersection(*sources) if sources else set()
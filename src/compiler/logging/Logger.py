@@ -1,15 +1,16 @@
 """
 Logging utilities and functions.
 """
-from typing import cast
+from typing import Any, Optional, TYPE_CHECKING
 
-from src.compiler.Args import Args
-from src.compiler.logging.LoggerGUI import LoggerGUI
-from src.compiler.logging.LoggerImage import LoggerImage
-from src.pyexpressions.abstract.PyExpression import PyExpression
-from src.pyexpressions.concrete.PyConstant import PyConstant
-from src.pyexpressions.concrete.PyExpr import PyExpr
-from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
+from src.compiler.CompileSession import CompileSession
+from src.structures.TypeRenames import LazyMessage
+
+# Only import the expression classes when type checking,
+# as they import this module to create their loggers.
+if TYPE_CHECKING:
+    from src.compiler.logging.Profiler import Profiler
+    from src.pyexpressions.abstract.PyExpression import PyExpression
 
 
 class Logger:
@@ -18,49 +19,108 @@ class Logger:
 
     Lightweight instance that belongs to and
     is passed between to each classes.
+
+    When no debugging flag is turned on, a single disabled
+    instance is shared by the entire tree, so creating a
+    node's logger costs nothing more than a method call.
     """
 
-    __indentation: int = 0
+    __indentation: int
+    # The session of the logged tree (None if logging is disabled)
+    __session: Optional[CompileSession]
 
-    def __init__(self, py_expr: PyExpression) -> None:
-        # Check if logging is enabled
-        if not self.is_debug():
-            # If not then no need to calculate expensive recursive logging operations
+    def __init__(self, py_expr: Optional["PyExpression"], indentation: int = 0,
+                 session: Optional[CompileSession] = None) -> None:
+        """
+        Creates a logger for a node.
+        Use Logger.for_root and Logger.create_child instead of calling this directly.
+
+        :param py_expr: The expression that this logger belongs to (None for the shared disabled logger).
+        :param indentation: How deep the expression is in the tree (passed down from the parent logger).
+        :param session: The session whose debugging flags are turned on (None to disable logging).
+        """
+        # Set to fields
+        self.__indentation = indentation
+        self.__session = session
+
+        # If logging is not enabled, then there is nothing to register
+        if session is None or py_expr is None:
             return
 
         # Add this expression to the AST GUI
-        if Args().get_args().debug_gui:
-            LoggerGUI().add_node(py_expr)
+        if session.get_options().debug_gui:
+            session.get_logger_gui().add_node(py_expr)
 
         # Add this expression to the AST image
-        if Args().get_args().debug_image:
-            LoggerImage().add_node(py_expr)
-
-        # Figure out indentation level
-        # We do this by figuring out how many parents there are to this node.
-        temp_expr: PyExpression = py_expr
-        indentation: int = 0
-
-        # Keep iterating up the "parent node chain" until
-        # we hit the edge of the Module scope (outer layer)
-        while not temp_expr.is_exterior_scope():
-            # Increment the count
-            indentation += 1
-            # Iterate to next parent
-            # Cast to PyExpression since the while loop condition has validated that
-            temp_expr = cast(PyExpression, temp_expr.get_parent())
-
-        # Set to field
-        self.__indentation = indentation
+        if session.get_options().debug_image:
+            session.get_logger_image().add_node(py_expr)
+
+    @classmethod
+    def for_root(cls, py_expr: "PyExpression") -> "Logger":
+        """
+        Creates the logger for the top-most node of a tree.
+        This is the only place where the debugging flags are checked,
+        the rest of the tree inherits the decision from here.
+
+        :param py_expr: The root expression (usually a PyModule).
+        :return: A new Logger instance if debugging is on, otherwise the shared disabled logger.
+        """
+        # Check if logging is enabled
+        session = py_expr.get_session()
+        if not session.get_options().is_debug():
+            # If not then share the disabled logger (no expensive logging operations)
+            return DISABLED_LOGGER
+
+        # The root of the tree is not indented
+        return cls(py_expr, 0, session)
+
+    def create_child(self, py_expr: "PyExpression") -> "Logger":
+        """
+        Creates the logger for a node whose parent owns this logger.
+
+        :param py_expr: The child expression.
+        :return: A Logger one level deeper in the tree, or this same instance if logging is disabled.
+        """
+        # Disabled loggers are shared by the whole tree
+        if self.__session is None:
+            return self
+
+        # Otherwise, the child is one level deeper than its parent
+        return Logger(py_expr, self.__indentation + 1, self.__session)
+
+    def is_enabled(self) -> bool:
+        """
+        :return: True if this logger records anything (any debugging flags are turned on).
+        """
+        return self.__session is not None
+
+    def get_profiler(self) -> Optional["Profiler"]:
+        """
+        :return: The profiler of the compiler (None if profiling is disabled).
+        """
+        if self.__session is None or not self.__session.get_options().profile_compiler:
+            return None
+        return self.__session.get_profiler()
+
+    def get_indentation(self) -> int:
+        """
+        :return: How deep the logged expression is in the tree.
+        """
+        return self.__indentation
 
     @staticmethod
-    def short_describe_node(node: PyExpression) -> str:
+    def short_describe_node(node: "PyExpression") -> str:
         """
         Take a PyExpression node and convert it to a small description.
 
         :return: A small description of the node, as a string.
                 If no description can be produced, returns an empty string.
         """
+        # Import locally, as these are only needed when debugging
+        from src.pyexpressions.concrete.PyConstant import PyConstant
+        from src.pyexpressions.concrete.PyExpr import PyExpr
+        from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
+
         # Add some informational text for each tree node
         desc = ""
         # Look up object from its memory ID
@@ -73,66 +133,65 @@ class Logger:
         # Return the description
         return desc
 
-    @staticmethod
-    def is_debug() -> bool:
-        """
-        :return: True if any debugging flags are turned on.
-        """
-        return \
-            Args().get_args().debug_gui or \
-            Args().get_args().debug_text or \
-            Args().get_args().debug_image
-
-    @staticmethod
-    def finalize_debuggers() -> None:
+    def finalize_debuggers(self, image_path: str) -> None:
         """
         Wrapper method to update the AST debuggers.
+
+        :param image_path: The file to render the AST image to.
         """
+        # Nothing to update if logging is disabled
+        if self.__session is None:
+            return
+
         # Check if GUI logging is enabled
-        if Args().get_args().debug_gui:
+        if self.__session.get_options().debug_gui:
             # Update the tree
-            LoggerGUI().update_tree()
+            self.__session.get_logger_gui().update_tree()
 
-        if Args().get_args().debug_image:
+        if self.__session.get_options().debug_image:
             # Render the image
-            LoggerImage().render()
+            self.__session.get_logger_image().render(image_path)
 
-    def log_tree_up(self, message: str) -> None:
+    def log_tree_up(self, message: LazyMessage, *args: Any) -> None:
         """
         Logs a string to standard output.
         Automatically formats the string with a tree
         that points upwards (branches head down).
 
-        :param message: The message to log.
+        :param message: The message to log, or a callable which builds it.
+                        The callable is only called if text logging is enabled.
+        :param args: Arguments to pass to the message callable.
         """
         # Check if logging is enabled
-        if Args().get_args().debug_text:
+        if self.__session is not None and self.__session.get_options().debug_text:
             # Merge the tree branches with the message
             # Log it
             self.log(
                 self.__get_log_prepend(
                     indentation=self.__indentation,
                     point_upwards=True
-                ) + message
+                ) + self.__build_message(message, args)
             )
 
-    def log_tree_down(self, message: str) -> None:
+    def log_tree_down(self, message: LazyMessage, *args: Any) -> None:
         """
         Logs a string to standard output.
         Automatically formats the string with a tree
         that points downwards (branches head up).
 
-        :param message: The message to log.
+        :param message: The message to log, or a callable which builds it.
+                        The callable is only called if text logging is enabled.
+        :param args: Arguments to pass to the message callable.
         """
         # Check if logging is enabled
-        if Args().get_args().debug_text:
+        if self.__session is not None and self.__session.get_options().debug_text:
             # Merge the tree branches with the message
             # Log it
             self.log(
                 self.__get_log_prepend(
                     indentation=self.__indentation,
                     point_upwards=False
-                ) + message
+                ) + self.__build_message(message, args)
             )
 
     @staticmethod
@@ -149,6 +208,17 @@ class Logger:
         # Print the input message
         print(message)
 
+    @staticmethod
+    def __build_message(message: LazyMessage, args: Any) -> str:
+        """
+        Builds a (possibly lazy) message.
+
+        :param message: The message, or a callable which builds it.
+        :param args: Arguments to pass to the message callable.
+        :return: The message as a string.
+        """
+        return message if isinstance(message, str) else message(*args)
+
     @staticmethod
     def __get_log_prepend(indentation: int, point_upwards: bool) -> str:
         """
@@ -167,3 +237,7 @@ class Logger:
         # Otherwise, if this is the root branch (layer zero)
         # Make a newline to separate from previous node tree.
         return "\n"
+
+
+# The logger shared by every node when no debugging flags are turned on
+DISABLED_LOGGER: Logger = Logger(None)
@@ -4,14 +4,17 @@ Class to build the Logging GUI.
 from threading import Event, Thread
 from tkinter import Tk, PhotoImage, END
 from tkinter.ttk import Treeview, Style
-from typing import List
+from typing import List, TYPE_CHECKING
 
 from src.compiler.Util import Util
-from src.pyexpressions.abstract.PyExpression import PyExpression
-from src.structures.Singleton import Singleton
 
+# Only import the expression classes when type checking,
+# as the expressions import the logger (which imports this module).
+if TYPE_CHECKING:
+    from src.pyexpressions.abstract.PyExpression import PyExpression
 
-class LoggerGUI(metaclass=Singleton):
+
+class LoggerGUI:
     """
     A Tkinter Graphical User Interface used for displaying
     the ComPy Abstract Syntax Tree in an interactive form.
@@ -20,7 +23,7 @@ class LoggerGUI(metaclass=Singleton):
     __window: Tk
     __tree: Treeview
     __window_ready: Event
-    __listed_nodes: List[PyExpression]
+    __listed_nodes: List["PyExpression"]
 
     def __init__(self) -> None:
         # Create an event to block the core thread while the GUI is not yet ready
@@ -58,7 +61,7 @@ class LoggerGUI(metaclass=Singleton):
         # Show the window
         self.__window.mainloop()
 
-    def add_node(self, node: PyExpression) -> None:
+    def add_node(self, node: "PyExpression") -> None:
         """
         Adds the PyExpression node to the GUI.
 
@@ -1,17 +1,19 @@
 """
 Class to help structure the AST in order for it to be rendered.
 """
-from typing import Dict, Union
+from typing import Dict, Union, TYPE_CHECKING
 
 from ete3 import TreeStyle, Tree, TextFace
 
-from src.compiler.Args import Args
 from src.compiler.Util import Util
-from src.pyexpressions.abstract.PyExpression import PyExpression
-from src.structures.Singleton import Singleton
 
+# Only import the expression classes when type checking,
+# as the expressions import the logger (which imports this module).
+if TYPE_CHECKING:
+    from src.pyexpressions.abstract.PyExpression import PyExpression
 
-class LoggerImage(metaclass=Singleton):
+
+class LoggerImage:
     """
     A class to structure the AST into the Newick
     format (also known as a Newick tree), which can
@@ -19,7 +21,7 @@ class LoggerImage(metaclass=Singleton):
     """
 
     __node_parents: Dict[int, Union[int, None]]
-    __node_hashes: Dict[int, PyExpression]
+    __node_hashes: Dict[int, "PyExpression"]
     __const_style: TreeStyle
 
     def __init__(self) -> None:
@@ -40,7 +42,7 @@ class LoggerImage(metaclass=Singleton):
         self.__const_style.scale = 50
         self.__const_style.min_leaf_separation = 50
 
-    def add_node(self, node: PyExpression) -> None:
+    def add_node(self, node: "PyExpression") -> None:
         """
         Adds the PyExpression node to the Newick tree.
 
@@ -52,10 +54,12 @@ class LoggerImage(metaclass=Singleton):
         self.__node_parents[id(node)] = None if parent is None else id(parent)
         self.__node_hashes[id(node)] = node
 
-    def render(self) -> None:
+    def render(self, output_file: str) -> None:
         """
         Compiles the AST tree to a Newick formatted tree,
         then renders it all to an image and saves it to a file.
+
+        :param output_file: The image file to render to.
         """
         # Get the top-most node
         top_node: int = -1
@@ -121,6 +125,5 @@ class LoggerImage(metaclass=Singleton):
         # Render the tree to an image
         from src.compiler.logging.Logger import Logger
         Logger.log(f"Rendering debugging image...")
-        output_file = Args().get_args().file.name + ".png"
         t.render(file_name=output_file, tree_style=self.__const_style)
         Logger.log(f"Wrote image to output file '{output_file}'...")
@@ -0,0 +1,152 @@
+"""
+Profiler class.
+Measures the compiler itself, per node class and per source line.
+"""
+from _ast import AST
+from time import perf_counter
+from tracemalloc import get_traced_memory, is_tracing, start, stop
+from typing import Dict, List, Optional, TYPE_CHECKING, TextIO, Tuple
+
+from src.compiler.logging.ProfilerFrame import ProfilerFrame
+from src.compiler.logging.ProfilerStats import ProfilerStats
+
+# Only import the expression classes when type checking, as they import the loggers
+if TYPE_CHECKING:
+    from src.pyexpressions.abstract.PyExpression import PyExpression
+
+
+class Profiler:
+    """
+    Profiles the compilation (see the --profile-compiler flag).
+
+    The tree builder and PyExpression.transpile report the start and the
+    end of each node's construction and transpilation. For each phase and
+    node class (and each source line), the profiler counts the nodes, and
+    sums their time and the bytes they allocated- both including and
+    excluding their nested nodes (cumulative and self). It also sums the
+    self time of each stack of node classes, for flame graph tools.
+
+    The allocations are traced with tracemalloc, which slows the
+    compilation down, so only compare the times of a profile with
+    the times of another profile.
+    """
+
+    # The stack of nodes being profiled (each with its phase, class name and location)
+    __frames: List[ProfilerFrame]
+    # Statistics by phase and node class, and by source line
+    __by_class: Dict[Tuple[str, str], ProfilerStats]
+    __by_line: Dict[Tuple[str, int], ProfilerStats]
+    # The self time of each stack of node classes (';' separated), in seconds
+    __stacks: Dict[str, float]
+    # How many frames of each phase and node class are on the stack (only the outer-most one adds cumulative time)
+    __active: Dict[Tuple[str, str], int]
+    # True if this profiler started tracing the allocations (so it stops it as well)
+    __started_tracing: bool
+
+    def __init__(self) -> None:
+        self.__frames = []
+        self.__by_class = {}
+        self.__by_line = {}
+        self.__stacks = {}
+        self.__active = {}
+        self.__started_tracing = not is_tracing()
+        if self.__started_tracing:
+            start()
+
+    def start(self, phase: str, node_class: type, expression: AST, node: "PyExpression") -> None:
+        """
+        Starts profiling a node (must be followed by a call to stop, once the node is complete).
+
+        :param phase: The phase of the compilation ("build" or "transpile").
+        :param node_class: The class of the node.
+        :param expression: The AST node of the node.
+        :param node: The node, or its parent if it does not exist yet (to find its module).
+        """
+        name = node_class.__name__
+        # Nodes which are not made of a single AST node (such as bodies) have no line
+        line: Optional[int] = getattr(expression, "lineno", None)
+        location = None if line is None else (node.get_module().get_path() or "<module>", line)
+        stack = name if not self.__frames else f"{self.__frames[-1].stack};{name}"
+        if not self.__frames or self.__frames[-1].phase != phase:
+            stack = f"{phase};{stack}"
+
+        key = (phase, name)
+        self.__active[key] = self.__active.get(key, 0) + 1
+        self.__frames.append(ProfilerFrame(phase, name, location, stack, perf_counter(), get_traced_memory()[0]))
+
+    def stop(self) -> None:
+        """
+        Stops profiling the latest node which was started.
+        """
+        frame = self.__frames.pop()
+        elapsed = perf_counter() - frame.start_time
+        allocated = get_traced_memory()[0] - frame.start_memory
+        self_time = elapsed - frame.nested_time
+        self_allocated = allocated - frame.nested_memory
+
+        # The parent's self time and allocations do not include this node
+        if self.__frames:
+            self.__frames[-1].nested_time += elapsed
+            self.__frames[-1].nested_memory += allocated
+
+        key = (frame.phase, frame.name)
+        self.__active[key] -= 1
+        # A node nested in a node of the same class (such as nested conditionals) was already counted by it
+        outer_most = self.__active[key] == 0
+        self.__get_stats(self.__by_class, key).add(self_time, elapsed if outer_most else 0.0, self_allocated)
+        if frame.location is not None:
+            self.__get_stats(self.__by_line, frame.location).add(self_time, 0.0, self_allocated)
+        self.__stacks[frame.stack] = self.__stacks.get(frame.stack, 0.0) + self_time
+
+    def report(self, folded_path: str, limit: int = 20) -> None:
+        """
+        Prints the statistics (sorted by self time), and writes the stacks in the collapsed
+        stack format (one "stack;of;classes microseconds" line per stack) for flame graph tools.
+
+        :param folded_path: The file to write the collapsed stacks to.
+        :param limit: The amount of source lines to print.
+        """
+        if self.__started_tracing:
+            stop()
+            self.__started_tracing = False
+
+        print("Compiler profile, by node class (times in ms, allocations in KB, net of what was freed):")
+        print(f"  {'phase':<10} {'node class':<22} {'count':>8} {'self':>10} {'cumulative':>11} {'allocated':>10}")
+        for (phase, name), stats in sorted(self.__by_class.items(), key=lambda item: -item[1].self_time):
+            print(f"  {phase:<10} {name:<22} {stats.count:>8} {stats.self_time * 1000:>10.2f} "
+                  f"{stats.cumulative_time * 1000:>11.2f} {stats.allocated / 1024:>10.1f}")
+
+        print(f"Compiler profile, by source line (top {limit}):")
+        print(f"  {'line':<40} {'count':>8} {'self':>10} {'allocated':>10}")
+        lines = sorted(self.__by_line.items(), key=lambda item: -item[1].self_time)
+        for (path, line), stats in lines[:limit]:
+            print(f"  {f'{path}:{line}':<40} {stats.count:>8} {stats.self_time * 1000:>10.2f} "
+                  f"{stats.allocated / 1024:>10.1f}")
+
+        with open(folded_path, "w") as f:
+            self.write_stacks(f)
+        print(f"Collapsed stacks written to '{folded_path}'")
+
+    def write_stacks(self, sink: TextIO) -> None:
+        """
+        Writes the stacks in the collapsed stack format (self time in microseconds).
+
+        :param sink: The file to write to.
+        """
+        for stack, self_time in sorted(self.__stacks.items()):
+            microseconds = round(self_time * 1e6)
+            if microseconds > 0:
+                sink.write(f"{stack} {microseconds}\n")
+
+    @staticmethod
+    def __get_stats(table: Dict, key: Tuple) -> ProfilerStats:
+        """
+        :param table: The statistics table.
+        :param key: The key of the statistics.
+        :return: The statistics of the key (added to the table if they are missing).
+        """
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = ProfilerStats()
+        return stats
+
@@ -0,0 +1,36 @@
+"""
+ProfilerFrame class.
+A node which is being profiled.
+"""
+from typing import Optional, Tuple
+
+
+class ProfilerFrame:
+    """
+    A node which is being profiled.
+    """
+
+    __slots__ = ("phase", "name", "location", "stack", "start_time", "start_memory", "nested_time", "nested_memory")
+
+    phase: str
+    name: str
+    # The file and the line of the node (None if it has no line)
+    location: Optional[Tuple[str, int]]
+    # The node classes of the stack, up to this node
+    stack: str
+    start_time: float
+    start_memory: int
+    # The time and the allocations of the nested nodes
+    nested_time: float
+    nested_memory: int
+
+    def __init__(self, phase: str, name: str, location: Optional[Tuple[str, int]], stack: str, start_time: float,
+                 start_memory: int) -> None:
+        self.phase = phase
+        self.name = name
+        self.location = location
+        self.stack = stack
+        self.start_time = start_time
+        self.start_memory = start_memory
+        self.nested_time = 0.0
+        self.nested_memory = 0
@@ -0,0 +1,37 @@
+"""
+ProfilerStats class.
+The statistics of profiled nodes.
+"""
+
+
+class ProfilerStats:
+    """
+    The statistics of a node class (or of a source line).
+    """
+
+    __slots__ = ("count", "self_time", "cumulative_time", "allocated")
+
+    count: int
+    self_time: float
+    cumulative_time: float
+    # The bytes allocated (and still held) by the nodes themselves
+    allocated: int
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.self_time = 0.0
+        self.cumulative_time = 0.0
+        self.allocated = 0
+
+    def add(self, self_time: float, cumulative_time: float, allocated: int) -> None:
+        """
+        Adds a profiled node.
+
+        :param self_time: The time of the node, without its nested nodes.
+        :param cumulative_time: The time of the node, with its nested nodes.
+        :param allocated: The bytes allocated by the node, without its nested nodes.
+        """
+        self.count += 1
+        self.self_time += self_time
+        self.cumulative_time += cumulative_time
+        self.allocated += allocated
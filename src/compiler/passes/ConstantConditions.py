@@ -0,0 +1,63 @@
+"""
+ConstantConditions class.
+Removes the branches which are never taken.
+"""
+from typing import Any, Dict, List, cast
+
+from src.compiler.passes.ConstantFolding import ConstantFolding
+from src.compiler.passes.Pass import Pass
+from src.pyexpressions.abstract.PyConditional import PyConditional
+from src.pyexpressions.concrete.PyConstant import PyConstant
+from src.pyexpressions.concrete.PyIf import PyIf
+from src.pyexpressions.concrete.PyIfExp import PyIfExp
+from src.pyexpressions.concrete.PyModule import PyModule
+from src.pyexpressions.concrete.PyWhile import PyWhile
+
+
+class ConstantConditions(Pass):
+    """
+    Replaces the conditionals whose condition is an integer constant
+    (usually after constant folding) with the branch which is taken:
+     - 'if' statements with their body, their 'else' body, or nothing,
+     - conditional expressions with one of their values,
+     - 'while' loops which never run with nothing.
+    A body keeps its braces, so its variables stay in their own C++ block.
+    The body then becomes a statement of its own, which every consumer of
+    statements handles (the transpilation of bodies, IRLowering, and
+    ReachabilityAnalysis).
+    """
+
+    NAME = "constant-conditions"
+    LEVEL = 3
+
+    def run(self, module: PyModule, results: Dict[str, Any]) -> int:
+        """
+        Removes the branches which are never taken.
+
+        :param module: The root module of the compilation.
+        :param results: The results of the analysis passes which ran before this one.
+        :return: The amount of conditionals which were replaced.
+        """
+        # The replaced conditionals are collected first, as the tree can't change while it is walked
+        conditionals: List[PyConditional] = [
+            node for node in module.walk()
+            if isinstance(node, PyConditional) and ConstantFolding.is_int(node.get_condition())
+        ]
+        replaced = 0
+        for conditional in conditionals:
+            taken = bool(cast(PyConstant, conditional.get_condition()).get_value())
+            if isinstance(conditional, PyWhile):
+                # (loops which always run are kept)
+                if taken:
+                    continue
+                self.remove(conditional)
+            elif isinstance(conditional, PyIfExp):
+                self.replace(conditional, conditional.get_code() if taken else conditional.get_else())
+            elif isinstance(conditional, PyIf):
+                branch = conditional.get_code() if taken else conditional.get_else()
+                if branch is None:
+                    self.remove(conditional)
+                else:
+                    self.replace(conditional, branch)
+            replaced += 1
+        return replaced
@@ -0,0 +1,78 @@
+"""
+ConstantFolding class.
+Computes the operations on integer constants at compile time.
+"""
+from ast import Constant, copy_location
+from typing import Any, Callable, Dict, List, Optional
+
+from src.compiler.passes.Pass import Pass
+from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.concrete.PyBinOp import PyBinOp
+from src.pyexpressions.concrete.PyConstant import PyConstant
+from src.pyexpressions.concrete.PyModule import PyModule
+
+# The operations which are folded (by their C++ operator), which give the same result in Python and in C++
+FOLDED_OPERATIONS: Dict[str, Callable[[int, int], int]] = {
+    "+": lambda left, right: left + right,
+    "-": lambda left, right: left - right,
+    "*": lambda left, right: left * right,
+}
+# The range of a C++ int (outside of it, C++ overflows, so the values are not folded)
+INT_MIN: int = -2 ** 31
+INT_MAX: int = 2 ** 31 - 1
+
+
+class ConstantFolding(Pass):
+    """
+    Replaces additions, subtractions and multiplications of integer
+    constants with their result (nested operations are folded from
+    the inside out, so '2 * 3 + 4' becomes '10').
+
+    Divisions are not folded, as Python and C++ divide differently,
+    and neither are results which overflow a C++ int.
+    """
+
+    NAME = "constant-folding"
+    LEVEL = 2
+
+    def run(self, module: PyModule, results: Dict[str, Any]) -> int:
+        """
+        Folds the operations on constants.
+
+        :param module: The root module of the compilation.
+        :param results: The results of the analysis passes which ran before this one.
+        :return: The amount of operations which were folded.
+        """
+        # Each node is walked before its nested nodes, so in reverse, the nested operations are folded first
+        nodes: List[PyExpression] = list(module.walk())
+        folded = 0
+        for node in reversed(nodes):
+            if not isinstance(node, PyBinOp):
+                continue
+            value = self.fold(node)
+            if value is not None:
+                self.replace(node, PyConstant(copy_location(Constant(value), node.get_expression()), node.get_parent()))
+                folded += 1
+        return folded
+
+    @staticmethod
+    def fold(operation: PyBinOp) -> Optional[int]:
+        """
+        :param operation: An operation.
+        :return: The result of the operation, or None if it can't be folded.
+        """
+        function = FOLDED_OPERATIONS.get(operation.get_op_type())
+        left, right = operation.get_left(), operation.get_right()
+        if function is None or not ConstantFolding.is_int(left) or not ConstantFolding.is_int(right):
+            return None
+        value = function(left.get_value(), right.get_value())
+        return value if INT_MIN <= value <= INT_MAX else None
+
+    @staticmethod
+    def is_int(node: PyExpression) -> bool:
+        """
+        :param node: A node.
+        :return: True if the node is an integer constant, which fits in a C++ int.
+        """
+        # (booleans are integers in Python, but not in the transpiled code)
+        return isinstance(node, PyConstant) and type(node.get_value()) is int and INT_MIN <= node.get_value() <= INT_MAX
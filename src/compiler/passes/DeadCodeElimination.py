@@ -0,0 +1,32 @@
+"""
+DeadCodeElimination class.
+Removes the statements which can never run.
+"""
+from typing import Any, Dict, List
+
+from src.compiler.passes.Pass import Pass
+from src.compiler.passes.ReachabilityAnalysis import ReachabilityAnalysis
+from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.concrete.PyModule import PyModule
+
+
+class DeadCodeElimination(Pass):
+    """
+    Removes the statements which the reachability analysis found to be unreachable.
+    """
+
+    NAME = "dead-code"
+    LEVEL = 1
+
+    def run(self, module: PyModule, results: Dict[str, Any]) -> int:
+        """
+        Removes the unreachable statements.
+
+        :param module: The root module of the compilation.
+        :param results: The results of the analysis passes which ran before this one (the reachability analysis).
+        :return: The amount of statements which were removed.
+        """
+        unreachable: List[PyExpression] = results[ReachabilityAnalysis.NAME]
+        for statement in unreachable:
+            self.remove(statement)
+        return len(unreachable)
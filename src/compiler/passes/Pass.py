@@ -0,0 +1,67 @@
+"""
+Pass base class.
+A single analysis or transformation of the tree (see PassManager).
+"""
+from ast import Pass as PassStatement, copy_location
+from abc import abstractmethod, ABCMeta
+from typing import Any, Dict
+
+from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.concrete.PyModule import PyModule
+from src.pyexpressions.concrete.PyPass import PyPass
+
+
+class Pass(metaclass=ABCMeta):
+    """
+    Pass base class.
+
+    An analysis pass only reads the tree, and returns a result which
+    the passes after it can use (by its name). A transformation pass
+    changes the tree, by replacing nodes in their parents (see
+    PyExpression.children and PyExpression.replace_child).
+
+    Passes run on the tree of a whole compilation (the imported modules
+    included), and must keep the meaning of the program- a tree must
+    transpile to the same behavior at every optimization level.
+    """
+
+    # The name of the pass (which the passes after it find its result by, if it is an analysis)
+    NAME: str = ""
+    # The lowest optimization level which runs the pass (-O1 to -O3)
+    LEVEL: int = 1
+    # True if the pass only analyses the tree, False if it changes it
+    IS_ANALYSIS: bool = False
+
+    @abstractmethod
+    def run(self, module: PyModule, results: Dict[str, Any]) -> Any:
+        """
+        Runs the pass on a tree.
+
+        :param module: The root module of the compilation.
+        :param results: The results of the analysis passes which ran before this one, by their names.
+        :return: The result of the analysis (for an analysis pass), or the amount of nodes which were
+                 replaced (for a transformation pass).
+        """
+
+    @staticmethod
+    def replace(node: PyExpression, new: PyExpression) -> None:
+        """
+        Replaces a node in its parent.
+
+        :param node: The node to replace (it must have a parent).
+        :param new: The node to put in its place.
+        """
+        parent = node.get_parent()
+        assert parent is not None, "modules cannot be replaced"
+        parent.replace_child(node, new)
+
+    @staticmethod
+    def remove(node: PyExpression) -> None:
+        """
+        Removes a statement, by replacing it with a 'pass' statement (which is not transpiled).
+
+        :param node: The statement to remove (it must have a parent).
+        """
+        parent = node.get_parent()
+        assert parent is not None, "modules cannot be removed"
+        Pass.replace(node, PyPass(copy_location(PassStatement(), node.get_expression()), parent))
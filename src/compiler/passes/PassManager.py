@@ -0,0 +1,116 @@
+"""
+PassManager class.
+Runs the analysis and transformation passes over the tree, by optimization level.
+"""
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.compiler.passes.Pass import Pass
+from src.pyexpressions.concrete.PyModule import PyModule
+
+
+class PassManager:
+    """
+    Runs the passes over the tree of each compilation, between parsing
+    and transpiling (see Compiler.parse).
+
+    The optimization level (-O0 to -O3) selects the passes: each pass
+    runs at its own level and above, in the order it was registered in.
+    -O0 runs no pass at all, so the tree is transpiled as it was parsed.
+
+    The time of each pass (and the amount of nodes that it replaced) is
+    summed over all the compilations of the session, see report.
+    """
+
+    # The highest optimization level
+    MAX_LEVEL: int = 3
+
+    __level: int
+    # The passes which run at the level, in order
+    __passes: List[Pass]
+    # The total time of each pass, in seconds, and the nodes that it replaced (by the name of the pass)
+    __times: Dict[str, float]
+    __changes: Dict[str, int]
+
+    def __init__(self, level: int, passes: Optional[Sequence[Pass]] = None) -> None:
+        """
+        :param level: The optimization level (0 to MAX_LEVEL).
+        :param passes: The passes to select from, in order (None for the default passes, see get_default_passes).
+        """
+        self.__level = level
+        self.__passes = []
+        self.__times = {}
+        self.__changes = {}
+        for new_pass in passes if passes is not None else self.get_default_passes():
+            self.register(new_pass)
+
+    @staticmethod
+    def get_default_passes() -> List[Pass]:
+        """
+        :return: The passes of the compiler, in the order they run in.
+        """
+        # Import locally, as the passes are only needed when optimizing
+        from src.compiler.passes.ConstantConditions import ConstantConditions
+        from src.compiler.passes.ConstantFolding import ConstantFolding
+        from src.compiler.passes.DeadCodeElimination import DeadCodeElimination
+        from src.compiler.passes.ReachabilityAnalysis import ReachabilityAnalysis
+
+        # The conditions are folded before they are checked, and the branches are
+        # removed before the unreachable code is searched (they can contain jumps)
+        return [ConstantFolding(), ConstantConditions(), ReachabilityAnalysis(), DeadCodeElimination()]
+
+    def register(self, new_pass: Pass) -> None:
+        """
+        Adds a pass after the registered passes (it only runs if its level is selected).
+
+        :param new_pass: The pass to add.
+        """
+        if new_pass.LEVEL <= self.__level:
+            self.__passes.append(new_pass)
+
+    def get_level(self) -> int:
+        """
+        :return: The optimization level.
+        """
+        return self.__level
+
+    def get_passes(self) -> List[Pass]:
+        """
+        :return: The passes which run at the optimization level, in order.
+        """
+        return self.__passes
+
+    def run(self, module: PyModule) -> None:
+        """
+        Runs the passes over the tree of a compilation.
+
+        :param module: The root module of the compilation.
+        """
+        # The results of the analysis passes, for the passes after them (only kept during this compilation)
+        results: Dict[str, Any] = {}
+        for current in self.__passes:
+            start_time = perf_counter()
+            result = current.run(module, results)
+            self.__times[current.NAME] = self.__times.get(current.NAME, 0.0) + perf_counter() - start_time
+            if current.IS_ANALYSIS:
+                results[current.NAME] = result
+            else:
+                self.__changes[current.NAME] = self.__changes.get(current.NAME, 0) + result
+
+    def get_times(self) -> Dict[str, float]:
+        """
+        :return: The total time of each pass which ran, in seconds (in the order the passes run in).
+        """
+        return self.__times
+
+    def report(self) -> None:
+        """
+        Prints the time of each pass, and the amount of nodes that it replaced.
+        """
+        print(f"Optimization passes (-O{self.__level}):")
+        print(f"  {'pass':<22} {'kind':<10} {'time (ms)':>10} {'replaced':>9}")
+        for current in self.__passes:
+            kind = "analysis" if current.IS_ANALYSIS else "transform"
+            replaced = "" if current.IS_ANALYSIS else str(self.__changes.get(current.NAME, 0))
+            print(f"  {current.NAME:<22} {kind:<10} {self.__times.get(current.NAME, 0.0) * 1000:>10.2f} "
+                  f"{replaced:>9}")
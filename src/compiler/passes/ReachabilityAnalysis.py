@@ -0,0 +1,57 @@
+"""
+ReachabilityAnalysis class.
+Finds the statements which can never run.
+"""
+from typing import Any, Dict, List
+
+from src.compiler.passes.Pass import Pass
+from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.concrete.PyBreak import PyBreak
+from src.pyexpressions.concrete.PyContinue import PyContinue
+from src.pyexpressions.concrete.PyModule import PyModule
+from src.pyexpressions.concrete.PyReturn import PyReturn
+from src.pyexpressions.highlevel.PyBody import PyBody
+
+
+class ReachabilityAnalysis(Pass):
+    """
+    Finds the statements which follow a 'return', 'break' or
+    'continue' statement in the same body, which can never run.
+    A body can be a statement of its own (see ConstantConditions), and
+    then it jumps if any of its own statements do.
+    """
+
+    NAME = "reachability"
+    LEVEL = 1
+    IS_ANALYSIS = True
+
+    def run(self, module: PyModule, results: Dict[str, Any]) -> List[PyExpression]:
+        """
+        Finds the unreachable statements.
+
+        :param module: The root module of the compilation.
+        :param results: The results of the analysis passes which ran before this one.
+        :return: The unreachable statements which are transpiled (dead expressions are not transpiled anyway).
+        """
+        unreachable: List[PyExpression] = []
+        for node in module.walk():
+            if not isinstance(node, PyBody):
+                continue
+            # Every statement after the first jump is unreachable
+            jumped = False
+            for statement in node.children():
+                if jumped and not statement.is_dead_expression():
+                    unreachable.append(statement)
+                elif self.__jumps(statement):
+                    jumped = True
+        return unreachable
+
+    @classmethod
+    def __jumps(cls, statement: PyExpression) -> bool:
+        """
+        :param statement: A statement of a body.
+        :return: True if the statement always jumps out of the body (the statements after it never run).
+        """
+        if isinstance(statement, PyBody):
+            return any(cls.__jumps(nested) for nested in statement.children())
+        return isinstance(statement, (PyReturn, PyBreak, PyContinue))
@@ -0,0 +1,212 @@
+"""
+PortLibrary class.
+Loads declarative port libraries (a manifest, and native header files).
+"""
+from hashlib import sha256
+from json import loads
+from re import compile as compile_regex
+from marshal import dumps as marshal_dumps, loads as marshal_loads
+from os.path import join, isdir, isfile, dirname, basename
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.pybuiltins.PortSource import PortSource
+from src.pybuiltins.PyPortHeaderSignature import PyPortHeaderSignature
+from src.structures.Errors import InvalidArgumentError, ObjectNotDefinedError
+
+# A compiled port: its interface, its native code, the native headers it includes, and the ports it calls
+CompiledPort = Tuple[str, str, List[str], List[str]]
+
+# Matches the preprocessor lines which are removed from the header files (see PortLibrary.__strip_header)
+HEADER_LINE_REGEX = compile_regex(r'^\s*#\s*(?:pragma\s+once|include\s*([<"])([^>"]+)[>"])\s*$')
+
+
+class PortLibrary(PortSource):
+    """
+    A declarative port library.
+
+    Instead of a Python module (with stub functions, and their native
+    code embedded in strings), the library is a directory with a
+    manifest (ports.json) and a native header file for each port:
+    {
+        "ports": {
+            "add": {
+                "signature": "add(number_one: int, number_two: int) -> int",
+                "header": "add.hpp",
+                "linked_ports": ["print"]
+            }
+        }
+    }
+    The signature is the Python interface of the port (what the Python code sees),
+    and the header file holds the whole native definition of the function.
+    Header files are complete (with their include guard and includes), so
+    g++ can compile them on their own. When a port is copied into the
+    output, its system includes are moved to the top of the output (along
+    with any extra "includes" listed in the manifest), and its local
+    includes are dropped (they should be the headers of its linked ports,
+    which are copied into the output as well).
+
+    The manifest and the header files are compiled into a binary index
+    (in the transpile cache directory, see PortSource), which is loaded
+    with a single read as long as none of the files changed since. Nothing is imported,
+    and no Python source code is inspected, so loading a library with
+    thousands of ports is nearly instant. Each port is kept serialized
+    in the index, and is only decoded when it is first called.
+    """
+
+    MANIFEST_NAME: str = "ports.json"
+    INDEX_EXTENSION: str = ".idx"
+    # Bumped whenever the layout of the index changes
+    INDEX_FORMAT: int = 2
+
+    # The directory of the library
+    __directory: str
+    # The transpile cache directory, which the index is stored in (None if it is not stored)
+    __cache_directory: Optional[str]
+    # The loaded index (None until it is first needed)
+    __index: Optional[Dict[str, Any]]
+
+    def __init__(self, path: str, cache_directory: Optional[str] = None) -> None:
+        """
+        :param path: The directory of the library, or the path of its manifest.
+        :param cache_directory: The transpile cache directory, to store the index in (None to not store it).
+        """
+        self.__directory = dirname(path) if basename(path) == self.MANIFEST_NAME else path
+        self.__cache_directory = cache_directory
+        self.__index = None
+
+    @classmethod
+    def is_library(cls, path: str) -> bool:
+        """
+        :param path: A linked library, as passed to the command line.
+        :return: True if it is a declarative library (otherwise it is a Python module name).
+        """
+        return isfile(join(path, cls.MANIFEST_NAME)) if isdir(path) else \
+            basename(path) == cls.MANIFEST_NAME and isfile(path)
+
+    def get_directory(self) -> str:
+        """
+        :return: The directory of the library.
+        """
+        return self.__directory
+
+    def get_index_path(self) -> Optional[str]:
+        """
+        :return: The path of the library's compiled index (None if it is not stored).
+        """
+        return self._get_index_path(self.__cache_directory, self.__directory, self.INDEX_EXTENSION)
+
+    def get_names(self) -> List[str]:
+        """
+        :return: The names of the library's ports.
+        """
+        return list(self.__get_index()["ports"])
+
+    def get_port(self, name: str) -> PyPortHeaderSignature:
+        """
+        Decodes a port of the library.
+
+        :param name: The name of the port (one of get_names).
+        :return: The signature of the port.
+        """
+        data: Optional[bytes] = self.__get_index()["ports"].get(name)
+        if data is None:
+            raise ObjectNotDefinedError(name)
+        interface, code, includes, linked_ports = marshal_loads(data)
+        return PyPortHeaderSignature(interface, code, includes or None, linked_ports or None)
+
+    def get_digest(self) -> str:
+        """
+        :return: A hash of the library's contents (the manifest, and every header file), as a hex string.
+        """
+        return str(self.__get_index()["digest"])
+
+    def __get_index(self) -> Dict[str, Any]:
+        """
+        Loads the index of the library, compiling it if it is missing or outdated.
+
+        :return: The index.
+        """
+        if self.__index is None:
+            self.__index = self.__load_index()
+            if self.__index is None:
+                self.__index = self.__compile_index()
+                self._write_index(self.get_index_path(), self.INDEX_FORMAT, self.__index)
+        return self.__index
+
+    def __load_index(self) -> Optional[Dict[str, Any]]:
+        """
+        :return: The stored index, or None if it is missing or outdated.
+        """
+        index = self._read_index(self.get_index_path(), self.INDEX_FORMAT)
+        if index is None:
+            return None
+        # Make sure that none of the files changed since the index was compiled
+        for file_name, stamp in index["stamps"].items():
+            if self._get_stamp(join(self.__directory, file_name)) != stamp:
+                return None
+        return index
+
+    def __compile_index(self) -> Dict[str, Any]:
+        """
+        Compiles the manifest and the header files to an index.
+
+        :return: The compiled index.
+        """
+        # Stamp the files before reading them, so changes made while compiling are noticed next time
+        stamps = {self.MANIFEST_NAME: self._get_stamp(join(self.__directory, self.MANIFEST_NAME))}
+        digest = sha256()
+        try:
+            with open(join(self.__directory, self.MANIFEST_NAME), "rb") as f:
+                manifest_data = f.read()
+            manifest: Dict[str, Any] = loads(manifest_data)
+        except (OSError, ValueError):
+            # The library is not valid or does not exist
+            raise InvalidArgumentError(self.__directory)
+        digest.update(manifest_data)
+
+        # Read the header file of each port (in order, so the digest is stable)
+        headers: Dict[str, str] = {}
+        # Each port is serialized on its own, so it is only decoded when it is called
+        ports: Dict[str, bytes] = {}
+        for name, port in sorted(manifest.get("ports", {}).items()):
+            header_name: str = port["header"]
+            if header_name not in headers:
+                stamps[header_name] = self._get_stamp(join(self.__directory, header_name))
+                try:
+                    with open(join(self.__directory, header_name), "r") as f:
+                        headers[header_name] = f.read()
+                except OSError:
+                    raise InvalidArgumentError(join(self.__directory, header_name))
+                digest.update(header_name.encode() + b"\0" + headers[header_name].encode() + b"\0")
+            code, includes = self.__strip_header(headers[header_name])
+            compiled_port: CompiledPort = (
+                f"def {port['signature']}:\n    pass\n",
+                code,
+                sorted(set(includes) | set(port.get("includes", []))),
+                list(port.get("linked_ports", []))
+            )
+            ports[name] = marshal_dumps(compiled_port)
+
+        return {
+            "stamps": stamps,
+            "digest": digest.hexdigest(),
+            "ports": ports
+        }
+
+    @staticmethod
+    def __strip_header(code: str) -> Tuple[str, List[str]]:
+        """
+        Removes the include guard and the includes of a header file, as its code is copied into the output directly.
+
+        :param code: The code of the header file.
+        :return: The code of the native definition, and the system headers that it includes.
+        """
+        lines: List[str] = []
+        includes: List[str] = []
+        for line in code.splitlines():
+            match = HEADER_LINE_REGEX.match(line)
+            if match is None:
+                lines.append(line)
+            elif match.group(1) == "<":
+                includes.append(match.group(2))
+        return "\n".join(lines).strip(), includes
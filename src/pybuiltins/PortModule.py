@@ -0,0 +1,133 @@
+"""
+PortModule class.
+Loads port libraries which are Python modules.
+"""
+from hashlib import sha256
+from importlib import import_module
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+from src.pybuiltins.PortSource import PortSource
+from src.pybuiltins.PyPortSignature import PyPortSignature
+from src.structures.Errors import InvalidArgumentError, ObjectNotDefinedError
+
+
+class PortModule(PortSource):
+    """
+    A port library which is a Python module (with stub functions, and
+    a 'ported_objs' dictionary of their signatures).
+
+    Importing a large library is expensive, so the names of its ports
+    are stored in a small index (in the transpile cache directory, see
+    PortSource), and the module itself is only imported when one of its
+    ports is first called. The index is compiled again whenever the
+    module's file changes.
+
+    Finding the module's file (with find_spec) does import the parent
+    packages of a dotted module name (running their __init__.py files),
+    so only the library module itself is imported lazily.
+    """
+
+    # Bumped whenever the layout of the index changes
+    INDEX_FORMAT: int = 1
+    INDEX_EXTENSION: str = ".ports"
+
+    # The module name of the library
+    __name: str
+    # The path of the module's file
+    __path: str
+    # The transpile cache directory, which the index is stored in (None if it is not stored)
+    __cache_directory: Optional[str]
+    # The imported module (None until one of its ports is called)
+    __module: Optional[ModuleType]
+    # The names of the library's ports (None until they are first needed)
+    __names: Optional[List[str]]
+    # The hash of the module's file (None until it is first needed)
+    __digest: Optional[str]
+
+    def __init__(self, name: str, cache_directory: Optional[str] = None) -> None:
+        """
+        :param name: The module name of the library.
+        :param cache_directory: The transpile cache directory, to store the index in (None to not store it).
+        """
+        # Find the module without importing it (only its parent packages are imported)
+        try:
+            spec = find_spec(name)
+        except (ModuleNotFoundError, ValueError):
+            spec = None
+        # The library does not exist
+        if spec is None or spec.origin is None or not spec.has_location:
+            raise InvalidArgumentError(name)
+
+        self.__name = name
+        self.__path = spec.origin
+        self.__cache_directory = cache_directory
+        self.__module = None
+        self.__names = None
+        self.__digest = None
+
+    def get_path(self) -> str:
+        """
+        :return: The path of the module's file.
+        """
+        return self.__path
+
+    def get_index_path(self) -> Optional[str]:
+        """
+        :return: The path of the index of the module's port names (None if it is not stored).
+        """
+        return self._get_index_path(self.__cache_directory, self.__path, self.INDEX_EXTENSION)
+
+    def get_names(self) -> List[str]:
+        """
+        :return: The names of the library's ports.
+        """
+        if self.__names is None:
+            index_path = self.get_index_path()
+            stamp = self._get_stamp(self.__path)
+            index = self._read_index(index_path, self.INDEX_FORMAT)
+            if index is not None and index["stamp"] == stamp:
+                self.__names = list(index["names"])
+            else:
+                # The index is missing or outdated, so the module must be imported to list its ports
+                self.__names = list(self.__get_ported_objs())
+                self._write_index(index_path, self.INDEX_FORMAT, {"stamp": stamp, "names": self.__names})
+        return self.__names
+
+    def get_port(self, name: str) -> PyPortSignature:
+        """
+        Loads a port of the library (importing the module, if it was not imported yet).
+
+        :param name: The name of the port (one of get_names).
+        :return: The signature of the port.
+        """
+        signature: Optional[PyPortSignature] = self.__get_ported_objs().get(name)
+        if signature is None:
+            raise ObjectNotDefinedError(name)
+        return signature
+
+    def get_digest(self) -> str:
+        """
+        :return: A hash of the library's contents (the module's file), as a hex string.
+        """
+        if self.__digest is None:
+            with open(self.__path, "rb") as f:
+                self.__digest = sha256(f.read()).hexdigest()
+        return self.__digest
+
+    def __get_ported_objs(self) -> Dict[str, Any]:
+        """
+        Imports the module.
+
+        :return: The ported objects of the module, by name.
+        """
+        # Catch errors (module can be non-existent, objects could be missing from file)
+        try:
+            if self.__module is None:
+                self.__module = import_module(self.__name)
+            ported_objs: Dict[str, Any] = getattr(self.__module, "ported_objs")
+        except (AttributeError, ModuleNotFoundError):
+            # The library is not valid or does not exist
+            raise InvalidArgumentError(self.__name)
+        return ported_objs
@@ -0,0 +1,126 @@
+"""
+PortSource class.
+A linked port library, which is loaded lazily.
+"""
+from abc import abstractmethod, ABCMeta
+from hashlib import sha256
+from marshal import dumps as marshal_dumps, loads as marshal_loads
+from os import close, makedirs, remove, replace, stat, write
+from os.path import dirname, isfile, join, realpath
+from sys import version
+from tempfile import mkstemp
+from typing import Any, Dict, List, Optional
+
+from src.pybuiltins.PyPortSignature import PyPortSignature
+
+
+class PortSource(metaclass=ABCMeta):
+    """
+    A linked port library.
+
+    Libraries can hold thousands of ports, of which a program only
+    uses a few, so a library only lists the names of its ports up front
+    (from a small index, which is stored on disk), and only loads a
+    port's definition when it is first called.
+
+    The indexes are stored in the transpile cache directory of the
+    compilation (see CompileOptions.cache_directory), by the real path of
+    their library, so loading a library never writes into the library
+    itself (which might be read-only, or shared with other users). When
+    nothing is cached, the index is compiled in memory, and not stored.
+    """
+
+    @abstractmethod
+    def get_names(self) -> List[str]:
+        """
+        :return: The names of the library's ports.
+        """
+
+    @abstractmethod
+    def get_port(self, name: str) -> PyPortSignature:
+        """
+        Loads a port of the library.
+
+        :param name: The name of the port (one of get_names).
+        :return: The signature of the port.
+        """
+
+    @abstractmethod
+    def get_digest(self) -> str:
+        """
+        :return: A hash of the library's contents, as a hex string.
+        """
+
+    @staticmethod
+    def _get_index_path(cache_directory: Optional[str], library_path: str, extension: str) -> Optional[str]:
+        """
+        :param cache_directory: The transpile cache directory (None if nothing is cached).
+        :param library_path: The path of the library (its directory, or its file).
+        :param extension: The extension of the index file, which tells the kinds of libraries apart.
+        :return: The path of the library's index, in the transpile cache directory (None if it is not stored).
+        """
+        if cache_directory is None:
+            return None
+        library_key = sha256(realpath(library_path).encode()).hexdigest()
+        return join(cache_directory, "ports", library_key + extension)
+
+    @staticmethod
+    def _read_index(path: Optional[str], index_format: int) -> Optional[Dict[str, Any]]:
+        """
+        Reads a stored index.
+
+        :param path: The path of the index (None if it is not stored).
+        :param index_format: The format which the index must have.
+        :return: The index, or None if it is missing, or was stored with another format or interpreter.
+        """
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                index: Dict[str, Any] = marshal_loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        # The index is only valid for the same format (and interpreter, as marshal's format can change)
+        if not isinstance(index, dict) or index.get("format") != index_format or index.get("python") != version:
+            return None
+        return index
+
+    @staticmethod
+    def _write_index(path: Optional[str], index_format: int, index: Dict[str, Any]) -> None:
+        """
+        Stores an index (skipped if its directory is read-only).
+
+        :param path: The path of the index (None if it is not stored).
+        :param index_format: The format of the index.
+        :param index: The index to store.
+        """
+        if path is None:
+            return
+        index = dict(index, format=index_format, python=version)
+        temp_path: Optional[str] = None
+        try:
+            makedirs(dirname(path), exist_ok=True)
+            # Write to a temporary file, then rename it over the index (so readers never see half an index)
+            file_descriptor, temp_path = mkstemp(dir=dirname(path), prefix=".tmp-")
+            try:
+                write(file_descriptor, marshal_dumps(index))
+            finally:
+                close(file_descriptor)
+            replace(temp_path, path)
+        except OSError:
+            # The index will be compiled again next time
+            if temp_path is not None and isfile(temp_path):
+                remove(temp_path)
+
+    @staticmethod
+    def _get_stamp(path: str) -> Optional[List[int]]:
+        """
+        :param path: The path of a file.
+        :return: The modification time and size of the file (None if it does not exist).
+        """
+        try:
+            stats = stat(path)
+        except OSError:
+            return None
+        return [stats.st_mtime_ns, stats.st_size]
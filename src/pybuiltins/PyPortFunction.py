@@ -4,7 +4,7 @@ Port a native function or object to Python.
 from ast import Pass
 from typing import Any
 
-from src.pybuiltins.PyPortFunctionSignature import PyPortFunctionSignature
+from src.pybuiltins.PyPortSignature import PyPortSignature
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyFunctionDef import PyFunctionDef
 from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
@@ -15,14 +15,16 @@ class PyPortFunction(PyExpression):
     Port a native function or object to Python.
     """
 
+    __slots__ = ("__func", "__signature")
+
     # __obj has a type of PyFunctionDef, but you
     # can't specify it here without a circular import
     # error so we will (overwrite) type hint in the constructor instead.
     __func: PyFunctionDef
-    # Native code as a string
-    __code: str
+    # The signature, which holds the native code
+    __signature: PyPortSignature
 
-    def __init__(self, func_sig: PyPortFunctionSignature, parent: GENERIC_PYEXPR_TYPE):
+    def __init__(self, func_sig: PyPortSignature, parent: GENERIC_PYEXPR_TYPE):
         """
         Initializes the ported function using a loaded signature.
 
@@ -34,15 +36,15 @@ class PyPortFunction(PyExpression):
         super().__init__(Pass(), parent)
 
         # Convert the function to a PyFunctionDef that can be represented locally later (as function header)
-        self.__func: PyFunctionDef = PyFunctionDef.from_single_object(func_sig.func, self)
+        self.__func: PyFunctionDef = PyFunctionDef.from_source(func_sig.get_interface_source(), self)
 
         # Set our expression to the FunctionDef AST expression
         # We do this now instead of during the super since we must
-        # call super() before running the from_single_object method.
+        # call super() before running the from_source method.
         self.set_expression(self.__func.get_expression())
 
-        # Store the native code segment
-        self.__code = func_sig.code
+        # Store the signature (for its native code)
+        self.__signature = func_sig
 
         # If there are any dependencies
         if func_sig.dependencies is not None:
@@ -71,7 +73,7 @@ class PyPortFunction(PyExpression):
         """
         Transpile the ported function to an entirely native function.
         """
-        return f"{self.__func.transpile_header()} {{\n{self.__code}\n}}"
+        return self.__signature.get_native_definition(self.__func.transpile_header())
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, PyPortFunction) and hash(self) == hash(other)
@@ -1,6 +1,7 @@
 """
 Port a native function or object to Python.
 """
+from inspect import getsource
 from typing import Optional, Iterable
 
 from src.pybuiltins.PyPortSignature import PyPortSignature
@@ -26,3 +27,16 @@ class PyPortFunctionSignature(PyPortSignature):
         # Set to fields
         self.func: AnyFunction = function
         self.code = code
+
+    def get_interface_source(self) -> str:
+        """
+        :return: The source code of the Python stub function.
+        """
+        return getsource(self.func)
+
+    def get_native_definition(self, header: str) -> str:
+        """
+        :param header: The transpiled header of the stub function.
+        :return: The native function, made of the header and the native body code.
+        """
+        return f"{header} {{\n{self.code}\n}}"
@@ -0,0 +1,42 @@
+"""
+Port a native function, which is written in a header file, to Python.
+"""
+from typing import Optional, Iterable
+
+from src.pybuiltins.PyPortSignature import PyPortSignature
+
+
+class PyPortHeaderSignature(PyPortSignature):
+    """
+    Port a native function, which is written in a header file, to Python.
+    Loaded from declarative port libraries (see PortLibrary), which have no Python code to import.
+    """
+
+    # The Python stub of the function (a single 'def' statement)
+    interface: str
+    # The whole native definition of the function, as written in its header file
+    code: str
+
+    def __init__(self,
+                 interface: str,
+                 code: str,
+                 dependencies: Optional[Iterable[str]] = None,
+                 linked_ports: Optional[Iterable[str]] = None) -> None:
+        # Call to super class constructor
+        super().__init__(dependencies, linked_ports)
+        # Set to fields
+        self.interface = interface
+        self.code = code
+
+    def get_interface_source(self) -> str:
+        """
+        :return: The Python stub of the function.
+        """
+        return self.interface
+
+    def get_native_definition(self, header: str) -> str:
+        """
+        :param header: The transpiled header of the stub function (the header file already holds its own).
+        :return: The native function, as written in its header file.
+        """
+        return self.code
@@ -2,31 +2,55 @@
 PyPortManager class.
 Stores ported objects.
 """
-from importlib import import_module
-from typing import Dict
+from os.path import dirname, join
+from typing import Dict, Iterable, List, Optional
 
-from src.compiler.Args import Args
+from src.pybuiltins.PortLibrary import PortLibrary
+from src.pybuiltins.PortModule import PortModule
+from src.pybuiltins.PortSource import PortSource
 from src.pybuiltins.PyPortFunction import PyPortFunction
-from src.pybuiltins.PyPortFunctionSignature import PyPortFunctionSignature
-from src.pybuiltins.module.builtins_port import ported_objs
-from src.structures.Errors import InvalidArgumentError, ObjectNotDefinedError
-from src.structures.Singleton import Singleton
+from src.pybuiltins.PyPortSignature import PyPortSignature
+from src.structures.Errors import ObjectNotDefinedError
 from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
 
 
-class PyPortManager(metaclass=Singleton):
+class PyPortManager:
     """
-    The PyPortManager class is a singleton class
-    responsible for managing ported objects, loading them,
-    and other such operations.
+    The PyPortManager class is responsible for managing
+    ported objects, loading them, and other such operations.
+    Each CompileSession has its own manager.
+
+    Each port is only loaded once per manager (reading its library is
+    expensive), and only built once per module, under the module itself
+    rather than under the call site: the PyPortFunction is shared by
+    every call site of the module, and resolves its names in the module's
+    scope. Modules are never given each other's ports, so a port never
+    keeps the tree of an earlier compilation of the session alive.
+
+    Linked libraries are only indexed by the names of their ports up
+    front, and each port's signature is loaded from its library when it
+    is first called (so a large library is cheap to link when a program
+    only uses a few of its ports). Libraries are never altered, so the
+    managers of different sessions never see each other's ports.
     """
 
-    # Static variable for ported library manager
-    __linked_port_manager: Dict[str, PyPortFunctionSignature]
+    # The directory of the builtin port library
+    BUILTINS_DIRECTORY: str = join(dirname(__file__), "module", "builtins")
+
+    # The library of each port, by name (later libraries override earlier ones)
+    __port_libraries: Dict[str, PortSource]
+    # The ports which were already loaded from their libraries, by name
+    __signatures: Dict[str, PyPortSignature]
 
-    def __init__(self) -> None:
-        # Load the linked libraries (and builtins)
-        self.__load_linked_libraries()
+    def __init__(self, links: Iterable[str] = (), cache_directory: Optional[str] = None) -> None:
+        """
+        :param links: The port libraries to link (directories of declarative libraries, or module names).
+        :param cache_directory: The transpile cache directory, to store the indexes of the libraries in
+                                (None to not store them).
+        """
+        # Index the linked libraries (and builtins)
+        self.__load_linked_libraries(links, cache_directory)
+        self.__signatures = {}
 
     def is_loaded(self, ported_name: str) -> bool:
         """
@@ -35,20 +59,33 @@ class PyPortManager(metaclass=Singleton):
         :param ported_name: The name of the ported object.
         :return: True if it is linked, False if not.
         """
-        return ported_name in self.__linked_port_manager
+        return ported_name in self.__port_libraries
+
+    def describe_port(self, ported_name: str) -> str:
+        """
+        Describes a linked port, without loading it.
+
+        :param ported_name: The name of the ported object (which must be linked).
+        :return: A short description, which changes whenever the port's library does.
+        """
+        # The library that the name resolves to (and its contents) decide the port's native definition
+        return f"port {ported_name} from {self.__port_libraries[ported_name].get_digest()}"
 
     def call_port(self, ported_name: str, parent: GENERIC_PYEXPR_TYPE) -> PyPortFunction:
         """
         Calls a ported object from the manager, instanciates it, and returns it.
 
         :param ported_name: The name of the ported object to call.
-        :param parent: The parent expression to link the returned PyPortFunction to.
-        :return: The created PyPortFunction instance which represents the requested port object.
+        :param parent: The call site (the returned PyPortFunction belongs to its module).
+        :return: The PyPortFunction instance which represents the requested port object.
         """
         # Check if called port is linked
         if self.is_loaded(ported_name):
+            # Let the module know that this port was called
+            parent.get_module().record_port_call(ported_name)
+
             # Get the function signature from the manager
-            function_signature = self.__linked_port_manager[ported_name]
+            function_signature = self.__get_signature(ported_name)
 
             # If this port is linked to any other ports
             if function_signature.linked_ports:
@@ -57,12 +94,14 @@ class PyPortManager(metaclass=Singleton):
                     # Call that port in order to transpile it as well
                     self.call_port(linked_port, parent)
 
-            # Compile the function to a PyPortFunction expression/object
-            native_func: PyPortFunction = PyPortFunction(function_signature, parent)
-            # Inherit dependencies
-            parent.add_dependencies(native_func.get_dependencies())
-            # Add as dependency
-            parent.add_ported_dependency(native_func)
+            # Reuse the port if it was already built for the module of this call site
+            module = parent.get_module()
+            native_func = module.get_port(ported_name)
+            if native_func is None:
+                # Otherwise, compile the function to a PyPortFunction expression/object, under the module
+                # (this also passes its dependencies, and itself as a ported dependency, up to the module)
+                native_func = PyPortFunction(function_signature, module)
+                module.add_port(ported_name, native_func)
 
             # Return the function
             return native_func
@@ -70,27 +109,37 @@ class PyPortManager(metaclass=Singleton):
             # Otherwise, throw an error
             raise ObjectNotDefinedError(ported_name)
 
-    def __load_linked_libraries(self) -> None:
+    def __get_signature(self, ported_name: str) -> PyPortSignature:
+        """
+        Gets the signature of a linked port, loading it from its library the first time.
+
+        :param ported_name: The name of the ported object.
+        :return: The signature of the ported object.
+        """
+        signature = self.__signatures.get(ported_name)
+        if signature is None:
+            signature = self.__port_libraries[ported_name].get_port(ported_name)
+            self.__signatures[ported_name] = signature
+        return signature
+
+    def __load_linked_libraries(self, links: Iterable[str], cache_directory: Optional[str]) -> None:
         """
         Go through all the ported libraries that need to
-        be linked, and load them into our static variable.
+        be linked, and index their ports by name.
+
+        :param links: The port libraries to link (directories of declarative libraries, or module names).
+        :param cache_directory: The transpile cache directory, to store the indexes of the libraries in.
         """
-        # Start by defaulting to builtins
-        self.__linked_port_manager = ported_objs
-        # If any libraries were linked
-        if Args().get_args().links:
-            # Go through each passed parameter
-            for port_library_path in Args().get_args().links.split(";"):
-                # Catch errors (module can be non-existent, objects could be missing from file)
-                try:
-                    # Import the linked library
-                    imported_module = import_module(port_library_path)
-
-                    # Try to get the ported objects
-                    obj_dict: Dict[str, PyPortFunctionSignature] = getattr(imported_module, "ported_objs")
-
-                    # Then add them to the ported object manager
-                    self.__linked_port_manager.update(obj_dict)
-                except (AttributeError, ModuleNotFoundError):
-                    # The library is not valid or does not exist
-                    raise InvalidArgumentError(port_library_path)
+        # Start by defaulting to builtins, then go through each linked library
+        libraries: List[PortSource] = [PortLibrary(self.BUILTINS_DIRECTORY, cache_directory)]
+        for port_library_path in links:
+            # Declarative libraries are directories, and the others are Python modules
+            libraries.append(PortLibrary(port_library_path, cache_directory)
+                             if PortLibrary.is_library(port_library_path)
+                             else PortModule(port_library_path, cache_directory))
+
+        # Only the names of the ports are read now
+        self.__port_libraries = {}
+        for library in libraries:
+            for ported_name in library.get_names():
+                self.__port_libraries[ported_name] = library
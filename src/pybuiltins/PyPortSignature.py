@@ -1,10 +1,11 @@
 """
 Port a native function or object to Python.
 """
+from abc import abstractmethod, ABCMeta
 from typing import Iterable, Optional
 
 
-class PyPortSignature:
+class PyPortSignature(metaclass=ABCMeta):
     """
     Port a native object or object to Python.
     """
@@ -15,6 +16,30 @@ class PyPortSignature:
     def __init__(self,
                  dependencies: Optional[Iterable[str]] = None,
                  linked_ports: Optional[Iterable[str]] = None) -> None:
-        # Set to fields
-        self.dependencies: Optional[Iterable[str]] = dependencies
-        self.linked_ports: Optional[Iterable[str]] = linked_ports
+        # Set to fields (in a stable order, as they decide the order of the output)
+        self.dependencies: Optional[Iterable[str]] = self.__to_ordered(dependencies)
+        self.linked_ports: Optional[Iterable[str]] = self.__to_ordered(linked_ports)
+
+    @staticmethod
+    def __to_ordered(names: Optional[Iterable[str]]) -> Optional[Iterable[str]]:
+        """
+        :param names: Names given to the signature (often as a set).
+        :return: The names in a stable order: sorted if they are unordered, and as given otherwise.
+        """
+        if names is None:
+            return None
+        return tuple(sorted(names)) if isinstance(names, (set, frozenset)) else tuple(names)
+
+    @abstractmethod
+    def get_interface_source(self) -> str:
+        """
+        :return: The Python source code of the ported object's interface
+                (how it looks like to the Python code which uses it).
+        """
+
+    @abstractmethod
+    def get_native_definition(self, header: str) -> str:
+        """
+        :param header: The transpiled header of the interface.
+        :return: The native code which defines the ported object.
+        """
@@ -0,0 +1,7 @@
+#pragma once
+
+#include <cstdlib>
+
+void exit_program(int exit_code = 0) {
+exit(exit_code);
+}
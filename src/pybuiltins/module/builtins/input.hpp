@@ -0,0 +1,9 @@
+#pragma once
+
+#include <iostream>
+#include <utility>
+#include "print.hpp"
+
+std::string input(std::string print_string) {
+print(std::move(print_string));std::string s;std::cin>>s;return s;
+}
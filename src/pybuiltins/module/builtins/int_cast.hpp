@@ -0,0 +1,7 @@
+#pragma once
+
+#include <iostream>
+
+int int_cast(std::string obj) {
+return std::stoi(obj);
+}
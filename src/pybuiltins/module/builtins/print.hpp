@@ -0,0 +1,7 @@
+#pragma once
+
+#include <iostream>
+
+void print(auto print_string) {
+std::cout<<print_string<<std::endl;
+}
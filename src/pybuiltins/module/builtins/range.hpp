@@ -1,3 +1,6 @@
+#pragma once
+
+auto range(int end) {
 class range {
 public:
 	class iterator {
@@ -42,3 +45,5 @@ private:
 	iterator begin_;
 	iterator end_;
 };
+return range(end);
+}
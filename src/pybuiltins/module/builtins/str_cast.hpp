@@ -0,0 +1,7 @@
+#pragma once
+
+#include <iostream>
+
+std::string str_cast(auto obj) {
+return std::to_string(obj);
+}
@@ -1,3 +0,0 @@
-"""
-Python module.
-"""
\ No newline at end of file
@@ -2,13 +2,12 @@
 PyConditional base class.
 Extends other conditional expressions such as if, if/else, while...
 """
-from _ast import AST
-from typing import Optional
+from _ast import If, IfExp, While
+from typing import Iterator, Optional, Union
 
-from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.highlevel.PyBody import PyBody
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE
 
 
 class PyConditional(PyExpression):
@@ -16,16 +15,48 @@ class PyConditional(PyExpression):
     PyConditional base class.
     """
 
+    __slots__ = ("__code", "__condition")
+
     __code: PyExpression
     __condition: PyExpression
 
-    def __init__(self, expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]):
+    def __init__(self, expression: Union[If, IfExp, While], parent: Optional[GENERIC_PYEXPR_TYPE]):
         super().__init__(expression, parent)
         # Copy each PyExpression to the body
-        code_instance = Util.get_attr(expression, 'body')
+        code_instance = expression.body
         self.__code = PyBody(code_instance, self) if isinstance(code_instance, list) else self.from_ast(code_instance)
         # Get condition
-        self.__condition = self.from_ast(Util.get_attr(expression, 'test'))
+        self.__condition = self.from_ast(expression.test)
+
+    def get_condition(self) -> PyExpression:
+        """
+        :return: The condition.
+        """
+        return self.__condition
+
+    def get_code(self) -> PyExpression:
+        """
+        :return: The body (or the value, for conditional expressions).
+        """
+        return self.__code
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the condition and the body.
+        """
+        yield self.__condition
+        yield self.__code
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the condition or the body.
+        """
+        if self.__condition is old:
+            self.__condition = self._adopt(new)
+        elif self.__code is old:
+            self.__code = self._adopt(new)
+        else:
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
@@ -37,6 +68,17 @@ class PyConditional(PyExpression):
         """
         return f"({self.transpile_condition()}) {self.transpile_body()}"
 
+    def _emit_conditional(self, sink: CodeSink) -> None:
+        """
+        Writes the condition and the body to a sink (like _transpile, for statements which implement _emit).
+
+        :param sink: The sink to write the code to.
+        """
+        sink.write("(")
+        self.__condition.emit(sink)
+        sink.write(") ")
+        self.__code.emit(sink)
+
     def transpile_condition(self) -> str:
         """
         :return: The string representation of the conditional's condition.
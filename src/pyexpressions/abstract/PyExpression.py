@@ -4,20 +4,24 @@ Used in extending for other pyexpressions.
 """
 from _ast import AST
 from abc import abstractmethod, ABCMeta
-from typing import Set, Iterable, Optional, TYPE_CHECKING, cast
+from typing import Any, Iterable, Iterator, List, Optional, Set, TYPE_CHECKING, cast, Callable
 
+from src.compiler.CodeBuffer import CodeBuffer
 from src.compiler.Util import Util
+from src.compiler.logging.Logger import Logger
 from src.scopes.Scope import Scope
-from src.structures.Errors import UnsupportedFeatureException
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.Errors import ChildNotFoundError
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE
 
 # If PyExpression is referenced in an import you
 # need for type hinting, then add the import here.
 # This will ONLY import it when performing type checking,
 # therefore no ImportError will occur.
 if TYPE_CHECKING:
+    from src.compiler.CompileSession import CompileSession
     from src.pybuiltins.PyPortFunction import PyPortFunction
-    from src.compiler.logging.Logger import Logger
+    from src.pyexpressions.concrete.PyModule import PyModule
+    from src.pyexpressions.highlevel.PyScoped import PyScoped
 
 
 class PyExpression(metaclass=ABCMeta):
@@ -25,33 +29,34 @@ class PyExpression(metaclass=ABCMeta):
     PyExpression base class.
     """
 
+    # Nodes are created in large amounts, so they are kept compact (no instance __dict__).
+    # Every subclass must declare its own fields in __slots__ as well.
+    __slots__ = ("__expression", "__parent", "__scope_owner", "__logger")
+
     __expression: AST
-    __depends: Set[str]
-    __ported_depends: Set["PyPortFunction"]
     __parent: Optional[GENERIC_PYEXPR_TYPE]
+    # The nearest parent which holds a scope (None for the module), so that finding
+    # the scope of a deeply nested node does not walk up through all of its parents
+    __scope_owner: Optional["PyScoped"]
+    __logger: Logger
 
     @abstractmethod
     def __init__(self, expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]) -> None:
         """
         Constructor for the expression.
         """
-        # Create dependency sets
-        self.__depends = set()
         # Assign parent node
         self.__parent = parent
-        # Local import to avoid error
-        self.__ported_depends = set()
+        self.__scope_owner = None if parent is None else parent._get_scope_owner_of_children()
         # Set base expression (might be needed later for throwing errors, will be useful for getting line #)
         self.__expression = expression
         # Create logger for this node
-        # Import dependencies locally to avoid import errors
-        from src.compiler.logging.Logger import Logger
-        from src.compiler.Compiler import Compiler
-        self.__logger = Logger(self)
+        # The parent passes down its logger (and indentation), so
+        # when debugging is off, this is only a method call.
+        self.__logger = Logger.for_root(self) if parent is None else parent.get_logger().create_child(self)
         # Print logging statement for creation of node
-        self.__logger.log_tree_up(
-            f"Creating expression <{Util.get_name(expression)}>: {Util.escape(Compiler.unparse(expression))} "
-        )
+        # (the message is only built if text logging is enabled)
+        self.__logger.log_tree_up(self.__describe_creation)
 
     @abstractmethod
     def _transpile(self) -> str:
@@ -72,98 +77,208 @@ class PyExpression(metaclass=ABCMeta):
         implement the transpilation process, implement the
         self._transpile method, which is wrapped by this method.
         """
+        # Profile the transpilation, if the compiler is profiled
+        profiler = self.__logger.get_profiler()
+        if profiler is not None:
+            profiler.start("transpile", self.__class__, self.__expression, self)
         # Execute the transpilation process by executing
         # the *IMPLEMENTATION* of the transpiler function
         transpiled_code: str = self._transpile()
+        if profiler is not None:
+            profiler.stop()
         # Currently, the only wrapping that we will do is logging.
         # However, this still allows for future useful extensions
         # such as beautifying the code, for example.
-        self.__logger.log_tree_down(
-            f"Compiled <{Util.get_name(self.get_expression())}> expression to: {Util.escape(transpiled_code)}"
-        )
+        self.__logger.log_tree_down(self._describe_transpilation, transpiled_code)
         # Return transpilation
         return transpiled_code
 
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Writes the transpiled code of this expression to a sink, in fragments.
+
+        This is the *wrapped* method. Nodes which hold statements (bodies,
+        definitions, the module...) implement it to stream the code of their
+        children, and implement _transpile with _transpile_emitted. Any other
+        node simply writes its transpiled string.
+
+        :param sink: The sink to write the code to.
+        """
+        sink.write(self._transpile())
+
+    def emit(self, sink: CodeSink) -> None:
+        """
+        Writes the transpiled code of this expression to a sink, in fragments.
+
+        This is the *wrapper* method (see transpile). The code is the same as
+        transpile's, without building the code of every node as a string.
+
+        :param sink: The sink to write the code to.
+        """
+        # Logging prints the code of each node, so the nodes must build it as a string anyway
+        if self.__logger.is_enabled():
+            sink.write(self.transpile())
+        else:
+            self._emit(sink)
+
+    def children(self) -> Iterator["PyExpression"]:
+        """
+        Iterates over the nodes nested directly in this expression.
+
+        Each node which holds other nodes implements this method (calling
+        the method of its base class first, if the base class holds nodes
+        too), alongside replace_child, so that passes over the tree (see
+        PassManager) do not need to know the fields of every node.
+
+        :return: The nested nodes, in the order in which their code is written.
+        """
+        return iter(())
+
+    def replace_child(self, old: "PyExpression", new: "PyExpression") -> None:
+        """
+        Replaces a node nested directly in this expression (the new node is moved under this expression).
+
+        Each node which implements children implements this method as
+        well, and calls the method of its base class if the old node is
+        not one of its own fields.
+
+        :param old: The nested node to replace (compared by identity).
+        :param new: The node to put in its place.
+        """
+        raise ChildNotFoundError(Util.get_name(old), Util.get_name(self))
+
+    def _adopt(self, child: "PyExpression") -> "PyExpression":
+        """
+        Moves a node under this expression (used by replace_child).
+
+        :param child: The node to move.
+        :return: The node.
+        """
+        child.__parent = self
+        child.__scope_owner = self._get_scope_owner_of_children()
+        return child
+
+    def _replace_in(self, nodes: List[Any], old: "PyExpression", new: "PyExpression") -> bool:
+        """
+        Replaces a node in a list of nested nodes (used by replace_child).
+
+        :param nodes: The list of nodes.
+        :param old: The node to replace (compared by identity, as some nodes compare equal by name).
+        :param new: The node to put in its place (moved under this expression).
+        :return: True if the node was in the list.
+        """
+        for index, node in enumerate(nodes):
+            if node is old:
+                nodes[index] = self._adopt(new)
+                return True
+        return False
+
+    def walk(self) -> Iterator["PyExpression"]:
+        """
+        Iterates over this expression and all the nodes nested in it, each before its nested nodes
+        (with an explicit stack, as operations can be nested tens of thousands of levels deep).
+        A module which is imported multiple times is only walked once.
+
+        :return: The nodes of the tree, in the order in which their code is written.
+        """
+        # Only modules have no parent, and the same module can be imported by many import statements
+        walked_modules: Set[int] = set()
+        stack: List[PyExpression] = [self]
+        while stack:
+            node = stack.pop()
+            if node.__parent is None:
+                if id(node) in walked_modules:
+                    continue
+                walked_modules.add(id(node))
+            yield node
+            stack.extend(reversed(list(node.children())))
+
+    def _transpile_emitted(self) -> str:
+        """
+        Transpiles this expression to a string, by emitting it to a buffer.
+        Used as the _transpile method of the nodes which implement _emit.
+
+        :return: The transpiled code.
+        """
+        buffer = CodeBuffer()
+        self._emit(buffer)
+        return buffer.getvalue()
+
+    def __describe_creation(self) -> str:
+        """
+        :return: The log message for the creation of this node.
+        """
+        # Import locally to avoid circular import errors
+        from src.compiler.Compiler import Compiler
+        expression = self.get_expression()
+        return f"Creating expression <{Util.get_name(expression)}>: {Util.escape(Compiler.unparse(expression))} "
+
+    def _describe_transpilation(self, transpiled_code: str) -> str:
+        """
+        :param transpiled_code: The code that this node was transpiled to.
+        :return: The log message for the transpilation of this node.
+        """
+        return f"Compiled <{Util.get_name(self.get_expression())}> expression to: {Util.escape(transpiled_code)}"
+
     def get_nearest_scope(self) -> Scope:
         """
         Returns the nearest Scope instance to this instance.
         """
-        from src.pyexpressions.highlevel.PyScoped import PyScoped
-
-        # Assign our parent to a temporary variable for iterating
-        temp_parent = self.get_parent()
-
-        # Traverse upwards (We could put the condition here,
-        # although it causes type hinting bugs which would
-        # lead to a lot of unnecessary type casting).
-        while True:
-            # If we hit a function or module
-            if isinstance(temp_parent, PyScoped):
-                # Get the scope
-                return temp_parent.get_scope()
-            # Otherwise,
-            else:
-                # Type cast to bypass type checking bug
-                # (Type[MY_CLASS] means MY_CLASS.__class__ and any class that inherits MY_CLASS)
-                temp_parent = cast(PyExpression, temp_parent).get_parent()
+        # The nearest function, class or module (found once, when this node was created)
+        return cast("PyScoped", self.__scope_owner).get_scope()
 
-    def add_dependencies(self, dependencies: Iterable[str]) -> None:
+    def _get_scope_owner_of_children(self) -> Optional["PyScoped"]:
         """
-        Adds multiple dependencies to the dependency list.
+        :return: The nearest node which holds a scope, for the nodes nested in this one.
+        """
+        return self.__scope_owner
 
-        :param dependencies: A list of native dependencies that this object relies on.
+    def get_module(self) -> "PyModule":
         """
-        # If we are on the outer scope
-        if self.is_exterior_scope():
-            # Then add the dependencies
-            self.__depends.update(dependencies)
-        # Otherwise,
-        else:
-            # Recurse upwards (up the parent node, towards the outer scope)
-            cast(PyExpression, self.get_parent()).add_dependencies(dependencies)
+        :return: The module (outer-most scope) which holds this expression.
+        """
+        # Traverse upwards through the scopes (functions and classes), until we hit the node without a parent
+        temp_expr: PyExpression = self
+        while temp_expr.__scope_owner is not None:
+            temp_expr = temp_expr.__scope_owner
+        # Only modules are built without a parent
+        return cast("PyModule", temp_expr)
+
+    def get_session(self) -> "CompileSession":
+        """
+        :return: The session of the compilation which this expression belongs to.
+        """
+        return self.get_module().get_session()
 
-    def get_dependencies(self) -> Set[str]:
+    def add_dependencies(self, dependencies: Iterable[str]) -> None:
         """
-        Returns the list of dependencies that this expression relies on.
+        Adds multiple dependencies to the dependency list.
+        Only the module (the outer-most scope) stores the dependencies.
+
+        :param dependencies: A list of native dependencies that this object relies on.
         """
-        return self.__depends
+        # Pass them to the outer scope
+        self.get_module().add_dependencies(dependencies)
 
     def add_ported_dependency(self, ported_dependency: "PyPortFunction") -> None:
         """
         Adds a single ported (reimplemented in native language) dependency to the list.
+        Only the module (the outer-most scope) stores the dependencies.
 
         :param ported_dependency: The ported dependency to add.
         """
-        # If we are on the outer scope
-        if self.is_exterior_scope():
-            # Then add the dependencies
-            self.__ported_depends.add(ported_dependency)
-        # Otherwise,
-        else:
-            # Recurse upwards (up the parent node, towards the outer scope)
-            cast(PyExpression, self.get_parent()).add_ported_dependency(ported_dependency)
+        # Pass it to the outer scope
+        self.get_module().add_ported_dependency(ported_dependency)
 
     def add_ported_dependencies(self, ported_dependencies: Iterable["PyPortFunction"]) -> None:
         """
         Adds multiple ported (reimplemented in native language) dependencies to the dependency list.
+        Only the module (the outer-most scope) stores the dependencies.
 
         :param ported_dependencies: A list of ported dependencies that this object relies on.
         """
-        # If we are on the outer scope
-        if self.is_exterior_scope():
-            # Then add the dependencies
-            self.__ported_depends.update(ported_dependencies)
-        # Otherwise,
-        else:
-            # Case to PyExpression (the 'if' condition has just guaranteed that it is not None)
-            # Recurse upwards (up the parent node, towards the outer scope)
-            cast(PyExpression, self.get_parent()).add_ported_dependencies(ported_dependencies)
-
-    def get_ported_dependencies(self) -> Set["PyPortFunction"]:
-        """
-        Returns the list of ported dependencies that this expression relies on.
-        """
-        return self.__ported_depends
+        # Pass them to the outer scope
+        self.get_module().add_ported_dependencies(ported_dependencies)
 
     def get_expression(self) -> AST:
         """
@@ -177,7 +292,7 @@ class PyExpression(metaclass=ABCMeta):
         """
         return self.__parent
 
-    def get_logger(self) -> "Logger":
+    def get_logger(self) -> Logger:
         """
         :return: Returns this expression's Logger instance.
         """
@@ -221,7 +336,7 @@ class PyExpression(metaclass=ABCMeta):
         :return: A PyExpression object of the matching type.
         """
         # Convert to PyExpression and return
-        return PyExpression.from_ast_statically(expression, self)
+        return PyExpression.__build(expression, self)
 
     @staticmethod
     def from_ast_statically(expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]) -> "PyExpression":
@@ -232,16 +347,32 @@ class PyExpression(metaclass=ABCMeta):
         :param parent: The parent expression which uses this node.
         :return: A PyExpression object of the matching type.
         """
-        # Local import to avoid circular import errors
-        from src.compiler.Constants import AST_EXPR_TO_PYEXPR
+        # Convert to PyExpression and return
+        return PyExpression.__build(expression, parent)
 
-        # Get the expression type
-        expr_type = type(expression)
+    @staticmethod
+    def set_tree_builder(builder: Callable[[AST, Optional[GENERIC_PYEXPR_TYPE]], "PyExpression"]) -> None:
+        """
+        Sets the function which converts AST expressions to PyExpression objects.
+        This is called by the TreeBuilder once its dispatch table is prepared.
 
-        # If the expression is valid
-        if expr_type in AST_EXPR_TO_PYEXPR:
-            # Convert to PyExpression and return
-            return AST_EXPR_TO_PYEXPR[expr_type](expression, parent)
-        # Otherwise, it is probably a feature we do not support
-        else:
-            raise UnsupportedFeatureException(expression)
+        :param builder: The function which converts an AST expression (and its parent) to a PyExpression.
+        """
+        PyExpression.__build = staticmethod(builder)
+
+    @staticmethod
+    def __load_tree_builder(expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]) -> "PyExpression":
+        """
+        Converts an AST expression to a PyExpression object,
+        before the TreeBuilder was imported (importing it replaces this method).
+
+        :param expression: The expression to convert.
+        :param parent: The parent expression which uses this node.
+        :return: A PyExpression object of the matching type.
+        """
+        # Local import to avoid circular import errors
+        from src.compiler.TreeBuilder import TreeBuilder
+        return TreeBuilder.build(expression, parent)
+
+    # The function which converts AST expressions to PyExpression objects
+    __build = __load_tree_builder
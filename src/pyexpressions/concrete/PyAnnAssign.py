@@ -2,9 +2,8 @@
 Assign an annotation (and possibly a value) to a variable.
 """
 from _ast import AnnAssign, Name
-from typing import Optional
+from typing import Iterator, Optional, cast
 
-from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyName import PyName
 from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
@@ -19,6 +18,8 @@ class PyAnnAssign(PyIdentifiable):
     Expression for assigning a variable.
     """
 
+    __slots__ = ("__type", "__value")
+
     __type: PyName
     __value: Optional[PyExpression]
 
@@ -26,10 +27,10 @@ class PyAnnAssign(PyIdentifiable):
         super().__init__(expression, parent)
 
         # Store variable
-        self.set_id(Util.get_attr(expression, "target.id"))
+        self.set_id(cast(Name, expression.target).id)
 
         # Get type hint
-        type_hint: Optional[Name] = Util.get_attr(expression, "annotation")
+        type_hint: Optional[Name] = cast(Optional[Name], expression.annotation)
         # Make sure type hint was passed
         if type_hint is not None:
             # Save it
@@ -42,7 +43,7 @@ class PyAnnAssign(PyIdentifiable):
         # (Then the value of expression.value will not be None)
         if expression.value:
             # Convert and store
-            self.__value = self.from_ast(Util.get_attr(expression, "value"))
+            self.__value = self.from_ast(expression.value)
         else:
             # Otherwise, leave as None
             self.__value = None
@@ -52,6 +53,37 @@ class PyAnnAssign(PyIdentifiable):
         # Add this variable to the nearest scope
         self.get_nearest_scope().declare_object(var_scope_sig)
 
+    def get_type(self) -> PyName:
+        """
+        :return: The type of the variable, as a PyName instance.
+        """
+        return self.__type
+
+    def get_value(self) -> Optional[PyExpression]:
+        """
+        :return: The assigned value (None if the variable is only declared).
+        """
+        return self.__value
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the type and the value of the assignment.
+        """
+        yield self.__type
+        if self.__value is not None:
+            yield self.__value
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the type or the value of the assignment.
+        """
+        if self.__type is old:
+            self.__type = self._adopt(new)
+        elif self.__value is old:
+            self.__value = self._adopt(new)
+        else:
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpile the operation to a string.
@@ -2,9 +2,8 @@
 Function argument name declaration.
 """
 from _ast import arg, Name
-from typing import Optional, cast
+from typing import Iterator, Optional, cast
 
-from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyName import PyName
 from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
@@ -17,6 +16,8 @@ class PyArg(PyIdentifiable):
     Function argument name declaration.
     """
 
+    __slots__ = ("__arg_type", "__self_arg")
+
     __arg_type: PyName
     __self_arg: bool
 
@@ -27,7 +28,7 @@ class PyArg(PyIdentifiable):
         self.set_id(expression.arg)
 
         # Arg type annotation
-        type_hint: Optional[Name] = Util.get_attr(expression, 'annotation')
+        type_hint: Optional[Name] = cast(Optional[Name], expression.annotation)
 
         # If the argument is 'self' (constructor parameter)
         if self.get_id() == "self":
@@ -67,6 +68,21 @@ class PyArg(PyIdentifiable):
         """
         return self.__arg_type
 
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the type of the argument.
+        """
+        yield self.__arg_type
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the type of the argument.
+        """
+        if self.__arg_type is old:
+            self.__arg_type = self._adopt(new)
+        else:
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpiles the constant to a string.
@@ -1,9 +1,9 @@
 """
 Assign a value to a variable.
 """
-from _ast import Assign
+from _ast import Assign, Name
+from typing import Iterator, cast
 
-from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
 from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
@@ -14,19 +14,42 @@ class PyAssign(PyIdentifiable):
     Expression for assigning a variable.
     """
 
+    __slots__ = ("__value",)
+
     __value: PyExpression
 
     def __init__(self, expression: Assign, parent: GENERIC_PYEXPR_TYPE):
         super().__init__(expression, parent)
         # Get the target variable(s) (could be Tuple of variables, but we don't support that currently)
         # Get the first variable, then get the stored ID
-        target_name: str = Util.get_attr(Util.get_attr(expression, "targets")[0], "id")
+        target_name: str = cast(Name, expression.targets[0]).id
 
         # Make sure the variable exists
         self.set_id(self.get_nearest_scope().get_object_if_exists(target_name))
 
         # Get the set value, convert it and store
-        self.__value = self.from_ast(Util.get_attr(expression, "value"))
+        self.__value = self.from_ast(expression.value)
+
+    def get_value(self) -> PyExpression:
+        """
+        :return: The assigned value.
+        """
+        return self.__value
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the assigned value.
+        """
+        yield self.__value
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the assigned value.
+        """
+        if self.__value is old:
+            self.__value = self._adopt(new)
+        else:
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
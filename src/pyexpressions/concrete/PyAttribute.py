@@ -2,8 +2,9 @@
 Attribute statement (object inside another object, usually classes).
 """
 from _ast import Attribute
+from typing import Iterator
 
-from src.compiler.Util import Util
+from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
 from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
 
@@ -13,6 +14,8 @@ class PyAttribute(PyIdentifiable):
     Attribute statement (object inside another object, usually classes).
     """
 
+    __slots__ = ("__parent_object",)
+
     __parent_object: PyIdentifiable
 
     def __init__(self, expression: Attribute, parent: GENERIC_PYEXPR_TYPE):
@@ -22,7 +25,28 @@ class PyAttribute(PyIdentifiable):
         self.set_id(expression.attr)
 
         # Set the attribute's parent object
-        self.__parent_object = self.from_ast(Util.get_attr(expression, "value"))
+        self.__parent_object = self.from_ast(expression.value)
+
+    def get_object(self) -> PyIdentifiable:
+        """
+        :return: The object which holds the attribute.
+        """
+        return self.__parent_object
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the object which holds the attribute.
+        """
+        yield self.__parent_object
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the object which holds the attribute.
+        """
+        if self.__parent_object is old:
+            self.__parent_object = self._adopt(new)
+        else:
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
@@ -2,8 +2,8 @@
 Assign via augmented assignment to a variable.
 """
 from _ast import AugAssign
+from typing import Iterator
 
-from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyBinOp import PyBinOp
 from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
@@ -14,6 +14,8 @@ class PyAugAssign(PyExpression):
     Expression for assigning a variable via augmented assignment.
     """
 
+    __slots__ = ("__op_type", "__value", "__target")
+
     __op_type: str
     __value: PyExpression
     __target: PyExpression
@@ -23,9 +25,45 @@ class PyAugAssign(PyExpression):
         # Get the assignment target
         self.__target = self.from_ast(expression.target)
         # Convert and store operation
-        self.__op_type = PyBinOp.bin_op_to_str(Util.get_attr(expression, "op"))
+        self.__op_type = PyBinOp.bin_op_to_str(expression.op)
         # Convert and store the value that is being operated with
-        self.__value = self.from_ast(Util.get_attr(expression, "value"))
+        self.__value = self.from_ast(expression.value)
+
+    def get_target(self) -> PyExpression:
+        """
+        :return: The assigned variable (or attribute).
+        """
+        return self.__target
+
+    def get_op_type(self) -> str:
+        """
+        :return: The operator, as a C++ string.
+        """
+        return self.__op_type
+
+    def get_value(self) -> PyExpression:
+        """
+        :return: The value that the target is operated with.
+        """
+        return self.__value
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the target and the value of the assignment.
+        """
+        yield self.__target
+        yield self.__value
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the target or the value of the assignment.
+        """
+        if self.__target is old:
+            self.__target = self._adopt(new)
+        elif self.__value is old:
+            self.__value = self._adopt(new)
+        else:
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
@@ -3,34 +3,96 @@ Binary operation.
 """
 from _ast import BinOp
 from _ast import operator
+from typing import Iterator
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.highlevel.PyIterative import PyIterative
 from src.structures.Errors import UnsupportedFeatureException
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE, NodeConstruction
 
 
-class PyBinOp(PyExpression):
+class PyBinOp(PyIterative):
     """
     Expression for binary operation.
     """
 
+    __slots__ = ("__left", "__right", "__op_type")
+
     __left: PyExpression
     __right: PyExpression
     __op_type: str
 
     def __init__(self, expression: BinOp, parent: GENERIC_PYEXPR_TYPE):
+        self._construct_nested(expression, parent)
+
+    def _construct(self, expression: BinOp, parent: GENERIC_PYEXPR_TYPE) -> NodeConstruction:
+        """
+        Build the operation (the sides are built by the TreeBuilder).
+        """
         super().__init__(expression, parent)
         # Convert op to string
         self.__op_type = self.bin_op_to_str(expression.op)
         # Store sides
-        self.__left = self.from_ast(expression.left)
-        self.__right = self.from_ast(expression.right)
+        self.__left = yield expression.left
+        self.__right = yield expression.right
+
+    def get_op_type(self) -> str:
+        """
+        :return: The operator, as a C++ string.
+        """
+        return self.__op_type
+
+    def get_left(self) -> PyExpression:
+        """
+        :return: The left side of the operation.
+        """
+        return self.__left
+
+    def get_right(self) -> PyExpression:
+        """
+        :return: The right side of the operation.
+        """
+        return self.__right
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the sides of the operation.
+        """
+        yield self.__left
+        yield self.__right
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace a side of the operation.
+        """
+        if self.__left is old:
+            self.__left = self._adopt(new)
+        elif self.__right is old:
+            self.__right = self._adopt(new)
+        else:
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
         Transpile the operation to a string.
         """
-        return f"({self.__left.transpile()} {self.__op_type} {self.__right.transpile()})"
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the operation to a sink.
+        """
+        self._emit_nested(sink)
+
+    def _emit_parts(self, sink: CodeSink) -> Iterator[PyExpression]:
+        """
+        Write the operation to a sink (the sides are written in place of the yielded nodes).
+        """
+        sink.write("(")
+        yield self.__left
+        sink.write(f" {self.__op_type} ")
+        yield self.__right
+        sink.write(")")
 
     @staticmethod
     def bin_op_to_str(op: operator) -> str:
@@ -2,36 +2,89 @@
 Boolean operation.
 """
 from _ast import BoolOp, boolop
-from typing import Union, List, cast
+from typing import Iterator, Union, List, cast
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.highlevel.PyIterative import PyIterative
 from src.pyexpressions.concrete.PyCompare import PyCompare
 from src.structures.Errors import UnsupportedFeatureException
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE, NodeConstruction
 
 
-class PyBoolOp(PyExpression):
+class PyBoolOp(PyIterative):
     """
     Expression for boolean operation.
     (Conditional)
     """
 
+    __slots__ = ("__conditions", "__op_type")
+
     __conditions: List[Union["PyBoolOp", PyCompare]]
     __op_type: str
 
     def __init__(self, expression: BoolOp, parent: GENERIC_PYEXPR_TYPE):
+        self._construct_nested(expression, parent)
+
+    def _construct(self, expression: BoolOp, parent: GENERIC_PYEXPR_TYPE) -> NodeConstruction:
+        """
+        Build the operation (the conditions are built by the TreeBuilder).
+        """
         super().__init__(expression, parent)
         # Convert op to string
         self.__op_type = f" {self.bool_op_to_str(expression.op)} "
         # Store conditions
-        self.__conditions = [cast(Union[PyBoolOp, PyCompare], self.from_ast(condition))
-                             for condition in expression.values]
+        self.__conditions = []
+        for condition in expression.values:
+            self.__conditions.append(cast(Union[PyBoolOp, PyCompare], (yield condition)))
+
+    def get_op_type(self) -> str:
+        """
+        :return: The operator, as a C++ string.
+        """
+        return self.__op_type.strip()
+
+    def get_conditions(self) -> List[Union["PyBoolOp", PyCompare]]:
+        """
+        :return: The conditions of the operation, in order.
+        """
+        return self.__conditions
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the conditions of the operation.
+        """
+        yield from self.__conditions
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace a condition of the operation.
+        """
+        if not self._replace_in(self.__conditions, old, new):
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
         Transpile the operation to a string.
         """
-        return f"({self.__op_type.join([condition.transpile() for condition in self.__conditions])})"
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the operation to a sink.
+        """
+        self._emit_nested(sink)
+
+    def _emit_parts(self, sink: CodeSink) -> Iterator[PyExpression]:
+        """
+        Write the operation to a sink (the conditions are written in place of the yielded nodes).
+        """
+        sink.write("(")
+        separator = ""
+        for condition in self.__conditions:
+            sink.write(separator)
+            yield condition
+            separator = self.__op_type
+        sink.write(")")
 
     @staticmethod
     def bool_op_to_str(operator: boolop) -> str:
@@ -12,6 +12,8 @@ class PyBreak(PyExpression):
     Break statement.
     """
 
+    __slots__ = ()
+
     def __init__(self, expression: Break, parent: GENERIC_PYEXPR_TYPE):
         super().__init__(expression, parent)
 
@@ -0,0 +1,115 @@
+"""
+Previously transpiled function or class definition.
+"""
+from _ast import FunctionDef, ClassDef
+from typing import List, Optional, Tuple, Union
+
+from src.compiler.cache.DefinitionStore import DefinitionEntry
+from src.pyexpressions.concrete.PyClassDef import PyClassDef
+from src.pyexpressions.concrete.PyFunctionDef import PyFunctionDef
+from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
+from src.scopes.Scope import Scope
+from src.scopes.objects.Class import Class
+from src.scopes.objects.Function import Function
+from src.scopes.objects.Type import Type
+from src.scopes.objects.Variable import Variable
+from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+
+
+class PyCachedDefinition(PyIdentifiable):
+    """
+    Top-level function or class definition, which was loaded from
+    the DefinitionStore instead of being parsed.
+
+    Rather than building the tree of the definition, this node repeats
+    what the definition did to its surroundings (declaring itself in the
+    scope and calling the ported objects which it uses), then transpiles
+    to the stored code.
+    """
+
+    __slots__ = ("__code", "__header")
+
+    # The transpiled definition
+    __code: str
+    # The transpiled function header (None for classes)
+    __header: Optional[str]
+
+    def __init__(self, expression: Union[FunctionDef, ClassDef], parent: GENERIC_PYEXPR_TYPE,
+                 entry: DefinitionEntry, replay: bool = True):
+        """
+        :param expression: The AST node of the definition.
+        :param parent: The parent node to this expression.
+        :param entry: The stored definition.
+        :param replay: Whether to repeat the definition's effects (False if the definition was just built).
+        """
+        super().__init__(expression, parent)
+
+        # Store the definition name
+        self.set_id(expression.name)
+        self.__code = entry["code"]
+        self.__header = entry["header"]
+
+        # If the definition was just built, then its effects already happened
+        if not replay:
+            return
+
+        # Declare the definition, just as the definition node would
+        if self.__header is None:
+            # Restore the fields and methods of the class, as its users see them
+            members = Scope(self.get_nearest_scope())
+            for name, kind, type_name in entry["members"]:
+                members.declare_object(Function(name, Type(type_name)) if kind == "function"
+                                       else Variable(name, Type(type_name)))
+            self.get_nearest_scope().declare_object(Class(self.get_id(), members))
+        else:
+            self.get_nearest_scope().declare_object(Function(self.get_id(), Type(entry["return_type"])))
+
+        # Call each port that the definition uses, so they are transpiled as well
+        port_manager = self.get_session().get_port_manager()
+        for ported_name in entry["ports"]:
+            port_manager.call_port(ported_name, self)
+
+    @staticmethod
+    def create_entry(pyexpr: Union[PyFunctionDef, PyClassDef], ports: List[str]) -> DefinitionEntry:
+        """
+        Transpiles a definition, and creates its entry for the DefinitionStore.
+
+        :param pyexpr: The definition to store.
+        :param ports: The names of the ported objects that the definition called.
+        :return: The entry of the definition.
+        """
+        # Get the declared signature of the definition
+        declared = pyexpr.get_nearest_scope().get_object(pyexpr.get_id())
+        return {
+            "code": pyexpr.transpile(),
+            "header": pyexpr.transpile_header() if isinstance(pyexpr, PyFunctionDef) else None,
+            "return_type": declared.return_type.name if isinstance(declared, Function) else None,
+            "members": PyCachedDefinition.__describe_members(declared) if isinstance(declared, Class) else None,
+            "ports": list(dict.fromkeys(ports))
+        }
+
+    @staticmethod
+    def __describe_members(declared: Class) -> List[Tuple[str, str, str]]:
+        """
+        :param declared: The declared class.
+        :return: The name, kind ("function" or "variable") and type of each of the class's members, in order.
+        """
+        members: List[Tuple[str, str, str]] = []
+        for name, member in declared.scope.get_declared_objects().items():
+            if isinstance(member, Function):
+                members.append((name, "function", member.return_type.name))
+            elif isinstance(member, Variable):
+                members.append((name, "variable", member.type.name))
+        return members
+
+    def get_header(self) -> Optional[str]:
+        """
+        :return: The transpiled function header, or None if this is a class.
+        """
+        return self.__header
+
+    def _transpile(self) -> str:
+        """
+        Transpiles the definition to a string.
+        """
+        return self.__code
@@ -2,28 +2,67 @@
 Call a function.
 """
 from _ast import Call
-from typing import List
+from typing import Iterator, List
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.pyexpressions.highlevel.PyIterative import PyIterative
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE, NodeConstruction
 
 
-class PyCall(PyExpression):
+class PyCall(PyIterative):
     """
     Call a function.
     """
 
+    __slots__ = ("__args", "__obj")
+
     __args: List[PyExpression]
     __obj: PyExpression
 
     def __init__(self, expression: Call, parent: GENERIC_PYEXPR_TYPE):
+        self._construct_nested(expression, parent)
+
+    def _construct(self, expression: Call, parent: GENERIC_PYEXPR_TYPE) -> NodeConstruction:
+        """
+        Build the call (the function and the arguments are built by the TreeBuilder).
+        """
         super().__init__(expression, parent)
         # Convert to name
-        self.__obj = self.from_ast(expression.func)
+        self.__obj = yield expression.func
 
         # For each argument
         # Convert to argument object and store
-        self.__args = [self.from_ast(arg) for arg in expression.args]
+        self.__args = []
+        for arg in expression.args:
+            self.__args.append((yield arg))
+
+    def get_function(self) -> PyExpression:
+        """
+        :return: The called function (a name, or an attribute for methods).
+        """
+        return self.__obj
+
+    def get_args(self) -> List[PyExpression]:
+        """
+        :return: The arguments of the call, in order.
+        """
+        return self.__args
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the function and the arguments of the call.
+        """
+        yield self.__obj
+        yield from self.__args
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the function or an argument of the call.
+        """
+        if self.__obj is old:
+            self.__obj = self._adopt(new)
+        elif not self._replace_in(self.__args, old, new):
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
@@ -35,4 +74,23 @@ class PyCall(PyExpression):
         # For each argument, transpile
         # Join the arguments together with commas
         # FUNC_NAME ( ARG1 , ARG2 , ... )
-        return f"{self.__obj.transpile()}({','.join([arg.transpile() for arg in self.__args])})"
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the call to a sink.
+        """
+        self._emit_nested(sink)
+
+    def _emit_parts(self, sink: CodeSink) -> Iterator[PyExpression]:
+        """
+        Write the call to a sink (the function and the arguments are written in place of the yielded nodes).
+        """
+        yield self.__obj
+        sink.write("(")
+        separator = ""
+        for arg in self.__args:
+            sink.write(separator)
+            yield arg
+            separator = ","
+        sink.write(")")
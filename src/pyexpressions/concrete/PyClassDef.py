@@ -2,7 +2,7 @@
 Class defenition.
 """
 from _ast import ClassDef
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
 from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
@@ -12,7 +12,7 @@ from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
 from src.pyexpressions.highlevel.PyScoped import PyScoped
 from src.scopes.objects.Class import Class
 from src.structures.Errors import UnsupportedFeatureException
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE
 
 
 class PyClassDef(PyScoped, PyIdentifiable):
@@ -20,6 +20,10 @@ class PyClassDef(PyScoped, PyIdentifiable):
     Class defenition.
     """
 
+    # The scope slot is declared here, as PyScoped can't hold slots of its own
+    __slots__ = ("_PyScoped__scope", "__constructor", "__private_methods", "__public_methods",
+                 "__private_fields", "__public_fields")
+
     __constructor: Optional[PyFunctionDef]
     __private_methods: List[PyFunctionDef]
     __public_methods: List[PyFunctionDef]
@@ -33,11 +37,14 @@ class PyClassDef(PyScoped, PyIdentifiable):
         self.set_id(expression.name)
 
         # Declare class
-        self.get_nearest_scope().declare_object(Class(self.get_id(), self.get_scope()))
+        class_object = Class(self.get_id(), self.get_scope())
+        self.get_nearest_scope().declare_object(class_object)
 
         # Create object scope (class body has it's own scope)
         # Inherit the scope from the previous scope
         self.update_from_nearest_scope()
+        # The class holds its members (which are declared in the new scope)
+        class_object.scope = self.get_scope()
 
         # Prepare to store methods and fields
         self.__constructor = None
@@ -97,37 +104,99 @@ class PyClassDef(PyScoped, PyIdentifiable):
         return "" if self.__constructor is None else \
             f"{self.get_id()}({self.__constructor.transpile_args()}) {self.__constructor.transpile_code()};"
 
+    def emit_constructor(self, sink: CodeSink) -> None:
+        """
+        Writes the class constructor to a sink, if there is one.
+        """
+        if self.__constructor is not None:
+            sink.write(f"{self.get_id()}({self.__constructor.transpile_args()}) ")
+            self.__constructor.emit_code(sink)
+            sink.write(";")
+
+    def get_constructor(self) -> Optional[PyFunctionDef]:
+        """
+        :return: The constructor of the class (None if there is none).
+        """
+        return self.__constructor
+
+    def get_fields(self) -> List[PyAnnAssign]:
+        """
+        :return: The fields of the class, private ones first.
+        """
+        return self.__private_fields + self.__public_fields
+
+    def get_methods(self) -> List[PyFunctionDef]:
+        """
+        :return: The methods of the class (without the constructor), private ones first.
+        """
+        return self.__private_methods + self.__public_methods
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the fields and the methods of the class (in the order they are written in).
+        """
+        yield from self.__private_fields
+        yield from self.__private_methods
+        yield from self.__public_fields
+        if self.__constructor is not None:
+            yield self.__constructor
+        yield from self.__public_methods
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace a field or a method of the class.
+        """
+        if self.__constructor is old:
+            self.__constructor = self._adopt(new)
+        elif not any(self._replace_in(members, old, new) for members in (
+                self.__private_fields, self.__private_methods, self.__public_fields, self.__public_methods)):
+            super().replace_child(old, new)
+
     # noinspection PyUnusedFunction
     def _transpile(self) -> str:
         """
         Transpile the statement to a string.
         """
-        # Class header
-        transpiled_class = [f"class {self.get_id()} {{"]
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the statement to a sink.
+        """
+        # Class header (each of the following segments is on its own line)
+        sink.write(f"class {self.get_id()} {{")
 
         # If there are any private attributes
         if self.__private_methods or self.__private_fields:
             # Then mark this section as private
-            transpiled_class.append("private:")
+            sink.write("\nprivate:")
             # Add transpiled private fields and methods
-            if self.__private_fields:
-                transpiled_class.append("\n".join([pyexpr.transpile() + ";" for pyexpr in self.__private_fields]))
-            if self.__private_methods:
-                transpiled_class.append("\n".join([pyexpr.transpile() + ";" for pyexpr in self.__private_methods]))
+            self.__emit_members(sink, self.__private_fields)
+            self.__emit_members(sink, self.__private_methods)
 
         # If there are any public attributes (or a constructor)
         if self.__constructor or self.__public_methods or self.__public_fields:
             # Then mark this section as public
-            transpiled_class.append("public:")
+            sink.write("\npublic:")
             # Transpile and add public attributes
-            if self.__public_fields:
-                transpiled_class.append("\n".join([pyexpr.transpile() + ";" for pyexpr in self.__public_fields]))
+            self.__emit_members(sink, self.__public_fields)
             if self.__constructor:
-                transpiled_class.append(self.transpile_constructor())
-            if self.__public_methods:
-                transpiled_class.append("\n".join([pyexpr.transpile() + ";" for pyexpr in self.__public_methods]))
+                sink.write("\n")
+                self.emit_constructor(sink)
+            self.__emit_members(sink, self.__public_methods)
 
         # Add ending bracket
-        transpiled_class.append("}")
-        # Join transpiled segments together
-        return "\n".join(transpiled_class)
+        sink.write("\n}")
+
+    @staticmethod
+    def __emit_members(sink: CodeSink, members: Sequence[PyExpression]) -> None:
+        """
+        Writes a segment of fields or methods to a sink (nothing if there are none).
+
+        :param sink: The sink to write the code to.
+        :param members: The fields or methods to write, each on its own line.
+        """
+        for member in members:
+            sink.write("\n")
+            member.emit(sink)
+            sink.write(";")
@@ -2,35 +2,92 @@
 Comparison expression (condition).
 """
 from _ast import Compare, cmpop
-from typing import List
+from typing import Iterator, List
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.pyexpressions.highlevel.PyIterative import PyIterative
 from src.structures.Errors import UnsupportedFeatureException
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE, NodeConstruction
 
 
-class PyCompare(PyExpression):
+class PyCompare(PyIterative):
     """
     Comparison expression (condition).
     """
 
+    __slots__ = ("__left", "__right", "__comparators")
+
     __left: PyExpression
     __right: List[PyExpression]
     __comparators: List[str]
 
     def __init__(self, expression: Compare, parent: GENERIC_PYEXPR_TYPE):
+        self._construct_nested(expression, parent)
+
+    def _construct(self, expression: Compare, parent: GENERIC_PYEXPR_TYPE) -> NodeConstruction:
+        """
+        Build the comparison (the sides are built by the TreeBuilder).
+        """
         super().__init__(expression, parent)
         # Translate the comparator to a string
         self.__comparators = [self.comparator_to_str(comp) for comp in expression.ops]
         # Left side
-        self.__left = self.from_ast(expression.left)
+        self.__left = yield expression.left
         # Translate each expression
-        self.__right = [self.from_ast(expr) for expr in expression.comparators]
+        self.__right = []
+        for expr in expression.comparators:
+            self.__right.append((yield expr))
+
+    def get_left(self) -> PyExpression:
+        """
+        :return: The left-most side of the comparison.
+        """
+        return self.__left
+
+    def get_comparators(self) -> List[str]:
+        """
+        :return: The comparators, as C++ strings (one between each pair of sides).
+        """
+        return self.__comparators
+
+    def get_right(self) -> List[PyExpression]:
+        """
+        :return: The sides right of each comparator, in order.
+        """
+        return self.__right
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the sides of the comparison.
+        """
+        yield self.__left
+        yield from self.__right
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace a side of the comparison.
+        """
+        if self.__left is old:
+            self.__left = self._adopt(new)
+        elif not self._replace_in(self.__right, old, new):
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
         Transpiles the comparison to a string.
         """
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Writes the comparison to a sink.
+        """
+        self._emit_nested(sink)
+
+    def _emit_parts(self, sink: CodeSink) -> Iterator[PyExpression]:
+        """
+        Writes the comparison to a sink (the sides are written in place of the yielded nodes).
+        """
         # The variable naming is slightly odd due to how the AST module names it's fields, but nevertheless-
         # The comparison should look something like this (example below):
         # left  comparators[0]  right[0]    comparators[1]  right[1] ...
@@ -51,9 +108,13 @@ class PyCompare(PyExpression):
         left_list: List[PyExpression] = [self.__left] + self.__right
         # Zip them together (iterate, where each iteration yields a LEFT, a COMPARATOR, and a RIGHT)
         # Then, join all the comparisons together with the 'AND' boolean operation
-        return ' && '.join([
-            f"{L.transpile()} {C} {R.transpile()}" for L, C, R in zip(left_list, self.__comparators, self.__right)
-        ])
+        separator = ""
+        for left, comparator, right in zip(left_list, self.__comparators, self.__right):
+            sink.write(separator)
+            yield left
+            sink.write(f" {comparator} ")
+            yield right
+            separator = " && "
 
     @staticmethod
     def comparator_to_str(comparator: cmpop) -> str:
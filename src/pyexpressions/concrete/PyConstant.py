@@ -2,7 +2,7 @@
 Constant literal.
 """
 from _ast import Constant
-from typing import Any
+from typing import Any, cast
 
 from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
@@ -15,6 +15,8 @@ class PyConstant(PyExpression):
     Literal constant value.
     """
 
+    __slots__ = ("__value",)
+
     __value: str
 
     def __init__(self, expression: Constant, parent: GENERIC_PYEXPR_TYPE):
@@ -22,6 +24,12 @@ class PyConstant(PyExpression):
         # Translate the value
         self.__value = self.translate_constant(expression)
 
+    def get_value(self) -> Any:
+        """
+        :return: The Python value of the constant.
+        """
+        return cast(Constant, self.get_expression()).value
+
     def _transpile(self) -> str:
         """
         Transpiles the constant to a string.
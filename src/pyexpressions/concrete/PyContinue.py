@@ -12,6 +12,8 @@ class PyContinue(PyExpression):
     Continue statement.
     """
 
+    __slots__ = ()
+
     def __init__(self, expression: Continue, parent: GENERIC_PYEXPR_TYPE):
         super().__init__(expression, parent)
 
@@ -2,6 +2,7 @@
 Expression statement.
 """
 from _ast import Expr, Constant
+from typing import Iterator
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
@@ -12,6 +13,8 @@ class PyExpr(PyExpression):
     Expression statement.
     """
 
+    __slots__ = ("__value", "__is_empty_expr")
+
     __value: PyExpression
     __is_empty_expr: bool
 
@@ -29,6 +32,27 @@ class PyExpr(PyExpression):
         """
         return self.__is_empty_expr
 
+    def get_value(self) -> PyExpression:
+        """
+        :return: The value of the statement.
+        """
+        return self.__value
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the value of the statement.
+        """
+        yield self.__value
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the value of the statement.
+        """
+        if self.__value is old:
+            self.__value = self._adopt(new)
+        else:
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpile the operation to a string.
@@ -2,14 +2,13 @@
 Class for a conditional looped statement.
 """
 from _ast import For, AnnAssign, Name, Call
-from typing import cast
+from typing import Iterator, cast
 
-from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyAnnAssign import PyAnnAssign
 from src.pyexpressions.concrete.PyCall import PyCall
 from src.pyexpressions.highlevel.PyBody import PyBody
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE
 
 
 # Does not inherit from PyConditional as it
@@ -22,6 +21,8 @@ class PyFor(PyExpression):
     Class for a Python iterating statement (for statement).
     """
 
+    __slots__ = ("__target", "__iter", "__code")
+
     __target: PyAnnAssign
     __iter: PyCall
     __code: PyBody
@@ -31,7 +32,7 @@ class PyFor(PyExpression):
 
         # Create and set iterator to field
         self.__target = PyAnnAssign(
-            expression=AnnAssign(Name(Util.get_attr(expression.target, "id"), None), Name("Any", None), None, simple=1),
+            expression=AnnAssign(Name(cast(Name, expression.target).id, None), Name("Any", None), None, simple=1),
             parent=self
         )
 
@@ -39,10 +40,56 @@ class PyFor(PyExpression):
         self.__iter = PyCall(cast(Call, expression.iter), self)
 
         # Create body, now that iterator exists
-        self.__code = PyBody(Util.get_attr(expression, 'body'), parent)
+        self.__code = PyBody(expression.body, parent)
+
+    def get_target(self) -> PyAnnAssign:
+        """
+        :return: The declaration of the loop variable.
+        """
+        return self.__target
+
+    def get_iter(self) -> PyCall:
+        """
+        :return: The iterated object.
+        """
+        return self.__iter
+
+    def get_code(self) -> PyBody:
+        """
+        :return: The body of the loop.
+        """
+        return self.__code
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the target, the iterable and the body of the loop.
+        """
+        yield self.__target
+        yield self.__iter
+        yield self.__code
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the target, the iterable or the body of the loop.
+        """
+        if self.__target is old:
+            self.__target = self._adopt(new)
+        elif self.__iter is old:
+            self.__iter = self._adopt(new)
+        elif self.__code is old:
+            self.__code = self._adopt(new)
+        else:
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
         Transpile the conditional statement to a string.
         """
-        return f"for ({self.__target.transpile()} : {self.__iter.transpile()}) {self.__code.transpile()}"
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the conditional statement to a sink.
+        """
+        sink.write(f"for ({self.__target.transpile()} : {self.__iter.transpile()}) ")
+        self.__code.emit(sink)
@@ -4,9 +4,8 @@ Function defenition.
 from _ast import FunctionDef, Constant
 from ast import parse
 from inspect import getsource
-from typing import List, cast, Optional, Any
+from typing import Iterator, List, cast, Optional, Any
 
-from src.compiler.Util import Util
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyArg import PyArg
 from src.pyexpressions.concrete.PyName import PyName
@@ -16,7 +15,7 @@ from src.pyexpressions.highlevel.PyScoped import PyScoped
 from src.scopes.objects.Function import Function
 from src.scopes.objects.Type import Type
 from src.scopes.objects.Variable import Variable
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE, AnyFunction
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE, AnyFunction
 
 
 class PyFunctionDef(PyScoped, PyIdentifiable):
@@ -24,6 +23,9 @@ class PyFunctionDef(PyScoped, PyIdentifiable):
     Function defenition.
     """
 
+    # The scope slot is declared here, as PyScoped can't hold slots of its own
+    __slots__ = ("_PyScoped__scope", "__args", "__defaults", "__code", "__return_type")
+
     __args: List[PyArg]
     __defaults: List[PyExpression]
     __code: PyBody
@@ -39,7 +41,7 @@ class PyFunctionDef(PyScoped, PyIdentifiable):
         # If return is a Constant, then it is None (there is no return value)
         # In which case in the transpilation stage, set as "void"
         # Otherwise, use a proper name (int, str, etc.)
-        returns = Util.get_attr(expression, 'returns')
+        returns = expression.returns
         self.__return_type = None if isinstance(returns, Constant) else PyName(returns, self)
 
         # If this is not a ported object (we will handle duplicated objects externally using a set)
@@ -88,13 +90,66 @@ class PyFunctionDef(PyScoped, PyIdentifiable):
         """
         return self.__code.transpile()
 
+    def emit_code(self, sink: CodeSink) -> None:
+        """
+        Write the code body of the function to a sink.
+        """
+        self.__code.emit(sink)
+
+    def get_args(self) -> List[PyArg]:
+        """
+        :return: The arguments of the function (without the 'self' argument of methods).
+        """
+        return self.__args
+
+    def get_defaults(self) -> List[PyExpression]:
+        """
+        :return: The default values of the last arguments.
+        """
+        return self.__defaults
+
+    def get_code(self) -> PyBody:
+        """
+        :return: The body of the function.
+        """
+        return self.__code
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the return type, the arguments, their defaults and the body of the function.
+        """
+        if self.__return_type is not None:
+            yield self.__return_type
+        yield from self.__args
+        yield from self.__defaults
+        yield self.__code
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the return type, an argument, a default or the body of the function.
+        """
+        if self.__return_type is old:
+            self.__return_type = self._adopt(new)
+        elif self.__code is old:
+            self.__code = self._adopt(new)
+        elif not self._replace_in(self.__args, old, new) and not self._replace_in(self.__defaults, old, new):
+            super().replace_child(old, new)
+
     # noinspection PyUnusedFunction
     def _transpile(self) -> str:
         """
         Transpile the statement to a string.
         """
-        # Join the header and the body together
-        return f"{self.transpile_header()} {self.transpile_code()}"
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the statement to a sink.
+        """
+        # Write the header, then the body
+        sink.write(self.transpile_header())
+        sink.write(" ")
+        self.emit_code(sink)
 
     def transpile_return_type(self) -> str:
         """
@@ -135,8 +190,8 @@ class PyFunctionDef(PyScoped, PyIdentifiable):
         # the function name and transpiled arguments.
         return f"{self.transpile_return_type()} {self.get_id()}({self.transpile_args()})"
 
-    @staticmethod
-    def from_single_object(obj: AnyFunction, parent: Optional[GENERIC_PYEXPR_TYPE]) -> "PyFunctionDef":
+    @classmethod
+    def from_single_object(cls, obj: AnyFunction, parent: Optional[GENERIC_PYEXPR_TYPE]) -> "PyFunctionDef":
         """
         Converts any singular (function, object, class, etc.) Python object to an AST node.
 
@@ -144,13 +199,24 @@ class PyFunctionDef(PyScoped, PyIdentifiable):
         :param parent: The parent expression which uses this node.
         :return: The parsed AST node.
         """
-        # Get the source code of the object
+        # Get the source code of the object, then parse it
+        return cls.from_source(getsource(obj), parent)
+
+    @staticmethod
+    def from_source(source: str, parent: Optional[GENERIC_PYEXPR_TYPE]) -> "PyFunctionDef":
+        """
+        Converts the source code of a single function definition to an AST node.
+
+        :param source: The source code of the function.
+        :param parent: The parent expression which uses this node.
+        :return: The parsed AST node.
+        """
         # Parse it to an AST tree
         # Get the body of the AST tree (scope is Module)
         # Get the first line
         # Turn it into a PyExpression
         py_expr: PyExpression = PyExpression.from_ast_statically(
-            expression=parse(getsource(obj)).body[0],
+            expression=parse(source).body[0],
             parent=parent
         )
 
@@ -2,11 +2,12 @@
 Class for a conditional statement.
 """
 from _ast import If
-from typing import Optional
+from typing import Iterator, Optional
 
 from src.pyexpressions.abstract.PyConditional import PyConditional
+from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.highlevel.PyBody import PyBody
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE
 
 
 class PyIf(PyConditional):
@@ -14,6 +15,8 @@ class PyIf(PyConditional):
     Class for a Python conditional statement.
     """
 
+    __slots__ = ("__else",)
+
     __else: Optional[PyBody]
 
     def __init__(self, expression: If, parent: GENERIC_PYEXPR_TYPE):
@@ -25,8 +28,41 @@ class PyIf(PyConditional):
             # Send to "else"
             self.__else = PyBody(expression.orelse, self)
 
+    def get_else(self) -> Optional[PyBody]:
+        """
+        :return: The 'else' body (None if there is none).
+        """
+        return self.__else
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the condition, the body and the 'else' body.
+        """
+        yield from super().children()
+        if self.__else is not None:
+            yield self.__else
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the condition, the body or the 'else' body.
+        """
+        if self.__else is old:
+            self.__else = self._adopt(new)
+        else:
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpile the conditional statement to a string.
         """
-        return "if " + super()._transpile() + (f" else {self.__else.transpile()}" if self.__else else "")
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the conditional statement to a sink.
+        """
+        sink.write("if ")
+        self._emit_conditional(sink)
+        if self.__else:
+            sink.write(" else ")
+            self.__else.emit(sink)
@@ -2,6 +2,7 @@
 Conditional expression.
 """
 from _ast import IfExp
+from typing import Iterator
 
 from src.pyexpressions.abstract.PyConditional import PyConditional
 from src.pyexpressions.abstract.PyExpression import PyExpression
@@ -13,6 +14,8 @@ class PyIfExp(PyConditional):
     Expression for a Python conditional expression.
     """
 
+    __slots__ = ("__else",)
+
     __else: PyExpression
 
     def __init__(self, expression: IfExp, parent: GENERIC_PYEXPR_TYPE):
@@ -20,6 +23,28 @@ class PyIfExp(PyConditional):
         # Send to "else"
         self.__else = self.from_ast(expression.orelse)
 
+    def get_else(self) -> PyExpression:
+        """
+        :return: The value of the expression when the condition is false.
+        """
+        return self.__else
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the condition and the values of the expression.
+        """
+        yield from super().children()
+        yield self.__else
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the condition or a value of the expression.
+        """
+        if self.__else is old:
+            self.__else = self._adopt(new)
+        else:
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpile the expression to a string.
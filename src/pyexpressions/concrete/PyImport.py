@@ -1,13 +1,13 @@
 """
 Import statement.
 """
-from _ast import Import
-from importlib.util import find_spec
-from typing import List
+from _ast import Import, ImportFrom, alias
+from typing import Iterator, List, Optional, Tuple, Union, cast
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyModule import PyModule
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.Errors import ObjectNotDefinedError
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE
 
 
 class PyImport(PyExpression):
@@ -15,20 +15,81 @@ class PyImport(PyExpression):
     Import (and 'from' import) statement.
     """
 
+    __slots__ = ("__imports",)
+
     __imports: List[PyModule]
 
-    def __init__(self, expression: Import, parent: GENERIC_PYEXPR_TYPE):
+    def __init__(self, expression: Union[Import, ImportFrom], parent: GENERIC_PYEXPR_TYPE):
         super().__init__(expression, parent)
 
         # Initiate list
         self.__imports = []
-        # For each name to import
-        for module in expression.names:
-            # Locate the module file
-            with open(find_spec(module.name).origin, "r") as f:
-                # Read the module and parse it
-                from src.compiler.Compiler import Compiler
-                self.__imports.append(Compiler.parse(f.read()))
+        # For each module to import
+        for module_name, alias in self.__get_module_names(expression):
+            # Parse the module (or reuse it, if it was already imported during this compilation)
+            imported_module = self.get_module().get_registry().load(module_name)
+            # The same module can be reached by multiple names in a single statement
+            if imported_module not in self.__imports:
+                self.__imports.append(imported_module)
+
+            # Our module now relies on the imported file, and on whatever it imports
+            self.get_module().add_source_files([cast(str, imported_module.get_path())])
+            self.get_module().add_source_files(imported_module.get_source_files())
+            self.get_module().add_resolved_imports({module_name: imported_module.get_path()})
+            self.get_module().add_resolved_imports(imported_module.get_resolved_imports())
+
+            # 'from' imports of objects declare them in our scope
+            if alias is not None:
+                self.__declare_imported_objects(imported_module, alias)
+
+    def __get_module_names(self, expression: Union[Import, ImportFrom]) -> List[Tuple[str, Optional[alias]]]:
+        """
+        Finds the absolute names of the modules which the statement imports.
+
+        :param expression: The import statement.
+        :return: The module names, each with the imported name of a 'from' import of an object in the module
+                 (None for imported modules).
+        """
+        # Regular imports list the modules themselves
+        if isinstance(expression, Import):
+            return [(name.name, None) for name in expression.names]
+
+        # 'from' imports are relative to the package of our module
+        resolver = self.get_session().get_resolver()
+        base_name = resolver.resolve_relative(expression.module, expression.level, self.get_module().get_package())
+
+        # Each imported name is either a sub-module, or an object in the base module
+        module_names: List[Tuple[str, Optional[alias]]] = []
+        for name in expression.names:
+            if name.name != "*" and resolver.find(f"{base_name}.{name.name}") is not None:
+                module_names.append((f"{base_name}.{name.name}", None))
+            else:
+                module_names.append((base_name, name))
+                # (the output would change if the name became a sub-module)
+                if name.name != "*":
+                    self.get_module().add_resolved_imports({f"{base_name}.{name.name}": None})
+        return module_names
+
+    def __declare_imported_objects(self, imported_module: PyModule, name: alias) -> None:
+        """
+        Declares the objects of a 'from' import in our scope. The imported module is
+        spliced into the output, so the code refers to the objects by their own names.
+
+        :param imported_module: The module which holds the objects.
+        :param name: The imported name (the name of an object, or '*' for the module's public objects).
+        """
+        scope = self.get_nearest_scope()
+        if name.name == "*":
+            # (sorted, so the order of the declarations does not depend on the hashes of the objects)
+            for imported_object in sorted(imported_module.get_scope().get_objects(), key=lambda obj: obj.name):
+                if not imported_object.name.startswith("_"):
+                    scope.declare_object(imported_object)
+            return
+
+        imported_object = imported_module.get_scope().get_object(name.name)
+        if imported_object is None:
+            raise ObjectNotDefinedError(name.name)
+        scope.declare_object(imported_object, name.asname)
 
     def get_imports(self) -> List[PyModule]:
         """
@@ -40,9 +101,31 @@ class PyImport(PyExpression):
         """
         return self.__imports
 
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the imported modules.
+        """
+        yield from self.__imports
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace an imported module.
+        """
+        if not self._replace_in(self.__imports, old, new):
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpiles the statement to a string.
         """
-        # Transpile each module
-        return "\n".join([module.transpile() for module in self.__imports])
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Writes the statement to a sink.
+        """
+        # Write each module, separated by newlines
+        for index, module in enumerate(self.__imports):
+            if index:
+                sink.write("\n")
+            module.emit(sink)
@@ -1,14 +1,23 @@
 """
 Python module.
 """
-from _ast import Module
-from copy import deepcopy
-from typing import List, Set
+from _ast import Module, AST, FunctionDef, ClassDef
+from re import split as split_regex
+from typing import Callable, Dict, List, Set, Iterable, Iterator, Optional, Tuple, Union, TYPE_CHECKING, cast
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.pyexpressions.concrete.PyFunctionDef import PyFunctionDef
+from src.pyexpressions.highlevel.PyIdentifiable import PyIdentifiable
 from src.pyexpressions.highlevel.PyScoped import PyScoped
 from src.structures.Errors import ObjectAlreadyDefinedError
+from src.structures.TypeRenames import CodeSink
+
+# Only import the ported functions when type checking, to avoid circular imports
+if TYPE_CHECKING:
+    from src.compiler.CompileSession import CompileSession
+    from src.compiler.ModuleRegistry import ModuleRegistry
+    from src.compiler.cache.DefinitionStore import DefinitionStore
+    from src.pybuiltins.PyPortFunction import PyPortFunction
 
 
 class PyModule(PyScoped):
@@ -16,15 +25,136 @@ class PyModule(PyScoped):
     Python module.
     """
 
+    # The scope slot is declared here, as PyScoped can't hold slots of its own
+    __slots__ = ("_PyScoped__scope", "__body", "__depends", "__ported_depends", "__ports", "__source_files",
+                 "__resolved_imports", "__port_calls", "__source_lines", "__registry", "__path")
+
     __body: List[PyExpression]
+    # The dependencies are ordered sets (dictionaries without values), which keep the order they were first used
+    # in, so the output is the same on every run (sets of strings are ordered by their randomized hashes)
+    __depends: Dict[str, None]
+    __ported_depends: Dict["PyPortFunction", None]
+    # The ports which were built for this module, by name (see PyPortManager.call_port)
+    __ports: Dict[str, "PyPortFunction"]
+    # Paths of the Python files that were imported into this module (directly or not)
+    __source_files: Set[str]
+    # The files which the imported module names resolved to, directly or not (None for names which are not modules)
+    __resolved_imports: Dict[str, Optional[str]]
+    # The names of the ports called while building a definition (None when not recording)
+    __port_calls: Optional[List[str]]
+    # The lines of the source code, used to fingerprint definitions (only when there is a definition store)
+    __source_lines: List[str]
+    # The modules imported during this compilation (shared with the imported modules)
+    __registry: "ModuleRegistry"
+    # The path of the module's file (None if it is unknown)
+    __path: Optional[str]
+
+    def __init__(self, expression: Module, definitions: Optional["DefinitionStore"] = None, source: str = "",
+                 registry: Optional["ModuleRegistry"] = None, path: Optional[str] = None):
+        """
+        :param expression: The AST node of the module.
+        :param definitions: A store of previously transpiled definitions, to reuse unchanged
+                            top-level functions and classes (None to build everything).
+        :param source: The source code which the module was parsed from (required by the definition store).
+        :param registry: The registry of the modules imported during this compilation
+                         (None to start a new compilation, with the default options).
+        :param path: The path of the module's file, used to resolve relative imports (None if it is unknown).
+        """
+        # Import locally to avoid cyclic import error
+        from src.compiler.CompileSession import CompileSession
+        from src.compiler.ModuleRegistry import ModuleRegistry
 
-    def __init__(self, expression: Module):
+        # Create dependency sets (only the module stores them, the rest of the tree passes them up to here)
+        self.__depends = {}
+        self.__ported_depends = {}
+        self.__ports = {}
+        self.__source_files = set()
+        self.__resolved_imports = {}
+        self.__port_calls = None
+        self.__registry = registry if registry is not None else ModuleRegistry(CompileSession())
+        self.__path = path
+        # (split like the parser does, so the line numbers of the AST nodes match)
+        self.__source_lines = split_regex(r"\r\n|\r|\n", source) if definitions is not None else []
         super().__init__(expression, None)
         # For each body expression
         # Create a PyExpression from the AST node
-        self.__body = [self.from_ast(ast) for ast in expression.body]
+        self.__body = [self.__build_statement(ast, definitions) for ast in expression.body]
         # Update the debuggers, now that we have parsed the entire module
-        self.get_logger().finalize_debuggers()
+        # (imported modules are part of the tree of the importing one, so only its root updates them)
+        if not self.__registry.is_loading():
+            self.get_logger().finalize_debuggers((path or "module.py") + ".png")
+            # The whole compilation is parsed, so the imported modules are no longer needed by the registry
+            self.__registry.close()
+
+    def __build_statement(self, expression: AST, definitions: Optional["DefinitionStore"]) -> PyExpression:
+        """
+        Converts a top-level statement to a PyExpression.
+        Function and class definitions are loaded from the definition store, if they are unchanged.
+
+        :param expression: The statement to convert.
+        :param definitions: The definition store (None to build everything).
+        :return: The PyExpression of the statement.
+        """
+        # Import locally to avoid cyclic import error
+        from src.pyexpressions.concrete.PyCachedDefinition import PyCachedDefinition
+        from src.pyexpressions.concrete.PyClassDef import PyClassDef
+
+        # Only definitions are stored
+        if definitions is None or not isinstance(expression, (FunctionDef, ClassDef)):
+            return self.from_ast(expression)
+
+        # Look up the definition
+        fingerprint = definitions.fingerprint(
+            expression, self.__source_lines, self.get_scope(), self.get_session().get_port_manager())
+        entry = definitions.load(fingerprint)
+        if entry is not None:
+            # Reuse the transpiled definition
+            return PyCachedDefinition(expression, self, entry)
+
+        # Otherwise, build the definition, while recording the ports that it calls
+        self.__port_calls = []
+        try:
+            pyexpr = self.from_ast(expression)
+            entry = PyCachedDefinition.create_entry(cast(Union[PyFunctionDef, PyClassDef], pyexpr), self.__port_calls)
+        finally:
+            self.__port_calls = None
+
+        # Store it for the next time (its effects already happened, so they are not repeated)
+        definitions.store(fingerprint, entry)
+        return PyCachedDefinition(expression, self, entry, replay=False)
+
+    def record_port_call(self, ported_name: str) -> None:
+        """
+        Records a call to a ported object, if a definition is being recorded (see __build_statement).
+
+        :param ported_name: The name of the called port.
+        """
+        if self.__port_calls is not None:
+            self.__port_calls.append(ported_name)
+
+    def get_registry(self) -> "ModuleRegistry":
+        """
+        :return: The registry of the modules imported during this compilation.
+        """
+        return self.__registry
+
+    def get_session(self) -> "CompileSession":
+        """
+        :return: The session of this compilation.
+        """
+        return self.__registry.get_session()
+
+    def get_path(self) -> Optional[str]:
+        """
+        :return: The path of the module's file (None if it is unknown).
+        """
+        return self.__path
+
+    def get_package(self) -> Optional[str]:
+        """
+        :return: The name of the package that this module is in (None if it is unknown).
+        """
+        return None if self.__path is None else self.get_session().get_resolver().get_package(self.__path)
 
     def get_body(self) -> List[PyExpression]:
         """
@@ -35,82 +165,304 @@ class PyModule(PyScoped):
         """
         return self.__body
 
+    def iterate_body(self) -> Iterator[PyExpression]:
+        """
+        Lazily iterates over the body code of the current module,
+        with the body of each imported module spliced in right
+        after its import statement (the import itself is skipped).
+        Each imported module is only spliced in at the first import
+        which reaches it, even if it is imported multiple times.
+        Neither this module nor the imported ones are altered.
+
+        :return: An iterator over the expressions of the flattened body.
+        """
+        from src.pyexpressions.concrete.PyImport import PyImport
+
+        # A stack of the bodies that we are currently iterating,
+        # the top of the stack is the most recently imported body
+        bodies: List[Iterator[PyExpression]] = [iter(self.__body)]
+        # The modules which were already spliced in
+        spliced: Set[PyModule] = set()
+        while bodies:
+            # Continue iterating the top body
+            for pyexpr in bodies[-1]:
+                # If the segment is a module import
+                if isinstance(pyexpr, PyImport):
+                    # The native compiler will copy the imported module into the code directly
+                    # So we will do this for it instead, rather than create extra files.
+                    # Each imported module is placed right after the import, so when importing
+                    # multiple modules in the same statement, the last one is placed first.
+                    for imported_module in pyexpr.get_imports():
+                        if imported_module not in spliced:
+                            spliced.add(imported_module)
+                            bodies.append(iter(imported_module.get_body()))
+                    # Go iterate the imported bodies, then come back to this one
+                    break
+                # Otherwise, this is a regular expression
+                yield pyexpr
+            else:
+                # This body is done, go back to the previous one
+                bodies.pop()
+
+    def get_imported_modules(self) -> List["PyModule"]:
+        """
+        Gets the modules which are spliced into the body of this module (see iterate_body), directly or not.
+
+        :return: The imported modules, each one once, in the order they are first imported in.
+        """
+        from src.pyexpressions.concrete.PyImport import PyImport
+
+        imported_modules: Dict[PyModule, None] = {}
+        # A stack of the bodies that we are currently searching for imports
+        bodies: List[Iterator[PyExpression]] = [iter(self.__body)]
+        while bodies:
+            for pyexpr in bodies[-1]:
+                if isinstance(pyexpr, PyImport):
+                    new_modules = [module for module in pyexpr.get_imports()
+                                   if module not in imported_modules and module is not self]
+                    imported_modules.update(dict.fromkeys(new_modules))
+                    # Search the imported modules first (in reverse, so the first one is on the top of the stack)
+                    if new_modules:
+                        bodies.extend(iter(module.get_body()) for module in reversed(new_modules))
+                        break
+            else:
+                bodies.pop()
+        return list(imported_modules)
+
+    @staticmethod
+    def __get_function_header(pyexpr: PyExpression) -> Optional[str]:
+        """
+        :param pyexpr: A segment of the module body.
+        :return: The transpiled header of the segment, if it is a function definition (otherwise None).
+        """
+        # Import locally to avoid cyclic import error
+        from src.pyexpressions.concrete.PyCachedDefinition import PyCachedDefinition
+
+        if isinstance(pyexpr, PyFunctionDef):
+            return pyexpr.transpile_header()
+        elif isinstance(pyexpr, PyCachedDefinition):
+            return pyexpr.get_header()
+        return None
+
+    @staticmethod
+    def __is_function_definition(pyexpr: PyExpression) -> bool:
+        """
+        :param pyexpr: A segment of the module body.
+        :return: True if the segment is a function definition (like __get_function_header, without transpiling it).
+        """
+        # Import locally to avoid cyclic import error
+        from src.pyexpressions.concrete.PyCachedDefinition import PyCachedDefinition
+
+        return isinstance(pyexpr, PyFunctionDef) or \
+            (isinstance(pyexpr, PyCachedDefinition) and pyexpr.get_header() is not None)
+
+    def add_dependencies(self, dependencies: Iterable[str]) -> None:
+        """
+        Adds multiple dependencies to the dependency list.
+
+        :param dependencies: A list of native dependencies that this module relies on.
+        """
+        self.__depends.update(dict.fromkeys(dependencies))
+
+    def get_dependencies(self) -> List[str]:
+        """
+        Returns the list of dependencies that this module relies on, in the order they were first used in.
+        """
+        return list(self.__depends)
+
+    def add_ported_dependency(self, ported_dependency: "PyPortFunction") -> None:
+        """
+        Adds a single ported (reimplemented in native language) dependency to the list.
+
+        :param ported_dependency: The ported dependency to add.
+        """
+        self.__ported_depends[ported_dependency] = None
+
+    def add_ported_dependencies(self, ported_dependencies: Iterable["PyPortFunction"]) -> None:
+        """
+        Adds multiple ported (reimplemented in native language) dependencies to the dependency list.
+
+        :param ported_dependencies: A list of ported dependencies that this module relies on.
+        """
+        self.__ported_depends.update(dict.fromkeys(ported_dependencies))
+
+    def get_port(self, ported_name: str) -> Optional["PyPortFunction"]:
+        """
+        :param ported_name: The name of a ported object.
+        :return: The port which was built for this module (None if it was not built yet).
+        """
+        return self.__ports.get(ported_name)
+
+    def add_port(self, ported_name: str, port: "PyPortFunction") -> None:
+        """
+        Stores a port which was built for this module, so later call sites share it.
+
+        :param ported_name: The name of the ported object.
+        :param port: The built port.
+        """
+        self.__ports[ported_name] = port
+
+    def get_ported_dependencies(self) -> List["PyPortFunction"]:
+        """
+        Returns the list of ported dependencies that this module relies on, in the order they were first used in
+        (a port is always used after the ports that it is linked to, see PyPortManager.call_port).
+        """
+        return list(self.__ported_depends)
+
+    def collect_dependencies(self) -> Tuple[List[str], List["PyPortFunction"]]:
+        """
+        Gathers the dependencies of this module, and of the modules spliced into it (see iterate_body).
+
+        :return: The native dependencies and the ported dependencies, each in the order they were first used in.
+        """
+        # (the imported modules only pass their dependencies to themselves, as they are built on their own)
+        dependencies = dict.fromkeys(self.get_dependencies())
+        ported_dependencies = dict.fromkeys(self.get_ported_dependencies())
+        for imported_module in self.get_imported_modules():
+            dependencies.update(dict.fromkeys(imported_module.get_dependencies()))
+            ported_dependencies.update(dict.fromkeys(imported_module.get_ported_dependencies()))
+        return list(dependencies), list(ported_dependencies)
+
+    def add_source_files(self, source_files: Iterable[str]) -> None:
+        """
+        Adds multiple imported source files to the list.
+
+        :param source_files: The paths of the Python files that this module imports.
+        """
+        self.__source_files.update(source_files)
+
+    def get_source_files(self) -> Set[str]:
+        """
+        Returns the paths of the Python files that this module imports (directly or not).
+        Useful for knowing when the transpiled output becomes outdated.
+        """
+        return self.__source_files
+
+    def add_resolved_imports(self, resolved_imports: Dict[str, Optional[str]]) -> None:
+        """
+        Adds imported module names, along with the files they resolved to.
+
+        :param resolved_imports: The real paths of the modules' files, by the absolute module names
+                                 (None for the names which were looked up, but are not modules).
+        """
+        self.__resolved_imports.update(resolved_imports)
+
+    def get_resolved_imports(self) -> Dict[str, Optional[str]]:
+        """
+        Returns the files which the imported module names resolved to (directly or not).
+        Useful for knowing when the transpiled output becomes outdated, even if none of
+        the imported files changed (a new module can shadow an imported one).
+        """
+        return self.__resolved_imports
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the statements of the module.
+        """
+        yield from self.__body
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace a statement of the module.
+        """
+        if not self._replace_in(self.__body, old, new):
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpiles the module to a native string.
         """
-        from src.compiler.Constants import OUTPUT_CODE_TEMPLATE
-        from src.pyexpressions.concrete.PyImport import PyImport
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Writes the module to a sink, streaming each section of the output template in turn.
+        """
+        from src.compiler.Constants import OUTPUT_CODE_SECTIONS
+
+        dependencies, ported_dependencies = self.collect_dependencies()
 
-        # For each expression, we will compile them
-        # However, we will separate this into "is a function"
-        # or "is not", so that we can put all the function
-        # definitions at the top of the output code.
-        output_list: List[str] = []
-        function_list: List[str] = []
+        # The writer of each section of the template
+        sections: Dict[str, Callable[[], None]] = {
+            # For each dependency, insert the dependency as a string
+            "dependency_code": lambda: self.__emit_lines(
+                sink, [f"#include <{dependency}>" for dependency in dependencies]),
+            # Inject native dependency headers
+            "ported_headers": lambda: self.__emit_lines(
+                sink, [port.get_interface_function().transpile_header() + ";" for port in ported_dependencies]),
+            # Inject native dependency bodies
+            "ported_code": lambda: self.__emit_statements(sink, ported_dependencies, ";"),
+            # Flatten the current code
+            "transpiled_funcs": lambda: self.__emit_statements(sink, self.__iterate_functions(), ""),
+            # Join the transpiled code
+            "transpiled_code": lambda: self.__emit_statements(sink, self.__iterate_code(), ";"),
+        }
+
+        # Write the template, with each section in its place
+        for literal_text, section in OUTPUT_CODE_SECTIONS:
+            sink.write(literal_text)
+            if section is not None:
+                sections[section]()
+
+    def __iterate_functions(self) -> Iterator[PyExpression]:
+        """
+        Iterates over the function definitions of the flattened body (see iterate_body),
+        which are placed at the top of the output code.
+
+        :return: An iterator over the definitions.
+        """
         function_sigs: Set[str] = set()
-        # Transpile each segment and add it to the output
-        # Deep copy the body, since we don't want to alter it
-        expr_index = 0
-        body: List[PyExpression] = deepcopy(self.__body)
-        while expr_index != len(body):
-            # Get the current segment by index (as the body can dynamically expand, such as with PyImports)
-            pyexpr = body[expr_index]
-
-            # If the segment is a module import
-            if isinstance(pyexpr, PyImport):
-                # The native compiler will copy the imported module into the code directly
-                # So we will do this for it instead, rather than create extra files
-                # For each import (you can import multiple modules at the same time)
-                for imported_module in pyexpr.get_imports():
-                    # Insert into next index (inserting into current index will
-                    # push the PyImport back into the loop, causing recursion)
-                    insert_index = expr_index + 1
-                    # Insert all of the code here
-                    body[insert_index:insert_index] = imported_module.get_body()
+        for pyexpr in self.iterate_body():
+            # Get the signature, if the segment is a function definition
+            func_sig = self.__get_function_header(pyexpr)
             # If the segment is a function definition
-            elif isinstance(pyexpr, PyFunctionDef):
-                # Get the signature
-                func_sig = pyexpr.transpile_header()
+            if func_sig is not None:
                 # Check if it exists already
                 if func_sig in function_sigs:
                     # Throw an error since you can't create the same function 2 times
-                    raise ObjectAlreadyDefinedError(pyexpr.get_id())
-                else:
-                    # Add the signature to the list
-                    function_sigs.add(func_sig)
-                    # Add it to the function list
-                    function_list.append(pyexpr.transpile())
-
-            # Make sure it's not a dead expression
-            elif not pyexpr.is_dead_expression():
-                # Transpile and add to code segment
-                # https://stackoverflow.com/q/9997895/11985743
-                output_list.append(pyexpr.transpile() + ";")
-
-            # Increment the index
-            expr_index += 1
-
-        # Format each part of the output,
-        # then format each segment into the template string,
-        # then return it all as a string.
-        return OUTPUT_CODE_TEMPLATE.format(
-            # For each dependency, insert the dependency as a string
-            dependency_code="\n".join([f"#include <{dependency}>" for dependency in self.get_dependencies()]),
+                    raise ObjectAlreadyDefinedError(cast(PyIdentifiable, pyexpr).get_id())
+                # Add the signature to the list
+                function_sigs.add(func_sig)
+                yield pyexpr
 
-            # Inject native dependency headers
-            ported_headers="\n".join([
-                port.get_interface_function().transpile_header() + ";" for port in self.get_ported_dependencies()
-            ]),
+    def __iterate_code(self) -> Iterator[PyExpression]:
+        """
+        Iterates over the rest of the flattened body (see iterate_body), which is placed in the main function.
 
-            # Inject native dependency bodies
-            ported_code="\n".join([
-                port.transpile() + ";" for port in self.get_ported_dependencies()
-            ]),
+        :return: An iterator over the statements.
+        """
+        for pyexpr in self.iterate_body():
+            # Make sure it's not a function definition, or a dead expression
+            # https://stackoverflow.com/q/9997895/11985743
+            if not self.__is_function_definition(pyexpr) and not pyexpr.is_dead_expression():
+                yield pyexpr
 
-            # Flatten the current code
-            transpiled_funcs="\n".join(function_list),
+    @staticmethod
+    def __emit_lines(sink: CodeSink, lines: Iterable[str]) -> None:
+        """
+        Writes lines of code to a sink, separated by newlines.
 
-            # Join the transpiled code
-            transpiled_code="\n".join(output_list)
-        )
+        :param sink: The sink to write the code to.
+        :param lines: The lines to write.
+        """
+        separator = ""
+        for line in lines:
+            sink.write(separator)
+            sink.write(line)
+            separator = "\n"
+
+    @staticmethod
+    def __emit_statements(sink: CodeSink, statements: Iterable[PyExpression], terminator: str) -> None:
+        """
+        Writes statements to a sink, separated by newlines.
+
+        :param sink: The sink to write the code to.
+        :param statements: The statements to write.
+        :param terminator: The string to write after each statement.
+        """
+        separator = ""
+        for pyexpr in statements:
+            sink.write(separator)
+            pyexpr.emit(sink)
+            sink.write(terminator)
+            separator = "\n"
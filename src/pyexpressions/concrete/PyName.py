@@ -13,6 +13,8 @@ class PyName(PyIdentifiable):
     Name statement (usage of an object).
     """
 
+    __slots__ = ()
+
     def __init__(self, expression: Name, parent: GENERIC_PYEXPR_TYPE):
         # Make sure an expression was passed
         if expression is None:
@@ -22,7 +24,6 @@ class PyName(PyIdentifiable):
         super().__init__(expression, parent)
         # Import locally to avoid import error
         from src.pyexpressions.concrete.PyCall import PyCall
-        from src.pybuiltins.PyPortManager import PyPortManager
 
         # Store the object name to a class variable
         # If this was used in a PyCall, then don't try to
@@ -32,10 +33,11 @@ class PyName(PyIdentifiable):
         # second_var = str(10)  # Name used as type conversion/cast function
         if isinstance(parent, PyCall):
             # Check if this is a ported and linked object
-            if PyPortManager().is_loaded(expression.id):
+            port_manager = self.get_session().get_port_manager()
+            if port_manager.is_loaded(expression.id):
                 # Then retrieve it from the manager
                 # Update target name (we will use the native function name)
-                self.set_id(PyPortManager().call_port(expression.id, self).get_function_name())
+                self.set_id(port_manager.call_port(expression.id, self).get_function_name())
             else:
                 # Otherwise, use the function name directly.
                 # This line should be equivalent to using expression.id
@@ -43,8 +45,10 @@ class PyName(PyIdentifiable):
                 # error if it can't retrieve the object (it does not exist).
                 self.set_id(self.get_nearest_scope().get_object_if_exists(expression.id))
         else:
-            # Otherwise, translate it as a type hint
-            self.set_id(self.translate_builtin_name(expression.id))
+            # Otherwise, it is an object (referred to by its own name, as it can be an imported alias),
+            # or a type hint to translate
+            name_object = self.get_nearest_scope().get_object(expression.id)
+            self.set_id(name_object.name if name_object is not None else self.translate_builtin_name(expression.id))
 
     def _transpile(self) -> str:
         """
@@ -12,6 +12,8 @@ class PyPass(PyExpression):
     Pass statement.
     """
 
+    __slots__ = ()
+
     def __init__(self, expression: Pass, parent: GENERIC_PYEXPR_TYPE):
         super().__init__(expression, parent)
 
@@ -2,7 +2,7 @@
 Return statement.
 """
 from _ast import Return
-from typing import Optional
+from typing import Iterator, Optional
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
 from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
@@ -13,6 +13,8 @@ class PyReturn(PyExpression):
     Return statement.
     """
 
+    __slots__ = ("__value",)
+
     __value: Optional[PyExpression]
 
     def __init__(self, expression: Return, parent: GENERIC_PYEXPR_TYPE):
@@ -21,6 +23,28 @@ class PyReturn(PyExpression):
         # (If none, then set none)
         self.__value = None if expression.value is None else self.from_ast(expression.value)
 
+    def get_value(self) -> Optional[PyExpression]:
+        """
+        :return: The returned value (None if nothing is returned).
+        """
+        return self.__value
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the returned value.
+        """
+        if self.__value is not None:
+            yield self.__value
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace the returned value.
+        """
+        if self.__value is old:
+            self.__value = self._adopt(new)
+        else:
+            super().replace_child(old, new)
+
     def _transpile(self) -> str:
         """
         Transpiles the constant to a string.
@@ -4,7 +4,7 @@ Class for a conditional looped statement.
 from _ast import While
 
 from src.pyexpressions.abstract.PyConditional import PyConditional
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE
 
 
 class PyWhile(PyConditional):
@@ -12,6 +12,8 @@ class PyWhile(PyConditional):
     Class for a Python conditional looped statement (while statement).
     """
 
+    __slots__ = ()
+
     def __init__(self, expression: While, parent: GENERIC_PYEXPR_TYPE):
         super().__init__(expression, parent)
 
@@ -19,4 +21,11 @@ class PyWhile(PyConditional):
         """
         Transpile the conditional statement to a string.
         """
-        return "while " + super()._transpile()
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the conditional statement to a sink.
+        """
+        sink.write("while ")
+        self._emit_conditional(sink)
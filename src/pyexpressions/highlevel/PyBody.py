@@ -2,34 +2,81 @@
 Python "block", conjoined statements.
 """
 from _ast import Pass, AST
-from typing import List, Sequence
+from typing import Iterator, List, Sequence, cast
 
 from src.pyexpressions.abstract.PyExpression import PyExpression
-from src.structures.TypeRenames import GENERIC_PYEXPR_TYPE
+from src.pyexpressions.highlevel.PyIterative import PyIterative
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE, NodeConstruction
 
 
-class PyBody(PyExpression):
+class PyBody(PyIterative):
     """
     Python "block", conjoined statements.
     Such as in a function or conditional body.
     """
 
+    __slots__ = ("__code",)
+
     __code: List[PyExpression]
 
     def __init__(self, expressions: Sequence[AST], parent: GENERIC_PYEXPR_TYPE):
+        # The statements are passed in place of an AST node
+        self._construct_nested(cast(AST, expressions), parent)
+
+    def _construct(self, expressions: Sequence[AST], parent: GENERIC_PYEXPR_TYPE) -> NodeConstruction:
+        """
+        Build the body (the lines of code are built by the TreeBuilder).
+        """
         super().__init__(Pass(), parent)
         # For each line of code, convert to expression
         # Set expressions to field
-        self.__code = [self.from_ast(ast) for ast in expressions]
+        self.__code = []
+        for ast in expressions:
+            self.__code.append((yield ast))
+
+    def get_code(self) -> List[PyExpression]:
+        """
+        :return: The lines of the body.
+        """
+        return self.__code
+
+    def children(self) -> Iterator[PyExpression]:
+        """
+        Iterate over the lines of the body.
+        """
+        yield from self.__code
+
+    def replace_child(self, old: PyExpression, new: PyExpression) -> None:
+        """
+        Replace a line of the body.
+        """
+        if not self._replace_in(self.__code, old, new):
+            super().replace_child(old, new)
 
     def _transpile(self) -> str:
         """
         Transpile the body to a string.
         """
-        # Join the body together with newlines
-        return "{\n" + '\n'.join([
-            # Transpile each line
-            expr.transpile() + ";" for expr in self.__code \
+        return self._transpile_emitted()
+
+    def _emit(self, sink: CodeSink) -> None:
+        """
+        Write the body to a sink, one line at a time.
+        """
+        self._emit_nested(sink)
+
+    def _emit_parts(self, sink: CodeSink) -> Iterator[PyExpression]:
+        """
+        Write the body to a sink (the lines are written in place of the yielded nodes).
+        """
+        sink.write("{\n")
+        # Write each line, separated by newlines
+        separator = ""
+        for expr in self.__code:
             # Don't transpile if this is a dead expression
-            if not expr.is_dead_expression()
-        ]) + "\n}"
+            if not expr.is_dead_expression():
+                sink.write(separator)
+                yield expr
+                sink.write(";")
+                separator = "\n"
+        sink.write("\n}")
@@ -15,6 +15,8 @@ class PyIdentifiable(PyExpression, metaclass=ABCMeta):
     this concept.
     """
 
+    __slots__ = ("__id",)
+
     __id: str
 
     def set_id(self, new_id: str) -> None:
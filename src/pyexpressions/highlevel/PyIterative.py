@@ -0,0 +1,94 @@
+"""
+Python expression which is built and written with an explicit stack.
+"""
+from _ast import AST
+from abc import abstractmethod, ABCMeta
+from typing import Iterator, List, Optional, Tuple, cast
+
+from src.compiler.CodeBuffer import CodeBuffer
+from src.pyexpressions.abstract.PyExpression import PyExpression
+from src.structures.TypeRenames import CodeSink, GENERIC_PYEXPR_TYPE, NodeConstruction
+
+
+class PyIterative(PyExpression, metaclass=ABCMeta):
+    """
+    Python expression which is built and written with an explicit stack.
+
+    Operations, calls and bodies can be nested tens of thousands of levels
+    deep, which recursive construction and transpilation cannot handle.
+    These nodes implement _construct (and implement __init__ with
+    _construct_nested), and _emit_parts (and implement _emit with
+    _emit_nested). The TreeBuilder and _emit_nested put every nested node
+    which is a PyIterative on their stack, and build or write any other
+    node recursively.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _construct(self, expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]) -> NodeConstruction:
+        """
+        Initializes this expression, and yields the AST nodes of its nested nodes,
+        receiving each one converted to a PyExpression (see TreeBuilder.construct).
+
+        :param expression: The expression to convert.
+        :param parent: The parent expression which uses this node.
+        :return: The AST nodes of the nested nodes (the converted nodes are sent back).
+        """
+
+    @abstractmethod
+    def _emit_parts(self, sink: CodeSink) -> Iterator[PyExpression]:
+        """
+        Writes the code of this expression to a sink, and yields its nested
+        nodes at the places where their code goes (see _emit_nested).
+
+        :param sink: The sink to write the code to.
+        :return: The nested nodes, in the order in which their code is written.
+        """
+
+    def _construct_nested(self, expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]) -> None:
+        """
+        Initializes this expression with _construct, converting
+        the nested nodes with an explicit stack (instead of recursion).
+
+        :param expression: The expression to convert.
+        :param parent: The parent expression which uses this node.
+        """
+        # Local import to avoid circular import errors
+        from src.compiler.TreeBuilder import TreeBuilder
+        TreeBuilder.construct(self, expression, parent)
+
+    def _emit_nested(self, sink: CodeSink) -> None:
+        """
+        Writes the code of this expression to a sink, with an explicit stack
+        of the nested nodes which are PyIterative as well (instead of recursion).
+
+        :param sink: The sink to write the code to.
+        """
+        # Logging prints the code of each node, so each nested node then writes to a buffer of its own
+        logging = self.get_logger().is_enabled()
+        profiler = self.get_logger().get_profiler()
+        # The nodes being written (each with its parts, and the sink that they are written to)
+        stack: List[Tuple[PyIterative, Iterator[PyExpression], CodeSink]] = [(self, self._emit_parts(sink), sink)]
+        while stack:
+            node, parts, node_sink = stack[-1]
+            child = next(parts, None)
+            # The node is complete
+            if child is None:
+                stack.pop()
+                # The code of the outer-most node is logged by transpile
+                if logging and stack:
+                    if profiler is not None:
+                        profiler.stop()
+                    code = cast(CodeBuffer, node_sink).getvalue()
+                    node.get_logger().log_tree_down(node._describe_transpilation, code)
+                    stack[-1][2].write(code)
+            # The nested node is written on the stack
+            elif isinstance(child, PyIterative):
+                child_sink = CodeBuffer() if logging else node_sink
+                if profiler is not None:
+                    profiler.start("transpile", child.__class__, child.get_expression(), child)
+                stack.append((child, child._emit_parts(child_sink), child_sink))
+            # The nested node is written recursively
+            else:
+                child.emit(node_sink)
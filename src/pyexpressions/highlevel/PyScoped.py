@@ -20,6 +20,10 @@ class PyScoped(PyExpression, metaclass=ABCMeta):
     inside the function body cannot be used outside it.
     """
 
+    # Empty, since PyScoped is combined with PyIdentifiable (only one of them can hold slots).
+    # Each concrete subclass declares the '_PyScoped__scope' slot instead.
+    __slots__ = ()
+
     __scope: Scope
 
     def __init__(self, expression: AST, parent: Optional[GENERIC_PYEXPR_TYPE]):
@@ -40,6 +44,12 @@ class PyScoped(PyExpression, metaclass=ABCMeta):
         else:
             self.__scope = Scope(self.get_nearest_scope())
 
+    def _get_scope_owner_of_children(self) -> Optional["PyScoped"]:
+        """
+        :return: This node, as it holds the scope of the nodes nested in it.
+        """
+        return self
+
     # noinspection PyUnusedFunction
     def get_scope(self) -> Scope:
         """
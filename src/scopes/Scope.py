@@ -1,7 +1,7 @@
 """
 Compiler class for managing objects and their types between scopes.
 """
-from typing import Set, Optional
+from typing import Dict, Optional, Set, Tuple, cast
 
 from src.scopes.abstract.Object import Object
 from src.structures.Errors import ObjectAlreadyDefinedError, ObjectNotDefinedError
@@ -10,17 +10,45 @@ from src.structures.Errors import ObjectAlreadyDefinedError, ObjectNotDefinedErr
 class Scope:
     """
     Handler for objects.
+
+    Each scope only holds the objects that were declared in it (by name,
+    for constant time lookups), and is linked to its external scope
+    instead of copying its objects. A scope sees the objects which its
+    external scope held when it was created (later declarations of the
+    external scope are not visible from it), so every object is declared
+    before it is used- exactly like when the external objects were copied.
+
+    As the external objects that a scope sees never change, a name which
+    was looked up through a long chain of external scopes is remembered
+    (even if there is no such object) by every scope that the lookup
+    passed through, so a lookup takes constant time no matter how deeply
+    the scopes are nested. Most lookups pass through a scope or two (a
+    function in a module, or a method in a class), which is cheaper than
+    remembering them, so those are not remembered.
     """
 
-    __objects: Set[Object]
+    # Lookups which pass through at least this many scopes are remembered
+    REMEMBERED_DEPTH: int = 3
+
+    # Scopes are created for every module, class and function, so they are kept compact
+    __slots__ = ("__objects", "__external_scope", "__external_limit", "__external_objects")
+
+    # The objects declared in this scope, by name, alongside the order they were declared in
+    __objects: Dict[str, Tuple[Object, int]]
+    __external_scope: Optional["Scope"]
+    # The amount of objects that the external scope held when this scope was created
+    __external_limit: int
+    # The objects that were looked up through a long chain of external scopes, by name
+    # (None if there is no such object), or None until such a lookup is made
+    __external_objects: Optional[Dict[str, Optional[Object]]]
 
     def __init__(self, external_scope: Optional["Scope"] = None) -> None:
-        if external_scope is not None:
-            # Initiate the scope with the parent scope's objects
-            self.__objects = external_scope.get_objects()
-        else:
-            # TODO Initialize the handler with builtin_names
-            self.__objects = set()
+        # TODO Initialize the handler with builtin_names
+        self.__objects = {}
+        # Link to the parent scope (its objects are only looked up, never copied)
+        self.__external_scope = external_scope
+        self.__external_limit = len(external_scope.__objects) if external_scope is not None else 0
+        self.__external_objects = None
 
     def does_object_exist(self, object_name: str) -> bool:
         """
@@ -28,23 +56,27 @@ class Scope:
 
         :param object_name: The name of the object to check.
         """
-        return any(iter_var.name == object_name for iter_var in self.__objects)
+        return self.get_object(object_name) is not None
 
-    def declare_object(self, new_obj: Object) -> None:
+    def declare_object(self, new_obj: Object, name: Optional[str] = None) -> None:
         """
         Declare an object by adding it to the handler.
 
         :param new_obj: The Object instance to add to the handler.
+        :param name: The name to declare the object by (None for its own name). Objects imported
+                     under another name ('from x import y as z') keep their own name, which
+                     is the one that the code refers to them by (see get_object_if_exists).
         """
+        name = new_obj.name if name is None else name
         # If the object does not exist
-        if not self.does_object_exist(new_obj.name):
-            # Make a new Object instance, then add it to the object set
-            self.__objects.add(new_obj)
+        if not self.does_object_exist(name):
+            # Add it to the objects of this scope
+            self.__objects[name] = (new_obj, len(self.__objects))
         else:
             # Otherwise, raise an exception.
             # All objects have immutable types, and
             # currently we do not support freeing objects.
-            raise ObjectAlreadyDefinedError(new_obj.name)
+            raise ObjectAlreadyDefinedError(name)
 
     def get_object_if_exists(self, object_name: str) -> str:
         """
@@ -52,22 +84,102 @@ class Scope:
         Throws an error if it doesn't exist.
 
         :param object_name: The name of the object to retrieve.
+        :return: The name that the code refers to the object by.
         """
-        # For each object
-        for obj in self.__objects:
-            # If the variable has this name
-            if obj.name == object_name:
-                # Return this variable
-                return object_name
-        else:
-            # Otherwise, if no variables were found
+        # If no object was found
+        obj = self.get_object(object_name)
+        if obj is None:
             raise ObjectNotDefinedError(object_name)
+        # Otherwise, return its name (which differs from the looked up name for imported aliases)
+        return obj.name
+
+    def get_object(self, object_name: str) -> Optional[Object]:
+        """
+        Retrieves the object from the manager, if it exists.
+
+        :param object_name: The name of the object to retrieve.
+        :return: The Object instance, or None if it does not exist.
+        """
+        # Look in this scope, then in its external scope (most lookups end here)
+        declared = self.__objects.get(object_name)
+        if declared is not None:
+            return declared[0]
+        external = self.__external_scope
+        if external is None:
+            return None
+        declared = external.__objects.get(object_name)
+        if declared is not None:
+            # Only the objects that the external scope held when this scope was created are seen
+            return declared[0] if declared[1] < self.__external_limit else None
+        return self.__get_distant_object(object_name)
+
+    def __get_distant_object(self, object_name: str) -> Optional[Object]:
+        """
+        Looks up an object which is not declared in this scope nor in its external scope,
+        through the rest of the chain of external scopes.
+
+        :param object_name: The name of the object to retrieve.
+        :return: The Object instance, or None if it does not exist.
+        """
+        remembered = self.__external_objects
+        if remembered is not None and object_name in remembered:
+            return remembered[object_name]
+
+        # Go on up the chain (from the external scope, which does not declare the name),
+        # until a scope which remembers the name, or which sees it declared
+        scope = cast(Scope, self.__external_scope)
+        passed = 1
+        found: Optional[Object] = None
+        while True:
+            remembered = scope.__external_objects
+            if remembered is not None and object_name in remembered:
+                found = remembered[object_name]
+                break
+            passed += 1
+            external = scope.__external_scope
+            if external is None:
+                break
+            declared = external.__objects.get(object_name)
+            if declared is not None:
+                found = declared[0] if declared[1] < scope.__external_limit else None
+                break
+            scope = external
+
+        # Every scope that a long lookup passed through sees the same object
+        if passed >= self.REMEMBERED_DEPTH:
+            scope = self
+            for _ in range(passed):
+                if scope.__external_objects is None:
+                    scope.__external_objects = {}
+                scope.__external_objects[object_name] = found
+                scope = cast(Scope, scope.__external_scope)
+        return found
+
+    def get_size(self) -> int:
+        """
+        :return: The amount of objects declared in this scope (without its external scopes).
+        """
+        return len(self.__objects)
+
+    def get_declared_objects(self) -> Dict[str, Object]:
+        """
+        :return: The objects declared in this scope (without its external scopes),
+                 by the names they were declared by, in the order they were declared in.
+        """
+        return {name: obj for name, (obj, index) in self.__objects.items()}
 
     def get_objects(self) -> Set[Object]:
         """
         Retrieves the full list of objects in the scope,
         and returns it.
         """
-        # Copy the set to a new set (use Python builtin methods for speed).
-        # Basically a copy-by-value, so the external scope can't be altered.
-        return set(list(self.__objects))
+        # Collect the visible objects of every scope in the chain, into a new
+        # set (a copy-by-value, so the scopes themselves can't be altered)
+        objects: Set[Object] = set()
+        scope: Optional[Scope] = self
+        limit: Optional[int] = None
+        while scope is not None:
+            objects.update(obj for obj, index in scope.__objects.values() if limit is None or index < limit)
+            limit = scope.__external_limit
+            scope = scope.__external_scope
+        return objects
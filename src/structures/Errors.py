@@ -3,7 +3,7 @@ Error classes, when needed for exceptions.
 """
 from _ast import AST
 from dataclasses import dataclass, field
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from src.compiler.Util import Util
 
@@ -72,6 +72,20 @@ class InvalidArgumentError(ValueError):
                 "Internal argument handling error encountered."
 
 
+@dataclass(frozen=True)
+class OutputCollisionError(InvalidArgumentError):
+    """
+    An error to throw when two input files of a batch would be transpiled to the same output file.
+    """
+
+    first_source: str = field(default="")
+    second_source: str = field(default="")
+
+    def __str__(self) -> str:
+        # Error text
+        return f"Files '{self.first_source}' and '{self.second_source}' would both be written to '{self.argument}'."
+
+
 @dataclass(frozen=True)
 class SyntaxSubsetError(SyntaxError):
     """
@@ -101,3 +115,74 @@ class InvalidTypeError(TypeError):
         return f"Could not use type '{self.given_type}' when type '{self.expected_type}' was expected." \
                 if self.given_type is not None else \
                 "Invalid types (or value of conflicting type) found in code."
+
+
+@dataclass(frozen=True)
+class CyclicImportError(ImportError):
+    """
+    An error to throw when a module imports itself, directly or through other modules.
+    Since imported modules are copied into the output code, such a module can never be fully imported.
+    """
+
+    import_chain: Tuple[str, ...] = field()
+
+    def __str__(self) -> str:
+        # Error text
+        return f"Module '{self.import_chain[-1]}' is imported cyclically: {' -> '.join(self.import_chain)}."
+
+
+@dataclass(frozen=True)
+class UnresolvedImportError(ImportError):
+    """
+    An error to throw when an imported module could not be found in any of the source roots.
+    """
+
+    module_name: str = field()
+
+    def __str__(self) -> str:
+        # Error text
+        return f"Module '{self.module_name}' could not be found in the source roots."
+
+
+@dataclass(frozen=True)
+class MissingDependencyError(ImportError):
+    """
+    An error to throw when an optional feature is used, but the package that it relies on is not installed.
+    For example, the debugging backends (which are only imported when their flag is used).
+    """
+
+    feature: str = field()
+    package_name: str = field()
+
+    def __str__(self) -> str:
+        # Error text
+        return f"The {self.feature} requires the '{self.package_name}' package, which could not be imported."
+
+
+@dataclass(frozen=True)
+class ChildNotFoundError(LookupError):
+    """
+    An error to throw when a node is asked to replace a
+    nested node which it does not hold (see PyExpression.replace_child).
+    """
+
+    child: str = field()
+    parent: str = field()
+
+    def __str__(self) -> str:
+        # Error text
+        return f"Expression <{self.child}> is not nested in expression <{self.parent}>."
+
+
+@dataclass(frozen=True)
+class IRVerificationError(AssertionError):
+    """
+    An error to throw when the IR of a compilation is malformed (see IRVerifier).
+    This is a bug in the compiler, rather than in the user's code.
+    """
+
+    problems: Tuple[str, ...] = field()
+
+    def __str__(self) -> str:
+        # Error text
+        return "The IR failed verification:\n" + "\n".join(f" - {problem}" for problem in self.problems)
@@ -6,10 +6,15 @@ you will repeat a Union phrase often and will want to
 cut down on the times you need to copy the type hint.
 """
 
-from typing import Callable, Any, Union, TYPE_CHECKING
+from _ast import AST
+from typing import Callable, Any, Generator, Union, TextIO, TYPE_CHECKING
 
 # Prevent cyclic (recursive) imports
 if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    from src.compiler.CodeBuffer import CodeBuffer
+    # noinspection PyUnresolvedReferences
+    from src.compiler.ir.IRValue import IRValue
     # noinspection PyUnresolvedReferences
     from src.pyexpressions.abstract.PyExpression import PyExpression
 
@@ -18,3 +23,17 @@ AnyFunction = Callable[..., Any]
 
 # A PyExpression or a class that extends it
 GENERIC_PYEXPR_TYPE = Union["PyExpression"]
+
+# A log message, or a function which builds the log message only when it is needed
+LazyMessage = Union[str, Callable[..., str]]
+
+# Anything that transpiled code can be written to, in fragments (see PyExpression.emit)
+CodeSink = Union["CodeBuffer", TextIO]
+
+# The construction of a node, which yields the AST nodes of its nested nodes and receives them converted
+# (see PyIterative._construct)
+NodeConstruction = Generator[AST, "PyExpression", None]
+
+# The lowering of an expression to the IR, which yields its nested nodes and receives the values they were lowered to,
+# and returns its own value (see IRLowering)
+LoweringSteps = Generator["PyExpression", "IRValue", "IRValue"]
@@ -0,0 +1,63 @@
+"""
+Tests of the backends at every optimization level.
+"""
+from glob import glob
+from os.path import abspath, basename, dirname, join
+from unittest import TestCase, main
+
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.CompileSession import CompileSession
+from src.compiler.Compiler import Compiler
+from src.compiler.passes.PassManager import PassManager
+
+# The root of the repository (which the examples are imported from)
+ROOT_DIRECTORY = dirname(dirname(abspath(__file__)))
+# The example programs (the port library is linked, rather than compiled)
+EXAMPLES = sorted(path for path in glob(join(ROOT_DIRECTORY, "examples", "example_*.py"))
+                  if basename(path) != "example_port.py")
+
+# Programs which the passes reshape in ways that the backends must handle
+PROGRAMS = {
+    # ConstantConditions replaces the 'if' with its body, as a statement of its own
+    "taken_if": "x: int = 1\nif 1:\n    x = 2\nprint(str(x))\n",
+    "taken_else": "x: int = 1\nif 0:\n    x = 2\nelse:\n    x = 3\nprint(str(x))\n",
+    "return_in_taken_if": "def f() -> int:\n    if 1:\n        return 1\n    return 2\n\n\nprint(str(f()))\n",
+}
+
+
+class TestBackends(TestCase):
+    """
+    Transpiles the examples (and programs which the passes reshape) with
+    each backend, at every optimization level.
+    """
+
+    @staticmethod
+    def transpile(source: str, path: str, optimization_level: int, backend: str) -> str:
+        """
+        :param source: The source code to transpile.
+        :param path: The path of the source file.
+        :param optimization_level: The optimization level.
+        :param backend: The backend which prints the code.
+        :return: The transpiled code.
+        """
+        session = CompileSession(CompileOptions(
+            links=("examples.example_port",), source_roots=(ROOT_DIRECTORY,),
+            optimization_level=optimization_level, backend=backend
+        ))
+        return Compiler.transpile(Compiler.parse(source, session, path))
+
+    def test_levels(self) -> None:
+        """
+        Every program transpiles with both backends, at every optimization level.
+        """
+        sources = {path: open(path, "r").read() for path in EXAMPLES}
+        sources.update({join(ROOT_DIRECTORY, f"{name}.py"): source for name, source in PROGRAMS.items()})
+        for path, source in sources.items():
+            for backend in ("tree", "ir"):
+                for optimization_level in range(PassManager.MAX_LEVEL + 1):
+                    with self.subTest(program=basename(path), backend=backend, level=optimization_level):
+                        self.assertTrue(self.transpile(source, path, optimization_level, backend))
+
+
+if __name__ == "__main__":
+    main()
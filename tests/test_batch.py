@@ -0,0 +1,57 @@
+"""
+Tests of the batch compiler.
+"""
+from os import listdir, makedirs
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from src.compiler.BatchCompiler import BatchCompiler
+from src.structures.Errors import OutputCollisionError
+
+
+class TestBatch(TestCase):
+    """
+    Collects the files of a batch.
+    """
+
+    __directory: TemporaryDirectory
+
+    def setUp(self) -> None:
+        self.__directory = TemporaryDirectory()
+        for package in ("a", "b"):
+            makedirs(join(self.__directory.name, package))
+            with open(join(self.__directory.name, package, "main.py"), "w") as f:
+                f.write("print(1)\n")
+
+    def tearDown(self) -> None:
+        self.__directory.cleanup()
+
+    def test_output_collision(self) -> None:
+        """
+        Files with the same name in different directories can't be written to the same output directory.
+        """
+        sources = [join(self.__directory.name, package, "main.py") for package in ("a", "b")]
+        with self.assertRaises(OutputCollisionError):
+            BatchCompiler.collect_jobs(sources, join(self.__directory.name, "out"))
+
+    def test_mirrored_directories(self) -> None:
+        """
+        The files of a directory keep their relative paths in the output directory.
+        """
+        output = join(self.__directory.name, "out")
+        jobs = BatchCompiler.collect_jobs([self.__directory.name], output)
+        self.assertEqual([output_path for _, output_path in jobs],
+                         [join(output, "a", "main.py.cpp"), join(output, "b", "main.py.cpp")])
+
+    def test_same_file(self) -> None:
+        """
+        A file which is passed multiple times is only transpiled once.
+        """
+        source = join(self.__directory.name, "a", "main.py")
+        self.assertEqual(len(BatchCompiler.collect_jobs([source, source], join(self.__directory.name, "out"))), 1)
+        self.assertEqual(sorted(listdir(join(self.__directory.name, "a"))), ["main.py"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Tests of the compile server.
+"""
+from dataclasses import replace
+from unittest import TestCase, main
+
+from src import __version__
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.daemon.CompileRequest import CompileRequest
+from src.compiler.daemon.CompileServer import CompileServer
+
+
+class TestDaemon(TestCase):
+    """
+    Handles requests, without listening for clients.
+    """
+
+    __request: CompileRequest
+
+    def setUp(self) -> None:
+        self.__request = CompileRequest(__version__, "print(1)\n", None, CompileOptions())
+
+    def test_request(self) -> None:
+        """
+        A request of the server's version is transpiled.
+        """
+        response = CompileServer().handle(self.__request)
+        self.assertIsNone(response.error)
+        self.assertIn("print(1)", response.code)
+
+    def test_other_version(self) -> None:
+        """
+        A request of another version is refused.
+        """
+        response = CompileServer().handle(replace(self.__request, version=__version__ + 1))
+        self.assertIsNone(response.code)
+        self.assertIn(str(__version__), response.error)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Tests of the definition store.
+"""
+from ast import parse
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from src.compiler.CompileSession import CompileSession
+from src.compiler.Compiler import Compiler
+from src.compiler.cache.DefinitionStore import DefinitionStore
+from src.pybuiltins.PortLibrary import PortLibrary
+from src.pybuiltins.PyPortManager import PyPortManager
+
+# A class, and a function which uses it (the type of the class's field is filled in)
+CLASS_SOURCE = ("class Point:\n    x: {} = 1\n\n    def get(self) -> int:\n        return 1\n\n\n"
+                "def origin(p: Point) -> int:\n    return 1\n")
+
+
+class TestDefinitions(TestCase):
+    """
+    Fingerprints and reuses stored definitions.
+    """
+
+    __directory: TemporaryDirectory
+    __store: DefinitionStore
+
+    def setUp(self) -> None:
+        self.__directory = TemporaryDirectory()
+        self.__store = DefinitionStore(self.__directory.name)
+
+    def tearDown(self) -> None:
+        self.__directory.cleanup()
+
+    def fingerprint_function(self, source: str) -> str:
+        """
+        :param source: The source code of a module, which ends with a function definition.
+        :return: The fingerprint of the function, in the scope of the module.
+        """
+        session = CompileSession()
+        module = Compiler.parse(source, session, None, self.__store)
+        return self.__store.fingerprint(parse(source).body[-1], source.splitlines(), module.get_scope(),
+                                        session.get_port_manager())
+
+    def test_class_members(self) -> None:
+        """
+        The users of a class are rebuilt when its members change.
+        """
+        self.assertNotEqual(self.fingerprint_function(CLASS_SOURCE.format("int")),
+                            self.fingerprint_function(CLASS_SOURCE.format("float")))
+
+    def test_cached_class_members(self) -> None:
+        """
+        A class which is loaded from the store is declared with its members.
+        """
+        source = CLASS_SOURCE.format("int")
+        descriptions = []
+        for _ in range(2):
+            module = Compiler.parse(source, CompileSession(), None, self.__store)
+            descriptions.append(DefinitionStore.describe_object(module.get_scope().get_object("Point")))
+        self.assertEqual(descriptions[0], "class {x: variable: int, get: function -> int}")
+        self.assertEqual(descriptions[0], descriptions[1])
+
+    def test_port_library(self) -> None:
+        """
+        Ports are described by the library which they are linked from.
+        """
+        digest = PortLibrary(PyPortManager.BUILTINS_DIRECTORY).get_digest()
+        self.assertIn(digest, PyPortManager().describe_port("print"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Tests of the import statements.
+"""
+from os import mkdir
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.CompileSession import CompileSession
+from src.compiler.Compiler import Compiler
+from src.structures.Errors import ObjectNotDefinedError
+
+# The module which the tests import (as pkg.util)
+UTIL_SOURCE = "def helper(x: int) -> int:\n    return x + 1\n\n\nlimit: int = 3\n"
+
+
+class TestImports(TestCase):
+    """
+    Transpiles programs which import the objects of another module.
+    """
+
+    __directory: TemporaryDirectory
+
+    def setUp(self) -> None:
+        self.__directory = TemporaryDirectory()
+        package = join(self.__directory.name, "pkg")
+        mkdir(package)
+        open(join(package, "__init__.py"), "w").close()
+        with open(join(package, "util.py"), "w") as f:
+            f.write(UTIL_SOURCE)
+
+    def tearDown(self) -> None:
+        self.__directory.cleanup()
+
+    def transpile(self, source: str, backend: str = "tree") -> str:
+        """
+        :param source: The source code of a program in the temporary directory.
+        :param backend: The backend which prints the code.
+        :return: The transpiled code.
+        """
+        session = CompileSession(CompileOptions(source_roots=(self.__directory.name,), backend=backend))
+        return Compiler.transpile(Compiler.parse(source, session, join(self.__directory.name, "main.py")))
+
+    def test_from_import(self) -> None:
+        """
+        Imported objects are referred to by their own names, with or without an alias.
+        """
+        for source in ("from pkg.util import helper, limit\nprint(str(helper(limit)))\n",
+                       "from pkg.util import helper as h, limit as lim\nprint(str(h(lim)))\n",
+                       "from pkg.util import *\nprint(str(helper(limit)))\n"):
+            for backend in ("tree", "ir"):
+                with self.subTest(source=source, backend=backend):
+                    self.assertIn("helper(limit)", self.transpile(source, backend))
+
+    def test_missing_object(self) -> None:
+        """
+        Importing an object which the module does not define is an error.
+        """
+        with self.assertRaises(ObjectNotDefinedError):
+            self.transpile("from pkg.util import missing\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Tests of the optimization passes.
+"""
+from unittest import TestCase, main
+
+from src.compiler.CompileOptions import CompileOptions
+from src.compiler.CompileSession import CompileSession
+from src.compiler.Compiler import Compiler
+
+
+class TestPasses(TestCase):
+    """
+    Transpiles programs at the optimization levels of the passes, and checks their output.
+    """
+
+    @staticmethod
+    def transpile(source: str, optimization_level: int, backend: str = "tree") -> str:
+        """
+        :param source: The source code to transpile.
+        :param optimization_level: The optimization level.
+        :param backend: The backend which prints the code.
+        :return: The transpiled code.
+        """
+        return Compiler.compile(source, CompileSession(CompileOptions(
+            optimization_level=optimization_level, backend=backend
+        )))
+
+    def test_taken_if_keeps_its_block(self) -> None:
+        """
+        A taken 'if' is replaced with its body, which keeps its braces.
+        """
+        code = self.transpile("x: int = 1\nif 1:\n    y: int = 2\n    x = y\nprint(str(x))\n", 3)
+        self.assertNotIn("if", code)
+        self.assertIn("{\nint y = 2;", code.replace("    ", ""))
+
+    def test_jump_in_taken_if(self) -> None:
+        """
+        The statements after a taken 'if' which returns are unreachable, with both backends.
+        """
+        source = "def f() -> int:\n    if 1:\n        return 1\n    return 2\n\n\nprint(str(f()))\n"
+        for backend in ("tree", "ir"):
+            with self.subTest(backend=backend):
+                code = self.transpile(source, 3, backend)
+                self.assertIn("return 1;", code)
+                self.assertNotIn("return 2;", code)
+
+
+if __name__ == "__main__":
+    main()
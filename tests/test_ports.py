@@ -0,0 +1,46 @@
+"""
+Tests of the port libraries.
+"""
+from os import listdir
+from os.path import isfile, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from src.pybuiltins.PortLibrary import PortLibrary
+from src.pybuiltins.PortModule import PortModule
+from src.pybuiltins.PyPortManager import PyPortManager
+
+
+class TestPorts(TestCase):
+    """
+    Links port libraries, and stores their indexes.
+    """
+
+    def test_index_directory(self) -> None:
+        """
+        The indexes of the libraries are stored in the given cache directory.
+        """
+        with TemporaryDirectory() as directory:
+            PyPortManager(("examples.example_port",), directory)
+            self.assertTrue(isfile(PortLibrary(PyPortManager.BUILTINS_DIRECTORY, directory).get_index_path()))
+            self.assertTrue(isfile(PortModule("examples.example_port", directory).get_index_path()))
+
+    def test_no_cache(self) -> None:
+        """
+        Without a cache directory, the indexes are not stored.
+        """
+        self.assertIsNone(PortLibrary(PyPortManager.BUILTINS_DIRECTORY).get_index_path())
+        self.assertTrue(PyPortManager(("examples.example_port",)).is_loaded("add"))
+
+    def test_library_digest(self) -> None:
+        """
+        A library has the same digest, whether or not its index is stored.
+        """
+        with TemporaryDirectory() as directory:
+            self.assertEqual(PortLibrary(PyPortManager.BUILTINS_DIRECTORY).get_digest(),
+                             PortLibrary(PyPortManager.BUILTINS_DIRECTORY, directory).get_digest())
+            self.assertEqual(len(listdir(join(directory, "ports"))), 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Tests that the transpiled output is reproducible (see benchmarks/check_reproducible).
+"""
+from os import environ
+from os.path import basename, join
+from subprocess import run, DEVNULL
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import Dict
+from unittest import TestCase, main
+
+from src.compiler.passes.PassManager import PassManager
+from tests.test_backends import EXAMPLES, ROOT_DIRECTORY
+
+# The string hash seeds to transpile with (any order which comes from a set of strings differs between them)
+SEEDS = ("0", "1")
+
+
+class TestReproducible(TestCase):
+    """
+    Transpiles the examples in fresh interpreters with different hash seeds,
+    and compares the outputs byte for byte.
+    """
+
+    @staticmethod
+    def transpile(seed: str, backend: str, output_directory: str) -> Dict[str, bytes]:
+        """
+        Transpiles the examples in a fresh interpreter (at the highest optimization level).
+
+        :param seed: The hash seed of the interpreter.
+        :param backend: The backend which prints the code.
+        :param output_directory: The directory to write the outputs to.
+        :return: The output of each example, by the name of the example.
+        """
+        # The cache and the compile server would return the output of another run
+        run([executable, join(ROOT_DIRECTORY, "compy.py"), "--no-cache", "--no-daemon", "-l", "examples.example_port",
+             "-O", str(PassManager.MAX_LEVEL), "--backend", backend, "-o", output_directory, *EXAMPLES],
+            cwd=ROOT_DIRECTORY, env=dict(environ, PYTHONHASHSEED=seed), stdout=DEVNULL, check=True)
+        outputs: Dict[str, bytes] = {}
+        for path in EXAMPLES:
+            with open(join(output_directory, basename(path) + ".cpp"), "rb") as f:
+                outputs[basename(path)] = f.read()
+        return outputs
+
+    def test_hash_seeds(self) -> None:
+        """
+        The output does not depend on the hash seed of the interpreter.
+        """
+        for backend in ("tree", "ir"):
+            with TemporaryDirectory() as directory:
+                first, second = (self.transpile(seed, backend, join(directory, seed)) for seed in SEEDS)
+            for name in first:
+                with self.subTest(backend=backend, example=name):
+                    self.assertEqual(first[name], second[name])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Tests of the scope handler.
+"""
+from unittest import TestCase, main
+
+from src.scopes.Scope import Scope
+from src.scopes.objects.Type import Type
+from src.scopes.objects.Variable import Variable
+from src.structures.Errors import ObjectAlreadyDefinedError, ObjectNotDefinedError
+
+
+class TestScope(TestCase):
+    """
+    Declares objects, and looks them up from nested scopes.
+    """
+
+    @staticmethod
+    def nest(scope: Scope, depth: int, prefix: str = "local") -> Scope:
+        """
+        :param scope: The outer-most scope.
+        :param depth: The amount of scopes to nest in it (each one declares a local variable).
+        :param prefix: The prefix of the names of the local variables.
+        :return: The inner-most scope.
+        """
+        for level in range(depth):
+            scope = Scope(scope)
+            scope.declare_object(Variable(f"{prefix}_{level}", Type("int")))
+        return scope
+
+    def test_nested_lookup(self) -> None:
+        """
+        Objects are seen from every depth, and looking them up again gives the same objects.
+        """
+        module_scope = Scope()
+        module_scope.declare_object(Variable("value", Type("int")))
+        for depth in (1, 2, Scope.REMEMBERED_DEPTH, 50):
+            with self.subTest(depth=depth):
+                inner_scope = self.nest(module_scope, depth)
+                for _ in range(2):
+                    self.assertEqual(inner_scope.get_object_if_exists("value"), "value")
+                    self.assertEqual(inner_scope.get_object_if_exists("local_0"), "local_0")
+                    self.assertIsNone(inner_scope.get_object("missing"))
+
+    def test_snapshot(self) -> None:
+        """
+        Objects which are declared after a scope was created are not seen from it, even after a lookup.
+        """
+        module_scope = Scope()
+        middle_scope = self.nest(module_scope, 25)
+        inner_scope = self.nest(middle_scope, 25, "inner")
+        self.assertIsNone(inner_scope.get_object("late"))
+        module_scope.declare_object(Variable("late", Type("int")))
+        self.assertIsNone(inner_scope.get_object("late"))
+        self.assertIsNone(middle_scope.get_object("late"))
+        self.assertIsNotNone(self.nest(module_scope, 50).get_object("late"))
+
+        # Objects which are declared in the inner scope itself are seen right away
+        inner_scope.declare_object(Variable("late_inner", Type("int")))
+        self.assertIsNotNone(inner_scope.get_object("late_inner"))
+
+    def test_redefinition(self) -> None:
+        """
+        Objects can't be declared again in nested scopes.
+        """
+        module_scope = Scope()
+        module_scope.declare_object(Variable("value", Type("int")))
+        inner_scope = self.nest(module_scope, 10)
+        with self.assertRaises(ObjectAlreadyDefinedError):
+            inner_scope.declare_object(Variable("value", Type("int")))
+        with self.assertRaises(ObjectNotDefinedError):
+            inner_scope.get_object_if_exists("missing")
+
+    def test_alias(self) -> None:
+        """
+        Objects which are declared under another name are looked up by it, and keep their own name.
+        """
+        module_scope = Scope()
+        module_scope.declare_object(Variable("value", Type("int")), "alias")
+        inner_scope = self.nest(module_scope, 10)
+        self.assertEqual(inner_scope.get_object_if_exists("alias"), "value")
+        self.assertIsNone(inner_scope.get_object("value"))
+
+
+if __name__ == "__main__":
+    main()